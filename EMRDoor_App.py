@@ -1,7 +1,12 @@
+import os
+import platform
 import sys
+import threading
+import time
+from collections import Counter
 from PySide6.QtWidgets import QApplication, QMainWindow, QMessageBox, QDialog,QTableWidgetItem, QTableWidget,QVBoxLayout, QLabel, QWidget,QCheckBox
 from PySide6.QtGui import QPixmap
-from PySide6.QtCore import QThread, Signal,Qt, QSize
+from PySide6.QtCore import QThread, Signal,Qt, QSize, QTimer, QSettings
 from EMRDoor_ui import Ui_MainWindow
 from PySide6.QtGui import QPixmap, QIcon
 
@@ -9,6 +14,26 @@ import serial
 import serial.tools.list_ports
 import emrdoor_imag_rc
 from EMRDoor01_ui import Ui_Dialog  # 변환된 EMRDoor01.py 파일을 import
+from emrdoor_journal import JournalWriter, EV_FRAME, EV_DOOR_STATE, EV_COMMAND, EV_CONNECT, EV_DISCONNECT, ALL
+from emrdoor_journal_index import JournalIndex, build_index, index_journal
+from emrdoor_eventlog import EventLogWindow
+from emrdoor_log import Sampler, get_logger, setup_logging
+from emrdoor_protocol import (FrameDecoder, BROADCAST, ALL_DOORS, CMD_OPEN, CMD_CLOSE, CMD_ACK, CMD_NAK,
+    CMD_EVENT, CMD_STATUS, CMD_STATUS_BITS, FLAG_COLUMNS, ACTION_OPEN, ACTION_CLOSE, OVERHEAD, open_door)
+from emrdoor_state import DoorState
+from emrdoor_shared import X86, SharedDoorState
+from emrdoor_ioproc import BATCH, CLOSED, LOST, IOPool, PortSpec, RemoteWriter
+from emrdoor_capture import REPLAY_PREFIX, CaptureWriter, CapturingSerial, capture_path, open_replay
+from emrdoor_metrics import REGISTRY
+from emrdoor_diagnostics import DiagnosticsOverlay
+from emrdoor_metrics_http import MetricsServer
+from emrdoor_commands import REASON_TIMEOUT, CommandCoalescer, CommandWriter
+from emrdoor_trace import TRACER
+from emrdoor_watchdog import EventLoopMonitor
+from emrdoor_profiling import ProfilerPanel
+from emrdoor_ports import BAUDRATES, autodetect, line_report, load_settings, open_port, save_settings
+from emrdoor_polling import PollScheduler
+from emrdoor_pacing import Pacer
 
 from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
     QMetaObject, QObject, QPoint, QRect,
@@ -25,6 +50,49 @@ from PySide6.QtWidgets import (QAbstractItemView, QAbstractScrollArea, QApplicat
     QWidget)
 
 
+JOURNAL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "journal")
+LOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs", "emrdoor.log")
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiles")
+SETTINGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "emrdoor.ini")
+AUTO_BAUD = "자동"
+WRITER_JOIN_TIMEOUT = 1.0   # 읽기 쓰레드가 포트를 닫기 전에 명령 쓰레드를 기다리는 한도 (GUI와 무관)
+EXIT_TIMEOUT_MS = 1000      # 앱 종료 때 포트 쓰레드를 기다리는 한도
+# 상태 폴링 (emrdoor.ini [polling]): 버스 점유 상한 (0 = 폴링 안 함), 보드별 간격 범위 (초)
+# max_interval을 비워 두면 상한에서 전체를 한 바퀴 도는 시간, age_limit: 어느 보드든 다시 볼 때까지의 한도
+# (라운드 로빈 한 바퀴 단위, 1 = 라운드 로빈보다 늦게 보는 보드가 없다)
+POLL_CEILING = 0.5
+POLL_MIN_INTERVAL = 0.25
+POLL_AGE_LIMIT = 1.0
+# 보드별 송신 속도 조절 (emrdoor.ini [pacing]): enabled, 시작 속도 / 상한 (프레임/초), ACK 대기 (초)
+PACING_INITIAL = 50.0
+PACING_MAXIMUM = 2000.0
+PACING_TIMEOUT = 0.5
+# 도어별 명령을 보드별 한 프레임으로 묶는 시간 (emrdoor.ini [commands] window_ms, 0 = 묶지 않음)
+COMMAND_WINDOW_MS = 20
+# 도어 명령이 ACK/NAK를 기다리는 한도 ([commands] timeout_ms, 재전송 포함)
+COMMAND_TIMEOUT_MS = 5000
+# 포트 입출력과 디코딩을 별도 프로세스에서 (emrdoor.ini [io] process, 또는 EMRDOOR_IO_PROCESS=1)
+IO_PROCESS = False
+IO_WORKERS = 1  # 포트를 나눠 맡는 I/O 프로세스 수 ([io] workers, EMRDOOR_IO_WORKERS); 포트 수보다 많으면 포트 수
+
+log = get_logger("app")
+FRAME_LOG_EVERY = 1000  # 받은 바이트 로그는 읽기 1000번에 1번만 (읽기 쓰레드마다)
+
+# GUI 쓰레드 쪽 단계별 지표 (읽기/디코드 지표는 포트별로 SerialReadThread에)
+m_batches_handled = REGISTRY.counter("frame_batches_handled_total", "frame batches taken off the queue")
+m_queue_ns = REGISTRY.histogram("frame_queue_ns", "read -> handle_frames delay")
+m_state_ns = REGISTRY.histogram("state_update_ns", "handle_frames time per batch")
+m_doors_changed = REGISTRY.counter("door_changes_total", "door state changes applied")
+m_paint_ns = REGISTRY.histogram("paint_ns", "repaint_doors time")
+m_rows_painted = REGISTRY.counter("door_rows_painted_total", "grid rows repainted")
+m_read_to_paint_ns = REGISTRY.histogram("read_to_paint_ns", "oldest unpainted read -> repaint done")
+m_ack_ns = REGISTRY.histogram("command_ack_ns", "command queued -> ACK/NAK handled")
+m_connects = REGISTRY.counter("serial_connects_total", "successful port connects")
+m_disconnects = REGISTRY.counter("serial_disconnects_total", "port disconnects (closed or lost)")
+REGISTRY.gauge("frame_queue_depth", "frame batches emitted but not yet handled",
+               fn=lambda: REGISTRY.total("frame_batches_queued_total") - m_batches_handled.value)
+
+
 class SubDialog(QDialog):
 
     row_changed = Signal(int)  # Custom signal to notify row change
@@ -45,40 +113,206 @@ class SubDialog(QDialog):
     def update_rowcnt(self, value):
         # Update the rowcnt with the new value
         self.rowcnt1 = int(value)
-        print(self.rowcnt1)
+        log.debug("row count edited", extra={"fields": {"rows": self.rowcnt1}})
     
    
     def change_row_and_close_dialog(self):
         # Perform the desired action, e.g., changing the row
         self.row_changed.emit(self.rowcnt1)
-        print("chageed good")
+        log.info("row count applied", extra={"fields": {"rows": self.rowcnt1}})
         # Close the dialog
         # self.close()
 
 class SerialReadThread(QThread):
-    data_received = Signal(str)
+    data_received = Signal(str)             # "Disconnected"만 (받은 프레임은 frames_received로)
+    frames_received = Signal(list, object)  # 디코딩된 프레임 (emrdoor_protocol.Frame), 읽은 시각 (ns)
 
-    def __init__(self, serial_connection):
+    # 종료: stop()은 read를 취소만 하고 바로 돌아온다. 포트는 이 쓰레드가 (명령 쓰레드가 끝난 뒤) 닫고,
+    # 다 닫히면 QThread.finished가 나간다. GUI 쓰레드는 기다리지 않는다.
+    def __init__(self, serial_connection, writer=None, journal=None):
         super().__init__()
         self.serial_connection = serial_connection
+        self.writer = writer  # 같은 포트에 쓰는 CommandWriter (닫기 전에 끝나기를 기다림)
+        self.journal = journal  # 디코딩한 프레임마다 EV_FRAME (GUI 쓰레드를 거치지 않고 여기서)
+        self.decoder = FrameDecoder()
+        self.frame_log = Sampler(log, every=FRAME_LOG_EVERY)
         self._running = True
 
+        port = str(getattr(serial_connection, "port", ""))
+        self.m_bytes = REGISTRY.counter("serial_read_bytes_total", "bytes read from the port", port=port)
+        self.m_frames = REGISTRY.counter("frames_decoded_total", "frames decoded", port=port)
+        self.m_errors = REGISTRY.counter("frame_errors_total", "decoder resyncs", port=port)
+        self.m_decode_ns = REGISTRY.histogram("decode_ns", "decode time per read", port=port)
+        self.m_queued = REGISTRY.counter("frame_batches_queued_total", "frame batches emitted", port=port)
+
     def run(self):
-        while self._running:
-            try:
-                if self.serial_connection.in_waiting > 0:
-                    data = self.serial_connection.read(self.serial_connection.in_waiting)
-                    hex_data = data.hex().upper()  # Convert to hex string and make uppercase
-                    self.data_received.emit(hex_data)
-            except serial.SerialException:
-                self._running = False
-                self.data_received.emit("Disconnected")
+        # 프로파일러/추적 결과에 쓰레드 이름이 보이도록
+        threading.current_thread().name = f"SerialRead {getattr(self.serial_connection, 'port', '')}"
+        try:
+            while self._running:
+                try:
+                    # 1바이트 이상 올 때까지 (timeout까지) 블록, in_waiting만 돌리면 GIL을 계속 잡는다
+                    data = self.serial_connection.read(max(1, self.serial_connection.in_waiting))
+                    if data and self.serial_connection.in_waiting:
+                        # 첫 바이트를 기다리는 동안 들어온 나머지도 한 번에
+                        data += self.serial_connection.read(self.serial_connection.in_waiting)
+                    if data:
+                        read_ns = time.perf_counter_ns()
+                        self.m_bytes.inc(len(data))
+                        if self.frame_log():    # 16진 문자열은 로그에 남길 때만 만든다
+                            log.debug("frame received", extra={"fields": {
+                                "port": getattr(self.serial_connection, "port", ""), "data": data.hex().upper(),
+                                "skipped": self.frame_log.take_suppressed()}})
+                        errors = self.decoder.errors
+                        frames = self.decoder.feed(data)
+                        self.m_decode_ns.record(time.perf_counter_ns() - read_ns)
+                        if self.decoder.errors != errors:
+                            self.m_errors.inc(self.decoder.errors - errors)
+                        self.m_frames.inc(len(frames))
+                        if self.journal is not None:
+                            for f in frames:
+                                self.journal.append(f.board, 0, EV_FRAME, f.cmd, OVERHEAD + len(f.payload))
+                        if frames and self.writer is not None and self.writer.pacer is not None:
+                            # ACK 왕복 시간은 GUI를 거치지 않고 여기서 잰다; 다시 보낼 NAK busy는
+                            # GUI에 넘기지 않는다 (다시 보낸 명령의 답이 future를 푼다)
+                            now = time.monotonic()
+                            frames = [f for f in frames
+                                      if f.cmd not in (CMD_ACK, CMD_NAK) or self.writer.answered(f, now)]
+                        if frames:
+                            self.m_queued.inc()
+                            self.frames_received.emit(frames, read_ns)
+                except (serial.SerialException, OSError) as e:
+                    if self._running:
+                        self._running = False
+                        log.warning("serial read failed", extra={"fields": {
+                            "port": getattr(self.serial_connection, "port", ""), "error": e}})
+                        self.data_received.emit("Disconnected")
+        finally:
+            self._close()
+
+    def _close(self):
+        if self.writer is not None:
+            self.writer.stop()
+            if not self.writer.join(WRITER_JOIN_TIMEOUT):
+                log.warning("command writer did not stop", extra={"fields": {
+                    "port": getattr(self.serial_connection, "port", "")}})
+        try:
+            self.serial_connection.close()
+        except (serial.SerialException, OSError) as e:
+            log.warning("port close failed", extra={"fields": {"error": e}})
 
     def stop(self):
         self._running = False
-        self.serial_connection.close()
+        cancel_read = getattr(self.serial_connection, "cancel_read", None)
+        if cancel_read is not None and self.isRunning():
+            try:
+                cancel_read()
+            except OSError:
+                pass  # 그 사이에 쓰레드가 (포트가 끊겨) 스스로 닫았다
+
+class IOProcessThread(QThread):
+    data_received = Signal(str)             # "Disconnected"만 (받은 바이트는 I/O 프로세스가 디코딩)
+    frames_received = Signal(list, object)  # ACK/NAK 프레임, 읽은 시각 (ns)
+    doors_changed = Signal(int, object)     # 공유 메모리에 적용된 도어 변경 수, 가장 이른 읽은 시각 (ns)
+
+    # I/O 프로세스의 보고를 받는 쓰레드: 포트별 지표와 저널은 여기서 남기고, GUI에는 모인 만큼 한 번에 알린다.
+    # stop()은 프로세스에 멈추라고만 하고 돌아온다; 프로세스가 포트를 닫고 끝나면 finished.
+    # 공유 블록은 GUI가 아직 읽을 수 있으니 여기서 지우지 않는다: detach() 뒤에 GUI 쓰레드가 (port_closed)
+    def __init__(self, io, state, journal):
+        super().__init__()
+        self.io = io
+        self.serial_connection = io     # port_closed / wait_closed가 포트 이름을 읽는다
+        self.state = state
+        self.journal = journal
+        self.frames = 0
+        self.m_ports = [(
+            REGISTRY.counter("serial_read_bytes_total", "bytes read from the port", port=spec.name),
+            REGISTRY.counter("frames_decoded_total", "frames decoded", port=spec.name),
+            REGISTRY.counter("frame_errors_total", "decoder resyncs", port=spec.name),
+            REGISTRY.histogram("decode_ns", "decode time per read", port=spec.name),
+        ) for spec in io.specs]
+        self.m_queued = REGISTRY.counter("frame_batches_queued_total", "frame batches emitted", port=io.port)
+
+    def run(self):
+        threading.current_thread().name = f"IOProcess {self.io.port}"
+        decoder = FrameDecoder()
+        lost = False
+        try:
+            while True:
+                try:
+                    messages = [self.io.receive()]
+                    while self.io.poll():   # 밀린 보고는 모아서 GUI에 한 번만 알린다
+                        messages.append(self.io.receive())
+                except (EOFError, OSError):
+                    if not self.io.stopping and not lost:
+                        log.warning("I/O process exited", extra={"fields": {"port": self.io.port}})
+                        self.data_received.emit("Disconnected")
+                    return
+                changed, first_ns, closed = 0, None, False
+                for kind, port, body in messages:
+                    if kind == BATCH:
+                        changed += self._batch(body, decoder)
+                        if body.changes and (first_ns is None or body.read_ns < first_ns):
+                            first_ns = body.read_ns
+                    elif kind == LOST:
+                        log.warning("serial read failed", extra={"fields": {
+                            "port": self.io.specs[port].name, "error": body}})
+                        if not lost:
+                            lost = True
+                            self.data_received.emit("Disconnected")
+                    elif kind == CLOSED:
+                        closed = True
+                if changed:
+                    self.m_queued.inc()
+                    self.doors_changed.emit(changed, first_ns)
+                if closed:
+                    return
+        finally:
+            self.io.join(WRITER_JOIN_TIMEOUT)
+
+    def _batch(self, batch, decoder):
+        m_bytes, m_frames, m_errors, m_decode_ns = self.m_ports[batch.port]
+        m_bytes.inc(batch.bytes)
+        m_decode_ns.record(batch.decode_ns)
+        if batch.errors:
+            m_errors.inc(batch.errors)
+        m_frames.inc(batch.frames)
+        self.frames += batch.frames
+        headers = batch.headers
+        for k in range(0, len(headers), 3):
+            self.journal.append(headers[k], 0, EV_FRAME, headers[k + 1], OVERHEAD + headers[k + 2])
+        if batch.answers:
+            self.m_queued.inc()
+            self.frames_received.emit(decoder.feed(batch.answers), batch.read_ns)
+        location = self.state.location
+        for i, flags in zip(batch.changes, batch.values):
+            board, door = location(i)
+            self.journal.append(board, door, EV_DOOR_STATE, flags)
+        return len(batch.changes)
+
+    def stop(self):
+        self.io.stop()
+
+class BaudDetectThread(QThread):
+    detected = Signal(str, object, dict)  # 포트, 찾은 PortSettings (없으면 None), 속도별 왕복 시간
+
+    def __init__(self, port, base):
+        super().__init__()
+        self.port = port
+        self.base = base
+
+    def run(self):
+        try:
+            found, results = autodetect(self.port, self.base)
+        except (serial.SerialException, OSError, ValueError) as e:
+            log.error("baud detect failed", extra={"fields": {"port": self.port, "error": e}})
+            found, results = None, {}
+        self.detected.emit(self.port, found, results)
 
 class MainWindow(QMainWindow):
+
+    serial_closed = Signal(str)  # 포트 이름: 읽기/명령 쓰레드가 끝나고 포트가 닫힘
+
     def __init__(self):
         super(MainWindow, self).__init__()
         self.ui = Ui_MainWindow()
@@ -87,6 +321,13 @@ class MainWindow(QMainWindow):
         # 상태바 추가
         self.statusBar().showMessage("Ready")
         self.statusBar().setStyleSheet("QStatusBar{background-color: rgb(172, 157, 255) ;}")
+        # GUI 쓰레드 멈춤 감시 (EMRDOOR_STALL_MS 이상 늦으면 스택 샘플과 함께 기록)
+        self.watchdog = EventLoopMonitor(self, threshold_ms=int(os.environ.get("EMRDOOR_STALL_MS", "200")))
+        self.watchdog.start()
+
+        # 상태바 오른쪽: 처리량/지연 요약 (1초마다 갱신)
+        self.diagnostics = DiagnosticsOverlay(REGISTRY, self)
+        self.statusBar().addPermanentWidget(self.diagnostics)
         
         
         # 버튼 클릭 시 호출할 슬롯 연결
@@ -96,6 +337,7 @@ class MainWindow(QMainWindow):
         self.ui.pushButton_4.clicked.connect(self. setting_serial)
         self.ui.pushButton_5.clicked.connect(self. uiopen)
         self.ui.OpenAllBt.clicked.connect(self. sendAllDoorOpen)
+        self.ui.eventBt.clicked.connect(self.show_event_log)
         self.ui.ByeBt.clicked.connect(self. close)
         
         # self.ui.tableWidget
@@ -120,7 +362,6 @@ class MainWindow(QMainWindow):
         
         # Adjust the row and column sizes to fit the label
    
-<<<<<<< HEAD
 
         # Insert the QLabel into the QTableWidget at position (0, 0)
         # self.ui.tableWidget.setCellWidget(0, 0, label)
@@ -153,37 +394,96 @@ class MainWindow(QMainWindow):
                 # label.setContentsMargins(5,5,5,5)
                 self.ui.tableWidget.setCellWidget(i, j, label)
                 self.ui.tableWidget.setRowHeight(i, desired_size.height()+5)
-=======
-        self.item = QTableWidgetItem()
-        pixmap = QPixmap(u":/image/image/RedOff.png")  # Replace with the path to your image
-        self.item.setIcon(QIcon(pixmap))
-        self.item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)  # Center the item in the cell
-        self.ui.tableWidget.setItem(0, 1, self.item)
-        self.ui.tableWidget.setIconSize(QSize(32, 32))  # Set icon size
-        self.ui.tableWidget.setRowHeight(0, 40)  # Set row height
-        self.ui.tableWidget.setColumnWidth(1, 40)  # Set column width
-
-        # Additionally, if you want to center the icon itself, set the horizontal and vertical alignment of the item:
-        self.ui.tableWidget.item(0, 1).setTextAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignVCenter)
->>>>>>> eb94b4c7a8cb73d97e5730e6117a92f534196ecc
 
         
         # 버튼 Enable setting 
         self.ui.OpenAllBt.setEnabled(False)
 
         # ComboBox에 COM 포트 목록 추가
+        self.emulator = None
         self.populate_com_ports()
         self.ui.pushButton_2.hide()
+        # 설정 창 아래쪽: 프로파일러 / 메모리 스냅샷 (현장에서 결과 파일을 수거)
+        self.ui.dockWidget_2.setMinimumSize(QSize(200, 260))
+        self.ui.dockWidget_2.setMaximumSize(QSize(200, 260))
+        self.profiler_panel = ProfilerPanel(PROFILE_DIR, self.ui.dockWidgetContents_2)
+        self.profiler_panel.setGeometry(QRect(10, 125, 180, 110))
+        # 포트 선택 아래: 통신 속도 (자동 = 연결할 때 감지), 포트별로 emrdoor.ini에 저장
+        self.settings = QSettings(SETTINGS_FILE, QSettings.IniFormat)
+        self.baud_label = QLabel("속도 :", self.ui.dockWidgetContents_2)
+        self.baud_label.setGeometry(QRect(20, 65, 61, 21))
+        self.baud_label.setFont(self.ui.label_2.font())
+        self.baud_combo = QComboBox(self.ui.dockWidgetContents_2)
+        self.baud_combo.setGeometry(QRect(100, 65, 91, 21))
+        self.baud_combo.addItem(AUTO_BAUD)
+        self.baud_combo.addItems([str(rate) for rate in sorted(BAUDRATES)])
+        self.baud_detect = None
+        self.ui.comboBox.currentTextChanged.connect(self.show_port_settings)
+        self.show_port_settings(self.ui.comboBox.currentText())
         self.ui.dockWidget_2.hide()
 
         # 시리얼 객체 초기화
         self.serial_connection = None
         self.serial_thread = None
+        self.closing = {}  # 닫는 중인 읽기 쓰레드 -> stop() 시각 (ns)
+
+        # 도어 상태, 변경된 셀만 타이머로 다시 그린다
+        self.door_state = DoorState()
+        self.command_seq = 0
+        self.command_sent_ns = {}  # seq -> 보낸 시각, ACK 지연 측정용
+        self.commands = None       # 명령 큐 (연결되어 있는 동안)
+        self.coalescer = None      # 도어별 명령 묶음 (명령 큐 앞단)
+        self.poller = None         # 상태 폴링 일정 (명령 큐가 비었을 때 POLL)
+        # 명령 추적: seq -> (trace_id, 클릭 시각), ACK 뒤 다시 그려질 때까지 (trace_id, 클릭, ACK 처리 시각)
+        self.command_traces = {}
+        self.repaint_traces = []
+        if os.environ.get("EMRDOOR_TRACE"):
+            TRACER.start()
+        self.pix_on = QPixmap(u":/image/image/RedOn.png").scaled(QSize(40, 40), Qt.KeepAspectRatio)
+        self.pix_off = QPixmap(u":/image/image/RedOff.png").scaled(QSize(40, 40), Qt.KeepAspectRatio)
+        self.repaint_timer = QTimer(self)
+        self.repaint_timer.setSingleShot(True)
+        self.repaint_timer.setInterval(16)
+        self.repaint_timer.timeout.connect(self.repaint_doors)
+        self.command_timer = QTimer(self)     # 답이 안 온 도어 명령의 기한
+        self.command_timer.setSingleShot(True)
+        self.command_timer.timeout.connect(self.expire_door_commands)
+        self.unpainted_ns = None  # 아직 화면에 안 그려진 가장 오래된 수신 시각
+
+        # 표에서 도어(줄)를 여러 개 골라 오른쪽 클릭: 열기 / 닫기
+        self.ui.tableWidget.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.ui.tableWidget.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.ui.tableWidget.setContextMenuPolicy(Qt.ActionsContextMenu)
+        for text, action in (("선택한 도어 열기", ACTION_OPEN), ("선택한 도어 닫기", ACTION_CLOSE)):
+            menu_action = QAction(text, self.ui.tableWidget)
+            menu_action.triggered.connect(lambda checked=False, a=action: self.send_selected(a))
+            self.ui.tableWidget.addAction(menu_action)
+
+        # 이벤트 저널 (도어 이벤트 기록), 닫힌 세그먼트는 바로 인덱싱;
+        # 지난 실행에서 인덱스 없이 남은 세그먼트는 시작을 막지 않도록 같은 백그라운드 쓰레드에서
+        # (그 사이의 조회는 인덱스 없는 세그먼트를 훑는다)
+        self.journal = JournalWriter(JOURNAL_DIR, on_seal=build_index)
+        self.journal.in_background(index_journal, JOURNAL_DIR)
+        self.journal_index = JournalIndex(JOURNAL_DIR)
+        self.event_log = None
+
+        # Prometheus 스크레이프용 (EMRDOOR_METRICS_PORT=9464, localhost만)
+        self.metrics_server = None
+        metrics_port = os.environ.get("EMRDOOR_METRICS_PORT")
+        if metrics_port:
+            try:
+                self.metrics_server = MetricsServer(REGISTRY, int(metrics_port)).start()
+                log.info("metrics endpoint", extra={"fields": {"address": self.metrics_server.address}})
+            except (OSError, ValueError) as e:
+                log.error("metrics endpoint failed", extra={"fields": {"port": metrics_port, "error": e}})
 
     def on_button_click(self):
 
         selected_port = self.ui.comboBox.currentText()
-        if selected_port:
+        if (selected_port and self.baud_combo.currentText() == AUTO_BAUD
+                and not selected_port.startswith(REPLAY_PREFIX)):
+            self.detect_baudrate(selected_port)
+        elif selected_port:
             self.connect_to_com_port(selected_port)
             self.ui.pushButton.hide()
             self.ui.pushButton_2.show()
@@ -193,47 +493,378 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please select a COM port")
 
     def populate_com_ports(self):
+        # 에뮬레이터 / 직접 지정한 포트 (pty 등, comports()에 안 나옴)
+        spec = os.environ.get("EMRDOOR_EMULATOR")
+        if spec is not None and self.emulator is None:
+            from emrdoor_emulator import DoorControllerEmulator, parse_spec
+            self.emulator = DoorControllerEmulator(**parse_spec(spec))
+            self.ui.comboBox.addItem(self.emulator.start())
+        # 캡처 파일 재생 (PATH[@배속], 배속 max = 최대 속도)
+        replay = os.environ.get("EMRDOOR_REPLAY")
+        if replay:
+            self.ui.comboBox.addItem(REPLAY_PREFIX + replay)
+        for port in filter(None, os.environ.get("EMRDOOR_PORTS", "").split(os.pathsep)):
+            self.ui.comboBox.addItem(port)
+
         ports = serial.tools.list_ports.comports()
         for port in ports:
             self.ui.comboBox.addItem(port.device)
 
+    def show_port_settings(self, port_name):
+        # 포트를 고르면 그 포트에 저장된 속도를 보여준다 (재생 파일은 속도 없음)
+        self.baud_combo.setEnabled(not port_name.startswith(REPLAY_PREFIX))
+        rate = str(load_settings(self.settings, port_name).baudrate)
+        if self.baud_combo.findText(rate) < 0:
+            self.baud_combo.addItem(rate)
+        self.baud_combo.setCurrentText(rate)
+
+    def port_settings(self, port_name):
+        # 저장된 설정 + 선택한 속도, 연결할 때마다 저장
+        port_settings = load_settings(self.settings, port_name)
+        rate = self.baud_combo.currentText()
+        if rate.isdigit():
+            port_settings = port_settings._replace(baudrate=int(rate))
+        save_settings(self.settings, port_name, port_settings)
+        # EMRDOOR_LOW_LATENCY=1: 저장하지 않고 이번 연결에만 저지연 모드
+        if os.environ.get("EMRDOOR_LOW_LATENCY") == "1":
+            port_settings = port_settings._replace(low_latency=True)
+        return port_settings
+
+    def detect_baudrate(self, port_name):
+        # 빠른 속도부터 POLL을 보내 응답이 깨끗한 가장 빠른 속도를 찾는다 (최대 몇 초, 백그라운드)
+        if self.baud_detect is not None and self.baud_detect.isRunning():
+            return
+        self.ui.pushButton.setEnabled(False)
+        self.statusBar().showMessage(f"Detecting baud rate on {port_name}...")
+        self.baud_detect = BaudDetectThread(port_name, load_settings(self.settings, port_name))
+        self.baud_detect.detected.connect(self.baud_detected)
+        self.baud_detect.start()
+
+    def baud_detected(self, port_name, port_settings, results):
+        self.baud_detect.wait()
+        self.ui.pushButton.setEnabled(True)
+        if port_settings is None:
+            self.statusBar().showMessage(f"No baud rate answered on {port_name}", 2000)
+            QMessageBox.warning(self, "Warning", f"No controller answered on {port_name}\n"
+                                f"tried: {', '.join(map(str, results)) or '-'}")
+            return
+        save_settings(self.settings, port_name, port_settings)
+        self.baud_combo.setCurrentText(str(port_settings.baudrate))
+        if self.ui.comboBox.currentText() == port_name:
+            self.on_button_click()
+
     def connect_to_com_port(self, port_name):
         try:
-            self.serial_connection = serial.Serial(port_name, baudrate=9600, timeout=1)
-            self.statusBar().showMessage(f"Connected to {port_name}")
+            if self.io_process_enabled():
+                line = self.connect_io_process(port_name)
+            else:
+                line = self.connect_serial(port_name)
+            self.statusBar().showMessage(f"Connected to {port_name}{line}")
+            log.info("connected", extra={"fields": {"port": port_name}})
+            m_connects.inc()
+            self.journal.append(0, 0, EV_CONNECT)
             # QMessageBox.information(self, "Success", f"Connected to {port_name}")
-
-            # 시리얼 읽기 쓰레드 시작
-            self.serial_thread = SerialReadThread(self.serial_connection)
-            self.serial_thread.data_received.connect(self.handle_serial_data)
-            self.serial_thread.start()
             
             # Enable setting 
             self.ui.pushButton_3.setEnabled(False)
             self.ui.OpenAllBt.setEnabled(True)
-        except serial.SerialException as e:
+        except (serial.SerialException, OSError, ValueError) as e:
+            log.error("connect failed", extra={"fields": {"port": port_name, "error": e}})
             self.statusBar().showMessage(f"Failed to connect to {port_name}", 2000)
             QMessageBox.critical(self, "Error", f"Failed to connect to {port_name}\n{str(e)}")
 
+    def connect_serial(self, port_name):
+        # 포트를 열고 이 프로세스의 읽기 / 명령 쓰레드를 시작한다; 상태바에 붙일 선로 설정을 돌려준다
+        if port_name.startswith(REPLAY_PREFIX):
+            self.serial_connection = open_replay(port_name, timeout=1)
+            line = ""
+        else:
+            self.serial_connection = open_port(port_name, self.port_settings(port_name))
+            # 실제로 적용된 설정 (저지연 모드는 드라이버가 지원하는 만큼만)
+            line = self.line_text(line_report(self.serial_connection))
+        # 수신/송신 바이트 캡처 (EMRDOOR_CAPTURE=파일 또는 폴더)
+        capture = os.environ.get("EMRDOOR_CAPTURE")
+        if capture:
+            path = capture_path(capture)
+            self.serial_connection = CapturingSerial(self.serial_connection, CaptureWriter(path))
+            log.info("capturing serial traffic", extra={"fields": {"path": path}})
+
+        # 시리얼 읽기 쓰레드 시작
+        replay = port_name.startswith(REPLAY_PREFIX)
+        self.poller = None if replay else self.make_poller(self.serial_connection)
+        pacer = None if replay else self.make_pacer(port_name)
+        self.commands = CommandWriter(self.serial_connection, self.poller, pacer)
+        self.coalescer = self.make_coalescer(self.commands)
+        self.serial_thread = self.start_reader(self.serial_connection, self.commands)
+        return line
+
+    def connect_io_process(self, port_name):
+        # 포트 입출력, 디코딩, 폴링, 송신 속도 조절은 I/O 프로세스에서; 도어 상태는 공유 메모리로 받는다
+        replay = port_name.startswith(REPLAY_PREFIX)
+        port_settings = None if replay else self.port_settings(port_name)
+        capture = os.environ.get("EMRDOOR_CAPTURE")
+        path = capture_path(capture) if capture else None
+        if path:
+            log.info("capturing serial traffic", extra={"fields": {"path": path}})
+        spec = PortSpec(port_name, port_settings, path,
+                        None if replay else self.poll_options(port_settings.baudrate),
+                        None if replay else self.pacer_options())
+        self.serial_thread = self.start_io_process([spec])
+        self.serial_connection = self.serial_thread.io
+        self.commands = RemoteWriter(self.serial_connection, 0)
+        self.coalescer = self.make_coalescer(self.commands)
+        report = self.serial_connection.reports[0]
+        return self.line_text(report) if report else ""
+
+    def line_text(self, report):
+        log.info("line settings", extra={"fields": report})
+        return f" ({report['baudrate']} {report['framing']}{', low latency' if report['low_latency'] else ''})"
+
+    def io_process_enabled(self):
+        value = os.environ.get("EMRDOOR_IO_PROCESS") or self.settings.value("io/process", IO_PROCESS)
+        if str(value).lower() not in ("1", "true", "yes", "on"):
+            return False
+        if not X86:
+            # 공유 메모리의 seqlock은 x86에서만 맞다: 읽기 쓰레드로
+            log.warning("I/O process needs an x86 host, using reader threads", extra={"fields": {
+                "machine": platform.machine()}})
+            return False
+        return True
+
+    def io_workers(self):
+        return int(os.environ.get("EMRDOOR_IO_WORKERS") or self.settings.value("io/workers", IO_WORKERS))
+
+    def poll_options(self, baudrate):
+        # PollScheduler 인자 (폴링 안 함이면 None); I/O 프로세스에는 이것만 넘긴다
+        ceiling = float(self.settings.value("polling/ceiling", POLL_CEILING))
+        if ceiling <= 0:
+            return None
+        max_interval = self.settings.value("polling/max_interval")
+        return {"boards": self.board_count(self.ui.tableWidget.rowCount()),
+                "doors_per_board": self.door_state.doors_per_board, "baudrate": baudrate, "ceiling": ceiling,
+                "min_interval": float(self.settings.value("polling/min_interval", POLL_MIN_INTERVAL)),
+                "max_interval": float(max_interval) if max_interval not in (None, "") else None,
+                "age_limit": float(self.settings.value("polling/age_limit", POLL_AGE_LIMIT))}
+
+    def make_coalescer(self, writer):
+        return CommandCoalescer(writer, float(self.settings.value("commands/window_ms", COMMAND_WINDOW_MS)) / 1e3,
+                                float(self.settings.value("commands/timeout_ms", COMMAND_TIMEOUT_MS)) / 1e3)
+
+    def make_poller(self, connection):
+        options = self.poll_options(connection.baudrate)
+        return None if options is None else PollScheduler(**options)
+
+    def pacer_options(self):
+        if str(self.settings.value("pacing/enabled", "true")).lower() in ("0", "false", "no", "off"):
+            return None
+        return {"initial": float(self.settings.value("pacing/initial", PACING_INITIAL)),
+                "maximum": float(self.settings.value("pacing/maximum", PACING_MAXIMUM)),
+                "timeout": float(self.settings.value("pacing/timeout", PACING_TIMEOUT))}
+
+    def make_pacer(self, port_name):
+        options = self.pacer_options()
+        return None if options is None else Pacer(port_name, **options)
+
+    def board_count(self, rows):
+        # 한 줄 = 도어 하나, 보드마다 doors_per_board 줄
+        return -(-rows // self.door_state.doors_per_board)
+
+    def start_reader(self, connection, writer=None):
+        # 포트마다 읽기 쓰레드 하나 (부하 발생기는 여러 포트를 붙인다)
+        thread = SerialReadThread(connection, writer, self.journal)
+        thread.data_received.connect(self.handle_serial_data)
+        thread.frames_received.connect(self.handle_frames)
+        thread.start()
+        return thread
+
+    def start_io_process(self, specs, workers=None):
+        # 포트들을 I/O 프로세스(들)에 나눠서: 도어 상태를 공유 메모리로 옮기고 (그리는 쪽은 그대로) 보고 쓰레드 시작
+        workers = max(1, min(self.io_workers() if workers is None else workers, len(specs)))
+        state = SharedDoorState(self.door_state.doors_per_board, workers, self.door_state.flags)
+        try:
+            io = IOPool(specs, state, workers)
+        except BaseException:
+            state.close()
+            raise
+        state.mark_dirty(self.door_state.take_dirty())
+        self.door_state = state
+        thread = IOProcessThread(io, state, self.journal)
+        thread.data_received.connect(self.handle_serial_data)
+        thread.frames_received.connect(self.handle_frames)
+        thread.doors_changed.connect(self.handle_changes)
+        thread.start()
+        return thread
+
     def handle_serial_data(self, data):
         if data == "Disconnected":
+            log.warning("serial port disconnected")
+            m_disconnects.inc()
+            self.journal.append(0, 0, EV_DISCONNECT)
+            if self.sender() is self.serial_thread:
+                self.retire_reader()
             self.statusBar().showMessage("Disconnected from COM port", 2000)
             QMessageBox.critical(self, "Error", "Disconnected from COM port")
-            if self.serial_thread:
-                self.serial_thread.stop()
-                self.serial_thread = None
-            self.serial_connection = None
-        else:
-            print(f"Received data: {data}")
 
         
+    def handle_frames(self, frames, read_ns=None):
+        start_ns = time.perf_counter_ns()
+        m_batches_handled.inc()
+        if read_ns is not None:
+            m_queue_ns.record(start_ns - read_ns)
+            if self.unpainted_ns is None:
+                self.unpainted_ns = read_ns
+        changed = 0
+        now = time.monotonic()
+        bitmaps = []    # 연속된 STATUS_BITS는 모아서 한 번에 푼다
+        for frame in frames:
+            if frame.cmd == CMD_STATUS_BITS:
+                bitmaps.append(frame)
+                continue
+            if frame.cmd in (CMD_ACK, CMD_NAK):
+                if self.coalescer is not None:
+                    self.coalescer.resolve(frame)
+                sent_ns = self.command_sent_ns.pop(frame.seq, None)
+                if sent_ns is not None:
+                    m_ack_ns.record(start_ns - sent_ns)
+                if TRACER.enabled:
+                    self.trace_ack(frame.seq, read_ns, start_ns)
+            if frame.cmd == CMD_ACK:
+                log.debug("ack", extra={"fields": {"board": frame.board, "seq": frame.seq}})
+                continue
+            if frame.cmd == CMD_NAK:
+                log.warning("nak", extra={"fields": {"board": frame.board, "seq": frame.seq,
+                                                     "cmd": frame.answers, "reason": frame.reason}})
+                continue
+            if bitmaps:
+                # 도어 상태를 바꾸는 다음 프레임보다 먼저 적용해 순서를 지킨다
+                changed += self.apply_bitmaps(bitmaps, now)
+                bitmaps = []
+            changes = self.door_state.apply(frame)
+            if self.poller is not None:
+                if frame.cmd == CMD_STATUS:
+                    self.poller.status(frame.board, len(changes), now)
+                elif frame.cmd == CMD_EVENT:
+                    self.poller.event(frame.board, now)
+            changed += self.journal_changes(changes)
+        if bitmaps:
+            changed += self.apply_bitmaps(bitmaps, now)
+        m_doors_changed.inc(changed)
+        m_state_ns.record(time.perf_counter_ns() - start_ns)
+        if not self.repaint_timer.isActive():
+            self.repaint_timer.start()
+
+    def handle_changes(self, changed, read_ns):
+        # I/O 프로세스가 공유 메모리에 적용한 변경: 다시 그리기만 예약 (repaint_doors가 pull)
+        m_batches_handled.inc()
+        m_queue_ns.record(time.perf_counter_ns() - read_ns)
+        if self.unpainted_ns is None:
+            self.unpainted_ns = read_ns
+        m_doors_changed.inc(changed)
+        if not self.repaint_timer.isActive():
+            self.repaint_timer.start()
+
+    def apply_bitmaps(self, frames, now):
+        changes = self.door_state.set_bitmaps(frames)
+        if self.poller is not None:
+            per_board = Counter(i // self.door_state.doors_per_board + 1 for i in changes)
+            for frame in frames:
+                self.poller.status(frame.board, per_board[frame.board], now)
+        return self.journal_changes(changes)
+
+    def journal_changes(self, changes):
+        for i in changes:
+            board, door = self.door_state.location(i)
+            self.journal.append(board, door, EV_DOOR_STATE, self.door_state.flags[i])
+        return len(changes)
+
+    def repaint_doors(self):
+        # 바뀐 도어의 상태 아이콘(1~7열)만 갱신
+        start_ns = time.perf_counter_ns()
+        rows = self.ui.tableWidget.rowCount()
+        painted = 0
+        for i in self.door_state.take_dirty():
+            if i >= rows:
+                continue
+            flags = self.door_state.flags[i]
+            for col, flag in enumerate(FLAG_COLUMNS, 1):
+                label = self.ui.tableWidget.cellWidget(i, col)
+                if label is not None:
+                    label.setPixmap(self.pix_on if flags & flag else self.pix_off)
+            painted += 1
+        end_ns = time.perf_counter_ns()
+        m_paint_ns.record(end_ns - start_ns)
+        m_rows_painted.inc(painted)
+        if self.unpainted_ns is not None:
+            m_read_to_paint_ns.record(end_ns - self.unpainted_ns)
+            self.unpainted_ns = None
+        if self.repaint_traces:
+            for trace_id, click_ns, ack_ns in self.repaint_traces:
+                TRACER.span(trace_id, "repaint", ack_ns, end_ns, rows=painted)
+                TRACER.span(trace_id, "command", click_ns, end_ns)
+            self.repaint_traces.clear()
+
+    def trace_ack(self, seq, read_ns, handled_ns):
+        trace = self.command_traces.pop(seq, None)
+        if trace is None:
+            return
+        trace_id, click_ns = trace
+        written_ns = self.commands.written_ns.pop(seq, None) if self.commands else None
+        if written_ns is not None and read_ns is not None:
+            TRACER.span(trace_id, "bus", written_ns, read_ns)
+        if read_ns is not None:
+            TRACER.span(trace_id, "dispatch", read_ns, handled_ns)
+        self.repaint_traces.append((trace_id, click_ns, handled_ns))
+        if not self.repaint_timer.isActive():
+            self.repaint_timer.start()
+
+    def retire_reader(self):
+        # 기다리지 않는다: 읽기 쓰레드가 명령 쓰레드를 멈추고 포트를 닫은 뒤 finished -> port_closed
+        thread, self.serial_thread = self.serial_thread, None
+        if self.coalescer is not None:
+            self.coalescer.stop()   # 못 보냈거나 답을 못 받은 도어 명령은 취소
+        self.coalescer = None
+        self.command_timer.stop()
+        self.commands = None
+        self.poller = None
+        self.serial_connection = None
+        if isinstance(self.door_state, SharedDoorState):
+            # 공유 블록은 I/O 프로세스가 끝난 뒤 port_closed에서 지운다
+            self.door_state = self.door_state.detach()
+        if thread is None:
+            return
+        self.closing[thread] = time.perf_counter_ns()
+        thread.finished.connect(lambda: self.port_closed(thread))
+        thread.stop()
+        if thread.isFinished():
+            self.port_closed(thread)
+
+    def port_closed(self, thread):
+        stop_ns = self.closing.pop(thread, None)
+        if stop_ns is None:
+            return
+        thread.wait()  # finished 뒤라 바로 돌아온다; 실행 중인 QThread를 놓아 버리지 않도록
+        if isinstance(thread, IOProcessThread):
+            thread.state.close()    # 프로세스는 끝났고 GUI는 detach()한 사본을 그린다
+        port = str(getattr(thread.serial_connection, "port", ""))
+        log.info("port closed", extra={"fields": {
+            "port": port, "ms": round((time.perf_counter_ns() - stop_ns) / 1e6, 2)}})
+        self.serial_closed.emit(port)
+
+    def wait_closed(self, timeout_ms=EXIT_TIMEOUT_MS):
+        # 앱 종료 때만: 취소된 쓰레드는 보통 수 ms 안에 끝난다
+        deadline = time.monotonic() + timeout_ms / 1e3
+        for thread in list(self.closing):
+            if not thread.wait(max(0, int((deadline - time.monotonic()) * 1e3))):
+                log.warning("serial thread still running at exit", extra={"fields": {
+                    "port": str(getattr(thread.serial_connection, "port", ""))}})
+                continue
+            self.port_closed(thread)
+
     # 시리얼 통신 종료 
     def close_serial(self):
-        if self.serial_thread and self.serial_thread.isRunning():
-            self.serial_thread.stop()
-            self.serial_thread.wait()
-        if self.serial_connection and self.serial_connection.is_open:
-            self.serial_connection.close()
+        self.retire_reader()
+        self.journal.append(0, 0, EV_DISCONNECT)
+        m_disconnects.inc()
 
         self.ui.pushButton.show()
         self.ui.pushButton_2.hide()
@@ -244,7 +875,60 @@ class MainWindow(QMainWindow):
         self.statusBar().showMessage(f"Disconnected from COM port ", 2000)
     
     def sendAllDoorOpen(self):
-        print(f"all Door Open")
+        if not (self.commands and self.serial_connection and self.serial_connection.is_open):
+            return
+        click_ns = time.perf_counter_ns()
+        trace_id = TRACER.new_trace() if TRACER.enabled else 0
+        self.command_seq = self.commands.next_seq()
+        self.command_sent_ns[self.command_seq] = click_ns
+        self.commands.send(open_door(BROADCAST, self.command_seq, ALL_DOORS), self.command_seq, trace_id)
+        self.journal.append(ALL, ALL, EV_COMMAND, CMD_OPEN)
+        log.info("open all doors", extra={"fields": {"seq": self.command_seq}})
+        if trace_id:
+            self.command_traces[self.command_seq] = (trace_id, click_ns)
+            TRACER.span(trace_id, "gui", click_ns, time.perf_counter_ns(), seq=self.command_seq)
+
+    def send_selected(self, action):
+        # 고른 줄마다 도어 명령 하나; 같은 보드는 CommandCoalescer가 한 프레임으로 묶는다
+        if self.coalescer is None:
+            return []
+        rows = sorted({index.row() for index in self.ui.tableWidget.selectedIndexes()})
+        futures = []
+        for row in rows:
+            board, door = self.door_state.location(row)
+            futures.append(self.coalescer.submit(board, door, action))
+            self.journal.append(board, door, EV_COMMAND, CMD_OPEN if action == ACTION_OPEN else CMD_CLOSE)
+        log.info("door commands", extra={"fields": {"action": action, "doors": len(rows)}})
+        for future in futures:
+            future.add_done_callback(self.door_command_done)
+        if futures and not self.command_timer.isActive():
+            self.command_timer.start(int(self.coalescer.timeout * 1e3))
+        return futures
+
+    def expire_door_commands(self):
+        # 기한이 지난 도어 명령을 실패로 (GUI 쓰레드에서: 콜백이 상태 표시줄을 만진다)
+        if self.coalescer is None:
+            return
+        wait = self.coalescer.expire(time.monotonic())
+        if wait is not None:
+            self.command_timer.start(max(1, int(wait * 1e3) + 1))
+
+    def door_command_done(self, future):
+        # ACK/NAK 처리 중 (GUI 쓰레드) 또는 취소될 때 불린다
+        if future.cancelled():
+            return
+        result = future.result()
+        if result.reason == REASON_TIMEOUT:
+            self.statusBar().showMessage(f"도어 {result.board}-{result.door} 응답 없음", 2000)
+        elif not result.ok:
+            log.warning("door command rejected", extra={"fields": {
+                "board": result.board, "door": result.door, "reason": result.reason}})
+            self.statusBar().showMessage(f"도어 {result.board}-{result.door} 명령 거절", 2000)
+
+    def export_trace(self, path):
+        # 명령 추적 링 버퍼를 Chrome trace JSON으로
+        log.info("trace exported", extra={"fields": {"path": path, "spans": len(TRACER.spans())}})
+        return TRACER.export(path)
         
     def setting_serial(self):
         if self.ui.dockWidget_2.isVisible():
@@ -264,32 +948,81 @@ class MainWindow(QMainWindow):
             self.dialog.row_changed.connect(self.update_table_row)  # Connect signal to slot
             self.dialog.exec()
             
-        except Exception as e:
-            print("An error occurred:", e)
+        except Exception:
+            log.exception("door settings dialog failed")
         
     def update_table_row(self, row_changed):
-        self.ui.tableWidget.setRowCount(row_changed)  # Update the table row count
-        print(row_changed)
+        log.info("table rows changed", extra={"fields": {"rows": row_changed}})
         self.dialog.close()
+        self.build_door_rows(row_changed)
 
-        for i in range( row_changed):
+    def build_door_rows(self, rows):
+        # 도어 한 줄당 상태 아이콘 8칸, 현재 상태로 다시 그린다
+        self.ui.tableWidget.setRowCount(rows)  # Update the table row count
+        if self.poller is not None:
+            self.poller.set_boards(self.board_count(rows))
+        elif isinstance(self.serial_connection, IOPool):
+            self.serial_connection.set_boards(self.board_count(rows))
+        for i in range(rows):
             for j in range( 8):
-                # self.item = QTableWidgetItem()
-                pixmap = QPixmap(u":/image/image/RedOff.png")  # Replace with the path to your image
-                # Scale the pixmap to the desired size, for example, 32x32
-                desired_size = QSize(40, 40)
-                scaled_pixmap = pixmap.scaled(desired_size, Qt.KeepAspectRatio)
-
                 label = QLabel()
                 # label.setFixedSize(150, 150)  # QLabel의 크기를 200x200으로 설정
-                label.setPixmap(scaled_pixmap)
+                label.setPixmap(self.pix_off)
                 label.setAlignment(Qt.AlignCenter)
                 # label.setContentsMargins(5,5,5,5)
                 self.ui.tableWidget.setCellWidget(i, j, label)
-                self.ui.tableWidget.setRowHeight(i, desired_size.height()+5)
+            self.ui.tableWidget.setRowHeight(i, 40+5)
+        self.door_state.mark_dirty(range(min(rows, len(self.door_state))))
+        self.repaint_doors()
+
+
+    def show_event_log(self):
+        # 이벤트 로그 창 (저널을 실시간으로 보여줌)
+        if self.event_log is None:
+            self.event_log = EventLogWindow(JOURNAL_DIR, self)
+        if self.event_log.isVisible():
+            self.event_log.hide()
+        else:
+            self.event_log.show()
+            self.event_log.raise_()
+
+    def door_history(self, doors, start_ns, end_ns):
+        # 도어별 이력 조회 ((board, door) 목록, 시간 범위)
+        try:
+            self.journal.flush()
+        except OSError as e:
+            log.warning("journal flush failed, history is what is on disk", extra={"fields": {"error": e}})
+        return self.journal_index.query(doors, start_ns, end_ns)
+
+    def metrics_snapshot(self):
+        # 단계별 지표 전체 (이름{라벨} -> 값 / 히스토그램 요약)
+        return REGISTRY.snapshot()
+
+    def closeEvent(self, event):
+        if self.serial_thread is not None:
+            self.close_serial()
+        self.wait_closed()
+        self.watchdog.stop()
+        if self.baud_detect is not None:
+            self.baud_detect.wait()
+        if self.watchdog.stalls:
+            log.info("gui stall report\n" + self.watchdog.format_report())
+        if self.emulator is not None:
+            self.emulator.stop()
+        if self.event_log is not None:
+            self.event_log.close()
+            self.event_log.model.close()
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+        if os.environ.get("EMRDOOR_TRACE"):
+            self.export_trace(os.environ["EMRDOOR_TRACE"])
+        self.journal.close()
+        self.journal_index.close()
+        super().closeEvent(event)
 
         
 if __name__ == "__main__":
+    setup_logging(LOG_FILE)
     app = QApplication(sys.argv)
 
     window = MainWindow()
@@ -142,23 +142,7 @@ class Ui_MainWindow(object):
         if (self.tableWidget.rowCount() < 5):
             self.tableWidget.setRowCount(5)
         self.tableWidget.setObjectName(u"tableWidget")
-<<<<<<< HEAD
         self.tableWidget.setGeometry(QRect(70, 120, 831, 631))
-=======
-        self.tableWidget.setGeometry(QRect(30, 90, 951, 781))
-        self.tableWidget.setMinimumSize(QSize(951, 781))
-        self.tableWidget.setMaximumSize(QSize(951, 781))
-        palette = QPalette()
-        brush = QBrush(QColor(170, 255, 127, 255))
-        brush.setStyle(Qt.SolidPattern)
-        palette.setBrush(QPalette.Active, QPalette.Base, brush)
-        palette.setBrush(QPalette.Active, QPalette.Window, brush)
-        palette.setBrush(QPalette.Inactive, QPalette.Base, brush)
-        palette.setBrush(QPalette.Inactive, QPalette.Window, brush)
-        palette.setBrush(QPalette.Disabled, QPalette.Base, brush)
-        palette.setBrush(QPalette.Disabled, QPalette.Window, brush)
-        self.tableWidget.setPalette(palette)
->>>>>>> eb94b4c7a8cb73d97e5730e6117a92f534196ecc
         self.tableWidget.setFont(font)
         self.tableWidget.setStyleSheet(u"QHeaderView::section{\n"
 "font-weight:bold;\n"
@@ -182,13 +166,7 @@ class Ui_MainWindow(object):
         self.tableWidget.setShowGrid(True)
         self.tableWidget.setGridStyle(Qt.PenStyle.DotLine)
         self.tableWidget.setSortingEnabled(False)
-<<<<<<< HEAD
         self.tableWidget.setColumnCount(8)
-=======
-        self.tableWidget.setRowCount(5)
-        self.tableWidget.setColumnCount(8)
-        self.tableWidget.horizontalHeader().setMinimumSectionSize(38)
->>>>>>> eb94b4c7a8cb73d97e5730e6117a92f534196ecc
         MainWindow.setCentralWidget(self.centralwidget)
         self.tableWidget.raise_()
         self.horizontalLayoutWidget.raise_()
@@ -0,0 +1,90 @@
+"""Event log panel: time to jump to and paint arbitrary rows of a large log.
+
+Runs headless with the offscreen Qt platform:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_eventlog --events 10000000
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from emrdoor_journal import EV_DOOR_STATE, HEADER, MAGIC, VERSION, RECORD, segment_name
+from emrdoor_journal_mmap import RECORD_DTYPE
+
+
+def write_synthetic_journal(directory, events, segment_records=1 << 20, seed=1):
+    """Write segments directly (much faster than going through JournalWriter)."""
+    rng = np.random.default_rng(seed)
+    start = time.time_ns() - 365 * 86400 * 10**9
+    written = number = 0
+    while written < events:
+        n = min(segment_records, events - written)
+        records = np.zeros(n, dtype=RECORD_DTYPE)
+        records["ts_ns"] = start + (np.arange(written, written + n, dtype=np.uint64) * 10**6)
+        records["board"] = rng.integers(1, 1251, n)
+        records["door"] = rng.integers(1, 9, n)
+        records["event"] = EV_DOOR_STATE
+        records["value"] = rng.integers(0, 128, n)
+        with open(os.path.join(directory, segment_name(number)), "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, number))
+            records.tofile(f)
+        written += n
+        number += 1
+
+
+def run(events=10_000_000, jumps=50, directory=None):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    from emrdoor_eventlog import EventLogWindow
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    workdir = directory or tempfile.mkdtemp(prefix="emrdoor-eventlog-")
+    result = {"events": events}
+    try:
+        if not os.listdir(workdir):
+            write_synthetic_journal(workdir, events)
+
+        t0 = time.perf_counter()
+        window = EventLogWindow(workdir)
+        window.show()
+        app.processEvents()
+        result["open_ms"] = (time.perf_counter() - t0) * 1e3
+
+        rng = random.Random(3)
+        latencies = []
+        for _ in range(jumps):
+            row = rng.randrange(events)
+            j0 = time.perf_counter()
+            window.jump_to(row)
+            window.view.viewport().repaint()
+            latencies.append(time.perf_counter() - j0)
+        latencies.sort()
+        result["jump_median_ms"] = latencies[len(latencies) // 2] * 1e3
+        result["jump_max_ms"] = latencies[-1] * 1e3
+
+        window.close()
+        window.model.close()
+    finally:
+        if directory is None:
+            shutil.rmtree(workdir, ignore_errors=True)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=10_000_000)
+    parser.add_argument("--jumps", type=int, default=50)
+    parser.add_argument("--dir", help="reuse or keep the synthetic journal in this directory")
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.events, args.jumps, args.dir), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Journal write throughput and indexed door-history queries.
+
+Writes a synthetic year of events for ``--doors`` doors, indexes the sealed
+segments and times "every event for N doors over the last 90 days" queries
+against a record-by-record scan and a vectorized mmap scan of the same
+journal.
+
+    python -m benchmarks.bench_journal --doors 10000 --events-per-door-day 2
+"""
+import argparse
+import json
+import random
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from emrdoor_journal import EV_DOOR_STATE, JournalWriter, read_journal
+from emrdoor_journal_index import JournalIndex, index_journal
+from emrdoor_journal_mmap import JournalView
+
+DAY_NS = 86400 * 10**9
+DOORS_PER_BOARD = 8
+
+
+def synthetic_year(doors, events_per_door_day, seed=1):
+    rng = np.random.default_rng(seed)
+    n = int(doors * events_per_door_day * 365)
+    start = time.time_ns() - 365 * DAY_NS
+    ts = np.sort(rng.integers(start, start + 365 * DAY_NS, n, dtype=np.int64))
+    door = rng.integers(0, doors, n)
+    return ts, door // DOORS_PER_BOARD + 1, door % DOORS_PER_BOARD + 1
+
+
+def run(doors=10000, events_per_door_day=2.0, queries=20, doors_per_query=1,
+        segment_records=1 << 20, directory=None):
+    ts, boards, door_nos = synthetic_year(doors, events_per_door_day)
+    n = len(ts)
+    workdir = directory or tempfile.mkdtemp(prefix="emrdoor-journal-")
+    result = {"events": n, "doors": doors}
+    try:
+        writer = JournalWriter(workdir, segment_records=segment_records, fsync=False)
+        t0 = time.perf_counter()
+        append = writer.append
+        for t, b, d in zip(ts.tolist(), boards.tolist(), door_nos.tolist()):
+            append(b, d, EV_DOOR_STATE, 1, ts_ns=t)
+        t1 = time.perf_counter()
+        writer.close()
+        t2 = time.perf_counter()
+        index_journal(workdir)
+        t3 = time.perf_counter()
+        result["append_events_per_s"] = n / (t1 - t0)
+        result["write_events_per_s"] = n / (t2 - t0)
+        result["index_s"] = t3 - t2
+
+        index = JournalIndex(workdir)
+        rng = random.Random(2)
+        end = int(ts[-1]) + 1
+        start = end - 90 * DAY_NS
+        latencies, hits = [], 0
+        for _ in range(queries):
+            picked = [(rng.randrange(doors) // DOORS_PER_BOARD + 1,
+                       rng.randrange(DOORS_PER_BOARD) + 1) for _ in range(doors_per_query)]
+            q0 = time.perf_counter()
+            found = index.query(picked, start, end)
+            latencies.append(time.perf_counter() - q0)
+            hits += len(found)
+        index.close()
+        latencies.sort()
+        result["query_median_ms"] = latencies[len(latencies) // 2] * 1e3
+        result["query_max_ms"] = latencies[-1] * 1e3
+        result["query_mean_hits"] = hits / queries
+
+        s0 = time.perf_counter()
+        wanted = set(picked)
+        scanned = sum(1 for e in read_journal(workdir)
+                      if (e.board, e.door) in wanted and start <= e.ts_ns < end)
+        result["full_scan_ms"] = (time.perf_counter() - s0) * 1e3
+        # 인덱스 결과가 전체 스캔과 같아야 한다
+        assert scanned == len(found), (scanned, len(found))
+
+        view = JournalView(workdir)
+        m0 = time.perf_counter()
+        board, door = picked[0]
+        result["mmap_count"] = view.count(board=board, door=door, start_ns=start, end_ns=end)
+        result["mmap_scan_ms"] = (time.perf_counter() - m0) * 1e3
+        view.close()
+    finally:
+        if directory is None:
+            shutil.rmtree(workdir, ignore_errors=True)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--doors", type=int, default=10000)
+    parser.add_argument("--events-per-door-day", type=float, default=2.0)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--doors-per-query", type=int, default=1)
+    parser.add_argument("--dir", help="keep the generated journal in this directory")
+    args = parser.parse_args(argv)
+    result = run(args.doors, args.events_per_door_day, args.queries,
+                 args.doors_per_query, directory=args.dir)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Receive-path cost with logging off, sampled, unsampled and the old print().
+
+Each iteration does what the app does for one serial read: journal the
+frame, and hex-encode and log the chunk only when the sampler lets it
+through.  The print() mode hex-encodes every read, as the old app did.
+
+    python -m benchmarks.bench_logging --frames 200000
+"""
+import argparse
+import contextlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+from emrdoor_journal import EV_FRAME, JournalWriter
+from emrdoor_log import Sampler, get_logger, setup_logging, shutdown_logging
+
+FRAME = bytes.fromhex("0201100302000516EF03")
+
+
+def _receive_loop(journal, frames, log, sampler):
+    for _ in range(frames):
+        journal.append(0, 0, EV_FRAME, aux=len(FRAME))
+        if sampler():   # 16진 문자열은 로그에 남길 때만 만든다
+            log.debug("frame received", extra={"fields": {
+                "data": FRAME.hex().upper(), "skipped": sampler.take_suppressed()}})
+
+
+def _print_loop(journal, frames):
+    for _ in range(frames):
+        data = FRAME.hex().upper()
+        journal.append(0, 0, EV_FRAME, aux=len(data) // 2)
+        print(f"Received data: {data}")
+
+
+def run(frames=200_000, every=1000, rounds=5):
+    workdir = tempfile.mkdtemp(prefix="emrdoor-logging-")
+    journal = JournalWriter(os.path.join(workdir, "journal"), fsync=False)
+    log = get_logger("bench")
+    result = {"frames": frames, "every": every}
+    modes = {
+        "off": (logging.WARNING, lambda: _receive_loop(journal, frames, log, Sampler(log, every=every))),
+        "sampled": (logging.DEBUG, lambda: _receive_loop(journal, frames, log, Sampler(log, every=every))),
+        "unsampled": (logging.DEBUG, lambda: _receive_loop(journal, frames, log, Sampler(log, every=1))),
+        "print": (logging.WARNING, lambda: _print_loop(journal, frames)),
+    }
+    best = {}
+    # print()는 실제 fd로: 콘솔처럼 줄 단위 버퍼라 print 한 번이 write() 한 번 (StringIO는 비용을 숨긴다)
+    console = open(os.devnull, "w", buffering=1)
+    try:
+        setup_logging(os.path.join(workdir, "bench.log"), console=False)
+        # 모드를 번갈아 여러 번 돌리고 최소값을 쓴다 (저널/로그 쓰레드 잡음 제거)
+        for _ in range(rounds):
+            for name, (level, loop) in modes.items():
+                get_logger().setLevel(level)
+                journal.flush()
+                t0 = time.perf_counter()
+                with contextlib.redirect_stdout(console):
+                    loop()
+                elapsed = time.perf_counter() - t0
+                best[name] = min(best.get(name, elapsed), elapsed)
+        for name, elapsed in best.items():
+            result[f"{name}_ns_per_frame"] = elapsed / frames * 1e9
+        result["sampled_overhead_pct"] = (best["sampled"] - best["off"]) / best["off"] * 100
+        # 측정 잡음보다 작은 경우를 위해: 기록 1건 비용 / every 로 계산한 값
+        result["sampled_overhead_pct_amortized"] = \
+            (best["unsampled"] - best["off"]) / every / best["off"] * 100
+    finally:
+        shutdown_logging()
+        console.close()
+        journal.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=200_000)
+    parser.add_argument("--every", type=int, default=1000, help="frame log sampling interval")
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.frames, args.every), indent=2))
+
+
+if __name__ == "__main__":
+    main()
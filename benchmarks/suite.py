@@ -0,0 +1,1102 @@
+"""End-to-end benchmark suite.
+
+Stages (all headless: offscreen Qt platform, pty emulator instead of hardware):
+
+  metrics   cost of one counter increment / histogram sample
+  scrape    Prometheus exposition of a 32-port registry: cold, unchanged
+            (cached) and with one port's metrics changed
+  decode    bytes -> frames throughput of FrameDecoder
+  codec     ns per frame of the compiled schema codec for every message
+            type: payload -> message (decode) and fields -> frame bytes
+            (encode)
+  checksum  ns per 16-byte frame of the 8-, 16- and 32-bit checksums: the
+            bit-at-a-time loop, the table loop, compute() (the C fast path
+            where the polynomial has one) and the bulk call over 10,000
+            frames
+  state     frames -> DoorState update throughput
+  bitmap    one STATUS_BITS sweep of 10,000 doors (40 boards x 250 doors and
+            250 x 40) into DoorState: vectorized set_bitmaps() vs a per-door
+            loop, with no door and with 1% of the doors changed
+  serial    emulator -> pty -> pyserial read -> decode throughput
+  baud      wire-paced throughput and POLL round trip at each common baud
+            rate, and how long autodetect takes to find the emulator's rate
+  lowlat    POLL round trip with the default line settings and in low-latency
+            mode (pty emulator, or EMRDOOR_BENCH_PORT=/dev/ttyUSB0 for a real
+            adapter; the ioctl needs real hardware to have any effect)
+  polling   status polling of 10,000 doors (5 ports x 250 boards x 8 doors,
+            115200, 50% of each bus) in simulated time: how long an
+            unreported door change stays unseen, adaptive vs plain
+            round-robin (mean / p99 / max); and command -> ACK
+            latency on the emulator with polling off / using 90% of the bus
+  pacing    240 single-door commands burst at 2 boards that hold 4 frames
+            while busy and drop the rest: fixed line-rate sending vs AIMD
+            per-board pacing (time until every command is ACKed, frames the
+            emulator dropped, retries, commands given up, final rates)
+  repaint   DoorState change -> MainWindow grid repaint latency
+  stall     GUI stall detection: a 1600-row grid rebuild run from a timer,
+            caught by the event-loop watchdog with a stack sample
+  command   sendAllDoorOpen() click -> ACK received latency
+  coalesce  open / close all 64 doors of 8 boards from the grid selection,
+            one frame per door (window 0) vs merged per board (20 ms
+            window): time until every door's result is in, command + ACK
+            bytes on the bus, frames sent
+  trace     command phases (gui/queue/write/bus/dispatch/repaint) from the
+            command tracer, p50 per phase
+  replay    capture replayed as fast as possible through the app's full
+            receive pipeline (SerialReadThread -> handle_frames -> grid)
+  scale     8 ports x 25 boards through the multi-port receive path with a
+            site-wide status resync (emrdoor_loadgen herd profile)
+  ioproc    event storms read by reader threads in the GUI process vs one
+            I/O process writing the shared-memory door state: wide (1600
+            doors, 8,000 events/s) and hot (128 doors, 48,000 events/s);
+            events/s, GUI frame rate (16 ms timer ticks per second, p99
+            gap), CPU time of the GUI thread, change -> repaint latency
+  workers   event throughput of 4 ports x 32 boards sharded over 1, 2 and 4
+            I/O processes (IOPool) with every port's emulator in its own
+            process running flat out: events/s reported back to the main
+            process, speedup over one worker (null where the host has
+            fewer cores than workers), bytes the emulators dropped
+  shutdown  disconnect with a reader blocked in read() and commands queued:
+            time the GUI thread is blocked and time until the port is closed,
+            the same for 32 ports at once, and window close (app exit)
+  iocrash   the I/O process killed while connected: time until the GUI has
+            retired the connection and drawn from its own copy of the
+            door state (fails if anything raised on the way)
+  startup   process start -> main window shown
+
+Results are written as JSON; ``--compare`` checks them against a stored
+baseline and exits with status 1 when a metric regressed by more than
+``--threshold`` percent, or when a stage that ran no longer reports one of
+its baseline metrics.  Metric names ending in ``_per_s`` are
+higher-is-better, everything else (``_ms``, ``_us``, ``_s``) lower-is-better.
+
+    python -m benchmarks.suite --output bench.json
+    python -m benchmarks.suite --compare bench-baseline.json --threshold 10
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+from emrdoor_protocol import (ALL_DOORS, BROADCAST, CMD_ACK, FrameDecoder, door_event, open_door,  # noqa: E402
+                              status, status_bits)
+from emrdoor_state import DoorState  # noqa: E402
+
+
+def _percentiles(samples, scale=1e3, unit="ms"):
+    samples = sorted(samples)
+    pick = lambda q: samples[min(len(samples) - 1, int(q * len(samples)))] * scale  # noqa: E731
+    return {f"p50_{unit}": pick(0.50), f"p99_{unit}": pick(0.99), f"max_{unit}": samples[-1] * scale}
+
+
+def _event_stream(events, boards=200, doors=8, seed=1):
+    rng = random.Random(seed)
+    return b"".join(door_event(rng.randrange(boards) + 1, i & 0xFF, rng.randrange(doors) + 1,
+                               rng.randrange(128)) for i in range(events))
+
+
+# -- stages ---------------------------------------------------------------
+
+def bench_metrics(ops=1_000_000):
+    from emrdoor_metrics import Registry
+
+    registry = Registry()
+    counter = registry.counter("bench_total")
+    histogram = registry.histogram("bench_ns")
+    values = [random.Random(1).getrandbits(24) for _ in range(1024)]
+    result = {}
+    for name, op in (("counter", counter.inc), ("histogram", histogram.record),
+                     ("baseline", lambda v: None)):
+        t0 = time.perf_counter()
+        for i in range(ops):
+            op(values[i & 1023])
+        result[name] = (time.perf_counter() - t0) / ops * 1e9
+    # 루프와 호출 자체 비용은 뺀다
+    return {"counter_inc_ns": result["counter"] - result["baseline"],
+            "histogram_record_ns": result["histogram"] - result["baseline"]}
+
+
+def bench_scrape(ports=32, rounds=200):
+    from emrdoor_metrics import Registry
+    from emrdoor_metrics_http import Exposition
+
+    registry = Registry()
+    rng = random.Random(1)
+    for p in range(ports):
+        port = f"/dev/ttyUSB{p}"
+        registry.counter("serial_read_bytes_total", "bytes read", port=port).inc(rng.randrange(10**9))
+        registry.counter("frames_decoded_total", "frames decoded", port=port).inc(rng.randrange(10**8))
+        registry.counter("frame_errors_total", "decoder resyncs", port=port)
+        decode = registry.histogram("decode_ns", "decode time per read", port=port)
+        for _ in range(1000):
+            decode.record(rng.randrange(1, 10**6))
+    for name in ("frame_queue_ns", "state_update_ns", "paint_ns", "command_ack_ns"):
+        histogram = registry.histogram(name)
+        for _ in range(1000):
+            histogram.record(rng.randrange(1, 10**8))
+    exposition = Exposition(registry)
+
+    def timed(prepare=None):
+        samples = []
+        for _ in range(rounds):
+            if prepare:
+                prepare()
+            t0 = time.perf_counter()
+            exposition.render()
+            samples.append(time.perf_counter() - t0)
+        return min(samples) * 1e6
+
+    t0 = time.perf_counter()
+    body = exposition.render()
+    cold = (time.perf_counter() - t0) * 1e6
+    cached = timed()
+    one = registry.metrics("decode_ns")[0]
+    changed = timed(lambda: one.record(rng.randrange(1, 10**6)))
+    return {"cold_us": cold, "cached_us": cached, "one_changed_us": changed,
+            "bytes": len(body), "series": len(registry.metrics())}
+
+
+def bench_decode(events=200_000, chunk=4096):
+    data = _event_stream(events)
+    decoder = FrameDecoder()
+    t0 = time.perf_counter()
+    frames = 0
+    for i in range(0, len(data), chunk):
+        frames += len(decoder.feed(data[i:i + chunk]))
+    elapsed = time.perf_counter() - t0
+    assert frames == events and not decoder.errors
+    return {"frames_per_s": frames / elapsed, "mbytes_per_s": len(data) / elapsed / 1e6,
+            "ns_per_frame": elapsed / frames * 1e9}
+
+
+def bench_codec(rounds=100_000, doors=8):
+    from emrdoor_protocol import DECODERS, ENCODERS, SCHEMA
+
+    samples = {"ack": (0x20,), "nak": (0x20, 2), "door_event": (3, 1), "status": (1, bytes(doors)),
+               "status_bitmap": (1, bytes(doors // 8)), "open_door": (3,), "close_door": (3,),
+               "door_actions": ([(1, 1), (2, 0), (3, 1)],), "poll": ()}
+    def per_call(fn, args):
+        t0 = time.perf_counter()
+        for _ in range(rounds):
+            fn(*args)
+        return (time.perf_counter() - t0) / rounds * 1e9
+
+    result = {}
+    for kind in SCHEMA:
+        encode = ENCODERS[kind.encoder]
+        args = (1, 5) + samples[kind.encoder]
+        (frame,) = FrameDecoder().feed(encode(*args))
+        decode, header = DECODERS[kind.cmd], tuple(frame[:4])
+        for name, fn, fn_args in (("decode", decode, header), ("encode", encode, args)):
+            # 루프와 호출 자체 비용은 뺀다
+            result[f"{kind.name.lower()}_{name}_ns"] = per_call(fn, fn_args) - per_call(lambda *a: None, fn_args)
+    return result
+
+
+def bench_checksum(frames=10_000, size=16, naive_frames=500):
+    from emrdoor_checksum import CRC8, CRC16_MODBUS, CRC16_XMODEM, CRC32, LRC, Checksum
+
+    rng = random.Random(1)
+    chunks = [bytes(rng.randrange(256) for _ in range(size)) for _ in range(frames)]
+    result = {}
+
+    def per_frame(fn, items, repeat=3):
+        samples = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            for chunk in items:
+                fn(chunk)
+            samples.append(time.perf_counter() - t0)
+        return min(samples) / len(items) * 1e9
+
+    # C 경로에 init을 넘기는 방식은 대칭이 아닌 init에서만 드러난다 (0xFFFFFFFF는 뒤집어도 같다)
+    for spec in (Checksum("crc-32/init-12345678", 32, 0x04C11DB7, 0x12345678, True),
+                 Checksum("crc-16/aug-ccitt", 16, 0x1021, 0x1D0F)):
+        table = Checksum(spec.name, spec.width, spec.poly, spec.init, spec.reflect, spec.xorout, fast=False)
+        expected = [spec.bitwise(c) for c in chunks[:naive_frames]]
+        if ([spec.compute(c) for c in chunks[:naive_frames]] != expected
+                or [table.compute(c) for c in chunks[:naive_frames]] != expected):
+            raise RuntimeError(f"{spec.name}: fast and table paths disagree")
+
+    for spec in (LRC, CRC8, CRC16_XMODEM, CRC16_MODBUS, CRC32):
+        name = spec.name.replace("/", "_").replace("-", "")
+        table = Checksum(spec.name, spec.width, spec.poly, spec.init, spec.reflect, spec.xorout, fast=False)
+        expected = [spec.bitwise(c) for c in chunks[:naive_frames]]
+        if table.many(chunks[:naive_frames]) != expected or spec.many(chunks[:naive_frames]) != expected:
+            raise RuntimeError(f"{spec.name} disagrees with the bit-at-a-time loop")
+        result[f"{name}_naive_ns"] = per_frame(spec.bitwise, chunks[:naive_frames], 1)
+        result[f"{name}_table_ns"] = per_frame(table.compute, chunks)
+        result[f"{name}_compute_ns"] = per_frame(spec.compute, chunks)
+        t0 = time.perf_counter()
+        spec.many(chunks)
+        result[f"{name}_bulk_ns"] = (time.perf_counter() - t0) / frames * 1e9
+    return result
+
+
+def bench_state(events=200_000, boards=200, doors=8):
+    frames = FrameDecoder().feed(_event_stream(events, boards, doors))
+    frames += FrameDecoder().feed(b"".join(
+        status(b, 0, 1, bytes(random.Random(b).randrange(128) for _ in range(doors)))
+        for b in range(1, boards + 1)))
+    state = DoorState(doors_per_board=doors)
+    t0 = time.perf_counter()
+    for frame in frames:
+        state.apply(frame)
+    elapsed = time.perf_counter() - t0
+    return {"frames_per_s": len(frames) / elapsed, "ns_per_frame": elapsed / len(frames) * 1e9}
+
+
+def _set_bitmaps_per_door(state, frames):
+    # 비교용: 도어마다 비트를 꺼내 비교하는 단순한 루프
+    changed = []
+    for frame in frames:
+        first, bits = frame.first_door, frame.bits
+        for k in range(min(len(bits) * 8, state.doors_per_board - first + 1)):
+            i = state.index(frame.board, first + k)
+            old = state.flags[i]
+            new = (old & ~1) | (bits[k >> 3] >> (k & 7)) & 1
+            if new != old:
+                state.flags[i] = new
+                changed.append(i)
+    return changed
+
+
+def bench_bitmap(doors=10_000, changed=0.01, rounds=50):
+    rng = random.Random(1)
+    result = {}
+    for boards in (40, 250):
+        per_board = doors // boards
+        before = bytes(rng.randrange(128) for _ in range(doors))
+        after = bytearray(before)
+        for i in rng.sample(range(doors), int(doors * changed)):
+            after[i] ^= 1
+        sweeps = {}
+        for name, flags in (("same", before), ("changed", after)):
+            sweeps[name] = FrameDecoder().feed(b"".join(
+                status_bits(b + 1, 0, 1, flags[b * per_board:(b + 1) * per_board]) for b in range(boards)))
+        for name, frames in sweeps.items():
+            for method, apply in (("vector", DoorState.set_bitmaps), ("loop", _set_bitmaps_per_door)):
+                samples = []
+                for _ in range(rounds):
+                    state = DoorState(per_board, doors)
+                    state.flags[:] = before
+                    t0 = time.perf_counter()
+                    found = apply(state, frames)
+                    samples.append(time.perf_counter() - t0)
+                if len(found) != (0 if name == "same" else int(doors * changed)):
+                    raise RuntimeError(f"{method} found {len(found)} changed doors")
+                result[f"{boards}x{per_board}_{name}_{method}_us"] = min(samples) * 1e6
+    return result
+
+
+def bench_serial(events=100_000, boards=200, doors=8):
+    import serial
+    from emrdoor_emulator import DoorControllerEmulator
+
+    with DoorControllerEmulator(boards, doors, baudrate=None, seed=1) as emulator:
+        port = serial.Serial(emulator.port, 115200, timeout=0.05)
+        decoder = FrameDecoder()
+        emulator.burst(events)
+        t0 = time.perf_counter()
+        frames = 0
+        while frames < events and time.perf_counter() - t0 < 30:
+            frames += len(decoder.feed(port.read(max(1, port.in_waiting))))
+        elapsed = time.perf_counter() - t0
+        port.close()
+    return {"frames_per_s": frames / elapsed, "mbytes_per_s": emulator.bytes_sent / elapsed / 1e6}
+
+
+def bench_baud(rates=(9600, 38400, 115200, 460800, 921600), seconds=1.0, detect=115200):
+    from emrdoor_emulator import DoorControllerEmulator
+    from emrdoor_ports import DEFAULT_SETTINGS, autodetect, handshake, open_port
+
+    result = {}
+    for rate in rates:
+        with DoorControllerEmulator(200, 8, baudrate=rate, response_delay=0, seed=1, check_line=True) as emulator:
+            port = open_port(emulator.port, DEFAULT_SETTINGS._replace(baudrate=rate, timeout=0.05))
+            rtts = handshake(port, attempts=20)
+            decoder = FrameDecoder()
+            # 측정 시간보다 넉넉히 (이벤트 프레임 9바이트 = 8N1로 90비트)
+            emulator.burst(int(rate / 90 * seconds * 2))
+            frames = len(decoder.feed(port.read(1)))
+            t0 = time.perf_counter()
+            while time.perf_counter() - t0 < seconds:
+                frames += len(decoder.feed(port.read(max(1, port.in_waiting))))
+            elapsed = time.perf_counter() - t0
+            port.close()
+        result[f"b{rate}_frames_per_s"] = frames / elapsed
+        if rtts:
+            result[f"b{rate}_poll_ms"] = sorted(rtts)[len(rtts) // 2] * 1e3
+    with DoorControllerEmulator(4, 8, baudrate=detect, event_rate=20, seed=1, check_line=True) as emulator:
+        t0 = time.perf_counter()
+        found, _ = autodetect(emulator.port)
+        result["autodetect_s"] = time.perf_counter() - t0
+        result["detected"] = found and found.baudrate
+    return result
+
+
+def bench_lowlat(polls=500, baud=115200):
+    from emrdoor_emulator import DoorControllerEmulator
+    from emrdoor_ports import DEFAULT_SETTINGS, handshake, line_report, open_port
+
+    def measure(port_name):
+        result = {}
+        for mode, low_latency in (("default", False), ("lowlat", True)):
+            port = open_port(port_name, DEFAULT_SETTINGS._replace(baudrate=baud, timeout=0.05,
+                                                                   low_latency=low_latency))
+            try:
+                report = line_report(port)
+                rtts = handshake(port, attempts=polls, timeout=1.0)
+            finally:
+                port.close()
+            if not rtts:
+                raise RuntimeError(f"no POLL reply on {port_name} ({mode})")
+            for key, value in _percentiles(rtts).items():
+                result[f"{mode}_{key}"] = value
+            result[f"{mode}_async_low_latency"] = report["low_latency"]
+            result[f"{mode}_latency_timer"] = report["latency_timer_ms"]
+        return result
+
+    port_name = os.environ.get("EMRDOOR_BENCH_PORT")
+    if port_name:
+        return dict(measure(port_name), port=port_name)
+    with DoorControllerEmulator(4, 8, baudrate=baud, response_delay=0, seed=1) as emulator:
+        return dict(measure(emulator.port), port="pty")
+
+
+def _simulate_polling(scheduler, duration=120.0, hot=0.05, hot_rate=0.5, cold_rate=1 / 900,
+                      rotate=20.0, seed=1):
+    """Changes no controller reports, found only by polling; returns detection delays (s)."""
+    rng = random.Random(seed)
+    boards = scheduler.boards
+    t0 = t = time.monotonic()   # 스케줄러는 monotonic 기준, 시간은 가상으로 흐른다
+    hot_set, rates, next_change = set(), [0.0] * (boards + 1), [0.0] * (boards + 1)
+
+    def rehash(now):
+        hot_set.clear()
+        hot_set.update(rng.sample(range(1, boards + 1), max(1, int(boards * hot))))
+        for b in range(1, boards + 1):
+            rates[b] = hot_rate if b in hot_set else cold_rate
+            next_change[b] = now + rng.expovariate(rates[b])
+
+    rehash(t)
+    delays, bus, staleness = [], 0.0, 0.0
+    next_rotate, next_sample = t + rotate, t + 1.0
+    while t < t0 + duration:
+        board, wait = scheduler.due(t)
+        if board is None:
+            t += wait
+        else:
+            answered = t + scheduler.poll_cost
+            found = 0
+            while next_change[board] <= t:
+                delays.append(answered - next_change[board])
+                next_change[board] += rng.expovariate(rates[board])
+                found += 1
+            scheduler.status(board, found, answered)
+            bus += scheduler.poll_cost
+        if t >= next_rotate:
+            rehash(t)
+            next_rotate += rotate
+        if t >= next_sample:
+            staleness = max(staleness, scheduler.staleness(t))
+            next_sample += 1.0
+    return delays, bus / (t - t0), staleness
+
+
+def bench_pacing(commands=120, boards=2, baud=115200, buffer=4):
+    import threading
+
+    import serial
+    from emrdoor_commands import CommandWriter
+    from emrdoor_emulator import DoorControllerEmulator
+    from emrdoor_metrics import REGISTRY
+    from emrdoor_pacing import Pacer
+
+    result = {}
+    unpaced = {"initial": 1e6, "minimum": 1e6, "maximum": 1e6}    # 선로 속도 그대로, 재전송만
+    for name, options in (("unpaced", unpaced), ("aimd", {})):
+        emulator = DoorControllerEmulator(boards, 8, baudrate=baud, rx_buffer=buffer, seed=1)
+        connection = serial.Serial(emulator.start(), baud, timeout=0.05)
+        pacer = Pacer(f"bench-{name}", **options)
+        writer = CommandWriter(connection, pacer=pacer)
+        acked, running = set(), [True]
+
+        def read():
+            decoder = FrameDecoder()
+            while running[0]:
+                for frame in decoder.feed(connection.read(max(1, connection.in_waiting))):
+                    if frame.cmd == CMD_ACK:
+                        acked.add(frame.seq)
+                    writer.answered(frame, time.monotonic())
+
+        reader = threading.Thread(target=read, daemon=True)
+        reader.start()
+        retries, timeouts = REGISTRY.total("command_retries_total"), REGISTRY.total("command_timeouts_total")
+        t0 = time.perf_counter()
+        for i in range(commands * boards):
+            seq = writer.next_seq()
+            writer.send(open_door(i % boards + 1, seq, i // boards % 8 + 1), seq)
+        while (len(acked) + REGISTRY.total("command_timeouts_total") - timeouts < commands * boards
+               and time.perf_counter() - t0 < 60):
+            time.sleep(0.005)
+        elapsed = time.perf_counter() - t0
+        result[f"{name}_done_s"] = elapsed
+        result[f"{name}_acked_per_s"] = len(acked) / elapsed
+        result[f"{name}_dropped"] = emulator.rx_dropped
+        result[f"{name}_retries"] = REGISTRY.total("command_retries_total") - retries
+        result[f"{name}_given_up"] = REGISTRY.total("command_timeouts_total") - timeouts
+        if name == "aimd":
+            result["aimd_final_rate_per_s"] = min(pacer.rate(b + 1) for b in range(boards))
+        writer.stop()
+        writer.join()
+        running[0] = False
+        reader.join()
+        connection.close()
+        emulator.stop()
+    return result
+
+
+def bench_polling(ports=5, boards=250, baud=115200, ceiling=0.5):
+    from emrdoor_polling import PollScheduler
+
+    # 보드 주소는 1바이트라 한 버스에 254개까지: 10,000 도어 = 포트 5개, 포트마다 스케줄러 하나
+    result = {"doors": ports * boards * 8}
+    for name, options in (("adaptive", {}), ("adaptive_age1.1", {"age_limit": 1.1}),
+                          ("adaptive_uncapped", {"age_limit": float("inf")}),
+                          ("roundrobin", {"min_interval": 0.0, "max_interval": 0.0, "backoff": 1.0})):
+        delays, utilization, staleness = [], 0.0, 0.0
+        for port in range(ports):
+            scheduler = PollScheduler(boards, 8, baud, ceiling, **options)
+            d, u, s = _simulate_polling(scheduler, seed=port)
+            delays += d
+            utilization = max(utilization, u)
+            staleness = max(staleness, s)
+        result[f"{name}_unseen_mean_s"] = statistics.fmean(delays)
+        for key, value in _percentiles(delays, 1, "s").items():
+            result[f"{name}_unseen_{key}"] = value
+        result[f"{name}_bus_utilization"] = utilization
+        result[f"{name}_staleness_max_s"] = staleness
+
+    app, window = _main_window(f"boards=32,doors=8,baud={baud},delay=0.002")
+    try:
+        window.build_door_rows(32 * 8)
+        for name, poll_ceiling in (("off", 0), ("busy", 0.9)):
+            window.settings.setValue("polling/ceiling", poll_ceiling)
+            window.on_button_click()
+            started = time.perf_counter()
+            acks = []
+            window.serial_thread.frames_received.connect(
+                lambda frames: acks.extend(time.perf_counter() for f in frames if f.cmd == CMD_ACK))
+            _spin(app, lambda: False, 0.5)
+            samples = []
+            for i in range(50):
+                t0 = time.perf_counter()
+                window.sendAllDoorOpen()
+                if not _spin(app, lambda: len(acks) > i):
+                    raise RuntimeError("no ACK from emulator")
+                samples.append(acks[i] - t0)
+                _spin(app, lambda: False, 0.01)
+            for key, value in _percentiles(samples).items():
+                result[f"command_{name}_{key}"] = value
+            if window.poller is not None:
+                result["polls_per_s"] = window.poller.polls / (time.perf_counter() - started)
+            window.close_serial()
+        return result
+    finally:
+        window.close()
+
+
+def _main_window(emulator_spec=None, replay=None):
+    """Import the app and build a MainWindow whose journal and settings live in a temp dir."""
+    from PySide6.QtWidgets import QApplication
+
+    for name, value in (("EMRDOOR_EMULATOR", emulator_spec), ("EMRDOOR_REPLAY", replay)):
+        if value:
+            os.environ[name] = value
+        else:
+            os.environ.pop(name, None)
+    sys.path.insert(0, ROOT)
+    import EMRDoor_App
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    scratch = tempfile.mkdtemp(prefix="emrdoor-bench-")
+    EMRDoor_App.JOURNAL_DIR = os.path.join(scratch, "journal")
+    EMRDoor_App.SETTINGS_FILE = os.path.join(scratch, "emrdoor.ini")   # 포트 / 단계 설정이 저장소의 ini에 남지 않도록
+    window = EMRDoor_App.MainWindow()
+    window.show()
+    app.processEvents()
+    return app, window
+
+
+def _spin(app, until, timeout=2.0):
+    end = time.perf_counter() + timeout
+    while not until() and time.perf_counter() < end:
+        app.processEvents()
+    return until()
+
+
+def bench_repaint(rounds=200):
+    app, window = _main_window()
+    try:
+        state = window.door_state
+        rows = window.ui.tableWidget.rowCount()
+        samples = []
+        for r in range(rounds):
+            for i in range(rows):
+                board, door = state.location(i)
+                state.set(board, door, (r + i) & 0x7F)
+            t0 = time.perf_counter()
+            window.repaint_doors()
+            window.ui.tableWidget.viewport().repaint()
+            samples.append(time.perf_counter() - t0)
+        result = _percentiles(samples)
+        result["doors"] = rows
+        return result
+    finally:
+        window.close()
+
+
+def bench_stall(rows=1600):
+    from PySide6.QtCore import QTimer
+
+    app, window = _main_window()
+    watchdog = window.watchdog
+    try:
+        _spin(app, lambda: False, timeout=0.3)
+        before = len(watchdog.stalls)
+        t = []
+        QTimer.singleShot(0, lambda: (t.append(time.perf_counter()), window.build_door_rows(rows),
+                                      t.append(time.perf_counter())))
+        if not _spin(app, lambda: len(watchdog.stalls) > before, timeout=30):
+            raise RuntimeError("grid rebuild stall was not detected")
+        stall = watchdog.stalls[before]
+        if "build_door_rows" not in stall.where and not any(
+                f.name == "build_door_rows" for f in stall.stack):
+            raise RuntimeError(f"stall attributed to {stall.where}")
+        return {"rebuild_ms": (t[1] - t[0]) * 1e3, "stall_ms": stall.duration * 1e3,
+                "lag_p99_ms": watchdog_lag_p99() / 1e6, "rows": rows}
+    finally:
+        window.close()
+
+
+def watchdog_lag_p99():
+    from emrdoor_metrics import REGISTRY
+    return max((h.percentile(0.99) for h in REGISTRY.metrics("event_loop_lag_ns")), default=0)
+
+
+def bench_command(rounds=50, baud=115200):
+    app, window = _main_window(f"boards=4,doors=8,baud={baud},delay=0.002")
+    try:
+        window.on_button_click()
+        acks = []
+        window.serial_thread.frames_received.connect(
+            lambda frames: acks.extend(time.perf_counter() for f in frames if f.cmd == CMD_ACK))
+        samples = []
+        for i in range(rounds):
+            t0 = time.perf_counter()
+            window.sendAllDoorOpen()
+            if not _spin(app, lambda: len(acks) > i):
+                raise RuntimeError("no ACK from emulator")
+            samples.append(acks[i] - t0)
+        result = _percentiles(samples)
+        result["baud"] = baud
+        return result
+    finally:
+        window.close_serial()
+        window.close()
+
+
+def bench_coalesce(rounds=10, boards=8, baud=115200):
+    from emrdoor_protocol import ACTION_CLOSE, ACTION_OPEN, OVERHEAD
+
+    app, window = _main_window(f"boards={boards},doors=8,baud={baud},delay=0.002")
+    result = {}
+    try:
+        window.build_door_rows(boards * 8)
+        window.settings.setValue("polling/ceiling", 0)
+        for name, window_ms in (("per_door", 0), ("merged", 20)):
+            window.settings.setValue("commands/window_ms", window_ms)
+            window.on_button_click()
+            written = []
+            write = window.serial_connection.write
+            window.serial_connection.write = lambda data: written.append(len(data)) or write(data)
+            acks = []
+            window.serial_thread.frames_received.connect(
+                lambda frames: acks.extend(f for f in frames if f.cmd == CMD_ACK))
+            window.ui.tableWidget.selectAll()
+            samples = []
+            for r in range(rounds):
+                t0 = time.perf_counter()
+                futures = window.send_selected(ACTION_OPEN if r % 2 == 0 else ACTION_CLOSE)
+                if not _spin(app, lambda: all(f.done() for f in futures)):
+                    raise RuntimeError("door commands not answered")
+                samples.append(time.perf_counter() - t0)
+                if not all(f.result().ok for f in futures):
+                    raise RuntimeError("door command rejected")
+            result[f"{name}_group_ms"] = sorted(samples)[len(samples) // 2] * 1e3
+            result[f"{name}_bus_bytes"] = (sum(written) + len(acks) * (OVERHEAD + 1)) / rounds
+            result[f"{name}_frames"] = len(written) / rounds
+            window.close_serial()
+        return result
+    finally:
+        window.close()
+
+
+def bench_trace(rounds=50, baud=115200):
+    from emrdoor_trace import TRACER
+
+    app, window = _main_window(f"boards=4,doors=8,baud={baud},delay=0.002")
+    TRACER.clear()
+    TRACER.start()
+    try:
+        window.on_button_click()
+        for i in range(rounds):
+            window.sendAllDoorOpen()
+            if not _spin(app, lambda: len(TRACER.durations().get("command", ())) > i):
+                raise RuntimeError("command trace did not complete")
+        result = {}
+        for phase, samples in TRACER.durations().items():
+            result[f"{phase}_p50_ms"] = sorted(samples)[len(samples) // 2] * 1e3
+        return result
+    finally:
+        TRACER.stop()
+        window.close_serial()
+        window.close()
+
+
+def synthetic_capture(path, events=100_000, seed=1):
+    """Write a capture of random door events split into serial-read sized chunks."""
+    from emrdoor_capture import RX, CaptureWriter
+
+    rng = random.Random(seed)
+    data = _event_stream(events, seed=seed)
+    capture = CaptureWriter(path)
+    ts, pos = time.monotonic_ns(), 0
+    while pos < len(data):
+        size = rng.randint(1, 256)
+        capture.record(RX, data[pos:pos + size], ts)
+        ts += size * 87_000  # 115200 baud
+        pos += size
+    capture.close()
+    return len(data)
+
+
+def bench_replay(events=100_000):
+    path = os.path.join(tempfile.mkdtemp(prefix="emrdoor-bench-"), "synthetic.emrcap")
+    nbytes = synthetic_capture(path, events)
+    app, window = _main_window(replay=f"{path}@max")
+    try:
+        received = [0]
+        handle_frames = window.handle_frames
+
+        def counting(frames, read_ns=None):
+            handle_frames(frames, read_ns)
+            received[0] += len(frames)
+
+        # 쓰레드가 시작되기 전에 연결되도록 슬롯 자체를 감싼다
+        window.handle_frames = counting
+        t0 = time.perf_counter()
+        window.on_button_click()
+        if not _spin(app, lambda: received[0] >= events, timeout=60):
+            raise RuntimeError(f"replay stalled at {received[0]} of {events} frames")
+        elapsed = time.perf_counter() - t0
+        return {"frames_per_s": events / elapsed, "mbytes_per_s": nbytes / elapsed / 1e6}
+    finally:
+        window.close_serial()
+        window.close()
+
+
+def bench_scale(ports=8, boards=25, rate=5.0, duration=3.0):
+    from emrdoor_loadgen import run_load
+
+    app, window = _main_window()
+    try:
+        return run_load(app, window, ports, boards, "herd", rate, duration)
+    finally:
+        window.close()
+
+
+def bench_ioproc(storms=(("wide", 8, 25, 40.0), ("hot", 8, 2, 3000.0)), duration=3.0):
+    from PySide6.QtCore import Qt, QTimer
+    from emrdoor_loadgen import run_load
+
+    result = {"cpus": os.cpu_count()}
+    for storm, ports, boards, rate in storms:
+        for mode, process in (("thread", False), ("process", True)):
+            # 창은 매번 새로: 같은 창에 큰 표를 다시 만들면 그 뒤의 이벤트 처리가 몇 배 느려진다
+            app, window = _main_window()
+            try:
+                # GUI 프레임: 16 ms 타이머가 실제로 몇 번, 얼마나 늦게 돌았나
+                ticks = []
+                timer = QTimer()
+                timer.setTimerType(Qt.PreciseTimer)
+                timer.timeout.connect(lambda: ticks.append(time.perf_counter()))
+                timer.start(16)
+                cpu = time.thread_time()    # GUI 쓰레드가 쓴 CPU (디코딩 / 상태 / 저널 / 그리기)
+                load = run_load(app, window, ports, boards, "steady", rate, duration, process=process)
+                cpu = time.thread_time() - cpu
+                timer.stop()
+            finally:
+                window.close()
+                window.deleteLater()
+            gaps = [b - a for a, b in zip(ticks, ticks[1:])]
+            key = f"{storm}_{mode}"
+            result[f"{key}_events_per_s"] = load["events_per_s"]
+            result[f"{key}_gui_fps_per_s"] = len(gaps) / (ticks[-1] - ticks[0])
+            result[f"{key}_tick_gap_p99_ms"] = _percentiles(gaps)["p99_ms"]
+            result[f"{key}_gui_cpu_s"] = cpu
+            result[f"{key}_paint_p50_ms"] = load["p50_ms"]
+            result[f"{key}_paint_p99_ms"] = load["p99_ms"]
+    return result
+
+
+def _feed(conn, boards, doors, seed):
+    """Emulator process for bench_workers: sends its pty, then runs at each rate it is sent (None ends)."""
+    from emrdoor_emulator import DoorControllerEmulator
+
+    with DoorControllerEmulator(boards, doors, baudrate=None, seed=seed) as emulator:
+        conn.send(emulator.port)
+        while True:
+            rate = conn.recv()
+            if rate is None:
+                break
+            emulator.event_rate = rate
+            conn.send((emulator.events_sent, emulator.overruns))
+
+
+def bench_workers(ports=4, boards=32, doors=8, workers=(1, 2, 4), rate=1_000_000.0, duration=3.0,
+                  warmup=0.5):
+    import multiprocessing
+    from emrdoor_ioproc import BATCH, IOPool, PortSpec
+    from emrdoor_loadgen import LOAD_SETTINGS
+    from emrdoor_shared import SharedDoorState
+
+    # 에뮬레이터는 포트마다 자기 프로세스에서 (rate는 만들 수 있는 것보다 크게: 받는 쪽이 한계가 되도록).
+    # 보드 번호는 포트마다 같다: 처리량만 본다
+    context = multiprocessing.get_context("spawn")
+    feeders = []
+    result = {"cpus": os.cpu_count(), "ports": ports}
+    try:
+        for p in range(ports):
+            conn, child = context.Pipe()
+            process = context.Process(target=_feed, args=(child, boards, doors, p + 1), daemon=True)
+            process.start()
+            child.close()
+            feeders.append((process, conn))
+        names = [conn.recv() for _, conn in feeders]
+        for n in workers:
+            state = SharedDoorState(doors, slots=n)
+            pool = IOPool([PortSpec(name, LOAD_SETTINGS) for name in names], state, n)
+            try:
+                for _, conn in feeders:
+                    conn.send(rate)
+                sent = [conn.recv() for _, conn in feeders]
+                start = time.perf_counter() + warmup
+                end = start + duration
+                frames = 0
+                while time.perf_counter() < end:
+                    if not pool.poll(0.05):
+                        continue
+                    kind, _, body = pool.receive()
+                    if kind == BATCH and time.perf_counter() >= start:
+                        frames += body.frames
+                for _, conn in feeders:
+                    conn.send(0.0)
+                done = [conn.recv() for _, conn in feeders]
+                # 남은 것을 다 읽고 닫는다: 다음 측정의 pty 버퍼가 비어 있도록
+                while pool.poll(0.3):
+                    pool.receive()
+            finally:
+                pool.stop()
+                while True:
+                    try:
+                        pool.receive()
+                    except (EOFError, OSError):
+                        break
+                pool.join(2.0)
+                state.close()
+            result[f"workers_{n}_events_per_s"] = frames / duration
+            result[f"workers_{n}_dropped_bytes"] = sum(d[1] - s[1] for s, d in zip(sent, done))
+        first = result[f"workers_{workers[0]}_events_per_s"]
+        for n in workers[1:]:
+            # 코어가 worker 수보다 적으면 프로세스끼리 번갈아 돌 뿐이다: 속도 향상은 해당 없음 (None)
+            result[f"workers_{n}_speedup"] = (result[f"workers_{n}_events_per_s"] / first
+                                              if (os.cpu_count() or 1) >= n else None)
+    finally:
+        for process, conn in feeders:
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+            process.join(5.0)
+            conn.close()
+    return result
+
+
+def bench_shutdown(ports=32, queued=20, baud=9600):
+    from emrdoor_commands import CommandWriter
+    from emrdoor_emulator import DoorControllerEmulator
+    from emrdoor_ports import DEFAULT_SETTINGS, open_port
+
+    app, window = _main_window(f"boards=4,doors=8,baud={baud}")
+    emulators = []
+    result = {}
+    try:
+        # 앱의 포트 하나: 읽기 쓰레드는 read()에서 (timeout 1초) 기다리고, 명령은 큐에 쌓여 있다
+        closed = []
+        window.serial_closed.connect(closed.append)
+        window.on_button_click()
+        _spin(app, lambda: False, 0.2)
+        for seq in range(queued):
+            window.commands.send(open_door(BROADCAST, seq, ALL_DOORS), seq)
+        t0 = time.perf_counter()
+        window.close_serial()
+        result["disconnect_call_ms"] = (time.perf_counter() - t0) * 1e3
+        if not _spin(app, lambda: closed):
+            raise RuntimeError("port did not close")
+        result["disconnect_ms"] = (time.perf_counter() - t0) * 1e3
+
+        readers = []
+        for p in range(ports):
+            emulator = DoorControllerEmulator(4, 8, baudrate=baud, seed=p)
+            emulators.append(emulator)
+            connection = open_port(emulator.start(), DEFAULT_SETTINGS._replace(baudrate=baud))
+            writer = CommandWriter(connection)
+            readers.append(window.start_reader(connection, writer))
+            for seq in range(queued):
+                writer.send(open_door(BROADCAST, seq, ALL_DOORS), seq)
+        _spin(app, lambda: False, 0.2)
+        finished = []
+        for reader in readers:
+            reader.finished.connect(lambda: finished.append(time.perf_counter()))
+        t0 = time.perf_counter()
+        for reader in readers:
+            reader.data_received.disconnect()
+            reader.stop()
+        result[f"stop_{ports}_ports_call_ms"] = (time.perf_counter() - t0) * 1e3
+        if not _spin(app, lambda: len(finished) == ports):
+            raise RuntimeError("readers did not stop")
+        result[f"stop_{ports}_ports_ms"] = (max(finished) - t0) * 1e3
+        for reader in readers:
+            reader.wait()
+
+        # 연결된 채로 창 닫기
+        window.on_button_click()
+        _spin(app, lambda: False, 0.2)
+        t0 = time.perf_counter()
+        window.close()
+        result["exit_ms"] = (time.perf_counter() - t0) * 1e3
+        return result
+    finally:
+        window.close()
+        for emulator in emulators:
+            emulator.stop()
+
+
+def bench_iocrash(baud=115200):
+    app, window = _main_window(f"boards=4,doors=8,baud={baud},delay=0.002")
+    import EMRDoor_App
+    from emrdoor_shared import SharedDoorState
+
+    # 끊김 대화상자는 모달이라 기다리지 않고 세기만 한다
+    alerts = []
+    message_box = EMRDoor_App.QMessageBox
+    EMRDoor_App.QMessageBox = type("Alerts", (), {"critical": staticmethod(lambda *a: alerts.append(a)),
+                                                 "warning": staticmethod(lambda *a: alerts.append(a))})
+    os.environ["EMRDOOR_IO_PROCESS"] = "1"
+    try:
+        closed = []
+        window.serial_closed.connect(closed.append)
+        window.on_button_click()
+        if not isinstance(window.door_state, SharedDoorState):
+            raise RuntimeError("I/O process did not start")
+        _spin(app, lambda: False, 0.2)
+        # I/O 프로세스가 갑자기 죽는다: 끊김으로 알리고, 공유 블록은 GUI가 떼어 낸 뒤에 지운다
+        t0 = time.perf_counter()
+        window.serial_thread.io.workers[0].process.kill()
+        if not _spin(app, lambda: closed, timeout=5):
+            raise RuntimeError("killed I/O process was not retired")
+        elapsed = time.perf_counter() - t0
+        if window.serial_thread is not None or window.closing or isinstance(window.door_state, SharedDoorState):
+            raise RuntimeError("connection left half retired after the I/O process died")
+        if not alerts:
+            raise RuntimeError("I/O process exit was not reported")
+        window.build_door_rows(window.ui.tableWidget.rowCount())    # 떼어 낸 상태로 다시 그린다
+        return {"retired_ms": elapsed * 1e3}
+    finally:
+        os.environ.pop("EMRDOOR_IO_PROCESS", None)
+        EMRDoor_App.QMessageBox = message_box
+        window.close()
+
+
+_STARTUP_PROBE = """
+import os, sys, time
+t0 = time.perf_counter()
+sys.path.insert(0, {root!r})
+from PySide6.QtWidgets import QApplication
+import EMRDoor_App
+EMRDoor_App.JOURNAL_DIR = {journal!r}
+app = QApplication(sys.argv)
+w = EMRDoor_App.MainWindow()
+w.show()
+app.processEvents()
+print(time.perf_counter() - t0)
+w.close()
+"""
+
+
+def bench_startup(rounds=3):
+    journal = tempfile.mkdtemp(prefix="emrdoor-bench-")
+    code = _STARTUP_PROBE.format(root=ROOT, journal=journal)
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    env.pop("EMRDOOR_EMULATOR", None)
+    env.pop("EMRDOOR_REPLAY", None)
+    walls, inproc = [], []
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True,
+                             text=True, check=True)
+        walls.append(time.perf_counter() - t0)
+        inproc.append(float(out.stdout.strip().splitlines()[-1]))
+    return {"process_ms": min(walls) * 1e3, "window_ms": min(inproc) * 1e3}
+
+
+STAGES = {
+    "metrics": bench_metrics,
+    "scrape": bench_scrape,
+    "decode": bench_decode,
+    "codec": bench_codec,
+    "checksum": bench_checksum,
+    "state": bench_state,
+    "bitmap": bench_bitmap,
+    "serial": bench_serial,
+    "baud": bench_baud,
+    "lowlat": bench_lowlat,
+    "polling": bench_polling,
+    "pacing": bench_pacing,
+    "repaint": bench_repaint,
+    "stall": bench_stall,
+    "command": bench_command,
+    "coalesce": bench_coalesce,
+    "trace": bench_trace,
+    "replay": bench_replay,
+    "scale": bench_scale,
+    "ioproc": bench_ioproc,
+    "workers": bench_workers,
+    "shutdown": bench_shutdown,
+    "iocrash": bench_iocrash,
+    "startup": bench_startup,
+}
+
+
+# -- results ----------------------------------------------------------------
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(stages=None):
+    results, errors = {}, {}
+    for name in stages or STAGES:
+        try:
+            results[name] = STAGES[name]()
+        except Exception:
+            errors[name] = traceback.format_exc(limit=3)
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+        "errors": errors,
+    }
+
+
+def higher_is_better(metric):
+    return metric.endswith("_per_s")
+
+
+def compare(current, baseline, threshold=10.0):
+    """Return ``(stage, metric, baseline, current, change %)`` for every regression."""
+    regressions = []
+    for stage, metrics in baseline.get("results", {}).items():
+        for metric, old in metrics.items():
+            new = current.get("results", {}).get(stage, {}).get(metric)
+            if new is None or not isinstance(old, (int, float)) or not old:
+                continue
+            if not (metric.endswith("_per_s") or metric.endswith(("_ms", "_us", "_ns", "_s"))):
+                continue  # 설정값 (doors, baud 등)
+            change = (new - old) / old * 100
+            worse = -change if higher_is_better(metric) else change
+            if worse > threshold:
+                regressions.append((stage, metric, old, new, change))
+    return regressions
+
+
+def missing(current, baseline):
+    """Return ``(stage, metric)`` for every baseline metric a stage that ran no longer reports."""
+    ran = current.get("results", {})
+    return [(stage, metric)
+            for stage, metrics in baseline.get("results", {}).items() if stage in ran
+            for metric in metrics if metric not in ran[stage]]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("stages", nargs="*", help=f"stages to run (default: all of {', '.join(STAGES)})")
+    parser.add_argument("--output", "-o", help="write results JSON here")
+    parser.add_argument("--compare", metavar="BASELINE", help="baseline results JSON")
+    parser.add_argument("--threshold", type=float, default=10.0, help="allowed regression in percent")
+    args = parser.parse_args(argv)
+    unknown = set(args.stages) - set(STAGES)
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(sorted(unknown))}")
+
+    result = run(args.stages or None)
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    for stage, error in result["errors"].items():
+        print(f"stage {stage} failed:\n{error}", file=sys.stderr)
+
+    status = 1 if result["errors"] else 0
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(result, baseline, args.threshold)
+        for stage, metric, old, new, change in regressions:
+            print(f"REGRESSION {stage}.{metric}: {old:.4g} -> {new:.4g} ({change:+.1f}%)",
+                  file=sys.stderr)
+        gone = missing(result, baseline)
+        for stage, metric in gone:
+            print(f"MISSING {stage}.{metric}: in the baseline but not in this run", file=sys.stderr)
+        if regressions or gone:
+            status = 1
+        else:
+            print(f"no regressions beyond {args.threshold:g}% against {args.compare}", file=sys.stderr)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
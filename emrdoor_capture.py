@@ -0,0 +1,278 @@
+"""Capture and replay of raw serial traffic.
+
+A capture file is a small header followed by one record per chunk read
+from or written to the port::
+
+    monotonic_ns (u64) | direction (u8) | length (u32) | data[length]
+
+``CapturingSerial`` wraps an open port and records everything passing
+through it; ``CaptureWriter`` writes the file from its own thread at least
+every ``flush_interval`` seconds, so the read path never waits on the disk.
+
+``ReplaySerial`` is a serial-port stand-in that feeds the received chunks
+of a capture back to ``SerialReadThread`` with the original timing scaled
+by ``speed`` (``0`` = as fast as possible), so the whole receive pipeline
+can be reproduced and benchmarked without hardware.  Once the capture is
+used up it reads like an idle port: ``read()`` waits out its timeout (or
+``cancel_read()``) and returns nothing (``finished``).
+
+    EMRDOOR_CAPTURE=captures/ python EMRDoor_App.py          # record
+    EMRDOOR_REPLAY=captures/site.emrcap@10 python EMRDoor_App.py   # replay at 10x
+"""
+import argparse
+import os
+import struct
+import threading
+import time
+
+from emrdoor_log import get_logger
+
+log = get_logger("capture")
+
+MAGIC = b"EMRC"
+VERSION = 1
+# magic, version, reserved, wall clock at start (ns since epoch)
+HEADER = struct.Struct("<4sHHQ")
+# monotonic_ns, direction, length
+CHUNK = struct.Struct("<QBI")
+
+RX = 0
+TX = 1
+
+SUFFIX = ".emrcap"
+REPLAY_PREFIX = "replay:"
+
+
+class CaptureWriter:
+    """Buffers recorded chunks and appends them to the capture file from a
+    background thread, every ``flush_interval`` seconds or at ``flush_bytes``."""
+
+    def __init__(self, path, flush_bytes=64 * 1024, flush_interval=0.5):
+        self.path = path
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._buf = bytearray()
+        self._closing = False
+        self.error = None           # 쓰기 쓰레드를 멈춘 예외 (그 뒤로는 기록하지 않는다)
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, 0, time.time_ns()))
+        self._thread = threading.Thread(target=self._run, name="CaptureWriter", daemon=True)
+        self._thread.start()
+
+    def record(self, direction, data, ts_ns=None):
+        # 읽기/쓰기 쓰레드에서 불린다: 버퍼에 붙이기만 하고 파일은 쓰기 쓰레드가 쓴다
+        if ts_ns is None:
+            ts_ns = time.monotonic_ns()
+        with self._lock:
+            if self._closing or self.error is not None:
+                return
+            self._buf += CHUNK.pack(ts_ns, direction, len(data))
+            self._buf += data
+            if len(self._buf) >= self.flush_bytes:
+                self._wake.set()
+
+    def close(self):
+        with self._lock:
+            if self._closing:
+                return
+            self._closing = True
+        self._wake.set()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            with self._lock:
+                buf, self._buf = self._buf, bytearray()
+                closing = self._closing
+            try:
+                if buf:
+                    self._file.write(buf)
+                    self._file.flush()
+            except OSError as e:
+                log.error("capture write failed", extra={"fields": {"path": self.path, "error": e}})
+                with self._lock:
+                    self.error = e
+                    self._buf = bytearray()
+                closing = True
+            if closing:
+                try:
+                    self._file.close()
+                except OSError:
+                    pass
+                return
+
+
+def capture_path(target):
+    """A directory gets a timestamped file name; anything else is used as is."""
+    if os.path.isdir(target) or target.endswith(os.sep):
+        os.makedirs(target, exist_ok=True)
+        return os.path.join(target, time.strftime("capture-%Y%m%d-%H%M%S") + SUFFIX)
+    return target
+
+
+def read_capture(path):
+    """Yield ``(monotonic_ns, direction, data)`` for every chunk in a capture."""
+    with open(path, "rb") as f:
+        magic, version, _, _ = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: not a serial capture")
+        while True:
+            head = f.read(CHUNK.size)
+            if len(head) < CHUNK.size:
+                return
+            ts_ns, direction, length = CHUNK.unpack(head)
+            data = f.read(length)
+            if len(data) < length:
+                return  # 기록 중 끊긴 마지막 청크
+            yield ts_ns, direction, data
+
+
+class CapturingSerial:
+    """Wraps a serial port and records every chunk read or written."""
+
+    def __init__(self, port, capture):
+        self._port = port
+        self.capture = capture
+
+    def read(self, size=1):
+        data = self._port.read(size)
+        if data:
+            self.capture.record(RX, data)
+        return data
+
+    def write(self, data):
+        n = self._port.write(data)
+        self.capture.record(TX, data)
+        return n
+
+    def close(self):
+        self._port.close()
+        self.capture.close()
+
+    def __getattr__(self, name):
+        return getattr(self._port, name)
+
+
+class ReplaySerial:
+    """Read-side replay of a capture that looks like a ``serial.Serial``."""
+
+    def __init__(self, path, speed=1.0, timeout=1):
+        self.port = path
+        self.speed = speed
+        self.timeout = timeout
+        self.is_open = True
+        self.bytes_written = 0
+        self._chunks = [(ts, data) for ts, direction, data in read_capture(path) if direction == RX]
+        self._next = 0
+        self._buf = bytearray()
+        self._cancel = threading.Event()
+        self._base = self._chunks[0][0] if self._chunks else 0
+        self._start = time.monotonic_ns()
+
+    @property
+    def finished(self):
+        return self._next == len(self._chunks) and not self._buf
+
+    def _due(self, i):
+        # 이 청크가 도착해야 하는 시각 (monotonic_ns)
+        return self._start + (self._chunks[i][0] - self._base) / self.speed
+
+    def _pump(self):
+        chunks = self._chunks
+        if self.speed <= 0:
+            # 최대 속도: 버퍼를 너무 키우지 않을 만큼만 미리 채운다
+            while self._next < len(chunks) and len(self._buf) < 65536:
+                self._buf += chunks[self._next][1]
+                self._next += 1
+            return
+        now = time.monotonic_ns()
+        while self._next < len(chunks) and self._due(self._next) <= now:
+            self._buf += chunks[self._next][1]
+            self._next += 1
+
+    @property
+    def in_waiting(self):
+        self._pump()
+        return len(self._buf)
+
+    def read(self, size=1):
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while True:
+            self._pump()
+            if self._cancel.is_set():
+                # serial.Serial처럼: read 밖에서 취소해도 다음 read가 바로 돌아온다
+                self._cancel.clear()
+                break
+            if self._buf:
+                break
+            if self._next == len(self._chunks):
+                # 다 재생했다: 조용한 포트처럼 timeout까지 (또는 취소될 때까지) 기다린다
+                wait = float("inf")
+            else:
+                wait = (self._due(self._next) - time.monotonic_ns()) / 1e9
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    break
+            self._cancel.wait(None if wait == float("inf") else max(wait, 0))
+        data = bytes(self._buf[:size])
+        del self._buf[:size]
+        return data
+
+    def write(self, data):
+        self.bytes_written += len(data)
+        return len(data)
+
+    def cancel_read(self):
+        self._cancel.set()
+
+    def cancel_write(self):
+        pass
+
+    def reset_input_buffer(self):
+        self._buf.clear()
+
+    def close(self):
+        self.is_open = False
+
+
+def parse_replay_port(name):
+    """``replay:PATH[@SPEED]`` -> ``(path, speed)``; SPEED ``max`` or ``0`` = unpaced."""
+    spec = name[len(REPLAY_PREFIX):]
+    path, _, speed = spec.rpartition("@")
+    if not path:
+        return spec, 1.0
+    if speed.lower() == "max":
+        return path, 0.0
+    return path, float(speed.removesuffix("x"))
+
+
+def open_replay(name, timeout=1):
+    path, speed = parse_replay_port(name)
+    return ReplaySerial(path, speed, timeout)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize a serial capture")
+    parser.add_argument("capture")
+    args = parser.parse_args(argv)
+    counts = {RX: [0, 0], TX: [0, 0]}
+    first = last = None
+    for ts_ns, direction, data in read_capture(args.capture):
+        first = ts_ns if first is None else first
+        last = ts_ns
+        counts[direction][0] += 1
+        counts[direction][1] += len(data)
+    duration = (last - first) / 1e9 if first is not None else 0.0
+    print(f"{args.capture}: {duration:.3f} s")
+    for name, direction in (("rx", RX), ("tx", TX)):
+        chunks, nbytes = counts[direction]
+        print(f"  {name}: {chunks} chunks, {nbytes} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,459 @@
+"""Outgoing command queue.
+
+The GUI thread only queues encoded frames; ``CommandWriter`` owns the
+writes to the port, so a slow or stalled port never blocks a click
+handler.  Queue depth is exported as the ``command_queue_depth`` gauge.
+
+``stop()`` never blocks either: commands still queued are dropped (each
+one logged by seq and counted in ``commands_dropped_total``, so every
+command is either written or reported), a write in progress is cancelled
+and the thread exits on its own; ``join()`` waits for that.
+
+With a ``PollScheduler`` the writer also sends the status polls, but only
+while no command is queued: ``send()`` wakes it out of the wait between
+polls, so operator commands never queue behind polling.  Polls and
+commands take their seq from the same ``SeqCounter`` (one per port), so a
+reply can never be matched to the wrong one.  Replies are matched by
+``(board, seq)``: the 8-bit seq wraps within a second or so under heavy
+polling, and a command still unanswered when its seq comes round again for
+the same board is given up (counted as timed out) rather than retried.
+
+With a ``Pacer`` every command to a board waits for that board's token
+(commands for other boards overtake it), the ACK/NAK that comes back
+(``answered()``) feeds the board's rate, and a command that gets no ACK
+within ``pacer.timeout`` or a NAK busy is sent again, up to ``RETRIES``
+times, with the same seq.  ``answered()`` says whether the reply settles
+the command: a NAK busy that will be retried does not, and the reader
+keeps it from whoever resolves futures (the retry's reply does that).
+
+``CommandCoalescer`` sits in front of the writer for single-door commands.
+Commands for the same board that arrive within ``window`` seconds of the
+first one go out as one ``CMD_DOORS`` frame (one ACK, one controller
+turnaround instead of one per door).  A later command for the same door
+replaces an earlier one (last one wins, the replaced caller's future is
+cancelled); the ACK/NAK of the merged frame resolves every caller's
+future with its own ``DoorResult``.  A frame still unanswered ``timeout``
+seconds after it was sent, or whose seq is reused for the same board before
+its reply, fails its futures with ``REASON_TIMEOUT``; the owner calls
+``expire()`` (from the thread its future callbacks expect).
+"""
+import concurrent.futures
+import queue
+import threading
+import time
+import weakref
+from collections import deque, namedtuple
+
+import serial
+
+from emrdoor_log import get_logger
+from emrdoor_metrics import REGISTRY
+from emrdoor_protocol import (ACTION_OPEN, BROADCAST, CMD_ACK, CMD_CLOSE, CMD_DOORS, CMD_NAK, CMD_OPEN,
+                              MAX_DOOR_ACTIONS, NAK_BUSY, OVERHEAD, close_door, door_actions, open_door, poll)
+from emrdoor_trace import TRACER
+
+log = get_logger("commands")
+
+Command = namedtuple("Command", "data seq trace_id queued_ns")
+# ok: ACK 받음, 아니면 reason = NAK 사유 (답이 안 왔으면 REASON_TIMEOUT)
+DoorResult = namedtuple("DoorResult", "board door action ok reason")
+REASON_TIMEOUT = -1
+
+_writers = weakref.WeakSet()
+m_written = REGISTRY.counter("commands_written_total", "command frames written to the port")
+m_write_errors = REGISTRY.counter("command_write_errors_total", "command writes that failed")
+m_dropped = REGISTRY.counter("commands_dropped_total", "queued commands dropped at disconnect")
+m_retries = REGISTRY.counter("command_retries_total", "commands sent again after a timeout or NAK busy")
+m_timeouts = REGISTRY.counter("command_timeouts_total", "commands given up after every retry")
+m_door_commands = REGISTRY.counter("door_commands_total", "single-door commands submitted")
+m_door_frames = REGISTRY.counter("door_command_frames_total", "frames the door commands went out in")
+m_superseded = REGISTRY.counter("door_commands_superseded_total", "door commands replaced within the window")
+m_door_timeouts = REGISTRY.counter("door_commands_timed_out_total", "door commands failed without an ACK/NAK")
+REGISTRY.gauge("command_queue_depth", "commands waiting to be written",
+               fn=lambda: sum(w.depth for w in list(_writers)))
+
+RETRIES = 3
+IDLE_WAIT = 1.0     # 기다릴 일이 없을 때도 이만큼마다 깨어 본다
+
+
+class SeqCounter:
+    """Sequence numbers of one port, shared by its commands and status polls.
+
+    ``cell`` is a ``multiprocessing`` ``Value("B")`` when the numbers are
+    drawn in two processes (the GUI's ``RemoteWriter`` and the I/O process's
+    ``CommandWriter``); without it the counter is local to this process.
+    """
+
+    def __init__(self, cell=None):
+        self._cell = cell
+        self._seq = 0
+        self._lock = threading.Lock() if cell is None else cell.get_lock()
+
+    def next(self):
+        with self._lock:
+            if self._cell is None:
+                self._seq = (self._seq + 1) & 0xFF
+                return self._seq
+            self._cell.value = (self._cell.value + 1) & 0xFF
+            return self._cell.value
+
+
+class CommandWriter:
+
+    def __init__(self, connection, poller=None, pacer=None, seqs=None):
+        self.connection = connection
+        self.poller = poller    # PollScheduler (없으면 폴링 안 함)
+        self.pacer = pacer      # Pacer (없으면 보드별 속도 조절, 재전송 안 함)
+        self.written_ns = {}    # seq -> 쓰기 끝난 시각 (추적 중인 명령만)
+        self._deferred = deque()    # 보드 토큰을 기다리는 명령 (쓰기 쓰레드만 만진다)
+        self._outstanding = {}      # (보드, seq) -> [명령, 보낸 시각, 보낸 횟수], ACK 대기
+        self._superseded = {}       # id -> 같은 (보드, seq)의 새 명령에 밀려 포기한, 재전송 줄에 선 명령
+        self._outstanding_lock = threading.Lock()
+        self.seqs = seqs if seqs is not None else SeqCounter()
+        self._queue = queue.Queue()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="CommandWriter", daemon=True)
+        self._thread.start()
+        _writers.add(self)
+
+    @property
+    def depth(self):
+        return self._queue.qsize()
+
+    def next_seq(self):
+        """Sequence number for the next command (shared by every sender on this port, and the polls)."""
+        return self.seqs.next()
+
+    def send(self, data, seq, trace_id=0):
+        self._queue.put(Command(data, seq, trace_id, time.perf_counter_ns() if trace_id else 0))
+
+    def stop(self):
+        """Drop what is still queued, cancel the current write; returns the dropped seqs."""
+        self._stopping = True
+        dropped = []
+        while True:
+            try:
+                command = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if command is not None:
+                dropped.append(command.seq)
+        self._queue.put(None)
+        cancel_write = getattr(self.connection, "cancel_write", None)
+        if cancel_write is not None:
+            cancel_write()
+        if dropped:
+            m_dropped.inc(len(dropped))
+            log.warning("commands dropped", extra={"fields": {"seqs": dropped}})
+        return dropped
+
+    def join(self, timeout=None):
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def answered(self, frame, now):
+        """An ACK/NAK arrived (any thread); feeds the pacer, NAK busy is retried.
+
+        False if the command is not settled by it (a NAK busy sent again, or a
+        late reply to a command already queued to be sent again).
+        """
+        if self.pacer is None or frame.cmd not in (CMD_ACK, CMD_NAK):
+            return True
+        busy = frame.cmd == CMD_NAK and frame.reason == NAK_BUSY
+        key = (frame.board, frame.seq)
+        with self._outstanding_lock:
+            entry = self._outstanding.get(key)
+            if entry is None:
+                return True
+            command, sent, tries = entry
+            retry = busy and sent is not None and tries <= RETRIES
+            if retry:
+                entry[1] = None     # 다시 보낼 때까지
+            elif sent is not None:
+                del self._outstanding[key]
+        if sent is None:
+            return False    # 이미 다시 보내려고 줄 선 명령의 늦은 답
+        if busy:
+            self.pacer.backoff(frame.board, sent, now)
+        else:
+            self.pacer.ack(frame.board, sent, now)
+        if retry:
+            m_retries.inc()
+            self._queue.put(command)
+        return not retry
+
+    def _next(self):
+        # 명령이 없을 때만 POLL을 쓴다; 기다리는 중에 명령이 들어오면 바로 깬다
+        while not self._stopping:
+            wait = None
+            if self.pacer is None:
+                try:
+                    return self._queue.get_nowait()
+                except queue.Empty:
+                    pass
+            else:
+                while True:     # 새 명령은 일단 미뤄 둔 명령 뒤에 줄 세운다
+                    try:
+                        command = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if command is None:
+                        return None
+                    self._deferred.append(command)
+                command, wait = self._ready(time.monotonic())
+                if command is not None:
+                    return command
+            if self.poller is not None:
+                board, poll_wait = self.poller.due(time.monotonic())
+                if board is not None:
+                    try:
+                        self.connection.write(poll(board, self.next_seq()))
+                    except (serial.SerialException, OSError) as e:
+                        m_write_errors.inc()
+                        log.debug("poll write failed", extra={"fields": {"board": board, "error": e}})
+                    continue
+                wait = poll_wait if wait is None else min(wait, poll_wait)
+            try:
+                command = self._queue.get(timeout=wait)
+            except queue.Empty:
+                continue
+            if self.pacer is None or command is None:
+                return command
+            self._deferred.append(command)
+        return self._queue.get()
+
+    def _ready(self, now):
+        """First deferred command whose board has a token, else ``(None, seconds to wait)``."""
+        wait = self._expire(now)
+        blocked = set()     # 보드마다 순서를 지킨다: 앞 명령이 막히면 뒤 명령도 기다린다
+        for k, command in enumerate(self._deferred):
+            board = command.data[1]
+            if board in blocked:
+                continue
+            delay = 0.0 if board == BROADCAST else self.pacer.take(board, now)
+            if delay == 0.0:
+                del self._deferred[k]
+                return command, 0.0
+            blocked.add(board)
+            wait = min(wait, delay)
+        return None, wait
+
+    def _expire(self, now):
+        # ACK가 안 온 명령: 속도를 줄이고 다시 보낸다; 다음 만료까지 남은 시간
+        wait = IDLE_WAIT
+        expired = []
+        with self._outstanding_lock:
+            for key, entry in list(self._outstanding.items()):
+                command, sent, tries = entry
+                if sent is None:
+                    continue
+                left = sent + self.pacer.timeout - now
+                if left > 0:
+                    wait = min(wait, left)
+                    continue
+                if tries <= RETRIES:
+                    entry[1] = None
+                else:
+                    del self._outstanding[key]
+                expired.append((command, sent, tries))
+        for command, sent, tries in reversed(expired):
+            self.pacer.backoff(command.data[1], sent, now)
+            if tries <= RETRIES:
+                m_retries.inc()
+                self._deferred.appendleft(command)
+            else:
+                m_timeouts.inc()
+                log.warning("command timed out", extra={"fields": {
+                    "board": command.data[1], "seq": command.seq, "tries": tries}})
+        return wait
+
+    def _supersede(self, entry):
+        # seq가 한 바퀴 돌도록 답이 없던 같은 보드의 명령: 이제 답을 새 명령과 구별할 수 없으니
+        # 재전송하지 않고 포기로 센다
+        command, sent, tries = entry
+        if sent is None:    # 재전송 줄에 서 있다
+            try:
+                self._deferred.remove(command)
+            except ValueError:
+                self._superseded[id(command)] = command     # 아직 _queue에 있다
+        m_timeouts.inc()
+        log.warning("command timed out", extra={"fields": {
+            "board": command.data[1], "seq": command.seq, "tries": tries, "reason": "seq reused"}})
+
+    def _run(self):
+        while True:
+            command = self._queue.get() if self.poller is None and self.pacer is None else self._next()
+            if command is None:
+                if self._deferred:
+                    seqs = [c.seq for c in self._deferred]
+                    m_dropped.inc(len(seqs))
+                    log.warning("commands dropped", extra={"fields": {"seqs": seqs}})
+                return
+            if self._stopping:
+                # stop()이 큐를 비우는 사이에 꺼낸 명령
+                m_dropped.inc()
+                log.warning("commands dropped", extra={"fields": {"seqs": [command.seq]}})
+                continue
+            if self._superseded.pop(id(command), None) is command:
+                continue    # 이미 포기로 센 명령의 재전송
+            start_ns = time.perf_counter_ns() if command.trace_id else 0
+            key = (command.data[1], command.seq)
+            if self.pacer is not None and command.data[1] != BROADCAST:
+                # 쓰기 전에 등록한다: ACK가 write() 반환보다 먼저 읽힐 수 있다
+                with self._outstanding_lock:
+                    entry = self._outstanding.get(key)
+                    if entry is not None and entry[0] is command:
+                        entry[1] = time.monotonic()     # 재전송
+                        entry[2] += 1
+                    else:
+                        self._outstanding[key] = [command, time.monotonic(), 1]
+                if entry is not None and entry[0] is not command:
+                    self._supersede(entry)
+            try:
+                self.connection.write(command.data)
+            except (serial.SerialException, OSError) as e:
+                m_write_errors.inc()
+                log.error("command write failed", extra={"fields": {"seq": command.seq, "error": e}})
+                if self.pacer is not None:
+                    with self._outstanding_lock:
+                        self._outstanding.pop(key, None)
+                continue
+            m_written.inc()
+            if self.poller is not None:
+                self.poller.traffic(len(command.data) + OVERHEAD + 1)   # 명령 + ACK
+            if command.trace_id:
+                end_ns = time.perf_counter_ns()
+                self.written_ns[command.seq] = end_ns
+                TRACER.span(command.trace_id, "queue", command.queued_ns, start_ns, seq=command.seq)
+                TRACER.span(command.trace_id, "write", start_ns, end_ns, bytes=len(command.data))
+
+
+class CommandCoalescer:
+
+    def __init__(self, writer, window=0.02, timeout=5.0):
+        self.writer = writer
+        self.window = window
+        self.timeout = timeout  # 보낸 뒤 ACK/NAK를 기다리는 한도 (재전송 포함)
+        self._lock = threading.Lock()
+        self._pending = {}      # board -> {door: (action, [future])}, 창이 닫히기 전
+        self._sent = {}         # (board, seq) -> (board, cmd, {door: (action, [future])}, 기한), ACK 대기
+        self._overtaken = []    # 같은 보드에 같은 seq가 다시 나가 답을 구별할 수 없게 된 _sent 항목
+        self._timer = None
+        self._stopped = False
+
+    def submit(self, board, door, action=ACTION_OPEN):
+        """Queue one door command; the future resolves to a ``DoorResult``."""
+        future = concurrent.futures.Future()
+        m_door_commands.inc()
+        with self._lock:
+            if self._stopped:
+                future.cancel()
+                return future
+            doors = self._pending.setdefault(board, {})
+            previous = doors.get(door)
+            if previous is not None and previous[0] == action:
+                previous[1].append(future)  # 같은 명령: 결과를 같이 받는다
+                return future
+            if previous is not None:
+                m_superseded.inc(len(previous[1]))
+                for f in previous[1]:
+                    f.cancel()
+            doors[door] = (action, [future])
+            if self.window <= 0:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        return future
+
+    def flush(self):
+        """Send what is pending now (the window timer calls this)."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, {}
+        for board, doors in pending.items():
+            items = sorted(doors.items())
+            for k in range(0, len(items), MAX_DOOR_ACTIONS):
+                chunk = dict(items[k:k + MAX_DOOR_ACTIONS])
+                seq = self.writer.next_seq()
+                if len(chunk) == 1:
+                    # 한 도어면 기존 단일 명령 (CMD_DOORS를 모르는 컨트롤러와도 통한다)
+                    (door, (action, _)), = chunk.items()
+                    cmd = CMD_OPEN if action == ACTION_OPEN else CMD_CLOSE
+                    data = (open_door if action == ACTION_OPEN else close_door)(board, seq, door)
+                else:
+                    cmd = CMD_DOORS
+                    data = door_actions(board, seq, ((d, a) for d, (a, _) in chunk.items()))
+                # seq가 한 바퀴 돌도록 답이 없던 명령 (폴링도 같은 seq를 쓴다): 다음 expire()에서 응답 없음으로
+                stale = self._sent.pop((board, seq), None)
+                if stale is not None:
+                    self._overtaken.append(stale)
+                self._sent[(board, seq)] = (board, cmd, chunk, time.monotonic() + self.timeout)
+                m_door_frames.inc()
+                self.writer.send(data, seq)
+
+    def resolve(self, frame):
+        """An ACK/NAK arrived; resolve the futures of the frame it answers."""
+        key = (frame.board, frame.seq)
+        with self._lock:
+            sent = self._sent.get(key)
+            if sent is None or frame.answers != sent[1]:
+                return False
+            del self._sent[key]
+        ok = frame.cmd == CMD_ACK
+        self._finish(sent, ok, 0 if ok else frame.reason)
+        return True
+
+    def expire(self, now):
+        """Fail the futures of frames unanswered past ``timeout``; seconds to the next deadline (or None).
+
+        A frame whose seq was reused for the same board before it was answered
+        fails here too, whatever its deadline: its answer can no longer be told
+        from the new frame's.
+        """
+        with self._lock:
+            keys = [key for key, sent in self._sent.items() if sent[3] <= now]
+            expired = self._overtaken + [self._sent.pop(key) for key in keys]
+            self._overtaken = []
+            deadlines = [sent[3] for sent in self._sent.values()]
+            if self._pending:
+                deadlines.append(now + self.window + self.timeout)
+        for sent in expired:
+            m_door_timeouts.inc(len(sent[2]))
+            log.warning("door command timed out", extra={"fields": {"board": sent[0], "doors": sorted(sent[2])}})
+            self._finish(sent, False, REASON_TIMEOUT)
+        return min(deadlines) - now if deadlines else None
+
+    @staticmethod
+    def _finish(sent, ok, reason):
+        board, _, doors, _ = sent
+        for door, (action, futures) in doors.items():
+            result = DoorResult(board, door, action, ok, reason)
+            for f in futures:
+                if f.set_running_or_notify_cancel():    # 그 사이에 취소됐으면 False
+                    f.set_result(result)
+
+    def stop(self):
+        """Cancel everything not yet sent or not yet answered."""
+        with self._lock:
+            self._stopped = True
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            for doors in self._pending.values():
+                self._cancel(doors)
+            for _, _, doors, _ in list(self._sent.values()) + self._overtaken:
+                self._cancel(doors)
+            self._pending, self._sent, self._overtaken = {}, {}, []
+
+    @staticmethod
+    def _cancel(doors):
+        for _, futures in doors.values():
+            for f in futures:
+                f.cancel()
@@ -0,0 +1,75 @@
+"""Status-bar diagnostics overlay over the metrics registry.
+
+Shows receive throughput, GUI stalls and the per-stage p99 of the last
+interval (``frame_queue_ns``, ``state_update_ns``, ``paint_ns``,
+``read_to_paint_ns``, ``event_loop_lag_ns``) as one line; the tooltip carries the full registry snapshot.
+"""
+import time
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QLabel
+
+STAGES = (("큐", "frame_queue_ns"), ("상태", "state_update_ns"),
+          ("그리기", "paint_ns"), ("수신→화면", "read_to_paint_ns"), ("루프 지연", "event_loop_lag_ns"))
+
+
+def format_ns(ns):
+    if ns >= 1_000_000:
+        return f"{ns / 1e6:.1f}ms"
+    if ns >= 1_000:
+        return f"{ns / 1e3:.0f}µs"
+    return f"{ns}ns"
+
+
+def format_snapshot(snapshot):
+    lines = []
+    for name, value in sorted(snapshot.items()):
+        if isinstance(value, dict):
+            value = " ".join(f"{k}={format_ns(v) if k not in ('count', 'sum') else v}"
+                             for k, v in value.items() if k != "sum")
+        lines.append(f"{name}: {value}")
+    return "\n".join(lines)
+
+
+class DiagnosticsOverlay(QLabel):
+
+    def __init__(self, registry, parent=None, interval_ms=1000):
+        super().__init__(parent)
+        self.registry = registry
+        self._last = None       # (시각, 바이트, 프레임)
+        self._bases = {}        # 히스토그램별 직전 (count, counts)
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.refresh)
+        if registry.enabled:
+            self.timer.start()
+            self.refresh()
+        else:
+            self.hide()
+
+    def refresh(self):
+        now = time.monotonic()
+        nbytes = self.registry.total("serial_read_bytes_total")
+        frames = self.registry.total("frames_decoded_total")
+        parts = []
+        if self._last is not None:
+            elapsed = now - self._last[0] or 1e-9
+            parts.append(f"수신 {(nbytes - self._last[1]) / elapsed / 1e3:.1f}kB/s "
+                         f"{(frames - self._last[2]) / elapsed:.0f}프레임/s")
+        self._last = (now, nbytes, frames)
+        parts.append(f"오류 {self.registry.total('frame_errors_total')}")
+        parts.append(f"대기 {self.registry.total('frame_queue_depth')}")
+        parts.append(f"멈춤 {self.registry.total('gui_stalls_total')}")
+        for label, name in STAGES:
+            for histogram in self.registry.metrics(name):
+                count, base = self._bases.get(name, (0, None))
+                if histogram.count > count:
+                    parts.append(f"{label} p99 {format_ns(histogram.percentile(0.99, base))}")
+                self._bases[name] = (histogram.count, list(histogram.counts))
+        self.setText(" | ".join(parts))
+        if self.underMouse():
+            self.setToolTip(format_snapshot(self.registry.snapshot()))
+
+    def enterEvent(self, event):
+        self.setToolTip(format_snapshot(self.registry.snapshot()))
+        super().enterEvent(event)
@@ -0,0 +1,387 @@
+"""Virtual door controller bus on a pseudo-terminal (POSIX only).
+
+The emulator owns the master side of a pty and presents the slave device
+(e.g. ``/dev/pts/5``) as the serial port, so the app, ``SerialReadThread``
+and the benchmarks talk to it exactly as they would to real hardware.  It
+simulates ``boards`` x ``doors`` doors, answers OPEN/CLOSE/DOORS/POLL commands, emits
+random door events at ``event_rate`` per second, paces output at the wire
+speed of ``baudrate`` (``None`` = unpaced) and can inject scripted faults.
+With ``check_line`` it also behaves like real hardware on a mismatched line:
+while the host side is not set to ``baudrate`` 8N1 it ignores commands and
+everything it sends arrives as garbage (used to exercise baud autodetect).
+With ``bitmap`` it answers POLL with ``STATUS_BITS`` like a large board.
+With ``rx_buffer`` every board only holds that many frames while it is
+busy with earlier ones and silently drops the rest (a receive overrun).
+
+    python -m emrdoor_emulator --boards 4 --doors 8 --rate 20
+    EMRDOOR_EMULATOR="boards=4,doors=8,rate=20" python EMRDoor_App.py
+"""
+import argparse
+import errno
+import fcntl
+import heapq
+import os
+import random
+import select
+import termios
+import threading
+import time
+import tty
+from collections import namedtuple
+
+from emrdoor_protocol import (
+    ACTION_CLOSE, ACTION_OPEN, ALL_DOORS, BROADCAST, CMD_CLOSE, CMD_DOORS, CMD_OPEN, CMD_POLL,
+    FLAG_COLUMNS, FLAG_OPEN, NAK_BAD_DOOR, NAK_UNKNOWN, CMD_ACK, FrameDecoder, ack, door_event, nak,
+    status, status_bits)
+
+# kind: garble (corrupt outgoing frames), drop (lose outgoing frames),
+#       silence (board ignores commands and sends nothing), disconnect (close the port)
+Fault = namedtuple("Fault", "at kind duration board")
+FAULT_KINDS = ("garble", "drop", "silence", "disconnect")
+
+TICK = 0.005
+WRITE_STALL = 0.5   # 이 시간 동안 아무도 안 읽으면 출력을 버린다
+
+
+def parse_fault(text):
+    """``kind@at[+duration][:board]`` e.g. ``drop@5+2:3`` -> Fault."""
+    board = None
+    if ":" in text:
+        text, board = text.split(":", 1)
+        board = int(board)
+    kind, when = text.split("@", 1)
+    duration = 0.0
+    if "+" in when:
+        when, duration = when.split("+", 1)
+    if kind not in FAULT_KINDS:
+        raise ValueError(f"unknown fault {kind!r}")
+    return Fault(float(when), kind, float(duration), board)
+
+
+def parse_spec(spec):
+    """``"boards=4,doors=8,rate=20,baud=9600,noise=0.01"`` -> emulator kwargs."""
+    names = {"boards": ("boards", int), "doors": ("doors", int), "rate": ("event_rate", float),
+             "baud": ("baudrate", int), "noise": ("noise", float), "seed": ("seed", int),
+             "delay": ("response_delay", float), "strict": ("check_line", lambda v: v not in ("0", "no")),
+             "bitmap": ("bitmap", lambda v: v not in ("0", "no")), "buffer": ("rx_buffer", int)}
+    kwargs = {}
+    for item in filter(None, (s.strip() for s in spec.split(","))):
+        key, value = item.split("=", 1)
+        name, kind = names[key]
+        kwargs[name] = None if name == "baudrate" and value in ("0", "none") else kind(value)
+    return kwargs
+
+
+class DoorControllerEmulator:
+
+    def __init__(self, boards=4, doors=8, baudrate=9600, event_rate=0.0, noise=0.0,
+                 response_delay=0.002, open_time=3.0, faults=(), seed=None, check_line=False,
+                 bitmap=False, rx_buffer=0):
+        self.boards = boards
+        self.doors = doors
+        self.baudrate = baudrate
+        self.event_rate = event_rate
+        self.noise = noise
+        self.response_delay = response_delay
+        self.open_time = open_time
+        self.check_line = check_line
+        self.bitmap = bitmap
+        self.rx_buffer = rx_buffer
+        self.faults = sorted(faults)
+        self.rng = random.Random(seed)
+
+        self.flags = bytearray(boards * doors)
+        self.port = None
+        self.bytes_sent = 0
+        self.events_sent = 0
+        self.commands_received = 0
+        self.overruns = 0  # 아무도 읽지 않아 버린 바이트
+        self.rx_dropped = 0  # 보드 수신 버퍼가 넘쳐 버린 프레임
+
+        self._master = self._slave = None
+        self._thread = None
+        self._running = False
+        self._lock = threading.Lock()
+        self._burst = 0
+        self._timers = []     # (when, board, door, flag) 자동 복귀
+        self._seq = 0
+        self._bus_free = 0.0
+        self._started = 0.0
+        self._mismatch = False  # 호스트 쪽 속도/프레이밍이 다름 (check_line)
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def start(self):
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._slave)
+        tty.setraw(self._master)
+        fl = fcntl.fcntl(self._master, fcntl.F_GETFL)
+        fcntl.fcntl(self._master, fcntl.F_SETFL, fl | os.O_NONBLOCK)
+        self.port = os.ttyname(self._slave)
+        self._running = True
+        self._started = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="DoorEmulator", daemon=True)
+        self._thread.start()
+        return self.port
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._close()
+
+    def _close(self):
+        for fd in (self._master, self._slave):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._master = self._slave = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def burst(self, events):
+        """Queue ``events`` random door events to be sent as fast as the bus allows."""
+        with self._lock:
+            self._burst += events
+
+    # -- bus ---------------------------------------------------------------
+
+    def _active_faults(self, now, board):
+        t = now - self._started
+        return {f.kind for f in self.faults
+                if f.at <= t < f.at + f.duration and f.board in (None, board)}
+
+    def _emit(self, board, frames, now):
+        faults = self._active_faults(now, board)
+        if "silence" in faults or "drop" in faults:
+            return
+        if self._mismatch:
+            # 속도가 다르면 상대편에는 엉뚱한 바이트로 보인다
+            self._write(self.rng.randbytes(len(frames)))
+            return
+        data = bytearray(frames)
+        if "garble" in faults and data:
+            data[self.rng.randrange(len(data))] ^= 1 << self.rng.randrange(8)
+        self._write(data)
+
+    def _write(self, data):
+        view = memoryview(data)
+        if not self.baudrate:
+            self._write_all(view)
+            return
+        # 8N1: 바이트당 10비트. TICK 분량씩 잘라 선로 속도에 맞춰 내보낸다
+        chunk = max(1, int(self.baudrate / 10 * TICK))
+        while view:
+            now = time.monotonic()
+            if self._bus_free > now:
+                time.sleep(self._bus_free - now)
+            piece, view = view[:chunk], view[chunk:]
+            self._bus_free = max(now, self._bus_free) + len(piece) * 10 / self.baudrate
+            if not self._write_all(piece):
+                return
+
+    def _write_all(self, view):
+        while view:
+            try:
+                n = os.write(self._master, view)
+            except BlockingIOError:
+                # pty 버퍼가 찼다: 읽는 쪽이 있으면 곧 비워지고, 없으면 버린다
+                _, writable, _ = select.select([], [self._master], [], WRITE_STALL)
+                if not writable:
+                    self.overruns += len(view)
+                    return False
+                continue
+            except OSError:
+                return False
+            self.bytes_sent += n
+            view = view[n:]
+        return True
+
+    def _line_mismatch(self):
+        """Host side of the pty not set to ``baudrate`` 8N1 (``termios`` is shared by the pty)."""
+        try:
+            cflag, ispeed = termios.tcgetattr(self._slave)[2:5:2]
+        except termios.error:
+            return False
+        # 리눅스 pty는 PARENB를 지워 버리므로 패리티 불일치는 흉내낼 수 없다
+        if cflag & (termios.CSIZE | termios.PARENB | termios.CSTOPB) != termios.CS8:
+            return True
+        speed = getattr(termios, f"B{self.baudrate}", None) if self.baudrate else None
+        return speed is not None and ispeed != speed
+
+    def _next_seq(self):
+        self._seq = (self._seq + 1) & 0xFF
+        return self._seq
+
+    # -- simulation ----------------------------------------------------------
+
+    def _set(self, board, door, flags, out):
+        i = (board - 1) * self.doors + (door - 1)
+        if self.flags[i] != flags:
+            self.flags[i] = flags
+            out += door_event(board, self._next_seq(), door, flags)
+            self.events_sent += 1
+
+    def _handle(self, frame, now):
+        self.commands_received += 1
+        board = frame.board
+        if board != BROADCAST and not 1 <= board <= self.boards:
+            return
+        if "silence" in self._active_faults(now, board):
+            return
+        if self.response_delay:
+            time.sleep(self.response_delay)
+
+        boards = range(1, self.boards + 1) if board == BROADCAST else (board,)
+        if frame.cmd in (CMD_OPEN, CMD_CLOSE, CMD_DOORS):
+            if frame.cmd == CMD_DOORS:
+                actions = frame.actions
+            else:
+                action = ACTION_OPEN if frame.cmd == CMD_OPEN else ACTION_CLOSE
+                doors = range(1, self.doors + 1) if frame.door == ALL_DOORS else (frame.door,)
+                actions = [(d, action) for d in doors]
+            if any(not 1 <= d <= self.doors for d, _ in actions):
+                # 하나라도 틀리면 프레임 전체를 거절한다
+                self._emit(board, nak(board, frame.seq, frame.cmd, NAK_BAD_DOOR), now)
+                return
+            out = bytearray(ack(board, frame.seq, frame.cmd))
+            for b in boards:
+                for d, action in actions:
+                    i = (b - 1) * self.doors + (d - 1)
+                    if action == ACTION_OPEN:
+                        self._set(b, d, self.flags[i] | FLAG_OPEN, out)
+                        heapq.heappush(self._timers, (now + self.open_time, b, d, FLAG_OPEN))
+                    else:
+                        self._set(b, d, self.flags[i] & ~FLAG_OPEN, out)
+            self._emit(board, out, now)
+        elif frame.cmd == CMD_POLL and board != BROADCAST:
+            start = (board - 1) * self.doors
+            encode = status_bits if self.bitmap else status
+            self._emit(board, encode(board, frame.seq, 1, self.flags[start:start + self.doors]), now)
+        elif frame.cmd != CMD_ACK:
+            self._emit(board, nak(board, frame.seq, frame.cmd, NAK_UNKNOWN), now)
+
+    def _overrun(self, frames):
+        # 앞 명령을 처리하는 동안 쌓인 프레임: 보드마다 rx_buffer개만 받는다
+        kept, held = [], {}
+        for frame in frames:
+            held[frame.board] = held.get(frame.board, 0) + 1
+            if held[frame.board] <= self.rx_buffer:
+                kept.append(frame)
+            else:
+                self.rx_dropped += 1
+        return kept
+
+    def _random_events(self, count, now):
+        # 보드별로 모아서 한 번에 쓴다
+        per_board = {}
+        for _ in range(count):
+            board = self.rng.randrange(self.boards) + 1
+            door = self.rng.randrange(self.doors) + 1
+            i = (board - 1) * self.doors + (door - 1)
+            if self.noise and self.rng.random() < self.noise:
+                # 센서 노이즈: 짧게 튀었다가 돌아오는 상태 비트
+                flag = self.rng.choice(FLAG_COLUMNS[1:])
+                heapq.heappush(self._timers, (now + 0.05, board, door, flag))
+            else:
+                flag = FLAG_OPEN
+            self._set(board, door, self.flags[i] ^ flag, per_board.setdefault(board, bytearray()))
+        for board, out in per_board.items():
+            self._emit(board, out, now)
+
+    def _expire_timers(self, now):
+        per_board = {}
+        while self._timers and self._timers[0][0] <= now:
+            _, board, door, flag = heapq.heappop(self._timers)
+            i = (board - 1) * self.doors + (door - 1)
+            if self.flags[i] & flag:
+                self._set(board, door, self.flags[i] & ~flag, per_board.setdefault(board, bytearray()))
+        for board, out in per_board.items():
+            self._emit(board, out, now)
+
+    def _run(self):
+        decoder = FrameDecoder()
+        last = time.monotonic()
+        carry = 0.0
+        try:
+            while self._running:
+                readable, _, _ = select.select([self._master], [], [], TICK)
+                now = time.monotonic()
+                if self.check_line:
+                    self._mismatch = self._line_mismatch()
+                if readable:
+                    try:
+                        data = os.read(self._master, 4096)
+                    except BlockingIOError:
+                        data = b""
+                    except OSError as e:
+                        if e.errno != errno.EIO:  # 슬레이브를 아무도 안 열었을 때 EIO
+                            raise
+                        data = b""
+                        time.sleep(TICK)
+                    if self._mismatch:
+                        data = b""  # 프레이밍 오류: 명령을 알아듣지 못한다
+                        decoder.reset()
+                    frames = decoder.feed(data)
+                    if self.rx_buffer:
+                        frames = self._overrun(frames)
+                    for frame in frames:
+                        self._handle(frame, now)
+
+                if any(f.kind == "disconnect" and f.at <= now - self._started for f in self.faults):
+                    break
+
+                self._expire_timers(now)
+                carry += self.event_rate * (now - last)
+                last = now
+                count, carry = int(carry), carry - int(carry)
+                with self._lock:
+                    count, self._burst = count + self._burst, 0
+                if count:
+                    self._random_events(count, now)
+        finally:
+            if self._running:
+                # disconnect 장애: 포트를 닫아 앱 쪽 read가 실패하게 한다
+                self._running = False
+                self._close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Virtual door controller on a pty")
+    parser.add_argument("--boards", type=int, default=4)
+    parser.add_argument("--doors", type=int, default=8)
+    parser.add_argument("--baud", type=int, default=9600, help="0 = unpaced")
+    parser.add_argument("--rate", type=float, default=1.0, help="random door events per second")
+    parser.add_argument("--noise", type=float, default=0.0, help="fraction of events that are sensor flicker")
+    parser.add_argument("--fault", action="append", default=[], type=parse_fault,
+                        metavar="KIND@AT[+DUR][:BOARD]")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--strict", action="store_true", help="garble the line unless the host uses --baud 8N1")
+    parser.add_argument("--bitmap", action="store_true", help="answer POLL with one bit per door")
+    parser.add_argument("--buffer", type=int, default=0, help="frames a board holds while busy (0 = no limit)")
+    args = parser.parse_args(argv)
+
+    emulator = DoorControllerEmulator(args.boards, args.doors, args.baud or None, args.rate,
+                                      args.noise, faults=args.fault, seed=args.seed,
+                                      check_line=args.strict, bitmap=args.bitmap, rx_buffer=args.buffer)
+    port = emulator.start()
+    print(f"emulating {args.boards}x{args.doors} doors on {port}")
+    print(f"  EMRDOOR_PORTS={port} python EMRDoor_App.py")
+    try:
+        while emulator._thread is not None and emulator._thread.is_alive():
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        pass
+    emulator.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""Live event log panel over the journal.
+
+``EventLogModel`` reads rows straight from the memory-mapped journal and
+only reports a window of them to the view, growing it in chunks: towards
+the end with ``canFetchMore``/``fetchMore``, towards the start with
+``fetch_earlier()`` when the view is scrolled to the top.  Opening the
+panel shows the last chunk and jumping far away moves the window, so a
+log with millions of events never has more than a few chunks of rows in
+the view.  New events are picked up by a timer and appended with
+``beginInsertRows`` without resetting the view.
+"""
+from datetime import datetime
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer
+from PySide6.QtWidgets import QAbstractItemView, QHeaderView, QTableView, QVBoxLayout, QWidget
+
+from emrdoor_journal import ALL, EV_COMMAND, EV_CONNECT, EV_DISCONNECT, EV_DOOR_STATE, EV_FRAME
+from emrdoor_journal_mmap import JournalView
+
+EVENT_NAMES = {
+    EV_FRAME: "프레임 수신",
+    EV_DOOR_STATE: "도어 상태",
+    EV_COMMAND: "명령",
+    EV_CONNECT: "연결",
+    EV_DISCONNECT: "연결 해제",
+}
+
+HEADERS = ("시간", "보드", "도어", "이벤트", "값")
+
+FETCH_ROWS = 1 << 16   # fetchMore 한 번에 보여줄 행 수
+BLOCK_ROWS = 256       # data() 캐시 단위
+CACHE_BLOCKS = 64
+
+
+def _format_row(ts_ns, board, door, event, value, aux):
+    return (
+        datetime.fromtimestamp(ts_ns / 1e9).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
+        "전체" if board == ALL else str(board),
+        "전체" if door == ALL else str(door),
+        EVENT_NAMES.get(event, str(event)),
+        str(aux) if event == EV_FRAME else f"0x{value:02X}",
+    )
+
+
+class EventLogModel(QAbstractTableModel):
+
+    def __init__(self, directory, parent=None):
+        super().__init__(parent)
+        self.journal = JournalView(directory)
+        self.first = 0      # 뷰의 0번 행 = 저널의 first번 행
+        self._loaded = 0
+        self._cache = {}    # 저널 행 기준 블록
+
+    # -- lazy loading ------------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    @property
+    def end(self):
+        """Journal row after the last row shown."""
+        return self.first + self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.end < len(self.journal)
+
+    def fetchMore(self, parent=QModelIndex()):
+        self.load_until(self.end + FETCH_ROWS)
+
+    def load_until(self, row):
+        """Expose journal rows up to ``row`` (clamped to the journal length) to views."""
+        row = min(row, len(self.journal))
+        if row <= self.end:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, row - self.first - 1)
+        self._loaded = row - self.first
+        self.endInsertRows()
+
+    def fetch_earlier(self, rows=FETCH_ROWS):
+        """Expose up to ``rows`` more journal rows before the first one shown; returns how many."""
+        rows = min(rows, self.first)
+        if rows:
+            self.beginInsertRows(QModelIndex(), 0, rows - 1)
+            self.first -= rows
+            self._loaded += rows
+            self.endInsertRows()
+        return rows
+
+    def show_around(self, row, rows=FETCH_ROWS):
+        """Show a window of at most ``rows`` journal rows around ``row``; returns its view row."""
+        total = len(self.journal)
+        if not self.first <= row < self.end:
+            first = max(0, min(row - rows // 2, total - rows))
+            self.beginResetModel()
+            self.first, self._loaded = first, min(total, first + rows) - first
+            self.endResetModel()
+        return row - self.first
+
+    def refresh(self):
+        """Pick up newly journaled events; returns how many were appended."""
+        before = len(self.journal)
+        at_end = self.end == before
+        after = self.journal.refresh()
+        # 마지막 블록은 새 행이 생겼을 수 있으므로 캐시에서 버린다
+        self._cache.pop(before // BLOCK_ROWS, None)
+        if at_end and after > before:
+            self.load_until(after)
+        return after - before
+
+    # -- data --------------------------------------------------------------
+
+    def _block(self, block):
+        rows = self._cache.get(block)
+        if rows is None:
+            if len(self._cache) >= CACHE_BLOCKS:
+                self._cache.pop(next(iter(self._cache)))
+            start = block * BLOCK_ROWS
+            stop = min(start + BLOCK_ROWS, len(self.journal))
+            rows = [_format_row(*r) for r in self.journal.rows(start, stop).tolist()]
+            self._cache[block] = rows
+        return rows
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        block, offset = divmod(self.first + index.row(), BLOCK_ROWS)
+        return self._block(block)[offset][index.column()]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return HEADERS[section]
+        return None
+
+    def close(self):
+        self._cache.clear()
+        self.journal.close()
+
+
+class EventLogWindow(QWidget):
+    """Event log table that follows the journal while it is shown."""
+
+    def __init__(self, directory, parent=None, interval=500):
+        super().__init__(parent, Qt.Window)
+        self.setWindowTitle("이벤트")
+        self.resize(640, 480)
+
+        self.model = EventLogModel(directory, self)
+        self.view = QTableView(self)
+        self.view.setModel(self.model)
+        self.view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.view.setAlternatingRowColors(True)
+        # 행 높이 고정: 수백만 행에서도 스크롤 계산이 O(1)
+        vheader = self.view.verticalHeader()
+        vheader.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vheader.setDefaultSectionSize(22)
+        vheader.hide()
+        self.view.horizontalHeader().setStretchLastSection(True)
+        self.view.setColumnWidth(0, 180)
+        # 맨 위까지 올리면 그 앞의 행을 더 보여준다 (맨 아래는 fetchMore)
+        self.view.verticalScrollBar().valueChanged.connect(self.scrolled)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.view)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.refresh)
+
+    def refresh(self):
+        bar = self.view.verticalScrollBar()
+        follow = bar.value() == bar.maximum()
+        if self.model.refresh() and follow:
+            self.view.scrollToBottom()
+
+    def scrolled(self, value):
+        if value == 0 and self.model.first:
+            added = self.model.fetch_earlier()
+            # 보고 있던 행이 맨 위에 그대로 있도록 (스크롤 범위는 뷰가 다시 배치된 뒤에 늘어난다)
+            index = self.model.index(added, 0)
+            self.view.updateGeometries()
+            self.view.scrollTo(index, QAbstractItemView.ScrollHint.PositionAtTop)
+
+    def jump_to(self, row):
+        """Scroll to journal row ``row``, moving the window of shown rows there if it is outside."""
+        row = self.model.show_around(row)
+        self.view.scrollTo(self.model.index(row, 0), QAbstractItemView.ScrollHint.PositionAtCenter)
+
+    def showEvent(self, event):
+        self.model.refresh()
+        # 처음 열 때는 최신 이벤트로 이동: 마지막 한 덩어리만 보여주고 위로 올리면 앞을 더 읽는다
+        if len(self.model.journal) and self.model.rowCount() == 0:
+            self.model.show_around(len(self.model.journal) - 1)
+            QTimer.singleShot(0, self.view.scrollToBottom)  # 창이 배치된 뒤에야 스크롤이 먹는다
+        self.timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def closeEvent(self, event):
+        self.timer.stop()
+        super().closeEvent(event)
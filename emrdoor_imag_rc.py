@@ -6,107 +6,6 @@
 from PySide6 import QtCore
 
 qt_resource_data = b"\
-<<<<<<< HEAD
-\x00\x00\x06\x0a\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
-\x00\x00\x00\x09pHYs\x00\x00\x01\xd8\x00\x00\x01\xd8\
-\x01\xfa\x5c\xa6r\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00\x05\x97ID\
-ATx\x9c\xed\x9bMlTU\x14\xc7\xff\xe7\xbd;\
-\xad@-t\xa6UBh\x01\xa9IIii\xf3\x16\
-\xca7A\x17\x88QW$ZW&\x1a4.\x84\x05\
-~\x84Hbt!b\x94\xe0\x06\x13#;\xbb`a\
-\x0cj\xd0\x04B\xe5k5\xe9G\xa84\x82\xe2LI\
-\x8d\xd2\x96\xb6@\xb1\x9d\xfb\xeeq\xd1\xe9\xf4uf\xda\
-y\xef\xcd{of*\xbf\xdd\xfd>\xe7\xdf{\xfb\xee\
-\xdc{.\xf0\x80\xff7\x14\xe4`l\x18\xa1[\xa6\xb9\
-ZS\xaa\x96\x81\x0a\x8dh\x11\x00\x10\xf3\xb8\x02\xee)\
-!\xe25\x95\x95\x7f\xd2\xb9s2(\x9b|\x15\xe0v\
-k\xeb*\xa5\xd4N0o\x07\xd1F\x00\x8f\x01\x109\
-\x9a%\x00\xfc\x01\xe0\x12\x13u\x90\x94g#W\xae\xf4\
-\xfbe\xa3\xe7\x02\x8c45UI]o#\xe66\x00\
-\x1b=\x18\x83\x01\x5c$\xa2v\x02\xbe\xa9\xea\xea\x1a\xc9\
-\xdf\xca\x19<\x13\xe0\x9f\xc6\xc6\xe5z(\xf4:\x98\xf7\
-\x01X\xeaU\xbfi\xdc\x05\xf05L\xf3S\xaffE\
-\xde\x02\x0c\x18\xc6\xe2r\xd3|\x1b\xcc\xef\x00x\xc8\x03\
-\x9b\xec0\x09\xe0\xb8)\xe5\xc1Gz{\xef\xe6\xd3Q\
-^\x02\x0c\xb7\xb4<\xcb\xcc\xc7\x01\xac\xcc\xa7\x1f\xd70\
-\xc7\x01\xec\x8d\xf4\xf4\x9cv\xdb\x85+\x01\xd80B\xc3\
-\xa6y\x10\xcc\xef\x03\xd0\xdc\x0e\xee\x11\x0c\xe0\x8b\xb0\x94\
-\x07\xa8\xb7w\xd2ic\xc7\x02\x8c\x19FuB\xcaS\
-\x00\x9et\xda\xd6g.\x0a)\x9f_\xda\xdb;\xec\xa4\
-\x91#\x01\x92\x9f\xb5\xd3\x00\x1a\x1c\x99\x16\x14\xccW)\
-\x14\xda\x15\x8eF\xe3v\x9b\xd8\x16 \xe9\xfc\x05\x14j\
-\xbd\xdb\xa7\x1f\xa6\xb9\xd9\xeeW\xc2\xd6\xfa\x1d3\x8c\xea\
-\xe4_\xbe\xd8\x9d\x07\x80Z\xe8\xfa\x99;\xad\xad5v\
-*\xe7\x14\x80\xeb\xeb\xcb\x13R~\x8fb\x9d\xf6\xd9y\
-|R\xa9o\xd90B\xb9*\xe6\x14`\xb8\xa2\xe20\
-\x80'<1+X6\x0fI\xf9Q\xaeJ\xf3\xfe\x0f\
-\x18nn~\x8e\x89\xbe\xcbU\xaf\x88a0\xef\x9eo\
-\x9f0\xa7c\x03\x86\xb1\xb8<\x91\xb8\x0a\xa2:\x7fl\
-\x0b\x8c\xfe\x04\xf3\xba\xe5==\xf7\xb2\x15\xce\xb9\x04\xca\
-\xa4<\xb4\x00\x9c\x07\x80\xda\x90\xa6\x1d\x98\xab0\xeb\x0c\
-H~\xf2~\x03P\xe6\x9bY\xc1r_\x09\xb1\xb6&\
-\x1a\xfd+\xbd \xeb\x0cP\xcc\xfb\xb1p\x9c\x07\x80E\
-$\xe5\xbel\x05\x193`\xb4\xb11,\x85\x88\x01\xa8\
-p5TY9P\xe7\xd3\xca\x89\xc7\x81\xc9\x09\xb7\xad\
-\xc7H\x88\xbap4:j\xcd\xcc8\x9dI\x08\xf12\
-\xb9u\x1e\x98r\xfe\xab\x13\xae\x9b\xcf\xcb\xab\xaf\x00\xd7\
-\xaf\xb9m]\x09)_\x04\xf0\xa553c\x09\x10\xd0\
-\xe6v\x84bG1\xbf\x94\x9e7K\x80\xdb--\xab\
-Q\x9a\x9b\x1e[\x10\xd1\xd6[\xad\xad+\xacy\xb3\x04\
-PJ=\x8d\xd2\xdd\xf4\xd8A\xd3\x95\xda9+\xc3\x9a\
- M\xdb\x1a\xac=\xc1\xc3\xcc\xdb\xaci-\xadpc\
-\xb0\xe6\x14\x00\xa2M\xd6dJ\x00nl,\x03\xb0&\
-p\x83\x02\x86\x81z\xde\xb3G\x9fN\xa7\x04\x18\xd4\xf5\
-5\xc8}iQ\xf2\x10P>r\xedZ\xedtZ\xb3\
-\x14\x94\xc2a\x87'\xb0R\x99\x02@\xd3\x1e.\x885\
-\x85\xc0\xe2kJ\x00\x8d\xd9\xfd\xee\xaf\xc4`\x8b\xaf3\
-3\x80\x88\x0bbM\x81I\x09\xa0\x80\xac\x07\x06\x0b\x11\
-\x22J]\xa7\xcd\xcc\x00\xa5\xee\x14\xc4\x9aB`\xf1u\
-f\x1f@\xe4\xdb\x1d|\xb1A\xba\x9e\xba8I\x09P\
--\xc4\x0d\x00\x81Ef\x14\x0a\x06&\x96\xd5\xd7\xdf\x9c\
-N\xcf\xec\x03\xa2\xd1\x04\x80\x1b\x05\xb1*@\x08\xb8N\
-'O\x9a\xd3\xe9\xd9?\x86\x88.\x07oR\xe0\x5c\xb4\
-&\xd2\x7f\x0cu\x04kK\xf0\x10\xd1/\xd6\xf4,\x01\
-4M;\x83\xa9\xfb\xf6\x85\x8a2u\xfd\xac5c\x96\
-\x00U\x9d\x9d1\x00\x0bv\x19\x10\xd0\x91~4\x9eq\
-&\xc8@{p&\x05\x0b\x13e\xf8\x96q\xfc5\xd2\
-\xd4TejZ\x1c\x0b\xefX|\x94\x84X\x95~,\
-\x9e\xf5\xfcoh\xc3\x86\xcf\x00\xecw;R1\xc2\xc0\
-\xc7\xd5\xdd\xdd\xef\xa5\xe7g\xbd\x19\x22!\x8e2\xe0Z\
-\xea\x22\xe4>\x0bq,[AV\x01\x9216\x9f\xfb\
-jR\x900\x1f\xcev/\x08\xccs;<)\xc4\x87\
-\x00b\xbe\x19\x15\x14\xcc\xf1\x89P\xe8\xc8\x5c\xc5s\x0a\
-\xb0\x22\x1a\x1d'\xa27Q\xda\xfb\x02\x05\xa2\xd7VD\
-\xa3\xe3sU\x987D&\xdc\xd5\xf5\x03\x80\xa3\x9e\x9b\
-\x15\x10\x0c|\x12\xe9\xee\xfey\xbe:9c\x84\xc2R\
-\xbe\x0b\xe6R\xdc\x1c\x9d\x8f\x08q(W%[\xd7`\
-c\x0d\x0d\x91DY\xd9y\x10\xad\xcb\xdf\xae@\xf8U\
-H\xb9\xd5N\xd4\xa8\xad8\xc1\xca\xbe\xbe!M\xd7\x9f\
-\x01p3g\xe5\xc2\xd3\x0f\xd3\xdce7d\xd6v\xa0\
-sUggL\xd3\xb4-\x00\xfa\x5c\x9b\xe67\xccW\
-I\x88-N\xde\x128\x0f\x96\x9eZ\x0e\xa7\x92O`\
-\x8a\x89\x0bB\xca\x17\x9c\x06K;\x0eu\xaf\xec\xeb\x1b\
-\x0a\x87\xc3\xdb@\xf4\x01\x00\xe5\xb4\xbd\x0f0\x80ca\
-)\x9fr\xea<\x90\xff\x83\x89\xdd\xc9\x07\x13\xb59+\
-\xfbC\x0c\xc0\xdeHw\xf7On;\xc8\xeb\xb1C\xb8\
-\xab\xeb\xc7\x09!\x1a\x92\xb3\xe1\xdf|\xfar\xc8}\x06\
-\x0e\x9bR\xae\xcf\xc7y\xc0\xc3h\x90\xbf\xd7\xaf\x7fT\
-\x08\xf1\x06\x98\xdf\x02\xb0\xcc\xab~\xd3\xb8\x03\xe0\x04\x98\
-\x8fDzz<\xf9\x22y\x1e\x0es\xbb\xa5e\x19\x03\
-m<\x15\x90\xb4\xd9\x831\x14\x88.\x10s;\x84h\
-O\xff=\x9f/\xbe\xc6\x03\x0d57\xafd`'\x11\
-m\x07\xb0\x09\xc0Z\x00\xb9B\xd8'\xc1\xfc;\x88.\
-1\xd0\xc1\x9av\xa6\xa6\xb3s\xc0/\x1b\x83}:\xbb\
-c\x87\x18\x1d\x1c\x5c\x95\xd0\xf5:\x1dX\xc2\xc0\x12\x00\
-L\xc0\xb8\x09\xdc\x0b)\x15[\xda\xd0\x10\xb3\x9e\xdb?\
-\xe0\x01\xfe\xf2\x1fH\xe6\xddU\x1f\xa9\xf9,\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-=======
 \x00\x00\x05\xd0\
 \x89\
 PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
@@ -202,716 +101,6 @@ i\xdc\x01p\x02\xccG\x22==\x9e|\x91<\x0f\x87\
 \x0e,a`\x09\x00&`\xdc\x04\xee\x85\x94\x8a-m\
 h\x88Y\xcf\xed\x1f\xf0\x00\x7f\xf9\x0fH\xe6\xddU\xbf\
 \xbd\x8cD\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x13Q\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
-\x00\x00\x00\x09pHYs\x00\x00\x01\xd8\x00\x00\x01\xd8\
-\x01\xfa\x5c\xa6r\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00\x12\xdeID\
-ATx\x9c\xed\x9bw\x94\xd4E\xb6\xc7?\xdf\xfau\
-\xf7\x0c\x82\xa0\xcf\x80\x09\x0f\x0c\xa8(\x8a\x0b\x88y\x11\
-te\x09\x22(\xce\xac\x02*\xb8$%\xa8\x18PP\
-l\x17\x14\x11\x03\x0b\xa6\x01\x04E\xd2\x0e\x865\xa1 \
-0\x04\x03\x22\xa8\xc0\xa2\x22 \xe8\xa2\xbbF\x82\xa4\xe9\
-\xfe\xfd~\xf7\xfd\xd1\xddC3\xce(\x8a\xac\xbc\xf3\xf6\
-\x9e\xd3\xa7\xabn\xac\xbaS}\xabn\xdd\x1a\xf1\x7f\x00\
-\xba\x17.\xde\xcf\x14;'\x89\xfd\xd1\x97\x1a\x07Ru\
-_:,\x90b\xbe\xb4\xd1\x97\xd6\x05\xe2\xfd\xa4\xf3\x8a\
-K\x12\xe1Ko\xfc\xb9\xee\xf7\xbb\xab[{s\xe0{\
-\x0a\xd7\x15.><\x19Fn\xf0E\x8f@T\xf1\xa5\
-\xad\xbe\xf4v }\xe1K_\xf9\x88\xc0\xb9\xea>\x1c\
-\x1585\xf0\xa5\xaa\xbe\xb4\xcdw\x9a\x1c\x86\x1a\xf6\xd6\
-\xe5uV\xff\x94\x8d}\xd2\x01\xf9EE\xdeQ\xdf\xe4\
-\x0d\x0cp\xb7\x06\x92\xe7K\x13\x03lJ\xa5D\x95\xf9\
-\xa3\xfa\x1eSR\xbe\xcc\x8a\xd8\x86\x1d\xae\x99\xaf\xc8%\
-\xbe\xb8\x22\x90\xe4;=\xb0\xa1Zx\xc7\xeaV\xe5\xcb\
-\xc0>\xe8\x80\x81\x0f/\xaaQbnr(\x9d\xed\xcb\
-ML\xe2\xdd\xf1\xe85\xf5?\xf99:\x9aL\xf8\xa8\
-V\xd2\xf3\x86\xf8r\x97\x06r\x0b\x13f\x17\xff\xa3C\
-\xde\x97\xe5\xf1\xeeS\x0e\x88?\xf8V\xcd\x92Hdn\
-R:\xc8\xe4\xba\xdf\xdf\xab\xe1\x94\xf2\xf8\xda\x14.\xde\
-/\x16\xc99\xc1w\x91\x12\xc1\xf7\x7f\xef\x5c\xf7S$\
-+\xcbw\xea\xe4\xd5\xed|\xb9\xa7|\xe9\xbb$^\xeb\
-\x0f/=\xfa\x1fey\xdc\xde\x98\xc8/\x81\xf8\xc8\x85\
-G\x05\x9e7GFe<;\xa3\xa2\xc9\x03T\xf1b\
-S\x1cz\xc7\xb3pY\x88\xadm\xfd\xe4G\xe3\xca\xe3\
-[\xd4\xa1\xce\xdf1\xceBrR8\xf3\xb8\xa2u\xb5\
-\xca\xf2\xec\x13\x0e\x88\xc7\xcda\x9a\x04\x1c\x1cz\xd6\xea\
-\xbe\xab\x1b\x97\xfe\xa5z\x8d~\xff\xd8\x1e\x8f\xbd\xd7*\
-\xd3\xef8qUUP\x0b\xd0S&\x0a\x043\x81\xd6\
-\x15\xe9~\xb7C\xde2'k\x03T\x05=]g\xfa\
-\xaa\x9cl\xfa>\xe1\x80\xe8\x01\x8bn\x00\x9a`t\xbd\
-\xa7\xd7\xa9\xefd\xf0}\x1f^\xd2\x02\xdf\xde\x05\xbd\xdc\
-u\xf4\xd2\x97\xaf\x1c\xbd\xb4\xbd\xb6\xef\x98\x08\xc4\xcc1\
-\xe6\xb9.\xf5\xa6!^\x00\x0ei\xfe\xe4G\x97`\xa6\
-s&\xae\xbc\xe8\xec\x89\xab\xe6\x9c>iM\xc7\x8c\x9e\
-\xf7\x0bj\xbd/\xb8\x12h`[rn\xcc\xb6\xfd\x9b\
-\xc7\x80\xe1\xc3\xdf8\xb4$\xea\xad\xf3\xa5\xd9\xf1kO\
-k\x93\xc1\xdf\xf0\xc8\xe2vI\x5cQ \x96\xfb\xf2\xa6\
-\x04\xb2;}i?\x1fm\xf6\x9d&\x05U?\xec3\
-\xad\xa0 \xb8p\xec\x8a:A\xc4\xcd\xf5\xa5#}\xe9\
-\x9b@:\xd8\x97\xb6\x04Rn\xd2\xb9\xf6\x8b/\xcb{\
-!\xa3\xf3\xb8\xa2O\xa7\xf9RsY\xb4\xce\xea\x82\xc3\
-\xbf\x86}`\x05\xf8\x11\xf5\x06b\x84a\x9fl\xbc\x99\
-.\x05\x14\x89D[\x15\xf6<\xf9\xbe0p'a\xba\
-\xa8d\xcb\x96\xc3\xa6v=\xe9\x9ai\x05\x05\x01\xc0\x0b\
-]\xeb\xad\x0e7Gj#u\x07\x96\x81uK\xc2\x91\
-\x98\x96\xc8lj\xa3\xc9k\xebft:\xe7\x06\x00\x95\
-\x02\xf9\xb7ep\xbf\xe9\x0a\x189rz\xce\xd6\xe0\xc0\
-\xcfC\xe9\x8d\x81\xd7\x9d\xde6\x9bv\xdd\xa8w\xce\x0a\
-=\xef\xf5P\xba\xed\xa1\xab\x1b\xdc\xf5su\x9f9i\
-\xf5]Ii\x80\x8fw\xe6{\x1dj\xbe\x95\xc1\xd7~\
-\xfa\x9f\x13\xcc\xacm\xc2t\xd8\xfa\x82\x1a\xdb#\xbf\xc6\
-D~)$\x12\xd5N\xc3\xe3 L\xa3\xcb\xd2F\xf4\
-i\xfcF\xdfG\xde]\x13B{\xa0\xd4\x01\x1d\xc7.\
-=/D7\xfar\x8d\x03I\x81\xb48\x94\xee\x7f\xb1\
-\xf3\xf133<M\xa6\xacj\x90\x0c\xb9\x19\xf1\xc4{\
-\x97\xed\x9c|\x0a\xecY\xe0\xf2\x5cYs\xe0\xf9\xdf\xf4\
-'`\xe2\x5c \x88\xf9\xb9s\xcb\xd2\xae\x7fxI\x1b\
-\xa06\xd8\xa4\x0c\xae\xf3\x98\xa57\xc9\xf4\x1a\xe8D\x13\
-/\x01\xcf\x1b\xd4\x0daF\xf3\x09\x1f\x0d\xcc\xf0\x85!\
-u\x80\x08\xa6g\xcb\xea\xdd\x9e\x13\x99\x09l\x0b\xd0\xb9\
-\x90\xfe\x09l\xec7\xad?F#\x03\x029\x02\x07I\
-\x84\x9fn\x07\x88@\x8ed\xba\x9d\x8dO\xa6\xdb~\x9a\
-'%\x0b\x81\x84\xef\x1cA\xba\x1d8G\x12\xf0\xd3\xed\
-\x00\xf0\x9d\xce\xf0\xd1\xe6[\xfb\x9dQ/3\xc0\x01#\
-\x17\x8dI:\x97\x1fH\xd5|\xe9\x9b-9\xfb\xe5\x8d\
-\xfbs\xdd\xef\xbb\x17\xbe\x7fvB\x9a\xef;\xf7lI\
-\x89\xeb<\xadW\xbd-\x90:\x14\x05\xb1*\xe3\x02G\
-\x81\x0f\xe7\xcd\xbe\xb2nq\xa3\xc2/\xf6\x8bU\xd9\xf6\
-\xef\xa44_\x11\xd7\xf5\x9d\x82Z\xff\xcevB\xde\xb4\
-\xcf\x16\x18\xf8k\xf3\x8fn\x96\xfa\x09\x18\x83\x80\x04\xf0\
-\x9da\x98)\x1d\x1e\x0d\x99\xc3\x04!\x06\xa6\xb4\xcb\x8c\
-0\x14\xe6\x00B0W\x8a\xdf)\x0b\x98\x81\x1c\x06\x98\
-\x19(\x15r\x14\x1a\xe6\x04\xc6a8-\xc8\x0c,>\
-ra\xd5\x12\xa9+0\x07\x98\xea\x11\xcc\x1e\x97\xce\xec\
-B\xd9\xb5\xa0\xaf-7\xf7\xaai]\x8f\xd9\x92\x91y\
-\xb1\xc7)\xdb\xf2\x8bVt\xdd\xbc\xddk\x22\xdcu@\
-\xf1\x92\x1eGl;c\xd2\x9a\x09\x82^A`_\xd4\
-\x9f\xbav\xeew.\xd2z}A\x8d\xed\xa9Q\xb2F\
-\xa8)\xc0\xce\x18 F\x1f\xf8@~\xff\xb2Kfo\
-\xc2\xf0\xfb\xdf\xf8\xda\x08\xbf\xcb\xf4\x93~\xb8?Q\x0f\
-\x93\xa6>\xd0\xab\xd1\x98]\x98\x8d\x06\x92\xde\x98\xd4\xe9\
-\x98\xcde\xf5L+\xa8\xb7\xa5\xf9\x13\x1f\xce3gg\
-gpou\xac\xdd\xfb\xd4\xa9\x9f\x8c\xc1\xd4\x17\xb8\xaa\
-\x0a\xd4\x01\x96\x03H\xda\x88Y5\xf8\xcd\xb7A\x99\xa4\
-\xd2\x9d(\x9a\x93S\x09\xc0\x85\xd6\xb6\xdfCK.\xe8\
-<\xbe87\x8b70\x88U\xa8I.\x06\x04\xd9\xb8\
-E\x97\xe6-5\xd9<\x80\xa8\x17n-%\x98\xe5\x02\
-\x06\xbb\xe1\x80\x15\xf1\xa2\x0a\x8d\xee\x0e\xbd\xa8\xa8\xc8\x8b\
-\xc7\xad\x02;\xb6\xc1\xe0\x7fJu\x1d\xb2f-0\xde\
-D\x13\xc4\x8b\xd5\xb6W+\x0d\x80\xc8\x16\x82\x9d}\xd9\
-\x98\xe5\xd5\xcbji3y\xe5\xc1`M\x81\xd2\x88\x7f\
-\xd6\x945\xa74\x9e\xbcf\x90\x8ck\x00JJ\xa2;\
-W\x8eq\x04\xb0\x11~\xc4\x01\xebo|\xa6\xc7\xba\x9b\
-\x9e\xfb*w[l\xcb\xca[\x9e\x7fq\xf9\x80\xe7w\
-1\xbc\xe8\xf6W\xeb-\x18\xf4\xca\xdb_\x87U\xb7\xcf\
-\xbec\xc6\x9aW\xe3\xb3Zd\xd3\xa7\x8f\x9c\x9e3\xf5\
-\xae9\x8f%V\x1f\xba\xb9f\xce\xbcM\x8f\xdf3\xff\
-\xfe\xa2\xa2\x22/\x9bG\xe8c\x19\xa5\x01pZAA\
-0\xb4O\xe3\xab*\x7fS\xe9`\x19\xe3\x0d\xda\xf4\x19\
-\xf9\xee!)\xe6\xc8\xfd\xc0~\x1e\xf6\xb7N\x85\x1f\x1c\
-\x9e\x91\xb9p\xcc\xf2\xeaa\xc2\xa6\x02UMn8\xc0\
-\x1f\x8a\xd6T\x0bC{\x0d\x18\x04T\xc3\x18\xfaq\x87\
-#\xbe\xc92|\x04\xe8\x93\x0a\x1d\xf0\xc5\x0d\xcf4\x01\
-=\x8aXlp/F\xd3H\xe8J\xf7\xea\xa2\xfc\x22\
-/\xb0\xf0\xb9\xb4'\xe3\x88\x0d\x22|zz\xbc\xf8\xa8\
-\x0c\xcf\xd6M9\xb7\x1at\x07\x1b\x0fL\x05\xeb\xb7q\
-]\xf5\xde\xd9v\x0c[\x0a\x9cx\xd7\x88\x85\xbb87\
-\x1e\xaf\x970\xd9S@\xd4b\x5c\x080\xb6\xdbI\xcb\
-$\xbb\x0a8#\xf0\x82\x8f\xf3\x1f_\xfe\xda\xc5\xe3V\
-\xcc$\xe2\xad\x02k\x82\xd1}\xce\xe5\xc7\xbc\x0b\xb0#\
-\x11^\x0d\x1c\x10B\xd3w/\xcb;~\xd9e\xb5\x06\
-dt\xd7|n\xed\x01@}\xc9\x16V\xe8\x00g\xb4\
-\x00vl\xdd/\xd9\xae\xce\xbd\xednC\x8c2\xec\x8f\
-E\xf9\xa9\xbf`^\x9dJ\xc7\x00\xc7\x08\xf5o\xfa\x97\
-\x16\x83\x1dt\x02*\xa3\xe0\x9c,/\xb7\x14\xcc\xec4\
-\xa0Y\xef\xce\xb76\xed\x06\xbc\x8d\xb9]\xb26\x93\xcd\
-\x00d\x96\xda\x93\xcb\x8c\xe2j\xa0\xc4|\xb70\x83\x19\
-\xdf\xedw\x13\xcd\xf3\x1a\x80M\x01W\x1d8\x1c(2\
-\xa3\xd1\x8c\xceu\xc7g\x09\xb7\x05\xd6/\xe9P\xfb\xf5\
-\x1fh\x0d\xbc\x96@4\x90{\x09\xb2w\x81l\x90}\
-\x09\xca\xad\xb2\xd5k\xbc6^\xbc$\xb1}\xf3i\x92\
-}]0-u\xfeN\xe4D\xbf\x92\x1f\x86\x10\xfe\xde\
-\xb0)\xc5\xccl\x92\x9asX\xba\xdf\x1a|ip\xf2\
-\x84\xe13\x0eua,Vb\xe4\x19\xf6j\xb6\x99\x9a\
-G}\xf1\xe6\x9a\xcfk|)Y\x01P\x9a\xff\xdf4\
-\xea\x9d\xb3\x02,_h\xc8\xc3\xbd\x7f\xb7\x22[f\xd2\
-U\xf5>\x00\xba\x97;\xee\xd2\xe1\xf38b\xcc\xa9S\
-V_\xb4\xe8\xb2:\xcf\xedB\x0b)0\xe9\xabu\xcb\
-\x8f\x5c\x04\x15\xac\x80hb\xc7x`\x95\xe1^\x0f\xb7\
-m\xda\x0845s\xa5'\xad3\xe3-\xbe\x03\x86\x83\
-z\xce\x1b4c\xbb\x19\x85\xc0\xcc\xb7\xed\xcd\xe2\x0c\x8f\
-\x17\xda`\xe0`\x97\x8c}\xee\x87Z\x07\xc4\x1c64\
-\xdbNAAA\x00z\xd8\xe0\xc2\xf8\xc8\x85'd\xf0\
-\xc9\x98>\x01\xbe6\xb8\xec\xeaG\x96\xe5u/\x5c:\
-\xa0k\xe1\xfb+\xbb\x8cY:\xe4\xf2G\x97\x1eZv\
-\xbc\x17\x8eY^\xbd\xc5\x93+\xaf9\xff\x89\x8f\xce\x02\
-\xf0\xfc\xc8K@\x89\x99\xbad\xf3\xd5-\xfa\xb4\x11\xa2\
-\xad\xb0\x87\x88+\xac\xd0\x01\x07\x8d\xea\xb49\xc7y\xa7\
-\x80\xf5F\x0c\x93\xb33O\x18\xd6fB6\xcf\x19C\
-Z\xdd\x82\xd1\xda\xe0>\xcc\xae\x88\x11m\x1d\x8f\xc7\xc3\
-\x0c\xbd\xfd\xa0?\xbc\xa3\xd0\xea\x1bv\x07\xc6\x00\xf9\x9c\
-\xd4\xad\xff9\x1f\x96\xb5\xe5\x12\xfe\x08\xd0\xb7\x98\x1e\xcc\
-\xe0F\xf48\xe5_\xc2\xb5\x06\xaa;\x05\xabdvW\
-jB\x0c\xb0\x88\xd6v\x18\xb3\xac\x11@~\x91ym\
-\xc7\xafx:\x88F\xd6\x1b\xf6p\xe84\xbf\xe9S\xab\
-F\xf91\x7f\x1e\x10`\x8c\xcc\xb6\x15\xc2P\xe0\xdbH\
-\xac\xd2\x88\x0c.u\x14\xbe~\xdaV\xc4C\x07\xfc\x87\
-\x0fB\x19\x182b\xe15\xbe\xf4p\x80\xeb1\xf8\xda\
-\xc6\xa5\xc1\xf6\xbaG\xdfk\x9a\x84\xae\x09\x8fG\xc6t\
-o\xf0f\x97\xc2\xa5\x0d\x93N\x8b\x03\x180\xa5[\xfd\
-{.\x19\xbf\xe2\xf7\x094?@O\x06\x8e\xc2\xa4\x5c\
-\xc7@\xba\xc6\x976\x84\x8e\x0b\xde\xecpL\xe9\xb6x\
-\xc2\xd4O\xfb\x04\x8e\x91>\xae\xcf\x9a\x82\x1a\x0fe\xf0\
-\xfb\x84\x03\xccLw\x8e\x5c\xf4L \xb5\xf4\xf1\x9a\x0f\
-\xed\xdbhAE\xbc\x9d\xc6,[\x13H\xdf\xf901\
-p\xee\x1c_j\x9d\x8cF\x0fy%}Bl:a\
-\xf5\x89\x04\xde7s\xbb\xec<\xff\xffn\xca\xda\xa6\x09\
-\xa7\x99\xa1\xdcK\x1f\xe5\xd7h\x9f}\x81Z\xea\x00\x19\
-\xb3\xcc11\x01\x04x\x04^\xeaX\x15\xe0\x91\xc8j\
-g\xf0\x892<\xe5\xe3!\xf0<\x12Y\xed\x0c>\x91\
-i{)y_T\x0b\xa4\x87|\xa9$\x10\x97\xdc\xdb\
-\xbb\xf1k\x158\xe0/\x81t\x9b\x9fJ\x85\xf1\x9d{\
-\xfa\x85\xce\xc7\xe7W\xe4\xb0FS?i\x9eDE\x81\
-\xf4\xef\x92d\xf2\xd4\xd5e\x8e\xd2;W\x00\xecg\xa4\
-\xb35\x09?\xfd\x09*\xf8\xfeq\x1a\xbb/\xe7\xca\xe5\
-\x09B4\xe8\xfe^\x0d\x87\x96w\xdd\x9d_T\xe4E\
-\xbf\xa9[uk\xae\xaa4\xf8\xec\xc4\xcf\xe3\xe9\x80\xb6\
-\x0b\x98\xe9\x94\xc9k{\x85\x8e\x07}iY\xe0h\xbd\
-\xa2LVX\xc6\x01\x9a\x08\x1a\x96)\xa1\xec\x00\xc8\x81\
-T?g'\x8e4.7\xd3\xcfe\x17\x99\x0c='\
-\xbb_F>\xeb\x84\xbf\x83\xdc\x9d2\xc0\xb6\x98\xcb\x09\
-\xc3pH\xe8\xdc\xc5\x814't\xf4\x1b\xd5\xb3\xe1\xd2\
-\x1fL\xf0G\xe0\xac\x89\xabN\x0f\xa5\x07|\xe9\x0c\xdf\
-\xb9\xe9\xdb*\x95\x5c\xba\xb2m\xf9\xf5\xc2\xacl\xd06\
-\x1e\xf0\xc0%?\xab\x02\xb3\x17\xa1\xfd\xf5\x8f,\xe9b\
-0<4\xbd\xd7\xe3\xb1\xf7_\xf3ec\x93\xc9\xdc9\
-\x13z\x1f\xffmy\x02-\xc7\xad:$\xe1\xd9\xc5\xbe\
-SA\x00\xcd0\xbeD\xba\xfc\xbd?\xd5\x9cT\xde*\
-\xca\xc0>\x11\x04+\x82\x1b\x87/\xad\xbc\xbdr\xd8\xcd\
-w\xea\x17\x88\x1a\xe9\x9f\xc7\xc7\xbe\xdc\x87\x81\xf4\x8d/\
-E\x02Q\xcb\x97\xab\x15\x88#}\xc9\x05\xd2\x87\xbe\xd3\
-\x93\xdb\xa3\xee\xb1%\x05\xb57\xfd\x94\x8d\x0a\xef\x04\xd7\
-\xf7{\xf6X\xdf\xe3\xa6\x10\x1d\x92t\xee\xe5c\x87]\
-8V\xec\xf4dq\xbc87\x1a\x94\xf4\x0b\xc4\x99\xbe\
-\xd3\xc7%\xb1`h\xab\x01\xad\xbe\xce\xd61\xf5\xae\xd9\
--}y\x9d}\x11$\xb1\xd1\xddnm6\xf7\xe78\
-\xe0\xbe\x9bN\xde\x0a\x8c\xc8/*\x1au\xe0\x86c\xcf\
-0\xec\x5cL\x0d\x84\xd5F\x9c.\xa8\x0e\xfa@\xd8b\
-\x99F\x1b\xcc\x9c{\xc5\xb1\x8b~\x8e\x8drW\xc0\x17\
-\xfd\x8b\x8e\x0e\x83\xc82_\xf2\x03\xe9s_\xaa\x1f8\
-\x86\x9c0\xb4\xed\xed\x19\xc1\x85\xb7M\x7f\xce\x97.\xf4\
-\xa5%\x81T\xcf\x97\xfb\xe7\xa6\xaa\x95\x1b\x14\xf4;s\
-;\xc0\xb4\xc1s.\xf6\x1d\xcf\xf8\xd2\x9a@\x8a\x06\xd2\
-QI\xa9y\xcf\xfeMf\xff\x9c\x01V\x04\x97\x8c]\
-\x91\x1f:\x8a\x92\x8e\x13_\xec\x5co\xc5OK\x94\x0f\
-\xe5\xae\x00\xe7{\x9dBQ\xd9\x0f\x94W\xe7\x81v\xff\
-\x5c\xd9\xff\xf9\xa7@\xd7\x186H\xc8\xde\x1c\xf8\xe2\x91\
-\x06\xed\xcc\xec\x96\xa6\x83[\x0e\x9b5h\xc6\xf9\xc8f\
-\xee\xbfy\xcb\xf9@\xaa\x10!\xeb\x05ZvT\x82F\
-\xeb\xb0\x08\xb9Z!t\x0dP\xae\x03\xe2\x0f\xbe\xd5\xd0\
-\xf7\xbc\x9bC\xc9%\x9d\x08p\xa9\xdd$\xdd\x0e\x04\xbe\
-\xd3+\xe3\xbb\xd5\x1f_\x9e\xfc/\x85r\x8f\xc2&b\
-@\x10\x8dE\xb6\xa4'\xb3\x19#J\xfcN\x01x\xb2\
-XZx3\x80\x9cm\x020\x5c\xd6\xe5\x88b\xc0\xb6\
-f\xf1f\xfe\xa74M\x00;\x0c\xab\xf8F\xc7\xa9\x9a\
- \xcfD\x9e\x8c<\xb0< O\xa6<\x93\xe5\x19\x96\
-\x87\xd9a\xbf\xc2\x9cw\x81rW\x80\xf9\xfa\x1b\x11n\
-\x09\x83\xe4\xdbkn~~\xa5o\xb4\xc2\xa9P\xe9\xb3\
-\xfe\xa9C\xda\xac{\xeb\xb6\xe9\x0bL\xee\xfe\xb9\xb7\xbf\
-rn`j\x82\xf8\xa2\x04oV\xe9\x84\xcc& \x8d\
-\x9exw\xf1|\x9fy9\x01:\x01\xb8\xa3\xa2\x81\xdc\
-q\xed\xe9\xc5\xc0\xa9\xbf\xf6\x04\x7f\x0a\xca]\x01G\x8c\
-\xb8\xf8C'w>\xb0\x0e\xa8apw\xa5\x9c*\xfd\
-2t!\xf3\x82\x9c\x8b\x10\x13\x90\x8e7\xb1 \xf4\x82\
-s/\x8a7\xdb\x98\xe1i\x7f\xdb\xb9cM\xea\x09\xc4\
-$|\x93]\xd1\xb3\x7f\x93\xa7\xf7\xf6\x84~.T\xb8\
-\x0b\x1c1\xbc\xdd\x02\xa0yE\xf4\xd3\x86\xfe\xe1[\xa0\
-gEt\xa5\xf6\xde\xc2\xf4g\x9f\x85\xdf\xbc8\xfa[\
-C\xe9\x0a0#w\xe3-\x93\x0e\x04\xd8D\xb5]\x98\
-\xca;M\x94\xc5m*\x15\xa9V>\xbd\xa2~\xb5\xb2\
-\xb8j?\xe4)\xa7\x9f\x14\x95\xcb\x19\xd6\xcf\x86R\x07\
-\x08\xfaZI\xac\xaf/\x91\xa3\x92]\x12\x97\x9cr\x92\
-\x9aH\x19\x5c\xb4$\xd3/\xc1W\xfa\x87\x9f\xc5\x93S\
-&\x19*\xd5Y\xb2\x93'Z*\x9f\xd6\xb9\x8b\x8d]\
-u\xa6\xae\xf5\xf7\xbc\xb8\x9d\x1d\x03\xe6I\xbc\x22\x0cK\
-\x97\xb325\x0b\xcb\xd4.LH\xa0t\x99\xcb\xccR\
-<\x96.u\x91*\x85e<\x0ai~\x84YJ\x8f\
-\x0cP\xba\x84\xa6\x94\x1e\x91\xd2ci\xdb)Q\xa5*\
-\x17\xe9r\x5cJN)\x132\x04'\x81:\xb2\x87\x90\
-]\x1a{\xfb\x80\x07\xf2\x87\xed\xa9\xc2\xff\x14\x5c2v\
-E>b\x8f\x1d\xf0\xdf X\x11\xc1\xe2\xc5\x91\xcf\xb6\
-lj\xe9K\x87$\xbcp\xce\xf1\xf7\x5c\xb4\xae,\xcf\
-\xfc\xf8+\xf5\xc3P\xa7\x85\xe6>>wp\xf3ye\
-\xe9O\xde=\xeb\xa0\x88\xbc\x16\x09\x11DwT\x9a\xde\
-)~\xfa\x0f\x0a\x9b\xbf5\x94\xbb\x02V\xf5\x99\x9e\xf3\
-\xf9\x96\x0dsM\xf6\x02\xb2\xc7\x9d\xb9\x0fV\xf4\x7f\xa1\
-e6\xcf[\x03_\xe9\xeb\x02\xde\x03F\x9b\xb3\xb93\
-\xe33wy\xab7\xf5\xeeY\xc7\xc6B\xf7\x0f3&\
-\xca4%\x91[\xb2|\xcc\xb0\x9d\x95\xa3}\x05\xca]\
-\x01Uc\xdb\xafL\xa2\xb3\x0c:x\xa1[\xe8{V\
-$\xf1W\xe0\x15\x80\xd7o~~\x7fd\xc3\x85\x9e\x89\
-8w]\x80u7\xb8\xe3\xa5\xf8\xec\xb1\x17\xc4\xcf{\
-\x13\xc0\x0b4\xd8\xf7p2\x1a\x98g\xb9f\x9a\x11*\
-r\x1b\x15\x1c\x9e\x86>\xb2\xe0\xc0\xedAN\xbb\x84\x14\
-\x0d\xd9\xf9\xd0\x22\xc4#\x99\xb9c\xb4\xf0\xf5\xf1=\x1b\
-~\xf0k:\xa0\xa2\x18P\x1b\xd8V\xb3\xf2\xd2\xbf\xd5\
-\xbc\xef\xc2\xb5\xa0\xe9@\xadLi,\xe2Ek\x001\
-CO\x9f\x1do\xfe\x05~\xf0\x14\x80sa\x9d,\xcd\
-\xb51\xde\xe98\xb0\xd9\xfb]\xfa7[\x08Z\x86Y\
-\x9d\xf2\x8c\x01\x94\xf8\xd1\x8b\xcc\x18'\xa3\xd0\xb0\xc2T\
-\xb1E\x85&+$Ux)\x0c\x9dw\xe7\xaf5\xf1\
-\x0c\x94\xbb\x02B1\x1f\xb8\xf9\xd3\xad\xf5\x0b?\xb9\xe9\
-\xefo'\xb1\x9e\xa0\xd73\xa5\xb1\xfds\xb6\xac\xde\xe4\
-W\xf9\x17\xd8\xa0\xb9\x83^\xcd\x09\xa5\x0e@\xd2\x85\xc1\
-\x9bYj\xe6\x03\xbd'\xdd]|c\xd2\x91\x1b`g\
-J\xaap\x02\xf1\xbe\xa7\x8f\x8b\xffu\xf1\xacd\xc4\x22\
-\x1e\x86\x8f\xe1\x01I\xcb\xc1Yj5l;\xd8[\xff\
-\xebM=\x05\xe5:\xe0\xf0\xfb\xda\xbf\xbc\xfe\xa6g\xef\
-\x06\xf57\xd1\x15XnX\xb7\x0c\xbd^\xbc \xf1\xf6\
-\xed\xaf\xfe)\xc4\xa6\x02\x13Ll\x15t\xffc\xbcE\
-\xe9\xfb\xfc\x92dI\xdc\x8bV\xaak0<\xbd\x97?\
-\x13\xdd\x16\xdc\xfbc\x83\x89_{\xcag\xbf\xd6\xc4v\
-\x17*\xdc\x05\x8e\x1a~\xf1\xc0\x8fn~\xfe\x9e\x1c\x17\
-\x1et\xdc=\xed\xd6\x95\xa5\x9f6\xb8\xc5\x82\xa2\xfc\xa2\
-\xa3\x0f:\xaeJ\xcd\x92\x0d\xaco5\xaa\xd5.o\xf2\
-;\xc5[m\x06Z\x8d\xbf\xb7\xf80\xf3]\xf0\xe7[\
-\x9b|]V\xc7\xbe\x00?\xfaN\xb0\xee\xbdm\xbf\x07\
-*\xfc\xf7\x93\xf4Ob\xcd\x8f\xe9\xe8rs\xb3\x1f\xdc\
-\xc5\xefK\xf0\xdf\x83Pi\xcb\xf8\xd3\x86\xeb\x8b\x1a\xa6\
-\xde\xf6\xa5\xde\x02f\xee\xe42o\x00}\xa5\xdf\x09\xba\
-L\xf5\xc7\xe1#B'\x92\x02\xdf9BR\xb4\xa4\x1c\
-\xbe#\xddO\xcbCV%\x88\xd4\xbd\x9f\xa7\xb4\x8d\xb4\
-\xbe\xf4\xfb\xc2\x10H\xa6\x93\x9f\x90\x94\xae\xa4H\xf7\x85\
-/~\xf0VhO\x1c\xf0\x04p\x1a\xe8\xc0L\xc2\x93\
-\xce:\xd2_;\xb3/\x95\xae\x99TCJ\xe5+ \
-\x9c\xa5\xb2\xb6T\xdeb\x08\xe5\x02\xf5\x10k\x85}\x87\
-\xdb\x99\xbd\x09W\x9a\xcc\x95&:d\x12\x1f+M\xc0\
-\x1c\x22p\x96\x96\x11\x0e\x08S\xac\x09`:%\xdb\xd7\
-\xee\x89\x03\xf6\xeac\xe9\xa9w\xcf:\xd6\xc7[\x99t\
-\xaec\x97[\xce\x99\xbc7m\xfdR\xf8\x7f\x1f\x03\xf6\
-\xae\x03\xcck\x08 \x0b\x1b\xeeU;{\x00{\xcd\x01\
-O\x0f\x99\xdd\xc6\xb0'\x81\x0d\xa0\x1b\xc6\x0d\x9b7\xf0\
-'\x85~\x03\xd8\xed\x18\xf0\xe1\xad\xcf\x1e\x94\xb4X\x03\
-?\x92JL|\x22\xa9\xa8\x9e\xd5\x07\xd8\xe1A\x88\xd5\
-\x0a\xe4\x1e\xf2\xa5\xf7B\x17m\x99$\x18\x11HW\xf8\
-\xe8\xee\xc0S\xb1\x0f\x04D\xf0#\xa4t\x00\x81\x17)\
-m\xfb\x00\x8a\xad\xb9\xaf\xcf\xc9{\x14\xe0v\x07v\xfb\
-\x1f&B\x8b\xc6\x91\xf5V\xa8T\xc4V\x88$\x14*\
-\xf5\xad\x90@\xa9\x9d LEp?\x0c\xbd\xcb;\x0e\
-\xfc\xfd\x86\xf1\xf1\xe2\x1e\xe4\xea<\xc4\x003\x06 a\
-\x0aS\xe1\xdc)}\xad\x96\xd6\x97\xfe\x84\xf2\xdf\x02\xce\
-\xdck3O\xc3n;`{.\xfdc;\xf4Dh\
-\xe0\xa2F\xea\x06/Jh\xe9m,j\x84\x18\x8e(\
-FX\x0bx\xc2\xb9\xe0\xd9'\x87\xccn\x11z\xeea\
-\xe0\x08\xb0\x1b\xe54\xd7H\xf1\xca\xa2\xe0 \x04\x1cF\
-`\x86Y\x940\x0a\x09_\xff\x91\xbc`\xafm\x83\xd3\
-\x06\xbf\xd6\xd4w\xdeK\x81\xe4|)\xd7w\xf4\xee\xda\
-\xbf\xe9#{\xcb\xde/\x85\xbd\x16\x04\xf3o?\x7f.\
-\xa1.\x00\xbeC\xf4\xda\x17'\x0f\xf0\xbfa\xaay2\
-\x9dNu\x7f\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x07\x08\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
-\x00\x00\x06\xcfIDATx\x9c\xdd\x9b{l\x14E\
-\x1c\xc7?\xb3{w-mQZ,\xe9\xf5\x0aB,\
-\xd8\x16\x89\xd8\xfa\x0e\x89\xe2\xeb\x8f\x02\xa2\xc6\xa4AQ\
-\x09\xbe\xa2b|!\x08\xc4D4*\xc1\xf8\xc2GL\
-4\x8a\x8a\x10\xdf\xf6\x0f\xab\x11\x8d\x1a\xe3\xb3\xa0\x88\x08\
-jU@\xe8C*\xf6\x04J)w\xbb\xe3\x1fe\xef\
-z\xd7\xbb\xde\xce\xdd\xee\xd1\xeb7ir;7\xf3\x9b\
-\xf9~\xba7\xbb\xf3\x12dQ\xb2\x13?!\xefl\x84\
-\x98\x09r\x22\x10\xa05T\x88.\x0e\xa3\x11\xc4+>\
-\xc1c\xae\x14\x93\xd8\x94\xad6\x89lT\x22\xdb8\x0e\
-\xcd\xbb\x14\xc9\xcd@^\xcc\x97\xbbC\x03[\x94'6\
-\xa2\xcb9\xa2\x86\x16\xb7\xdb\xe6:\x00\xb9\xdb;\x15\x9d\
-F`\x5c\xc2\x0c\xf1\x00,i\x18\x14\xea\xd7\x8b*\xe3\
-%\xf7Z\x07\x9a\x9b\xc1e\x87o6:_\x91\xcc\xfc\
-`2\xd19`\xbc(\xb7i\x0f9\xdf\xb2\xa8\x5c\x03\
- \xdb\xf5\x19H\xf9:0\x22\xfd \xc0\x01s\x89\xdc\
-\xaa\xadp\xacaqr\x05\x80l\xd7g\x80\xf66\xf1\
-\xbf\xf7t\xd5m.v\x0b\x82\xe3\x00\x1c7o\xc9%\
-\x08\x8e\x02p\xcd\xbc%\x17 8\x06\xc0u\xf3\x96\x1c\
-\x86\xe0\x08\x80\xac\x99\xb7\xe4 \x84\x8c\x01d\xdd\xbc%\
-\x87 d\x04\xe0\xa8\x99\xb7\xe4\x00\x84\xb4\x01\x1cu\xf3\
-\x962\x84\x90\x16\x80!c\xdeR\x06\x10\x94\x01\x0c9\
-\xf3\x96\xd2\x84\xa0\x04`\xc8\x9a\xb7\x94\x06\x04\xdb\x00\x86\
-\xbcyK\x8a\x10l\x01\xc8\x19\xf3\x96\x14 \xa4\x04\x90\
-s\xe6-\xd9\x840(\x80\x9c5o\xc9\x06\x84\xa4\x00\
-r\xde\xbc\xa5\x14\x10\x12\x02\x186\xe6-\x0d\x02a\x00\
-\x80ag\xdeR\x12\x081\x00d\x87o6h\xef2\
-\xdc\xcc[\xea6\x17\xc7\xcf1Ff\x85e\x9b\xb7\x16\
-\xc1\x17@\x81\x9dX_\xb5\x94\xb2\xf0\xb5Z\x82\x07}\
-\x09\xbf\xf7\x1f\xdb\xc3S\xf3\x9a\xa9\x09\xfc\x07@\xf3\x1f\
-\xa3\xb9cM\x1dB\xc0\xd3\xf3\x9a9y\x5cW_\xc6\
-#\xb3\xc2om\xf2s\xe3\xeaIH!x\xe6\xca\x16\
-\xe6\x9c\xda\x1a\x89\xb5\xb5\xad\x80\x9b_\x9dH\xfb\x7f>\
-\xbc\xba$P\xdc\xcb\xf9\xd5A\xae<s\x0f\x81\xe2^\
-\x05\x02G\x1c\x17\xe9\xf3\xad\xd9f\xd1g\x9e\xe3\x10\x9e\
-\x1fA\x94\xdb\x8dS\xbbt\x06\xdb\xda\x8e\x194\xcfE\
-S\xdah\xbc\xebs\x00\xa6-\xbf\x88\x8d\xdbG\x030\
-\xbe\xb4\x9b\xe6\x07\x9a(\xca\x0fG\x00\x8c\xb9\xf3\x5c\x82\
-\xfb\x0d\x00F\x16j\xec}\xe2\xf3H\x9c\x99O\x9e\xc4\
-G[\x8a\x07\xc4\x1f\xe15YT\xbf\x8b%\xf5\x7f\xa1\
-\xa9\xbc\xd3\xea\x18\xe4S-jh\xe9+\xa6y\x97\xa9\
-\x98\x07h\x0b\xe6\xa7\xcc\xe3\xd1e\xe4sG0zc\
-\xed\xe8,d\xd9\x1bSc\xf2v\xf7F\xf3\x1e\x8c\xfb\
-\xa7\xb6v%\xbe\xcbzB\x1a\xcb\x1b\x8f\xe7\xaa\x17\xaa\
-0M\x1b\x8d\xb6d\xa0c\x88u\x00\x1e\xd9\x89\x9f0\
-7)\x14\x1f\xa0<\x8fAyIOL\xda\xa4\xb2}\
-\xac\x9c\xf3}\xd22\xcf\x7f:\x91Y\xb5\xad\x5c0\xea\
-/\xa5\xba\x84\x00)c\xd3\xdel.\xa5\xca\x7f\x90{\
-g)\xc4\xea\x95u\xf27\xa6z\x08{/%\xc3N\
-\xaf\xaa|\x1f\xdf\xdc\xff\xa1R\x19)a\xc1\xea\xd3\xf8\
-\xec\xda=\x94\x8d<d\xbb\xdc\xe8\xc2\x10\xeb\x17\xfe\xc4\
-\xb2w\xc6\xd3\xb4\xb9$\x92\xfeH\xd3X\xae9\xfbo\
-\xc6\x8d\xb6\xd9'H \xa4-\xd4@\xd4+\xb5\xdcA\
-\xed\xfc\xa7\x90\xfaUu\xca\xe5&\x07\xbay{\xc1V\
-f\x9e\xbc7\x92v(\xac\xf1\xf2\x97ej\x81\x0cy\
-\x81\x06\xf2D\xe5\x16\xc4\xe9\x97\xb6c\xa8Y4\x8b\x9a\
-E\xb3\x98r\xcfL\x16\xac>\x8dP\xd8^\xaf\xb4e\
-\x87\xc6\xca\x8f*\x95\xeb\xd4\x85\xe4\xd1\x86?c\xd2\xd6\
-\xff<J-\x88A\xb1\x07P\xc46P\xbda\x9d\xed\
-{\x8a\x22\xd7\xbfw\x8c\xe4\x8c\xca\x7f\xb8j\xdav[\
-\xe5\xef{\xaf\x02S\xa6\xce\x17\xaf\x09\xa5\x87\x08\x14\xf7\
-\xd2\xda\xd5\xf7\x0b\xde\xf9o\xea\x8e9F\x86\xf4\xba\xb6\
-68\xd8\xb2\xb3\xbf\xb8\x87\xf1\xa5\xdd\x91\xebp\xc8\xc0\
-\x0c\x1bi\xd5#e\xb4&\xe5\xa5n\x01\x1a\x92\xf6\xb4\
-j\xee\xa7<\x8f\xc1\x841\x07\x980\xe6\x00\x95e\xfb\
-\xb9~\xfa\xef4\x9c\xb93i\xfe\x02\x9f\xc1s\xf3\xbf\
-Ed\xb88\xbf\xbd3\x9f\xb6`\xf4\x119\xae\xc4~\
-g\x0a\x80&B\x1e\x84\xf8\xf5\xc8n\x8d\xb4\x95\xceS\
-\xe0\x9c\xea\xbf\xb9az\x0b\xcf\xae\xf3\xa4U\xa7!\x05\
-w\xbe~BL\xda\x85\x93\x83jAt\xba4\xa4|\
-?\xad\x168\xa0\x07\x1b6\xe1\xf1\xa9\xff\x0a\x7f\xda]\
-\xc8\xa5\xab&\xf3\xfe\x8f\xd1\xc7`\xbe\xc7d\xde\xb4\x0e\
-\xb5@\xbaX\xef\xc1\x1bj$\xec}\x1cP\xecA\xa2\
-\xb2\x9e\x02\xfdU9f?\x8f\xcd\xddHe\xd9\xfe\xa4\
-\xe5\x0a\xf3\xc2<|\xf9.\xee^\x1b\xb0]\xd7\xden\
-/u\xcbk\x07\xa4/\x9e\xb1\x8b\xb1%\x0a\xe3\x02\x01\
-\xe8\xe6#\x9a(\xa5\x1dx\xd6~\xc9\x81\xb2\x9e\x02\xfd\
-\xff\xd6o\xf1\xb3h\xdd))\xcb\xde6\xfdON\x1a\
-o\xff=6\xfe-\x10\xa0\xe1\xf4N\x96\xd4\xab\xbdQ\
-\x92/\x9aE\x15\x9b\xfb\xee?#\xf4\x10B\xb6\xa6(\
-\x12\xa3@qO\xca<\x86\x19\xed\xe5\x02%\xd1^\xbf\
-\xa2\xdfg\x80\x0fn\xdd\x80\xc7\xabG\xaeG\xe4\xc7\xf6\
-\x8e\x15\xa3\x0e'\x8c_\xe03y\xe0\xb2\x1d\xbcr\xdd\
-/\xea\x83!)\xe7@\x06\xc3\xe1\xaf[JY\xb8\xb6\
-\x96\xae\xee\xc4\x03\x95\xf2Q=<5\xef;\xaa\xcb\xf7\
-\x01\xf0\xc3\x8e\x12n\x7f\xb5\x0e]\x93<y\xf5\x06\xa6\
-\x8c\x0d\xf6e\xb4\x86\xc3\xdf\x97s\xe3+\x93\x90\xc0\xaa\
-+\xfe`\xee\xe9\xbb\x22\xb1\xb6\xb5\x17p\xcb\x9aJZ\
-\xbb\xf2\xf0\xea\x92\xb1\xc5\xbd\x9cW\xdd\xc5\xdc\xb3\xf6\xe0\
-O\x02'\xa9\x12\x0d\x87-\xc9\x0e\xdfl\xa4|\x13\xf0\
-\xaaE\xcd@\xc9v\x89\xb9\xa5\x22\xedaQm.\xb5\
-.cn\x1cQv\xb8\x11\xccK\x00\xc5Y\x86\x1cQ\
-\x81\xb6\xa2\xbfyH0'(\xfcF\x13\x98\x971\xdc\
- \x14h+\xc4dsI|r\xc2\xaec\xd8AH\
-b\x1e\x06Y\x17\x186\x10\x061\x0f)V\x86r\x1e\
-B\x0a\xf3`cm0g!\xd80\x0f6W\x87s\
-\x0e\x82M\xf3\xa0\xb0? g (\x98\x07\xc5\x1d\x22\
-C\x1e\x82\xa2yHc\x8f\xd0\x90\x85\x90\x86yHs\
-\x97\xd8\x90\x83\x90\xa6y\xc8`\x9f\xe0\x90\x81\x90\x81y\
-\xc8p\xa7\xe8Q\x87\x90\xa1yp`\xaf\xf0Q\x83\xe0\
-\x80yph\xb7x\xd6!8d\x1e\x1c</\x905\
-\x08\x0e\x9a\x07\x87O\x8c\xb8\x0e\xc1a\xf3\xe0\xc2\x99!\
-\xd7 \xb8`\x1e\x5c:5\xe68\x04\x97\xcc\x83\x8b\xe7\
-\x06\x85\xdfhB\x88\x06 \xf5\xf4q\xd2 \xf4\xcd\xe1\
-\xb9d\x1e\x5c>9*\xca\x0e7bp6\xa08i\
-O\xdf\xd1\xd9\x22}~\xfc\x1c\x9e\xd3r\x15\x00\x80\xa8\
-\x08m\xc2\x08\xd5\x02\x8f\x01\xa9W/\x05\x90/6\xe0\
-\xe3D\xb7\xcf\x0d[\xd5eMG\x8e\xcf_\xdc\xef\xf8\
-|E\xbf\xe3\xf3]x\xc4\xc7\xe8\xe6JQ\xc5\xe6l\
-\xb5\xe9\x7f\xd9&\xc9\xb4'\x0e\x8b\x10\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00\x0a\xf9\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
-\x00\x00\x0a\xc0IDATx\x9c\xed\x9b\x7fpT\xd5\
-\x15\xc7?\xef\xbd\xdd\xfc\xfe\xbd!\xc4\xc4\x08\x04\x14\x84\
-\xaa\x15j\x11\xfc\x81\xb6E\x10\xa6\x8e\xad\xb6u:e\
-,\x1d\x07Z\x0cX\x14\x05\x9d\x8a\xa8\xf5W\xc5\xce\x08\
-N\x15\xa6\x9a\xfePQ\xa4u\xc6\x0a\xb5:\x85j\x05\
-\x11qj5R\x11\xf9\x11L6\xbf\x93M6\xc9&\
-\xfb\xe3\xdd\xfeq\xeff7\x98\xbc\xdd\xcd{\xebt\xa6\
-|g\xde\xec$\xef\xdcs\xce=\xf7\x9c{\xcf=\xf7\
->8\x8d\xd3\xf8\xbf\x86\xf6%\xca*\x07\x16\x01W\x00\
-3\x80\x09@\x81z\xd7\x0d\xd4\x03\x1f\x03o\x02\xbb\x80\
-\xe6/Q\xb7\xb4b\x1e\xf0\x17 \x0c\x88$\x9f\x90j\
-sy\xba\x95K\xa7\x07L\x016\x03\x0b\x01\x0c`f\
-v6\x0b\xf2\xf2\xb9(;\x9b\xb322(\xd2u\x00\
-|\xa6I}0\xc8\xc1@\x80\xbf\xf5\xfay?\x10\xc0\
-\x8c\xf1\xd9\x05\xac\x02\x8e\xa6C\xc9t\x19`\x09\xf0\x1b\
- /K\xd3XZ\x5c\xc2\xb2\x92\x12J\x0d#\xa9\xc6\
-\xed\xe10[\xba:\xa9\xed\xeabP\x08\x80^`9\
-\xf0\xbc\xd3\x8a\xa6\xc3\x00\x1b\x80{\x00\x16\xe7\xe7\xb3\xbe\
-\xac\x8c\x0a\x97{L\x8c\x1aC!6\xb4\xb6\xf2Z\xaf\
-?\x9e\xf7\xbd\x0e\xe88\x04\xa7\x0dp/\xb0^\x03~\
-\xee)eui\xe9\x90\x80\xeco~\x03!\x04\x03\xbb\
-\xf7\xa4\xc4P\x00Ovv\xf0H[[4,\xee\x01\
-\xeesJa\xdd)FH\xb7_\xaf\x03OTTp\
-k\x5c\xe7\x01\x84\x10 R\xb7\xb7\x06\xac(\xf1\xb0\xe9\
-\x8c\x8a\xa8\xb2\xf7\x02?\xb4\xafn\x8c\xbf\x13\x98\x02|\
-\x00\xe4\xdeQ:\x8e\x95\x1e\x0fZ\x86\x1b\xe3\x8c\x0a\xc2\
-\x0d\x0d\x10\x898\x22dSG\x07\x8f\xb6\xb7\x81\x9c\x13\
-.\x00\x8e\xd9\xe5\xe9\x94\x07l\x06r\x17\xe7\xe7S\xe3\
-\xf1\xa0i\x1a\x99\x97\x5cJ\xe6\xec\xd9\xb8\xab\xaa\x1c\x12\
-\x01+=\x1e\xae\xce\xcf\x07\xc8\x0369\xc1\xd3\x09\x03\
-\x5c\x01,\xcc\xd44\xee\x1eW\x86\x06\xb8/\x9c\x891\
-n\x1c\xa2\xbf\x9fp\xb3s\xf9\x8c\x06\xdcW6\x9e,\
-M\x03X\x0c\x5cf\x97\xa7\xcb.\x03`\x0d\xc0O\x8a\
-K\xa8t\xbb\xd1=%\xb8\xa7L\x86H\x84\xc1\xbd\xfb\
-\x10\x03\x03\xc3\x88[\xc3a^\xea\xe9f\xa7\xdfOc\
-(DP\x08*\xddn\xae\xca\xcbciQ1\xe3\x5c\
-\xd6*\x95\xbb\x5c\xdcX\x5c\xcc\x96\xceN\x80\xdb\x81\x7f\
-\xdaQ\xde\xee\x1cP\x0e|n\x80\xeb\xe0\x94\xb3)5\
-\x0c\xb2\xae\x98\x87Q6\x9e\xe0\xa1C\x84\xea\xea\x86\x11\
-\xbf\xe2\xefams\x0b\xbd\xe6\xc8sB\x9en\xb0\xb1\
-\xbc\x9c\xc5\xd2\xcdGE[8\xcc\xd7\x8e~\x86)\xb3\
-\xcbJ\xa0u\xac\x1d\xb0\x1b\x02\x8b\x01\xd7\xac\xec\x1cJ\
-\x0d\x03\xbd\xa0\x00\xa3l<\x22\x18$|\xf8\xf00\xc2\
-W\xfc=\xd4x\xbd\xf4\x9a\x11\xe6\xce\xbf\x9a\xc7w\xec\
-\xe2\xd5C'y\xe3h\x0b\x9b\xfe\xf4W.\xb9j\x11\
-\xbdf\x84\x9a&/{\xfa\xfa,\x85\x8es\xb9\x98\x99\
-\x9d\x0d\xd2\x83\x17\xd9\xe9\x80]\x03\xcc\x03X\x90\x97\x07\
-\x80QQ\x09@\xa4\xa1\x11\x11\x0a\x0d\x11\xb5\x86\xc3\xac\
-mnA\x00\xcb\xee\xdc\xc0#\x7fx\x89\x99\x97\x5cN\
-aq\x09Y9\xb9\x5c8\xf72\x1e\xfe\xfdv\x96\xad\
-\xbb\x87\xb0\x10\xac\xf0zi\x0b\x87-\x05/\xc8\x1b\xf2\
-\x92yv:`\xd7\x003\x00f\xc9\xd1\xc0(/\x03\
- \xd2\xe4\x1dF\xf4RO7\xbdf\x84\xd9W\xceg\
-\xc9\xaa5\xa32[r\xcb\xed\xcc\xf9\xd6Bz\xcd\x08\
-\xb5\xbe.K\xc1Q\x99Q\x1d\xc6\x0a\xbb\x06\x98\x000\
-1#\x03\x00-'\x17\x00\xb3\xbb{\x18\xd1N\xbfL\
-e\x7f\xb0|eB\x867(\x9a\xbf\xf7\xf6Z\xd2M\
-t\x0f\xa5\xd7\x13\x93Uv$\xd85@>@\x81\xda\
-\xd5\xe9jT\xcc@`\x18\x91W\x85\xc3\x8cY_O\
-\xc8p\xea\x053\x018\x1e\x17B#\xa10\xb6\xb1*\
-\xb0\xa2K\x04\xbb\xcb`\x08\xc8\x08\x0b\x81[\xd3\x88t\
-u\xcat\xf7\x94\xcc/ wtI!\x1c\x0a\x02r\
-\xfbl)8\xc6\xd3\xdaR\x09`\xd7\x03Z\x01\xdaU\
-\x87\x07v\xefa`\xcf\xee/\x10U)w\xfd\xf8\xfd\
-\x03\x09\x19\x1e\xa9\xfb\x10\x80I*\xacFC{\xcc\xc8\
-c^\x02\xc1\xbe\x01>\x01\xf8xp\xc0\x92\xe8*\xb5\
-Jl\xdf\xfa\x84\xdc\x14Y\xe0\xc5-\x9b\x01\x98\xaf\xda\
-\x8c\x86\xbaX\x82u(\x09=G\x85]\x03\xec\x038\
-\xd0\x1f\xb0$ZZTL\x9en\xb0\x7f\xf7\xeb\xd4>\
-\xf6\xd0\xa8F\xa8}\xecA\xf6\xef~\x9d|\xc3\xe0\xc6\
-\xa2bK\x9e\x07c\xf3\xcc;)k\x1d\x07\xbb\x99\xe0\
-\x1c`\xdf\x04\xb7\x9b\xb7\xab'[\x12\xee\xf4\xfb\xa9i\
-\xf2\x12\x16\x82\xd9W\xce\xe7\xfb\xcbk8\xf7\xab\xb30\
-M\x93O>x\x9f\x17\x9e\xda\xc4\xc1\xb7\xf6\xa0\x03[\
-++\xe3\xd7\xf9\x91\x05\x1f;J\x83\x9c(g\x03\x89\
-ck\x14\xd85\x80\x86\xac\xe6V\xed\x9a0\x91\xf3\xb2\
-\xb2,\x89\xf7\xf4\xf5\xb1\xc2\xdbH\xafi\x8e\xf8>\xdf\
-0\xf8uy9\x0b\x13t\xfe_\x03\x01\xae\xa9\xaf\x07\
-8\x01T#\xeb&c\x82\xdd\x10\x10\xc0\x0b\x00\xcf\xfa\
-|\x09\x89\xaf\xcc\xcd\xe5\xadI\xd5\xac\xf2x\x98\x9e\x99\
-I\xb6\xae\x93\xa7\xeb\x9c\x97\x95\xc5jO){'U\
-'\xec<\xc0\xf3\xbe\xa1<c\x1b6:\x0f\xce\x14D\
-&\x03\x9ff\xeb\xba\xbe\xbfz2%I\x16>\xc7\x8a\
-\x8eH\x849\xc7\x8e\x120\xcd\x08\xb2\x10s\xc2\x0e?\
-'\xea\x01G\x81]\x01\xd3d\xab\xdc\xa2\xa6\x15[;\
-;\x09\xc8\x10\xda\x89\xcd\xce\x83s%\xb1\x8b\x80ws\
-t]\xdbW=\x19O\x9a\xbc\xa0K\x8d~\x9f4\xc0\
-\xc5\xc0\xbbvy:U\x12{\x0fx\xb5\xdf4y\xba\
-\xcb\x19/\x08\x0a\xc1\xc1@\x80c\xc1\xe0\xd0\xff\xb6t\
-vF;\xff2\x0et\x1e\x9c\xad\x0a\xff\x020\x9f\xe9\
-\xea\x12\x89\xb6\xb2\xc9\xe0D0HH\x08L5\xc7\xb5\
-\x86\xc3\xfc\xce\xd7%\x00\x13Xo[\x80\x82\x93\x06\xf8\
-\x10\xd8\xdeg\x9a\xdaC\xb2r;f\xf8\x22\x11:\x22\
-\x11\x0c\x0d\xcer\xcb\x94\xf8\xc1\xb66\xfaLSC\x9e\
-\x0e\xd5Y2H\x01N\x1a\x00\xe4\xa1EhGww\
-|\xa6\x96\x12L\x18r\xfb*\xb7\x9b\x0cM\xe3` \
-\xc0\x9f{\xba\x01\x828|2\xe4\xb4\x01>\x05\x1e\x13\
-\xc0\xdd--\x8c\xe54\xa0!\x18bP\x08rt\x9d\
-r\xc3\x85\x09lhm\x89.\xf6\x8f\x02\x9f9\xa6-\
-\xce\x1b\x00\xe0~\xe0x\xdd\xe0\x00\xcf&\xa8\xea\x9c\x8a\
->a\xe2\x0d\x87\xd0\x80jw\x06\x9a\xa6\xf1G_\x17\
-\xff\x96\x1b\x9fc\xc0\x03N+\x9b\x0e\x03\xf4\x03+\x00\
-\x1ehk\xa3>Aa#\x0a\x1382\x10D\x00\xe5\
-.7\xf9\x86NC(\xc4CmC\xf3\xc9*`l\
-qe\x81t\x18\x00\xe05`G\xc04Y\xdb\xdc\x94\
-T\xaez2\x18\x22 L\xb25\x8d\xb32\xdc\x08`\
-mKst\xd9\xdb\x8eL|\x1cG\xba\x0c\x00p\x0b\
-\xd0\xb5\xb7\xbf\x9fm\xdd>KB\xbf\x19\xa19\x1cB\
-\xd34\xa6df\xa2\x03\xcf\xf9|\xbc%\xcb\xe3\x9d\xc0\
-\xeat)\x99N\x03x\x81\x9b\x01\xeeom\xe5\xf3Q\
-BA\x00G\x06\xa5\xeb\x9f\xe9r\x91\xa7\xeb\x9c\x0c\x85\
-\xf8e\xdbP\xa1\xe7f\xc5+-H\xa7\x01@\xee\xd6\
-^\xec5M~\xe6m$<J!\xc4\x85F\xa1a\
-P\xe9r\x11\x16\x82UM\xde\xa8\xeboC\xed6\xd3\
-\x85/\xe3\x96X\x112I\xaaZ\xed)\xe5\xd6\xd2R\
-K\xe2\x8d\xed\xed<\xde\xd1\x0e\xd0\x08\x9c\x8f\x0c\x81\xb4\
-!\xdd\x1e\x00\xe0\x03\x96\x01\xe2\xf1\x8ev\xde\xb3H\x90\
-\x0e\x04\xfa\xd9,;o\x02KIs\xe7!}\x06(\
-@\x1e\x9bOW\x7f\xbf\x06l4\x81\xe5\xdeFZG\
-\xd8+\xb4G\x22\xdc\xec\xf5F\xaf\xc1<\x02\xbc\xa1^\
-\x9d\xafx\xd9\xaa\xff\xa7\x1b\x99\xc8\x83\xd2\xa7\x81\xc3\xc8\
-\x11\x14@{\x1c\x8d\x0bx\x1b\x10ssr\xc4\x89\xa9\
-\xd3\xc4\xe7\xea\xa9\x9f:M\x5c\x96\x9b\x1b\xbd#\xf8\x0e\
-\x10\x7f\xab\xaaQ\xfd\xdfT\xbc\x9fV\xb22\xd3\xdc'\
-PBnB\x96\xbf\xbfX\xf0\x87\xa9@-\xf2\xa6g\
-\xfcE\xc7 r\x8b|\xea\xf2U\x854\x8aX\xe9\xf1\
-\x0c\x19\xa0\xc6\xe3\x89\xb6\xebD\x1d\xb7\xc5a\x8d\xe2\x15\
-<EF7\xf0\x0cp\xce\x08z\xfdC\xe9|\x13`\
-}\xc0`\x81\x1f\x13\xb3\xbe@\x8e^\x14\x1ar\xfb\x1b\
-\x7f\xfbs?p\x1b0\x17\xb0\xaa\x8e.\x02\x22:\x88\
-\xda\xca3Em\xe5\x99B\x93\xed\xc3\xc0\x02\x8bv\xd9\
-\x8a\xf7\x1ad- \xfeV\xe9]\x0c\x9f\xd0\xf7\xc6\xbd\
-o\x00nL\xdc\xdd\x18\x0a\x90[\xce\xf8\x8e]\xc7\xf0\
-\xf9\xe26bn\xf9[\xa4'\xa4\x82\xbb\x00Qh\x18\
-\xa2\xd00\xa2r\xeeL\x91\xc74%;\x1an\xf1\xde\
-\xa6+\x9d\xf7\xc7\xf5\xe39\x92\x98G\xb2\x911(\x80\
-\x0e\xe0G\xa3\xd0\xd5+\x9ao\xa7\xa8t\x14\x1a\xf0b\
-\x9cr/3\xf6%\xf9\x1a\xc5\xe3\xc4(\xef\x97 \xfb\
-\x22\x90\x079\x96\xb5\xfb\x0d\xc4\xdcf\x92\x05]\x8b\xa2\
-\xbb>%U\x87#\x1f9B\xfb\x91\xb7\xbe\xc6\x8a\xef\
-)]\xacncM\x22\x16\xce\x96\xd5\xa4\xe3\x8a(\xd1\
-\xed\xab5\x8a.\x82\x9c\x88R\x0d\x01'0M\xc9\x8e\
-(]nM@?O\xd1Y^\xba\xeeSD\x89F\
-D\x03\xee\x88\xa3\x17\xc8\xe3\xa9u\xc8\x89jl\x97\x83\
-\xad\xe1V\xbc\xd7!W\x85\xa8\xdc>\xe4m\xb1D\xc8\
-\x8f\xa3\x1f\xc2\xa9qw\x00Y\xe2^\x0elM\x82i\
-%r5\xb8\x01\x99\xf2F\xd1\x8f<\xb5\xfd\x8f\xfam\
-D\xbah\x13\xd0\x03\xf8\x952>E_\xa4t\xc9\x07\
-\x0a\x91\xb7\xcf\xca\x15\xff\xe9q\xcf\xd0\xbd\x18\xd5v\x1b\
-\xb2H\xd2\x98\x84\xae?\x05\x9eD\xae \x17\x8fF\x14\
-\x8d\xa7\x00pm\x12L\xa3\xc8\x04\xbe\x03lA\x16,\
-\xa3n\xe9\xe4\x13\x01>R2\xae%\xb5D\xe8\xbb\xc0\
-\x80\xe2s]\xfc\x8b\x91f\xde\x8d\xc4\x96\xb9m\xc8\x11\
->\x9e\x820\x90#:\x0397\x9c\x83L\x80\xca\xd4\
-S\x8a\x1cI\x83\xd8\xb2\xd4\x83\xec`\x00\x99(\xb5\xaa\
-\xe7$p\x04\x99\x01\xd6!\x93\x9fT0\x09\xe9!7\
- \xfb\xfa+`m2\x0dW!\xddX\x00\x83\xc0S\
-X\xb8\xcd\xff \xe6 =e\x90X\xdc\xd7\xa4\xcad\
-\x0ar\xad\x8ew\xe7O\x90\xcb\xc8\x1c\x9c\xb9f\xeb\x14\
-\x5cH\x9d\xd6#\xbd%>l\xb6!\x8f\xd0\xc7\x8c\xa9\
-\xc0\x83Hw\x8c\x8fI?\xf2{\x9eu\xc8\xf4v\xa2\
-\x1d!)@S\xb2\x16#\xb3\xc7]\xc4&\xd5\xe8S\
-\x8ft\xfd\x91\xf6\x09_`\x96,t\xe4\xb6\xf4z\xe4\
-\xd7\x5c\xd3Gh\xefG\xce\xfcG\x90\xc9R\xa3\xfa\xf5\
-\x227:~d\xea\x1a\xdd<\xf9T\xbb\x22\xc5\xabP\
-\xc9)\x00\x8a\x91\xab@\x99\xfa\x1d\x0f\x9c\x0d\x9c\x8b\xba\
-\x9e\x17\x07\x81\x5cm\xde\x04v\xa8\xdf\x91oa\x9c\x02\
-;\x15\xa1R\xe0R\xa41\xbe\x82LL\x9c\xfb8\xc0\
-\x1a'\x91\xae\xfe\x11\xf2\xb6\xf8\xdb\x0c\xdfz'\x0d\xa7\
-KbyHCLE\x8eX\x05\xb1\xd9\xff\x0c\xf5\xde\
-\x85\x1cA\x8dX\xee\xe0#\x16Va\xe4\x17!M\xc4\
-V\x03/\xd2\x93\x0e#\xe7!\xebk\xa4\xa7q\x1a\xa7\
-\x91,\xfe\x0b\x15d\xd6\x04\xd4\xb6\xb5\x1e\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x06R\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
-\x00\x00\x06\x19IDATx\x9c\x9d\x96kpU\xd5\
-\x15\xc7\x7f\xeb\xdc\x93{\xc3#\xb9\xc3kj\xb1P\x84\
-\xd1D\xf3\xa8\xd8a\x86\x09\x19\x13\xb0\x83$\xd4\x80u\
-\xb0\x01\x9d\xc0\xd0\xb1\x92Hri\xb5\xd3\xc7t\xc6~\
-\xf2C\xdb)`\x22AF\xec#Xm\xc2 \x1a\x03\
-\x08\x15\x92\x10\xd3\x99\xeaL[\x12\xf4b\x18\xac-\x90\
-B\x12B\x9e77\xf7\x9c\xb3\xfa\xc1\xdc\xeb}\xc5$\
-\xeeo\xfb\xbf\xf6Z\xbf\xb5\xcfYk\xef-\xcc`\x5c\
-\xf1\xfb3T\xecE+2\xb2\xda\x92\xd9\xb5\x0b\x0fA\
-\xcaP6#\xdc\x0f,\x04n\x01\x1f\x03\x8dx8,\
-w3\x18\xed#3I\xe0\xd3\x8f/\x9e\x05\xf2\xd5r\
-\x96,\xcf\xc9\xb9\x11\x03\xef`=\xc2+\xc0\x92/\x09\
-\xd1\x8b\xf2#\xc9\xe1HX0f\x92\x00\xca% \xc5\
-0\x8d\x87\xe2\xe0\xe5\x18\x9c\x98\x02\x0e\xb0\x10\xa1N\xcf\
-\xf2\xc7\xaf\x94\x80\x8a\xf3&\x80\x03\xf3#\xdaE*\x11\
-^BqM+\xc8u\xe03\xca\xb4\x91ZH\xf2\x0b\
-\xfe\xe3\xf7/\xb6\x1d\xe7\xf1\xa0a\x1c\xce\xcc\xcc\x1c\x8a\
-\xb7\x7fz\xe9B\xe6\xb2{r>\x11\x11G;\xa8B\
-\xd8\x97,\x0e\xf0?\xc0\x0f,\x05\x96G\x94\xffNX\
-M\x1c\x16\xb34\xe1\x0b\xd88[\x10\xdd\xebQ\xe7T\
-WWWz\xbc\xfd\xae\x8c\x5c\xff\x14\xf0\x11\x84\xa7\xc9\
-b\xb1d\xb3V\xb2Y\x01\x94\xd0\xcdH\x04\x0e`a\
-0BMB\x02A\x8cWA\xdaA\xf3L;\xf4\x8b\
-$;C;\xf0M\x0aw\xd8(Y\x1c\x12A\xc3\xa2\
-d\xd3H\x88_%\x04\x1a\xe3\xc1\xa4]\xd0\xd5\xd5\x95\
-nZ\xe3?w\x0c=\xb6\x22#\xfb\x83\x18x'O\
-\x01/O\x0a\xcf\xa5%YL\x00}\x8d\x10\xe3\x98\x11\
-\xc1\xc4\x99Q\x1bj\x07y\x08\xe7\x00w\x02\xdc\xa0X\
-\xee\xa3\xf5K\xfd\xeb\xb9\xc5\x08\xf3\x22\x821\xd36\x14\
-j\x92\xc0\x87\xa7\x03\x07 \x887fnbO;\x81\
-\xa6\xfa\x5c\x1f\xb02ZsT\x82\x7f\xffl\xf9\x0f\xa7\
-\x03\xd7F\xf6a\xc5m\xd8M\x9fy\xc5\xef\xcf\x10\xb5\
-kQ\xfc*\xce\xf1\xe5\xf7\xe6\x9c\x8e^\xb3\xb1\xa2*\
-OUj\x82\xe3\xe7c\xe0\x00\x07[\x0b=M\x9d\xb9\
-uE\xe5\x94`:U'\xab\xab{\x92\xc2\xdf\xa1\x82\
-~\xaa\x12\x0c\xa9\xbck\x18\xd8w\x02\xf9\x08\xe5\x82\xf1\
-\xee\xbf?\xe9\xb87l/\xaa\xf0=\xa5*\xe7\x80\x95\
-K\xe7\xf7\xc5\x06Uh\xbd|\x0f\x80K\xa0T,\xe3\
-\xc3\x87\xcav\xaeM\x80\x9fb\x17\xb7\xa8\xc1\x8a+Z\
-7\x16.v\x1b\xcb2\xb3\xce\xaa\xe5,\x11x\x02\xc1\
-\xd7;\x18\xbc\x0cPT\xbeg\x8f(/3\xf1\xcfS\
-M+\xc6?h\xa70\x1cL\x8d\xcc\x03\xb7\xfb\x96\x8e\
-\xf5\xf7\x9cY\xbfukf\x14\xfc\x19z8\x80\x9d\xe4\
-\xa0\x9a\xc7\xf3R\xcc\xa0\x090q\xb1\xfc9l+\xae\
-\xa8\xf2\xa1\xfa;\xa2Zmp,5\xc6?\xd5\x0cq\
-G\xfa\x00\xdd\x03^\x02\xb7\xfb\x08\xdc\xee\x03p\x8d\x06\
-\xc7O\x01\xcb&\xe0\xd5\x09;\x07X\xc01)\xe6\x05\
-H\xd2\x05\x9f\xc3e/q}\xdeu\xf3k\x09q\x1e\
-\xff\xf6\x07\xd1p\x00\xac\xc0\xe87?<|\xc7\x8b\x93\
-\xc2\xe7\xf3\x96\x94\xf0Xx\x1a\x93\xc0dp\x81\xe1\xee\
-\x01o\x85\x22\x1a\xad\xaf\xf7^\xe4\xc7+\x9b\x13\x18\x1e\
-k\xacr\x12x\x93lbs\xb4\x14I\xa0h\x97o\
-\xf7dp0\x8a\x7f\xf6\xec\xc9\xda\x90\xe5:\x1e1\x5c\
-\x07\xae\xc1\x86\xc5\xd7\x138\x17z\xe6%h,\xe0\xb8\
-l\xe2\xbb\xf1\xb2\x09P\x5cQ\xb5\x01M<\xdb\xc3\xf0\
-\xa6\xda\xbd\xe7\x01\xdc\x8e\xf5\xb4\xaa\xac\x92n\xfd\x06\xd7\
-&\x02\x84\x1c\xbc\xa9\xe3\x0c\x8c}q>\xdd\x18\x8e\xad\
-\x17\x16p\x5cJxTU\x8d\x0b\xef\x9f\x7fV\x0c\xbd\
-&F\xe8\xbd\x9c\xd5\xdf\xb9a\x14\xee\xd8\x91\x8a\xca!\
-H\xb8\xcfGD\xe5\x910\x1c@\x1e\xa0G\xfa\xb4\x8c\
-\x9b\xd8aMMb\xe0\x00\xe9\x9e\x89\x8e1\x80\x85\xd4\
-I\x09\x8f\x02|\xd4\xde\x9e+\xc2\xafQyMm\xf7\
-\xb5\x0b\xed\xad\x05\xc6\xecT\xefv\xe2^2\x02\xc3\x8e\
-\xb0\xe1\x9d\x83\xfb\x9a\xe3?\x99\x14r\x8eEd;i\
-r\x15\xe0r0-~\x09\xf7-\x1ap\x98\xcd(\x8b\
-\xf8\x81<BYX\xcfZ\xb3\xe6\x9f\xa2\xcez\x81Z\
-\xa0E\xd5\xee3\x116\xc5\x07Pe\xc7\xa9\xda\xfdI\
-\x1f\x9e\x00\xf20~\xd0%\xbf\xfd\xe5\xaa?\x9c\xee\xf4\
-n\x8f\xb7\x9f\xbd\xba\xe2P\xde\xee\x9b\xe5\xc9|s\xf2\
-\x0b\xcf\x00g\x22\xb1\x8a\xcb}\xd7\x81\xaf\x7fA\xe7\xea\
-\x89\x83\xfb\xa7z\xdbQX\xfa\xc43\xc1\xc1\xfejU\
-\x8d\xa9\x1b#\xc5=\xda\xfe\xf6[s\x01\x9d\xc45f\
-\x18\xc0\x82hA\xe0\xd2TN\xeb\xb6n\xad\x0c\x0e\xde\
-\xae\x89\x87\x0b\x82k\xd6l\xdft\xe1\x00&B?J\
-\xe4\x94Q\x99x\xbfM2\xd6\x96\x96V\x05\x06\x06\xf7\
-\xab:\x096\xf7\xdc\xf4\xba\x96\xbf\xbc\xfeJ\xb4\xd6\xf9\
-~\xf3*\x07yl\x96\xcb\xf3\xc2\xdd\xabW\x0f\xc6\xfb\
-\x18(\x1f\xc5iw\x15\xed\xda\xb3.\x19\xbc\xf0\xfb\xdb\
-v\x07\x86\x86\xf6%\x87\xa7\xbd\xd9\xd2\xf0FY\xbc\xee\
-\xa8\xb1\x0d\xe4\xa7\x01{\xfc\xa4\xbf\xad-\xa1b\x0d\x84\
-\xc6xql\xa0\xf7\xed\xc2\xd2\xd2\xe7\xa2\xd7\x15l)\
-=\x10\x1c\x1a\xa8\xc6I|E\xb9\xe7\xcc=\xd6\xdaP\
-\xff\xbddI\xcf2\xdd\xcf\x03\xed@^\xd0\xb0w\xc6\
-\xdb\xa5\xa8\xb22\x1d\xcb\xb8\x22\x13\xb5\x10\xe8\xef%0\
-p\xebs\xaa\xcb\xb4\x0c\xd3\x1c\xb6-+]m+\xe9\
-\xe3\xc537\xedhKC\xfd\x16U5\xfe\xf5\xb7\xd6\
-o\xdd\x9fW\xf0\x8f\xf85\xfe\xb6\xb6\xb4\xa0a\xef\xb4\
-\x1dW\xc3\x03\xf9\xf91G\xa7\x00l,\xf7=\xa9P\
-\x17\x0d\x9f\xce\xf0\xccI;\xdar\xb4~\x0b@G{\
-\xcbs\xaa\xf2\x1bA\x1f\xceYSpz*\xdf\xf00\
-\x00\x9aj\xf7\x1f\x09\x0c\x0d\xfei\xdap\x11<s\xbc\
-\xaf\x87\xe1\x00\xea\xd0=a\xdc<\xed\x1d\x10u\x19\x9d\
-;\xf2\xfb\xed\xee9\xde\x83\xe2r%VX\xb4\x83\x99\
-b\xa5\xa6\xa7\xff\xa4\xe5\xe8\x1b\xdbbr2C\x7f\x05\
-B\x0a\x193I \xa1\xa0\xd6\x95\x95\xddi\x8d\x06^\
-rB\xa1\x07\x1d\xdb\xf6\xaac\x1bb\xb8,\x97+\xa5\
-W<\xee\x13\x86\xce\xf757\x1c\x18N\x16\xac\xb3\xad\
-y\xadcHon^A\xc7t\x13\xf8?]Ws\
-\xa33\xb2\xc3\x09\x00\x00\x00\x00IEND\xaeB`\
-\x82\
->>>>>>> eb94b4c7a8cb73d97e5730e6117a92f534196ecc
 \x00\x00\x04\x0d\
 \x89\
 PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
@@ -979,204 +168,10 @@ u\xc5,\xe4\xc6\xe9\xa43v\xea\x8a\xee\xe5\x86\xab\x81\
 _\x02,p\xab\xf5@\x01\xe3\x08\xaec\x13\xb7C\xf4\
 &\xbb\xc4/\xf9E\x8f\x009\xb8\x15\xc0\x95\x8a\xb9\xbd\
 \x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07y\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
-\x00\x00\x07@IDATx\x9c\xed\x9b]PT\xd7\
-\x1d\xc0\x7f\xe7\xb2,\xb8\x80i\xc4\x8dCD\xd7\xc5\xaf\
-\x14Rh]\xb13\xd8\xc2\x92hL\x1a\xa3\x84\x08c\
-b^2\x93\xda\x99\xf6\xa1\x13_\xfa\xd0\xe94\x0f\x1d\
-\xa7\xed\x83\x9d\xe9\xe4\xa1N3c'/Z\x8c+~\
-\xc4\xaf\xb4\xc15\xf1c\x8c\xc4\x10\x83\xdaU@@B\
-\x94\x0f\xc7\xf0!\xec\xc7=}X\xdd\xbd\x0b\x08\xf7.\
-{Yf\xb2\xbf\x87\xe5\xfe\xef\x9es\xfe\x1f{\xfe\xe7\
-\xdc{\xce\x01R\xa4H\x91\x22E\x8a\xef-b&\x94\
-,\xa9\xf4l\x16\x92w@\xae\x06\x91\x95x\x0dr\x08\
-\xc4\xe7HeW\x9b\xb7\xea\x88\x91\x9a\xa6\x07\xa0\xc0\xed\
-\xf9\xb3\x84\xdf\x99\xad'\x82dg\x9b\xb7\xfa\xf7z\x8b\
-\x9b\x1a\x80\x87\xbf|\xbd\x99:&B\xc0+\xad\xa7\xab\
-\x8f\xea)\xab\x98j\x88\xe4\x1d3\xdb\x9f\x84\x1dz\x0b\
-Z\xcc\xb4\x02pi\x05EQ\xd6\xb6|RuNo\
-\xe5\xa2\x9a:\xebpo\xda\x8b\x12\xb1UH\xb9I\xef\
-\xf8!a\xb5^\x1df\x07 [+\xe8s\xfe]\xa5\
-\xc0]\x5c&%5\xc3=\xbc\x0e\xd8\xc3yj([\
-s\xf4\x164;\x00\xba)\xa88P\x8a\x10\xdb$\xd4\
-J\xc8\xd3\xe1\xefu\x89\xd8'UY\xa7X\xc4\x22T\
-y2\x1e\xbdI\x0f\xc0\xa2\xf5\x87\x9eN\x0f\x84\xde\x97\
-\xf0\xd2\x94\x85\xa5\xe8@\x91\xffVC\xea\xde\xf63[\
-.k\xbe\xb9\xe6t{\xe2\xd2\x9f\xd4\x00\x14\xac\xab{\
-B\x06B\xff\x95\xf0\xcc$\xc5z\x80:\x01\xfbZ\xbd\
-UgA\xc8D\xda\x90\xdc\x1e\x10\xb0\xec@L\xe8\xfc\
-}\x848\x8c*\xf6\xcf\x1b\xbcs\xa2\xb1\xf1W\x01\xb3\
-LHv\x0al\x19#{\x85\xe0\xef\xaa\xbc\x7f\xecV\
-\xc3[#\x00m&\x1b\x90\xd4\x00HX\xa6\x95m\x04\
-767\xd4\x0e\xce\xa4\x0d\xa6>\x08M\x89\xc0\xaa\x15\
-\x9bO\xcf\xac\xf3\x90\xa0\x1e\xe0r\xedN\xef\x9b\x9b\xfb\
-\x9c\x22\xd3^\x94H\xb7\x00\xbbD\xfe`l\xb9e/\
-\x1d\xcb\xb8y\xfc\x17\xa3\x89\xd0\x99(\xa6\x17\x80\x9a\xba\
-4\xe7\xdd\xb47\xfa\x84\xf8\xa3\x90,\x95\x84\x07\xe8\xf0\
-\xe7\xf8\x89<\xf4`\xe4\x86\xd3\xed\xf9\x8b\xcd\x1e\xfcg\
-\xf3\xfeZ\xff\xb4t'\x88\xb8S`\x85\xfb\xc8|g\
-\x8f\xe5$B| `\xa9\xcej\x8b\x80\xf7\x1e\xdc\xb5\
-\x9cw\x94\x1fv\xc6\xab;\x91\xc4\xd5\x03\x16?__\
-\x18\x08\x05N\x10v\xc80R\xb0J\x11\xc1\xcf\xe3\xa9\
-\x9bh\x0c\x07\xc0\xf9\xfc\xa1\x05\x84B\x1f1\xc6\xf9\x0c\
-\xab\x05W\xb1\x83\xc2\x95y\xd8ss\xc8\x9ace\xe8\
-\x81\x9f\x9e\xbe\x01\x9a}\xdd46\xb5\xe3\xf7\x07\xb5U\
-r\xa7i{B0\x18\x00)\x08\x1d<\x00,\xd1\xde\
--)\xccg\xe3\x0b\xc5d\xd92bJ\xe7dg\x92\
-\x93\x9dI\x81\xc3Ne\xd9J\x8e\x9cj\xe2\xca\xb5\xae\
-i\x9a\x9cX\x0c\x8d\x01Nw\xfd6`\xad\xf6\x9e\xbb\
-l%\xb5\x9bK\xc79?\x96\xec\xac\x0c\xb6V\xad\xa1\
-\xa2l\x85q+MDw\x0fp\xbb\x1b,\xed\xdc\xdb\
-\xa9\xbdWR\x98\xcf\xfa\x8aB\x84f\xc0\x0f\x86T\xbe\
-\xfc\xba\x13\x80\x1f?\xbb\x08KZ4\xc6B\xc0\x0b\x15\
-E\xf4\xdf\x1b\x9a\xb4'\x14T\x1ex\x19)vK\x90\
-\xaa\x14\xdb\xdb\xbd\xaf\x1e\xd7\xed\x91At\x07\xa0\x83~\
-7\x88H\xde[\xad\x16^^_\x1c\xe3\xfc\xa8?\xc8\
-\x9e\xbdg\xe9\xe8\xea\x07\xe0\x7f7\xbfe\xdbk?\x8d\
-iG\x08\xd8\xb4\xa1\x04_\xcb\x1dFc\xc7\x84\x08R\
-\x8a\x7f\x00\x0b\x01\x14!w\x03\x8b\xf5\xdai\x14\xdd)\
-\xa0\x0a\xaa\xb5\xf2\xeab\x07\xd9Y\xd1n?\xea\x0f\xb2\
-g_\xd4y\x80\x1b-w&l+\xcb\x96\xc1\xaa\xe2\
-I}\xca\xd7\x5c\xc75\xd3\xe8Ew\x00\x84*b\x96\
-\xb7\x0aW\xe6E\xae\xfd\x81P\xd8\xf9\xdb\xfd1u2\
-2\xd3\xf1\x9e\xf7\xe1=\xef\xe3RS;\xc1\x90\x1a\xf9\
-\xee\x87\xcb\xf3\x98\x0d\xe8\x9f\x05D\xec/a\xcf\x8d\xae\
-:5\x9c\xbd>\xcey\x80\x81\xc1\x11N64Gd\
-_\xcb\x1d\xde\xa8^\x03\xc0S\xf6\xb9\x86\x8d5\x03#\
-\xb3\xc0<\xad`\xb3E\xdfcnw\xdd\xd3\xd5\xc0\x8d\
-\xd6hJ\xd8\xe6X')9s\xe8\x0f\x80\xa4O+\
-\x0e\x0fG\x1f\xe5\xf3\x17>\xa9\xab\x89\x15K\x17D\xae\
-\x87\x86g\xc7;\x91\x91\x14\xe8\x02\x9e~$\xde\xed\x1d\
- ';\x13\x80\xca\xb5\xcf\xd0\xd6\xd1;.\x0dl6\
-+\xa5%K\x00\x98?/\x9b\x92g\xa3Y\xd4\xd3;\
-0\x0d\xb3\x13\x87\xfeA\x10\xbe\xd0\xcaWotG\xae\
-\xad\xe9i\xbc\xb5u-\x8b\xf3c\xb2\x84\xa0?\xc4\x86\
-\xca\x226T\x16\xe1*q\xc4<\x13\x5c\xf5u3\x09\
-\xb75\xd7\x9dzm\x8c\x07\x03\xd3\xa0zP+_j\
-\xba\xa5\x0e\x0c\x8eD\xe4\x0c\xab%\x1c\x84\x85\xd1 ,\
-_\xb6\x80\x89\x18\x1a\x1e\xe5\xf2\x95\x8e\xc7\xeb\x92b;\
-\xe1 tJ\xd8\xae\xd7\xc6x\xd0\x9d\x02\xb9\xdf\xf5}\
-\xd2\x9fc\xef\x06\xf2\x00\x02\xfe\x90r\xf4\xe3\xaf\xd8Z\
-\xb5&\xf20\x94a\xb5\xf0\xf6\x9b?\xa7\xa99\xfc\xa3\
-\x95\x14\x8d\x9f\xc2\xa5\x84C'\x9a\x1e\xfb\x10\x04\xf0\xf0\
-\xc9\xcf\xd4\xf9\xff\x11\xba{@xeV\xfcA{\xef\
-\xca\xb5.Ny\x9b\x91\x9a\x85jK\x9a\x82\xab\xd8\x81\
-\xab8\xb6\xcbC\xd8\xf9S\xdef\xbe\xbe>{^\x88\
-\x0c\xbd\x0c\xb5\xd9\x03\xff\x02\x1a\xb5\xf7\xbc\xe7|\xec\xab\
-\xbf\x886\x1d&b`p\x84\xbd\x07/\xe2=\xe73\
-l\xa4\x99\x18{\x1d\xde_\x1bR\xca\xeb_U\x85z\
-\x01\x11\x9d\x11\xae\x5c\xeb\xe2z\xcb\xb7\xaa\xebG\x0e\xa5\
-pE\x1eO\xd9\xe7\x92e\xb324\xec\xe7n\xcfw\
-\x5c\xf5u\xf3\xc5W\xed\xf8\x03\xa1\x84;0]\x0c/\
-\x88\xb4\x9c\xa9\xeat\x94\x7f\xb8Q\x11\xcaq 2\xca\
-\x05\xfc!\xe5Bc+\x17\x1a[\xf56\xd5\xc7,X\
-\x14\x89kM\xb0\xfd\xcc\x96\xcb\xc1\xf4\xb4U\xc0\xf98\
-\xf56\xaa\xaa\xa54\xce\xba\x09%\xeeE\xd1\xce\x8f7\
-\x7f3o\xa0\xa7\x02\xe4/\x81v\xbd\xd5\x84\x14\xbf\xb6\
-\xd9\x83e\xedg6\x99\xbd\xe9\xa3\x8bi-\x8b?\xdc\
-\xb3{\xbf\xa8\xa6\xee\x83\x07\xbd\xca:\xa9*\x1b\x10\x94\
-\x03\xf3A>9\xf6@C\xda\x9c\xcc\xe5\xb3m_\xc0\
-\xd43BN\xb7'f'\xb7\xedtu\x8c>g\x85\
-gT\xbb;d#\x98\x13\xef\xee\xd0T\xba\x1eGR\
-\xb7\xc6\x04\xdc\xd4\xca\xc3X\x8e\x16Tz\xaa\x97\xb8\xf7\
-d\xce\x94\x0dI\xde\x1b\x94\xfb\xc7\xdc\xa9\x90\x92\x03B\
->\xd1\xe7\xac\xf4\xd49+\xea_q\xb9v\xa7\x9bi\
-Br\x03`\x09\xfdMH\xae\x8e\xbb/\xb0!\xa9A\
-\xa8\x87\xfbs\xec]N\xb7\xe7\xbd\x02\xb7\xe7g \x13\
-\x9e\xb2I\x0d@\xeb\x7fj\xef\x87T\xb9NJql\
-\x92bv\xe07\x12>uV\xd4\xdfrVz\xfe\xea\
-(\xff\xf0'\x89\xb2!\xa9\x83\xa0\x16\xed!)\x1e\xbe\
-pMA\xe4\x90\x94Pp\x08\x88Y:\xd7;\x08\xce\
-\x9a\x00D\x89\x1e\x93C\x84\x8f\xc9\xc5\xa3{\xb6\xcc\x02\
-1SZ8\x8f\xa7\xe2]\xb5\xf5t\xf5gm\xde\xea\
-\xdf\xda\xec\xc1|\x84\xdc,\x05{\xc3\x07\xa2u\xa3{\
-\xb9\xc9\xec#2\x97\x00\xf7#A\xc2\xa7F\x8e\xb3\x0d\
-\xf7\x84\xff\x1a=()%\xbaw\x9e\xcd\xed\x01R\xd9\
-ej\xfb\x8fAQ\xa4n\xbd\xa6\x06\xa0\xcd[u\x04\
-\xc9\xce\xa9K&\x12\xf9\xa7\xd6\x86\xd7>\xd2[zF\
-\xfea\xa2\xc0\xed\xd9\x08\xec\x90P\xca\x98\xf3\xc3\x09b\
-PJ.*\x8a\xdce\xc4\xf9\x14)R\xa4H\x91\xe2\
-{\xce\xff\x01\x0c\x8et\xe3\x18\xdd.\xe6\x00\x00\x00\x00\
-IEND\xaeB`\x82\
 \x00\x00\x04R\
 \x89\
 PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
 \x00\x00@\x00\x00\x00@\x08\x03\x00\x00\x00\x9d\xb7\x81\xec\
-<<<<<<< HEAD
-\x00\x00\x00\x03sBIT\x08\x08\x08\xdb\xe1O\xe0\x00\
-\x00\x00\x09pHYs\x00\x00\x01\xbb\x00\x00\x01\xbb\x01\
-:\xec\xe3\xe2\x00\x00\x00\x19tEXtSoft\
-ware\x00www.inkscap\
-e.org\x9b\xee<\x1a\x00\x00\x01qPLT\
-E\xff\xff\xff\xff\x00\x00\xff\x00\x80\xcc33\xdb$I\
-\xdf @\xd5+@\xe1-<\xd6)=\xd9/B\xdb\
-.@\xd9+B\xda*A\xdc+B\xda,C\xdc+\
-C\xdb+A\xdc,C\xda+A\xdb,C\xdc+C\
-\xdc+B\xda*C\xdb+B\xdb+A\xdb,B\xdb\
-,C\xdb+B\xdc+C\xda+C\xfc\xea\xed\xdb,\
-A\xdb*B\xdb+B\xdb+B\xda,B\xdb+A\
-\xdc,A\xdb+B\xdb+B\xdfGZ\xdb+B\xda\
-+B\xdb+C\xda+B\xdc5J\xe7m~\xe2U\
-h\xe4\x5cn\xe5ev\xe8v\x85\xe3Uh\xea\x80\x8d\
-\xdc+B\xe9{\x89\xe0N`\xeb\x89\x95\xe1G[\xe0\
-H\x5c\xec\x8f\x9b\xec\x93\x9e\xdb+B\xdfAV\xee\x9b\
-\xa7\xde=R\xef\xa3\xad\xde=S\xef\xa7\xb0\xdb+A\
-\xde:O\xdb+B\xf2\xae\xb7\xdd8M\xf2\xb0\xb8\xdc\
-+C\xdd5K\xdd6K\xf3\xb5\xbc\xf4\xb9\xc1\xdb+\
-B\xdc3I\xf4\xc0\xc6\xdc2H\xdd7M\xf4\xc0\xc7\
-\xdc1G\xf5\xc7\xcc\xdc/E\xf8\xcf\xd4\xdb/E\xf7\
-\xd0\xd5\xdb+B\xdb-D\xdb+B\xf8\xd6\xda\xdc-\
-D\xf9\xdd\xe1\xdb+B\xdb,C\xf9\xdd\xe1\xdb+B\
-\xdb,C\xfa\xe2\xe5\xda,B\xdb+B\xfb\xe8\xeb\xdc\
-,B\xdc,C\xfb\xe6\xe9\xfc\xed\xef\xdb+B\xfd\xf0\
-\xf2\xdb+B\xfd\xf3\xf4\xfd\xf4\xf5\xfe\xf7\xf8\xfe\xf8\xf9\
-\xfe\xfa\xfb\xfe\xfc\xfc\xff\xfd\xfd\xff\xfd\xfe\xff\xfe\xfe\xff\
-\xff\xff\x93]vb\x00\x00\x00ptRNS\x00\x01\
-\x02\x05\x07\x08\x0c\x11\x19\x1b\x1c67BEHNW\
-Z\x5c_egpq\x80\x86\x87\x8a\x99\x9e\xa4\xa9\xab\
-\xb1\xb5\xb7\xbb\xbd\xbe\xbe\xc9\xca\xcb\xd1\xd5\xd5\xd6\xd6\xd6\
-\xd6\xd7\xd7\xd8\xd8\xd9\xd9\xda\xdb\xdb\xdb\xdc\xde\xde\xe0\xe0\
-\xe1\xe1\xe2\xe2\xe3\xe3\xe4\xe5\xe6\xe6\xe6\xe6\xe6\xe7\xe9\xe9\
-\xeb\xeb\xeb\xec\xed\xef\xef\xf1\xf1\xf2\xf2\xf3\xf3\xf5\xf5\xf7\
-\xf7\xf7\xf8\xf8\xf8\xfb\xfb\xfb\xfc\xfc\xfc\xfc\xfe\xfem\xc4\
-\xbb\x0e\x00\x00\x02\x05IDATX\xc3\xad\x97\xe9;\
-[Q\x10\xc6'\x96\x88=\x84\x9b \x04A\x04EK\
-Z\xbb\xd6N\x17\xad.\xb6\x06!\xad\xadM\xa7v\xf3\
-\xd7\xfb`O\xce2''\xef\xd7;\xef\xefy\xee9\
-g6\x00\x89\x0a*\x9c\xba\xc6\xd6\xae\xb9\xb9\xae\xd6\xc6\
-:\xa7\xa2\x00\x8cT\xe4k\x89\xe33\xc5[|E\x5c\
-w~m\xc7\x01\x0at\xd0Q\x9b\xcf\xb0\xbb\xaa\xc6Q\
-\xaa\xf1*\x97\xce_\xde\x8dJu\x97+\xed\xc5m\xa8\
-U[\xb1\xdc_\xba\x84\x0c-\x95\xca\xfc\xd5\x09d)\
-Q->\xbdzd\xab^p\x96y\xcdh\xa0\xe6\xbc\
-\x0c@\x03\x1a\xa9!\xdd\xefCC\xf9\x9e\xfb\xcb\x12\xa6\
-\x80D\xd9S\x7f\xc92\x1ak\xb9\xe4\x09\xa0\x1d\xb3P\
-\xfb\xa3\xbf\x12\xb3R\xe5\xc3\x0d\xf6d\x07\xe8\xb9\xbf\xcb\
-\x1a\xccR5\xb7\xfe\xc2\x19\xc1\xb7\xce#\x06`\xa6\x10\
-\x00\x00\x02\xa2oM;}\x0cB\x00\x00\x00\xa2B\x00\
-\xd1\xda\xb0\x16\x10\x05\x00\xf0\xa4$\x00\xa2/o5\x80\
-\x94\x07\x00\x1c\x94\x02\xe8z\xfe\xbd\x9a\xe0\x00@X\x01\
- \xba\x98\xfc\xae\x02\x84\x01\xdcI%\x80\xe8t\xe8\xa7\
-\x1c\x90t\x83\x175\x00\xa2\x7f\xaf~I\x09^\xf0\xeb\
-\x01D\x87/\x8f%\x00?\x049\x00\xa2\xbd\x01q\x5c\
-\x10B<\x00\xd1\xc6\x88(.\x04\x11.\x80\xe8\xdbT\
-f\x5c\x04b|\x00]/~H\x8f\x8b\xc1\xa6\x01\x80\
-\xe8\xcf\xd7\xb4\xb8M#\xc0\xff\xd7\xbb\x98\x01\xe0\xff\xc2\
-\xd9\xe8zf\x5c\x8c}\x88\x97\xefVDq\x11\xee5\
-~\x5c\x10\xc7\x85x\x0f\xe9\xc7\x84\xec)\x079Oy\
-\xeb\x8d<\x9b\xfc\xfad\xfa\xdd\x9fR\xe4\xb3W\x97\xce\
-\x7f{\xf7U\xf5 \xe9V\x17\x94\x93\xc1muE\x0a\
-+K\xda\xf9\xd8\xaa\xae\xaa:\x8a\xa2z5\xfdY[\
-\x95S\x1eyY\xff4\xcb\xe8\x0bQycy\x81\x1c\
-\x05\xe4\xad\x8d\xa5\xbb\xd6f\xdd\x5c\xed\xdb\xbb\xf5\x80a\
-?\xe2\xd8\x0fY\xd6c\x9e\xfd\xa0i?\xea\xda\x0f\xdb\
-\xd6\xe3\xbe\xfd\xc2\x91\x83\x95\xc7~\xe9\xb2_\xfbr\xb0\
-x\xda\xaf\xbe9X\xbe\xcd\xd6\xff\x1b\x844[\x18\xdb\
-z\x88o\x00\x00\x00\x00IEND\xaeB`\x82\
-=======
 \x00\x00\x01qPLTE\xff\xff\xff\xff\x00\x00\xff\x00\
 \x80\xcc33\xdb$I\xdf @\xd5+@\xe1-<\
 \xd6)=\xd9/B\xdb.@\xd9+B\xda*A\xdc\
@@ -1245,10 +240,10 @@ B>m\xacH<m\xe2\xc7U\xfe\xbc\x8b\x1b\x0cy\
 O%\x1e}\xdd\x90\x0d\xdf^p\xc7\xff\x7f\x844[\
 \x18`2,+\x00\x00\x00\x00IEND\xaeB`\
 \x82\
-\x00\x00h<\
+\x00\x00t\xec\
 \x89\
 PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x8e\x00\x00\x00\x8f\x08\x06\x00\x00\x00,\xa1\xe3\xad\
+\x00\x00\x8f\x00\x00\x00\x8e\x08\x06\x00\x00\x00\x08?[6\
 \x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
 \x01\x00\x9a\x9c\x18\x00\x00\x0aMiCCPPho\
 toshop ICC profi\
@@ -1467,34 +462,34 @@ shop CC (Windows\
 )</xmp:CreatorTo\
 ol>\x0a         <xm\
 p:CreateDate>201\
-8-07-30T16:34:01\
+8-07-30T16:31:32\
 +09:00</xmp:Crea\
 teDate>\x0a        \
  <xmp:MetadataDa\
 te>2018-07-30T16\
-:34:01+09:00</xm\
+:31:32+09:00</xm\
 p:MetadataDate>\x0a\
          <xmp:Mo\
 difyDate>2018-07\
--30T16:34:01+09:\
+-30T16:31:32+09:\
 00</xmp:ModifyDa\
 te>\x0a         <xm\
 pMM:InstanceID>x\
-mp.iid:fb879324-\
-762a-be4b-99e7-d\
-d558ed35657</xmp\
+mp.iid:fb48f00e-\
+ff8b-7d44-b66b-7\
+47567e34287</xmp\
 MM:InstanceID>\x0a \
         <xmpMM:D\
 ocumentID>xmp.di\
-d:6042ad05-036c-\
-bb41-b188-80daab\
-1b196c</xmpMM:Do\
+d:741e72f7-4fd5-\
+6640-a64a-3696ec\
+a5775b</xmpMM:Do\
 cumentID>\x0a      \
    <xmpMM:Origin\
 alDocumentID>xmp\
-.did:6042ad05-03\
-6c-bb41-b188-80d\
-aab1b196c</xmpMM\
+.did:741e72f7-4f\
+d5-6640-a64a-369\
+6eca5775b</xmpMM\
 :OriginalDocumen\
 tID>\x0a         <x\
 mpMM:History>\x0a  \
@@ -1508,14 +503,14 @@ tion>created</st\
 Evt:action>\x0a    \
               <s\
 tEvt:instanceID>\
-xmp.iid:6042ad05\
--036c-bb41-b188-\
-80daab1b196c</st\
+xmp.iid:741e72f7\
+-4fd5-6640-a64a-\
+3696eca5775b</st\
 Evt:instanceID>\x0a\
                 \
   <stEvt:when>20\
-18-07-30T16:34:0\
-1+09:00</stEvt:w\
+18-07-30T16:31:3\
+2+09:00</stEvt:w\
 hen>\x0a           \
        <stEvt:so\
 ftwareAgent>Adob\
@@ -1532,14 +527,14 @@ t:action>saved</\
 stEvt:action>\x0a  \
                 \
 <stEvt:instanceI\
-D>xmp.iid:fb8793\
-24-762a-be4b-99e\
-7-dd558ed35657</\
+D>xmp.iid:fb48f0\
+0e-ff8b-7d44-b66\
+b-747567e34287</\
 stEvt:instanceID\
 >\x0a              \
     <stEvt:when>\
-2018-07-30T16:34\
-:01+09:00</stEvt\
+2018-07-30T16:31\
+:32+09:00</stEvt\
 :when>\x0a         \
          <stEvt:\
 softwareAgent>Ad\
@@ -1600,11 +595,11 @@ onUnit>\x0a        \
 e>1</exif:ColorS\
 pace>\x0a         <\
 exif:PixelXDimen\
-sion>142</exif:P\
+sion>143</exif:P\
 ixelXDimension>\x0a\
          <exif:P\
 ixelYDimension>1\
-43</exif:PixelYD\
+42</exif:PixelYD\
 imension>\x0a      \
 </rdf:Descriptio\
 n>\x0a   </rdf:RDF>\
@@ -2363,4517 +1358,761 @@ n>\x0a   </rdf:RDF>\
 \x0a               \
              \x0a<?\
 xpacket end=\x22w\x22?\
->\x1d\x91px\x00\x00\x00 cHRM\x00\x00z\
+>&W\xe8\x15\x00\x00\x00 cHRM\x00\x00z\
 %\x00\x00\x80\x83\x00\x00\xf9\xff\x00\x00\x80\xe9\x00\x00u\
 0\x00\x00\xea`\x00\x00:\x98\x00\x00\x17o\x92_\xc5\
-F\x00\x00\x222IDATx\xda\xec\x9d{\x90$\
-\xc9]\xdf?\x99\xd5=3;\xbb\xb3s{\xb7\xbbw\
-\xbb\xb7\xba\x87\x84\x84t:\xa1\x03$dq\x06\x09\x10\
-\x02\xe1\xb0\x1d\xb6%\x1bcc0\x11~\xe0\x08D\x10\
-\xc1\x1f\xb2\x85l\x99\x90-G\xd8a\x1b9\x00\x1b\xc2\
-`\x029\xf4\x07!\x0b\x0b!\x19[\xbe3B\xa7\x13\
-\x0f=Ng\xb8;I\x16{/\xee\xf6v\xef\xb4;\
-;\xb3;3\xdd\x95\xe9?2\xab:\xab\xba\xaa\xf2\x97\
-\xd55\xfb\xba\xcd\x89\x8e\x99\xe9\xce\xaa\xee\xce\xfc\xd6\xf7\
-\xf7\xfd=2K\xf1\xe2h\x07\x80o\x00^\xe5\x1f\xb7\
-\x03'\xfc\xe3(\x90%\x9e\xcf\x00\xa7\x81\xa7\xfc\xe3\x09\
-\xe0O\x80G\x81\xaf\x02\xe7\xae\xf5\x01U\xd7\xe8\xf7\xba\
-\x1dx=p/\xf0Z\xe0\x1e\xe0\xd0%z\xef\x0d\xe0\
-!\xffx\x00\xf8\x03\xe0k\xd7\x81s\xe5~\x8f\xef\x04\
-\xde\x06\xbc\x09\xf8sW\xd8\xe7\xfb#\xe0S\xc0'\x80\
-\xdf\x05&\x5co\x97\xb5}\x17\xf0\x0b\xc0I\xc0^%\
-\x8f\xa7\x81_\x02\xbe\xef\xfa\xf4]\xdav\x07\xf0n\xe0\
-\xe1\xab\x08,m\x8f\xc7\x80\x9f\x05^q}Z\xf7\xae\
-\xbd\x19\xf8\x90\x17\xa6\xf6\x1a|\xfc\xb7\xeb,4l\xfb\
-\x9b\xc0g\xafQ\xb04=\xbe\x00\xfc\xdd\xeb\xd3\xde\xbf\
-\xfd\xa0\x1fD\xfb\x22}<r%\x03\xe8J\xf4\xaa\xbe\
-\x17x/\xf0\xed\x97\xe2\xdb\xabeE\xb6\x92\x91-g\
-\xa8\x91\x02\xedG\xc5\x82\xc5b\x8cq\x8f\xdc`s\x0b\
-;\xc0E \xbfd\xe3\xf1y\xe0\x9f\x03\x1f\xbd\x0e\x9c\
-\xe6\xf6\x12\xe0_\x01?4\xe4I\xc7\x8c\xd9w`\x1f\
-\xcb\x87\x96\x19\x1f\x1c\x93-g\x8cW\xc7\x8cW\xc7\xe8\
-e\xcdhy\x84^\xd2\xe8\xb1Fk\x8dR\x0a\x85\x02\
-\x05\xd6Z\x07\x1e\xeb\xc0\x93\xe79\xf9$g\xba3e\
-g{\x87\x9d\x0b;L\xb6&\x5c\xdc\xb8\xc8\xf6\xe66\
-\xf6\xacu\xa0\xda\x9b\xf6\x11\xe0]\xc0\x97\xaf\x03g\xd6\
-~\x0a\xf8\x97\xc0\xca\xa2'Zc\x8d\x83G\x0f\xb2r\
-t\x85\xf1\xfa\x18\xbd\xaaYZ_b\xbc\xcf\x01Eg\
-\xda\x19\x02\xe3Y\xc3\xf8\x07\xde@@\x09\x1c\xe5\x87\xa7\
-\xf8_+\x0d\x1a\x07\xaeLa\xb5%W9\x133a\
-g\xb2\xc3\xce\xe6\x0e\x9b\xe76\xd9za\x8b\xad3[\
-\xec\x9c\xd9\x81\xcdA\xc7\xc9\x02\xff\x14x\xdf\x8b\x1d8\
-\xf7\x00\x1f\x00\xbe\xa3\xef\x09\x96Y\xe6\xc6\xd5\x1b9x\
-\xfc +\xc7V`?d\x072\xf4~\x8d\x1dY7\
-\xd4\x13\x07\x0ee\x1c\x9b(\xa5Jf)\xff\xaf\x81%\
->\x83v6\x95\xca\x81Ig\x8e\xb9\xf2,g{\xba\
-\xcd\x85\xf3\x17\xd8x~\x83\x8dg68\x7f\xea<\xe6\
-\xb4\x19j\xdc>\x07\xbc\x13\xf8\xcc\x8b\x118\xef\x02\xde\
-\xdf\xe7@\x8d\xe6\x96}\xb7p\xd3\xb1\x9bX\xb9m\x05\
-\xb3f\xc8\xf7\xe5\xb0\xcfOh\x0ej\xaa\xc8\xc8\x1c0\
-\xb4B+]\x01\x89V\xba<W1\xf1\x15\x86\x11\x00\
-\xc7b\xb1\xd6\x01\xc8XS\xf9\xadPd\xa3\x0c\x96 \
-\xcfr\xb6.lq\xf6\xf4Y^x\xe2\x056\x9e\xd8\
-p\x89\x89\xc5\xdb\xfb\x80\xf7\xbcX\x80s\x14\xf8u\xe0\
-\xad\xa9\x07\xee\x1f\xef\xe7\xd6\x1bne\xfd\xf8:\xea\x98\
-b{y\x1b\xb3\xdf\xc0\x08T\xae\xd0S\x07\x8eLe\
-\x8e\x01\x94.\x7fkf\xfa\xa5|\xcd\x7f}\xadt\xc9\
-6\x05\xf3\xc4\x0cF\x01\x1c\xec\x0c,\x85\x1e\x0a\xb5\x91\
-\xb5\x16\x83!\xd3N\x80OGS\xce\x9f?\xcf\x99'\
-\xcfp\xfa+\xa7\xc9\x9fYXe\x7f\x06\xf8[\xb8\xe8\
-\xf95\x0b\x9c\xb7\xf8 \xde\xe1$\xdd\xb2\xb2\xc6m\xeb\
-\xb7\xb1vb\x8d\xe9\xcdS\xb6\x96\xb6`\xbf7\x0f\x13\
-\x8d\xb6\x1a\xad\xb4\x03\x0c\xaa\x14\xb9Z\xe9\x12 \xf5\xbf\
-Q\xcc\x81\x09\xaa\xcc\xd3\xc96\x01\xd3\x94\x00\xc2\x83&\
-\x14\xd5\x01x\x8a\xbfG\xd9\x08\xb5\xaa\xd8\x9clr\xe6\
-\xa93\x9cz\xec\x14\xd3\xc7\xa7\x8b\x8c\xeb\x05\x0f\x9e\xdf\
-\xbc\x16\x81\xf3\x93\xc0\xbfO\xd2/\xe3e^z\xe8\xa5\
-\xac\x1f_g\xf7\x96]6\x977a\x0d2\x939\xc0\
-\xe0<\xa1\x82Q*\x7f\xab*x\xc2\xff\x0b\xf0\x84\xa6\
-\xab\xd0=\x85\x99i\x03O\xc84\x05\x80\xeaLS\x02\
-\xc5\x98\x0a\x80\x8a>\xb9\xcd1\xc6\xb3\xd0j\xc6\x96\xdd\
-\xe2\xb9\xa7\x9f\xe3\xd9?~\x16\xfb\xa4]d\x8c\xdfs\
-\xa9\x84\xf3\xa5\x02\xce/\x00?\x9e\xe4\x9b\x1f|\x097\
-\xdfr3\xe6\x84acu\x03\xb5\xae\xd0\xb9FO5\
-\x19\xd9\x0c$5`d*k|>\x04W\x09\x9c\x06\
-\x81\x1c\x82\xa7>:\x05\xcb\x14\x00)\xfe6\x98\xd2d\
-52\x8d1\xd5\xdf\x05\x90\x8c\xfb\xadPd\xab\x19\xe7\
-\xedy\x9e>\xf94\xe7\x1e>\x07gz\x8f\xf5\x07\x81\
-\x1f\xbe\xda\x81\xa3\x80\xdf\xc6\x95;\xc8t\xcch?w\
-\x1e\xbe\x93\xa5;\x978w\xc39\xec\xbau@\xd9u\
-\x93\x1e\x02c\x0e$:`\x9e&6b\x9ey\xeaz\
-'d\x9eP(\x87@\x09\xc1S\x04\x09\x1b\x99\xc6\x18\
-rr\x07\x22c\xe7\xc0\x93\xdb|\x16#\xb29#5\
-\x82U8}\xf14O}\xf9)\xf2Grg\x84\xd2\
-\xdb\xa7\xbd\x86\xbcx5\x02g?p?\xae\xa0J\xa6\
-\x9a\xc7G9v\xe71vo\xdf\xe5\xe2\xfaE\xf4\x92\
-&\xdb\xce\x9c\x86\xc9\x1a@\x13\xb0N\x13\xd3\xd4\x1f\xa1\
-h\xae\x03\xa7\x10\xc9!\x80\xe6\xccT\x01\x9a\x16\x13U\
-a\x9a\x10\x18-\xcf5\x81\xc7Z\xcb\xd2h\x89\xcd\xa5\
-M\x9ex\xee\x09\xb6\xfed\xab\xaf\xec}\xd4\x879\xce\
-\x5cM\xc0\xb9\x01x\x10x\xa5\xf4\x80\xe3\xe3\xe3\xdc\xf8\
-\x9a\x1b\xd9<\xb6\x89Y7d;\x19Y\xee\xc0\x91\xe9\
-\xac\x02\x8e\x12$z\x1e0%\xa0h` \xe5\xceU\
-\x0a\xe8P4\x07f\xab\x8c\xe7\xf8\xdf\xa1\xa6\x09=\xaa\
-\x10\x10ez\x82\x99\x09\x0a\x19&7\xf9\x8c\x85\x02\xf0\
-\x14z\xa7x.\xb79\xb9q\xeccF\x86\xc7w\x1f\
-\xe7\xdc\xe3\xe7\x1c\x0c\xce'\xcf\xc3S\xb8\xa2\xb6\xa7\xaf\
-\x06\xe0\xac\xfb\x00\xd5\xcb\xa4\x07\x1c[>\xc6\xda\x1b\xd6\
-\xb8p\xf4\x02*S\x8ee<\x08*\xa0\xd15\xf0\xe8\
-*\xdb\x14}5\xc1\xdf\x91\xc7\x1c\x03\xd5uN-\xe0\
-W\xb2\x0b3\xf3S\x80\xa7\x91Il\x15<\x95>&\
-\xaf\xf4\xcdM^\xb2Nn\xf2\xd2l>5}\x8a\x17\
-\xce\xbd\xe0\x92\x0dO&\xcf\xc7)\xe0[\x87\x06\xcfh\
-`\xd0\xac\xe2jl\xc5\xa09\xb2\xff\x08\xcb\xf7.\xb3\
-y\xe3\xa6\xd31;\xce,\xcdyB\x01#\xcc\x09^\
-\x15h\x99&\xd0\xe8@PS\xd5C\x99\xce*A\xc1\
-08X\xe2\xc6\xd2h\xa2\x8c6h4\xc6\x98F/\
-L\xa1\xdc\xb1\xdaE\xae\xadr\xc7*\x14\xca\x06\xc1H\
-4\x16[\xbeoN\x8eV\x9a\xa9\x9d\x82\x85\x13\xfa\x04\
-\xd3\x95)\x1bwo\xb8\xca\xe9/%\xcd\xc9\xcd\xc0\x1f\
-\xe2j\xafO_\xa9\xc0y\x80\x84j\xb6\xb5Ck,\
-\xbdq\x89\x9d\x83;\xe8-]Fy\xdb\xd2\x02\x05\xb3\
-t\xb9\xd3\xe1\xf1s\xa0\xe9\xd0B\x85\xfe\xa9G\x96C\
-}\x13\x8a\xe1\xe2s\x19kJ`\xa0\x82\xbcWq\x9c\
-\xf2\xe6MY\x07\x90B'\x05\xffW\x98\xce\xcel\x81\
-F35S&j\xc2\xad\xfbne\xf7\xeb\xbbl\x9f\
-\xd8\x865\xcf\xe9\xdb\xe2y9\x86\xabi\xba{(\xc1\
-\xac\x07\x04\xcd}>\xf7$jKG\x96X\xfd\x8eU\
-\xf2\x039\x9c\xa7\xa2;\xe6\x22\xbca:\xa0\x06\xa8\x0a\
-\x00\x08\x18\xc5\x07\xf7B\x8d\x13j\xa3\xd2\x14zs\x98\
-\xe9\x8c\x91\x1e1\xd6c\xc6z\xccH\x8f\xaa\x8f\xcc\xfd\
-\x0e\xfb\x97\xfa\xab\xa6\xa3\x8a\xf7.E\xb6\xa2\xfd\xff\xa6\
-\x84j\xc8ZJ\x91\x1b\x17]>\xbev\x1c\xb5\xa9\x1c\
-p\xee%u\xdd\xc6K\x81\xdf\x1bj\xb2\x87\x02\xce\x87\
-p\x85\xe3\xb2v+\x1c\xb8\xf7\x00,\x81=o\xe7\x81\
-Q\x0b\xc0U\x12\x91\xe1\xff\xaaY\xcc\x96IG\xa5\xe7\
-\x19\xa9\x00Sh\xc6j\xdeZ\x01\x96\x0a\x88\xd4\xa8\x04\
-ZE#\xd5\x93\xa4JU\xd2\x17M9\xb0z\xd6\xbd\
-\x09,\xf5\xef?\x99NX\x1e-s\xf8\xc0a'\x92\
-G\xc0\x1b\x81[\x92\xe6\xe9[q+-\xae\x08\xe0\xbc\
-\x17W\xad'k'`\xe5u+\x8c\xd4\x88|3w\
-\xa6\xa5A\x8c\xd6\x074\x1c\xe4\xba\xab\x5cg#M \
-tk\x93U1u\xb5\xc8r(\xb2Gz\xc4R\xb6\
-\xc48\x1b\x97\xec2\x17}F7O|\xf1\xbfjx\
-\xae\xaf\x9b\xa2`g\xba\xc3\xfa\xf2:K+K\xae\x5c\
-c\x02\xbc\x0eW\xc9$o\xdf\x0f\xfc\xdc\xe5\x06\xce_\
-\x04\xfe\x99\xb8\xf7\x9dN\xa2-\x9be\xccE\x83\xd6\xf1\
-\xb7\x0f#\xb8\xf5hn\x1b\x80:\xcf\x15\xe9\x1fc\x83\
-\xb9\xd4C$\x19Z\xf7\xca$}K\xd7\xbf\xe1=\x01\
-\x0e.\x1ft\xe3PT#\xde\x03\xdc\x964o\xef\x04\
-~\xe4r\x01\xe7VR\xca\x19o\x07^\x05\xe3\xc9\x98\
-\xd1\xee(>\x90{\xd0\xea\xef9\x17\x0df\x96\x8c\x9c\
-\xda)\x93|\xc2\xc4L\xca\xf2\xd1J@/(\xab\x08\
-ksl\xf03\x97\x9e\x08\x7f\x87q\xa1Z\x9f\xd6\xb1\
-\xb105S\xf6e\xfb\xc8\xc6~\xd5\xf2\xc4\xa78_\
-\x9b\xcc<\xff%%\xce6\xa4W\xf5?\x93 v\xb7\
-\xf3\x02F\x8c`,\xbc\x0a\x9b&\xde\xceh\xddZ\xeb\
-J<k\x93T\xb8\xbd\xe1\xf9\x8b\xbf\x8d5(\xa5f\
-u3\xc6\xd5\x19+\xa3\xdcq\xcab\x94\xa9\xb0Y=\
-\xe3\x1dF{+\xf1\x9b\x22\xb6SKx\x16\xe0(?\
-s\x18D\xc4\xcc\x81\xad+R\x9d\xdb\x9cLg\xac\x8c\
-V\xd8\x9al\xb9U\xef\x05x\xee\x01\xa6\xc03\xe2!\
-\xfd\xa4\x13\x0f\x97\x0e8\x1f\x00\xee\x92\x05j\x80o\x02\
-v\xdd\x17\xcc\x96\xb32\x96Q\x19 5\x7fu\x15\x00\
-(\xfe.\x9fk\xe8_\x0e\xae\x0a\x98\xc0\xe7\x8e\x94R\
-\xeeo\xe3\x5c\xe79\xf3\xe3c,\x0a\x85\xb6\xba5\xdd\
-\x10\xba\xe3M\xa9\x83\x124aF\x9cZb\xd3\xff\x14\
-\x9f\xaf\xf2\xd9M\x90]\x0f\x22\xcfs\xac\xa6,#=\
-\x9a\x8d\x81\xf2\xe0\xb9\x08|\xb3\x1f\xeb\xe7\xc5\x97\xf4\x7f\
-\xc5\x95d$\xb5\xac\x07h\xbe\x1b\xf8yq8\xf0\xdb\
-\xfc\x17\xbb\x08*S,g\xcb\xb3\x8a;U\x0d\xe85\
-\xb9\xe1M\x9eQ\xc5}\xad\xbb\xb5>\x162'\xb8\xd5\
-\xbc\x10U\xa8\x0a \xc2lw\x18\x0d\xae\xa7\x03r\x9b\
-\x97}r\x93\xcf\xa5\x19\xc2\x08q\x01\xd8J\x8a\xa2\x9e\
-%\xb7\xa6\x02\x98\xb2o\xdbo\xff\xbe\x17\xa7\x17g\xdf\
-G\xe1j\xa8\xb5\xe7\x90g\x90\xaeP\x7f\x0d\xf0\xc7\xb8\
-\xdd6\xf6\x94q~#\xc9\xf9\x1b\xe3<\x00U\x13\x82\
-\x8a\x0a\x83\xd4\x7f\x1be\xca\x00\x9bBU\x98\xa4\x0c\xac\
-\x85t^\xbcn,V\x07\xd4N>\x0b\xcci\xdf?\
-\xf8[+]\xb2Z\x98\xeclb\x9b\xb2X\xab!\xa1\
-\xd9\xf4(\xf2Pe\x06\xbd\x96\xd7*M\xa0g\x9b\x10\
-\xb0m\xb9\xb0\x02\xe4\x8d\xa2]\xf9\xa0\xe0\xaa\xf7\xb6>\
-\x8dt\x19\xcf\x07\xbd^\xdd\xdd+\xc6\xf9\x00n)\xae\
-\x0c4G|bN\xcd\xbc\xa0Q6jd\x9b\xc2\x85\
-\xae\xff_\x89\xd74yYu\xef+\xa5\xe0\xdc\x9b<\
-cM\x09\x8aB\x07\xd5\xb5\x8b\xb1\xb3\x12\x89P\xdf\x14\
-\xecSLj\xc96\xf5:\x9c\xba6j2aA\xa1\
-WY\xf0U\xff\x1c\xc6}\xd6\xa9\x9drqr\xb1\x99\
-M'>c\xb8_\xacwF\xb8\xfd\x83>\xbc\x17\xc0\
-\xb9\x0b\xf85Q\xcfo\xf0\xd9\xaa\xf3\xf3\xae\xeeH\x8f\
-\xdc\x15m\x99\xaf{Q\xdd\xeep\xf9\x9cUs\x81\xc2\
-2\x5c_\x80\xca\xce\xd6F\x15\xecV\x0clE\xaf\x14\
-\xf5\xc2a\x99D\xadj\xaf\x04\x831\xf3\x13o\xe6\x13\
-\x9b\x8d\x93^Kx\xd6K)*\xa0\x09\x19\x8dy&\
-\x02\xd8\xc9w\xd8\x99\xee4\xc7\x7f\x0aW\xfd\x88\xe7\x90\
-\xb3b\x93\xf5\xbf\xa4i\xd4\x14S\xf5!Q\xaf\x1b\x80\
-\x97\x03[A\xfe&\x98\xb0b\x80\x0ao\xa8\xc93\x0a\
-_+\xbd\xa4\x9a\x19+\xcd\x0d\xae\xd0+79V\xcf\
-\xcc\x10\x0a\xac\xb1h\xad\xb1fvNc|bR\x99\
-2\x90WzQ\xb6;nS\xf7\xb0\x9a\x8a\xb8\xc2\xf2\
-\x89\x10 m\x0c4\x072\x1a\xbc5c*\xe0\x01\xca\
-4Dg\x5ch\xd3_\xee/ \xdd#\xecC>p\
-2\x18\xe3\xfcm\xa4\xa5\x9f\xaf\x07\x96\xbc\xadm2\xc3\
-J\x91\xe9l\x16\x1dn`\x9d\xa6\xf0\xfc\x9c\x09\x12X\
-\xa3R\x0fX5\xf3\xc6jq\x94J!y\xe8\xd1\xb4\
-i\x96\xba\xa9\xa2Z\x1aa\x8d\x03B+\xe3t<\x0a\
-MT\x17\xe4\x05\x98\xca\xf7\xc0rqz\xd1\x81Gu\
-D\xa2\x8d\xa7\x86#\x9eG\xe2\xd1\x8fu\xdc\xc2\x9d\xcf\
-\xc6\x03\xb3\xf1\xa6<\xd9\x1d\x14\x91\xdd\x9d\xbe\xb7j\xbe\
-\x0a\x94V\xec\x1b\xed\x9b\xaf\x0f\xf6Y\xec\xa2\xcc\xa1\xb1\
-D4\xc8t\x17\x1eW\xfd\xff\xa6R\xd1b\x15f\x99\
-\xf8\xf4\xe2\xb7\xd0R\x95\xa51\x02 \x86\xf5\xc5\x8d\xde\
-P\x0d|u\xd3W\x94\x94\x16\xee{\x9di*\xa0\x09\
-LZ\x11'\x9a\x9a)\x1b;\x1b\xcda\x8c&\xe6Y\
-\x07\xfe\x9f\xd8o\xca\xfd\x5c_X\x94q\xde\x8d\xa4f\
-\xf8&O\x8b[T\xb4\xc6\x1c\x04\xbd\xb6\xc9TVM\
-\xeaY5?\x81\xaa%\xffc\xe3\xd1\xe0b\xd0\x8c2\
-\x8eq\xb0s\xcbX\x9a\x04q\xb4(\xab\xe1\xff\xb6\xc2\
-\xac\xa6\xda\xe2$\xf6\xa9\x81\xc6\x18\xf7Y\xb7\xa7\xdbL\
-\xf3\xa9\xfc\xb2\x9f\xe0V\xb3=/*\xaa\xd0\xb8\xfc\xfb\
-\xffX\x84q\x96=u-E\xdf\xee^\x8f\xec\xcd\xc8\
-Y=\xeb\xacd+\xad\x85\xe6]53E\xdf\xb9\x92\
-\x8a\x22\xf1\xa8u#\xbb\x84}J\x97\xbb\x964\xedb\
-\x9c\xc6\xb4B-\xa2\x1c\x82\xb2\x8c$\xd7\x85\xaf\xb5\xdd\
-z\xa6\xa6\x85\xeau\xcb\xb9\xcd9\xbf{\xbe\xd4m\xc2\
-\x90\xbbs\xd17\xbd\x8b.k7yu\xd4\x8bq~\
-\x06\xf8\x1eQ\xa5\xc7\xedU\xd7\xbb\x13\xaa\x9e\x91\x8a\xc9\
-kz\xad\x0c\xd0\xf9\x09k*\xe3lM$\x86\xf1\xa1\
-\xda:\xa8r\xa9n\xd3\xe29f^L\xf8\xd3\xc40\
-\x8d\xaerhf\x98\xd7+\xf5\xa0_\x92\xfe\xf1\xa2{\
-{\xb2\xdd\xadm\xbaX\xe7\x90\xf7\xb6d^\xd6\x1a\xf0\
-\xf1>\x8c3\xf2Z|\xb5\xf3\xf4c\xcf6c\xff\xa1\
-\x94\xf0\x0aP\xb0\x94-U\x8b\xcbUs\x81y\xf8\x5c\
-\xc14e5`\xc3\x8a\xcdJy\x85V\xb3\xc2\xaa\xda\
-\xea\xcd9\xb7\xbf%\x06T\xf1\xf8l5Y\x19\xae\xab\
-*\xa3\xce\xa6\xba\xea\xa1)6\xd4\xc8<-\x85\xee\x85\
-\xe76\xc9'\xcd\xb1\x1b)\xeb,\xf9\xdf\x9f\x12G\x95\
-\x0f\xd2R\x22\xdf\xc58?\xe1\xcb&\xba\xdb\xabp\xc5\
-D[\x09_\xc63K\x91G\x0au\x8c8\xf1Y+\
-=(#\xc9\xccg\x9a+B\xb6\x81]\xea\xcb[Z\
-5\x07\xc1o\x9c\xe7\x94\x93W\x5c\xf1\x10\x0cM\x9eQ\
-\xd3\xf9b\x1eXa\xa2\xb6\xa7\xdb\xfd@C\x90\x92X\
-\xf3\xff\x9f\x11\xc3\xed\xbeT\xc6y\x16W\xe8\xdc\xde\xf6\
-y\xb6\xb1>+\x9b^\xe7\x80\xd2\x8a\xb1\x1e\x97\x8cQ\
-xUuV)6\x13(\xd8\xa7\xc24\xaa\x81ij\
-\x15\x7f\xf5j\xc1\xae\xadM\xda\xccb]\xe7\x84LS\
-\x89;\xd9j\x92\xb5\x92:\xf0\xcf\x87\xc1\xc2\xb9\xecz\
-\x00\xb2\x22#\xbe=\xd9\x96yQ\x92\x00\xcc\xd8\xb3N\
-\x5c(oy\xe5\x9aK\x19\xe7\x07\x80\xbf/\x8a%\x1f\
-\xf6\x8e[\xdf\xab\xa0`\x1e?\x99m\x91\xde9\xa6Q\
-\xcc\xd5\xb8\xd4\xf3X\xa1\x9e\xa9DaC\x17\xda\xdaV\
-m\xd3\xa6s\xe6\x02v\x0d\x7f\xe7\xe43\x16\xaa\xb1O\
-\xe5\x5c&/\xf5P\x994\x0d\xdc\xf8\xdc\xe4\xec\xe4;\
-\xc3\x80\xc6W\x02\xb0\xdf\x8fo|\xcd\xc3\x92w\xe4\x1f\
-\x922\xce}\xc4j\x88\x97=\xdb\xa8\x9elSg\x1e\
-\x1f\x18l\xf4\x94\x82\x85t\x85f\xd1J\xcf\xf6\xbdQ\
-\xf3\xcbf\x0a\xf1\xdd\xb5\x95I\x85\x81\x041\x9cza\
-V\xe9\xce\xd76 (\x92\xad\x15\x01\xde\x90u/\xa3\
-\xcef\xe6q\xd5\xb3\xf2\x93|2\x1chB\x87{\x84\
-+]\x8f\xaf\x94\xf8\xa2/\xd6\x88\x02\xe78\x92\xc5[\
-w\xf9|\xd49\x86\xf9R^0\x17\x05\xe1!@J\
-ph\xbfY\x92_\x02S\x06\xfe\xbc\x08\xae'EC\
-\x00\x15&h\xced5\x95]DtU\xa5\x82\xaf\xc6\
-l\x0eG\x0d\xeey(\x9a\x83\x1a\x9b\xc2[\x0a\x83\x81\
-\xd6\xba \xdf4\x9f\xf6\xd74\x92\xa0\xe0\xa3\xc0WD\
-G\xbc\xca\xf7\xee4U?\x11u\xc1\x15\xf0\x8d4\xae\
-#\xea\xdd\x82\xaa>\xa3L\x05L\x15s\x14\x14r\x95\
-\xa2V\x99\xb9\x1d$B\x0d\x12\x0a\xe0\x8a \xb6v.\
-K]\x7f\xae\xcd,\x95\xa6(H9\x94\xda%\x14\xbd\
-\x98F\x81\x1c\xba\xeb\xf5h\xf1\xc4L0\xb9\xd9\x1b\xd0\
-\x84\xe9\x88\xfd\xb8E\xc2q\x7fd\x97Z\xc5g\xd3\xc7\
-z\x8c\xd8\xa2\xba;\x80W3\xf4\xc6\x88s\xecS0\
-\x8c\xd63F)M\x14\xf3\xcf\x95k\xadtm\x9b\xb6\
-\xa6\xfdoTGyF\x93\x89\x0aE\xb2m\xd9\xb9\xa2\
-M$S\x15\xc6s\xf59\xa1y2\xf9\x5c\xe1\xfa\x9e\
-\x8d\xf1:n3\xdc\xb8}9Em!N=;\xfe\
-j$+1\x8f2\xdb\xc6y/\xae\x08=\x9b\xa0\xa9\
-\x9a\xa2\xacB\x1b\x17\xc71\xd6\xa0\x8d\xcfn\x1bg\xaa\
-\x0c\xc6m\x0cYxQ&\xd8\xd7\xcf\x06\xe5\x176X\
-\xb3\xd4T\xd6Q\xbf\x94ZR\x1b\x95\x22u\xcb\xccL\
-\x85QeS\xf3\xbal\x83\xe6\xa9e\xbfK\xf6n\xc9\
-\xf3\x0d\xde&bar3\xf0\xe7\xc3\xb8s\x1d8o\
-\x17\xc5\x13\x0fzWn\xafh\xb4aC\xa3\x5c9j\
-\xd7Jc\xf0\xa5\x11\xcc\x96\xe2jWc\x81V\x9a\x5c\
-\xe5\xb3\xf5\xd9\xc5\xb2b\xdb\xb0\x18\xae\x16\xa5\x06\xca~\
-]\x8cS\x09\x02\x16[\xba\x05\xf9\xaf\x10<a\x1c\xa9\
-H\x8eV\xdcsc\xe7.\x98\xf2\xa2\xec\x00\xf2 \xe3\
-\xbc\xed\xa3\xc9kHv\xc2xG\x08\x9c\xfa\xd4\x7f\xbe\
-IA\xcf\xc9\xa4\x97\xf9\x0c\x96\x1a\xf8\x8b4}\x22\xdd\
-\xdc\xb7\x1e\xbb\x09MT%\xeb][%\xda\xb4\xdc\xb6\
-\x91y\x9a\x80c\x9b\xe3:\xa1\x09\x02*l3\xb7[\
-\x971\xf3\xeb\xa6l\x0b0L\x0b\xeb\xd8\x01\xcd\xd5A\
-f\xf7\xf5\xebn'}\xed\xc3\x1c\xe3\xdc\x1c\x05M\x11\
-\x84\x9e\xee\x01hT\xe4\xb9\x1a\xb0\x8a\xc0X\xc1\x12J\
-\xab\x99\xb9\x0a\x7f\xac\xaa\x9a-\xab*\xe7/\xfbD\xc7\
-\xb8\x0a\xa0\x8a\xb6\x09\x00\xd3\xe4\x96\x871\xa6\xcaw\xb1\
--\x17\x8b\x0d.\x9a:\xfb\xd8\xf9\x0a\x81\x85\xc6}\x02\
-\xdc(\xea}\x07n\x1d\xd6\xa3u\xe0\xc4\xb7\x8f]\xf5\
-\x8f\xdd=\x04\x8d\x04D\xb5\xc1\x0e+\x09\xb1\xb3\xb2Q\
-\x8d\xae\x98\xa50\xa9Z\x01\x91$\x8en\xe7\xcdV\xa8\
-s\xea\x8b\xf3\x0a\xb3\xd5\x08\xfc\xba>\xec2K\xaa\xe5\
-\x98\xa1\x98g\xd7\x93\xc1~\x1f'\xeenom\x02\xce\
-\x9b\xa3\x87\x1dc\x96\x9e\xdf\x0b\xd3$\x05Q\x97i\x0b\
-&6/\x22\xe5\xbe$4\xb7\xf9\xdcr\xe2\xca\xb2b\
-+`\x1d[c\x1dl\xf3q\xaa\x06\x0c\xdb\xf0\x9am\
-a\x9a:X\x10\x82\xacO\xcb=h\x0e\x8b\x80\xf3\xdd\
-\xb8\x05\x0b\x15\xe0\xbcId\xa6\xec\x1e\x80&\xc5TI\
-\x01\xd54\xe9j\x1e\x04\x83\xea\xb36/\xa8\x0e\x94\xb6\
-\xc9o\x03G\x1dPf@\xd3U$?o\x00\x1e\x8f\
-\xf6\xbe\xb7.=oA\xb2\x8b\xd6>\x16\xbf\x0d\xa9\xaa\
-M|\x13@t\xcb\xeb\xf5\xd7\xea\xcf\xa9\x96\xf7\xa9\xf7\
-\xd1\xb5\x87\xea\xf1h;\x87\xc4\xe4j\xc1w\xa6\xe3;\
-7\x8d\xcf\x22\x9a\xb30W\xf1z\xd0\xc3>dS\x02\
-\xe7\x8d\xd1Cn\xf2\x946\x1d\x004)\xff#\x1cl\
-Z\x80\xa6\x1a\xc0!\x01u\xdb#v\xac\x16\x1e+\xb9\
-\x08\xd4\x02c\x97j\xaeV}@0\xde\xde\x10\x9a\xaa\
-WG\xbb\x1f\xc2\xa5\xe3w/\x01h\xfa\xea\x1e\x81\xc9\
-j|-\xb5\x9a\x8e\x0e}\xd2\xf4y\xa4}\x9bL\x94\
-\x12\xe8\x1c\x1b\xf9l\x12\xb7|\xe4\xe39/D{\xdf\
-\x15\x02\xe7\xb5\x22\x8fJ\xed\x01h\xbaX&U\xf7\xb4\
-\x81@\xf5\x04\x09\x89\xe0\xb3\x02p\xd0\x01\x946\x81\x5c\
-\xd7A\x12\xcf\xac\x0fx\x0e\x88z~K\x08\x9c\xf8\xce\
-\x13+\xf4\xbb\x9d\xa0j\xb0\xcf$\x82\xa6\x8fw\xa5\x84\
-@Y\x04H6\x02P\x1b\x89\xd7\xa4zS\xaa\xe3\xf9\
-E\xc13\x15\x03\xe7\x15\x05p\x96\x89m\xc9\x93\xe1J\
-z\xa6{\x0c\x1a%`\x11\x15\xb1\xe9]\xb6^\x0d\x04\
- \x9b\xe0M\xd1\x01\x86\x14oj\xaf\xc1\x93{$\x8c\
-\xa3\x0e\xd01\xe0\xf0\xc8G\x04\xd7\xa2n\xf8R\x22\xe3\
-HA\xd3\x97e\x94\x100j`\xf0\xd8\x08`\x94\xc0\
-%\x8f\x05\xf7\xdaLR\xe1\x8a\xef\x05x\x8c\x07\xce*\
-\xb1\xe5\xc2\x1ax\x85\xc6-n\xe9n\x07\x98U\xc8_\
-\x0e\xd0\xa8\x04W6\xe6\x1du\xf5I\x0d'\xa8\x16\xb7\
-XEX4\xd5\x1dor\xc5UG\xc8B\xf5\xbc \
-F>\xe4\x12ow\x8c\x90lx\xba\x8c|\xb7\xc0\x98\
-\xc7\x93\x02\x9a!\xbc\xab\xbe\xff\xa7h\x9b\x14\x96\x8a\x09\
-\xe2>\xdeT\x17\xf3H\x83\x84E\x9f%\xd17:2\
-Br\xb7\xba\xa5\xc4\x01\x8b]\x09)\xa0Y\x040}\
-\x05\xf3\x22\x1e\x95\x15Ld\x9b\xc9\xb3\x11o*\x15x\
-$F\x96\xe5\xc09<B\xb2?w\x86|\x9dr_\
-\xd0\xe8\x1e\xde\x95\xc4\x1d\x97\x98\xa1>@\xb2\x11PZ\
-!hl\x02\xfb,\x0a\x1e\x04\xac#\x03\xce\x8d2\xe0\
-\x8c\x04\x88\xed\x0b\x1a\x89K.\xcdM)!\xb3\xa8\x05\
-\x00\x14+\x85\xa0#\x0e\x13c\x03%\x04O=_5\
-\x14x\x0c\xe5\x8e\xb0\x91\xb66B\x12h\xd6t\x17\xa5\
-\x0f\x0d\x1ai\xac'5\xa63D\xfcF\x09<-i\
-\xf0O\x09\xbd\xa9&\x90i\xe4\xa5\x16J\xe8iY\xa4\
-[m\xed\x1f\x11[\x1b\x9e:\xc81\x8d\x113C*\
-\x014\xa9\x80Q\x03\x81'\x06\x1a%p\xd3U\x07\x90\
-h\x01S\x93+\x9e\x12\x1b\xb2\x82\xef\x22s\x82V\x8a\
-\x00`\xfc\x84V\xc86]\xde\xd4^\x81\xa6\xafX\x1e\
-B\xe3\xa8\x1e\xdeT\x9dQ\xda\xbc\x9f\xfa\xb1\xba\x01<\
-\xba\xc3l\xf51Y\xb2\xb1X\x1a\x89\xc8I\x0dd\xa2\
-$\xa0\x8a\x1d\xbf\xa8X\x1e\x8aiT\x04H\xb1\xc9R\
-\x82\xc0\xa2m\x01\x8fm\x01\x14-@L\x01\x8fll\
-\xf4\x88\xbeK\xea$Q\xdd&\xcd\xa2\x07\x00M\x8a\xee\
-Ia\x1b\x15\x89\x0c\xf7Id\x22`\x81.\xed\xd3e\
-v\xba\xcc\x96\x15\xf4[\xc0@\x8f\x90\x96f\xa9H\xbc\
-F\x1a\x00D\xc8 m\xbfu\xe43(\xe1gNe\
-\xa3\xae\xf3[a@N\xaag$\xe0\xa9\x9b\xad\x18\x9b\
-\xb4\x01\x0b\xfa,\x00\x9c\x8e\x90,;\x97\x8a\x5c\xa9\xae\
-\x89yO\xa9n{\xdf\xc0\xdf\xd0\xe2X\x12\x08\x8c\x99\
-\xa4E\x98G\x09\x04{\xec<2\xfb\xb3;BRz\
-n\x12\xa8\x1e\x01\x00\xa4L\x93\x0a\x9a\xc4\xd5\x11\x0b\x81\
-'\xc5[\xa2cr%\x80\xb2\x030K[\x04\xb9\xde\
-_\x06\x9c\x0b#\xe0\xeb\xd1n\xb9\x80a\xf4\x00ny\
-\x8a\x00N\x11\xc6C\xc7u\xa4\xac!\x09\xfcuyS\
-)\xe0!\xa2w\x88\x00\xb84B\xa2\x11\xd8L\x03\x8e\
-4z\xbb\x88\xf9\x8ae\x96%&j\x11\xb1\xdc\xd7\xa3\
-R\x02\x10I]\xf8E\xc1\x93\xf2\x9a\xad]\xfc;\xa2\
-\x118;Brg\xa3I\xc3\x17Z\xd4D\xed\x05h\
-$\xae?\x03\xb0M\xd7\xf1]\x13\xd7T\x8f\x13\xf3\x8e\
-\xba\xbc\xba\x98Y\x92\x88\xddz*CVS\xfe\xfc\x08\
-\xc9\x86^\x93\x06\x11\xd8\xc7\x0c\xe8\x04w^\x1a%N\
-\x11\xcd$\x02\xaa\xeb\xb8\x98[n\x91'*c\xda(\
-\x16\xd71\x11M\x93\xc2:2\xe0\x9c\x19!\xb9[\xc8\
-\x85\xc0\x5c\xd9\x04\xf7Yr\xe5\xab\x81@\xb3\x88w\xb5\
-\xa8\xb9\xea\xe3M\xc5\xa2\xc7)\xe0Q\x02\xb1,\xd1T\
-Fl\xaa\x9e\x19\xe16\x074te)\xcez$\x8e\
-kB\xb9\x8dQb`P\x82~\x121\x9c\x9a\xb3\x92\
-\x9a*\xc9\xfe4\xb1\x88k,B,\xf5\xb0b^P\
-\xaa\xe8n\x03\x95fv{\xc6x\xfb\xaa\x06\x9e\xc3m\
-M\xdb\xde.\xfa\x93f\x11W7vuJ\xeb\x82%\
-\xeex\x8c\xa5\xea\xaf\xc5JQc%\xa4*r\x9c\xe4\
-=\x17a\xcd\xa1\xe2Xmc\x95y\xb6\xb9\x10\x9d\xcd\
-\xf3\xc0\xd7\x0a\x8e\xf8\x9a\xc8\xb3\x1a\xf7d\x9b\xd8D\x80\
-\xbc\x866\x06\x06)`\xba\xfaKWt\xa6\xd44K\
-\xde\x1f\xe1sj\x01\x80\xb4]\xb4\x99'\x88x\xe4\xf8\
-\x09`\xb7\x98\xee/\x88t\x8e\xee\x91JP=\x19\xa4\
-+\xfe\x13\xf3\xbe\x9a>\x93tin\x8ay\x93\x82U\
-\xc2\x22}\xc1C\xc2\x85\xda\x05\xaa\x11\x92]\xb9\x00\xbe\
-Tt\x07\xc9\x9d\x8c6Z\xf4\x8d4\xd0\xd6'\xe6\xb3\
-\x88\xb7\x15\x13\xe8\xf4\xb8\x08l\xcf\xb8\x8cJ\x88$\xc7\
-\xbc\xb0\x98\x18F\xe8\xca7\xf5\x95\x01\xe7\xa1\xd0\xc0|\
->\xda\xfdYOeY\x82f\xe9S\x07,-XO\
-\x01M\x1b\xc3i\xe4\x1b\x12\xc4tN\xcc\x1cJ\xa3\xe0\
-\x8a~%$)\xa1\x92\xa6\x9c\xe16\xd2\xbb\xca|\xa9\
-\x0e\x9c\xee\x9c\xd5\xb6\x17\xc8K\x09^\x0f\x09\x00R\x0b\
-\xd0y\xfd\xdc\x92-CT\x04\x14R\xb3&1Q\x12\
-\x96M\x05\x8cJd\xf5.f]\xf6\xb3\x1f\x17\xc69\
-\xf0`\x08\x9c)\xf0G\xd1\xc3\xb6\x98\x153K\xb5\x81\
-\x122J\xeaU\xd96\x09m\x22\xbdkK\x94\x94=\
-r\xb4\x90i\xda\xbc\xb7>&\xbd\x8d\xa5\xa5\x01\xd5\xd8\
-\xf3c$\x89'p7\xb6?[\x7f\xeb\xfb\xa3\x87\x9d\
-\xf2\xac\xa3z\xb2\x8d4\xf1I\xe2U\x95z\xc5v1\
-\x8f4\xdc\xd0\xb5\xb24\x85=\xa5\xaf\xc5\xbeO_\xd6\
-)\xb4\x8f\xec6D\xf77a\xf6\x93\xd1\xc3\x9e\xf6&\
-k9\x91u\x10P\xb5D\xfd\xa7\xc6B$\x93\x9a\xea\
-V\xa7l\x92$e\xce\xd4\x80\xa7$R/\x9d\x9f\xb1\
-\x17\xc5\xcf\x8b\x80\xf3\xc9&\xe0|\x86\xd8rs[\x03\
-NJ\x80O\xba\x13\x96d\xd0@\xb6f\x9b\x04\x10u\
-m\xd3\xa6\x13B\x01\xba\x03\xbc}\xea\xb3u\xcfH\xb7\
-T>\xacx3\x15\xdfPbBp\xd3\xb3\xfa\xc7\xfa\
-D\xf4\xf0?c\xeeF\xf4\xd1\x0f,\x05\x88\x04p\x92\
-\x85z);\x7fI=\xab.o\xaa\xcfnc\x8b\xc4\
-p\xfa\x04\x08\xbb\xbe\xd7\xb3\x22\xb6\xf9?\xa1|\xae\x03\
-\xe7#\xd1\xc3\xff\xd4\xb3\xceJOq,\x89\x9d,\xe2\
-au]\xed1\xb1,5M\x08Do\xdfu\xf1\x12\
-FY\xb4V\xban\xa6N\x89\x80\xf3\x11:\x88\xf0c\
-\xc4j\xc0\x8c\xa7\xb6\x95D\x81,\xad\x95\x91\x1cG\x02\
-\xa8Rt\x8f\xee\xe1M\xc5R\x09Z\xf8}$\xf9\xba\
-E\x8e\xab?_\xdcR\xfaY\xa4U\x7f\x1f\xee\x02\xce\
-\x05\xe0\xb7\xa2\xa7\xf82.!\x96\xf5\x08\xd3K\x98G\
-\x12XT=@3\xe4\xfe8:\xc1\x13\xd2\x11S\x9b\
-Z\xf8\x9f\xc2Vm\xcfi\xafk\x1e\x17}\xebO\xe1\
-\x92\xe1\x9d\xd2\xeb?EO\xf3\xbc\x87\xd8~\x01P\xfa\
-dz\x17ucc\xe6$\xc5{\x92z\x5c\xb4\xc4\x92\
-\xa41\x97\x94\xaa\xc5!\xf6;\xdc\xef\xd9F\x16-\xfe\
-%:BHE\xfb\x1d\x91s\xf6e\xa1f\x91z[\
-)\x82y\x11\xad\x94\x92UOI\x1d\xe8\x16\xa0\xf4\x89\
-\xa6\xc7\xcc\xbd\xf4\xc2\xecz\x8f\x0cIM\x04\xde\xb6\xfc\
-\x86\x048\x00\xbf\x1c=\xddI\x5c\xee\xea\xc0\x02\xa8\x97\
-\xba\x90\xd2\xdcT*\xb5\xf7\xd9M=\xc5\x9b\xd2\x09\xe2\
-\xbe\x8f\xe9M\x19\xdf\xf0\xf9U\x1f\xf0\xfb3\xd1L|\
-\x90\x86\x82\xd26\xe0\xfc\x07\xd1)\x1fe~\xe5y\x1f\
-\xd70u\xf7\xf2\xd4X\x88\x94U\xfah\x1c\x897%\
-\x0d\x00\xaa\x84\x0b\xaa\xef\x05\x89\x8f\xc3=&\xee\xfdo\
-h\x91Hm\xd1\x9a\x8fGO\xf9\x15\xafu\xd6\xe8.\
-\x00\xea\xbb\xad\xac\xd4\xab\xea\xbb\xd8\xaf+c\xde\x15\x04\
-l2Q)\x9b9J\xc2\x17\x8b\xec\x8d\xd8u\xcc\x01\
-/s\x9f\x14\x81\xe6\xf7\xa9\xdd\xfd7\x06\x1c\x80\x9f\x11\
-\x9d\xfa\xa1\xda\xc0\xf6\xbdZ\xfaF\x96\x17\x09\xac\x81,\
-o\xd5\xc56)\xc1\xba\x14S\xb4\x08\xcbti\xca%\
-\xe0\xff\x8a\xd9\xe6\xddm/t\x01\xe7\x0b\x1eq\xf1\x80\
-\xe09\xaa\xb7$\x92\xee<\x9a*\x06%\xc2\xb2o\x80\
-P\xa2}\xa4\x11\xeaT}Fb\x9f>\xe6\xcax\xcb\
-\xf0\xa4X\xdb<\x06\xfc\xef>\xc0\x01\xf8)\xd1[<\
-\x18D\x22\xbb\x04j\xdf\xabH\x9a\x18Le\x80\x18\xa3\
-)\x01sh\xfa\xe7\x9dR\xd26)\xf7\xefj:_\
-17_\x14\xb3\xcdOw\xbd\xa8\x05\x90\xf8\x83\xe8[\
-\xbc\xe0\x99g\x9d\xf4\x96j\xde\x16\xdd\x89]\xea\xc2J\
-cR\x12M\x93\x12EO\xbd}\x90\xd4\x998HP\
-M#R\xaf\x1f[\x048\x00\xffP\xf4V\x9f\xc6\xe5\
-\xb0\x0e\x10\xbf\xd5`\x1f\x10\xa4\x88KiY\xe5\x22\xab\
-\x1dR\xc2\x01)\xe5\x9c\x8b\xba\xdd\xf5\xd7\xad\x0f\xf6\x9d\
-\x05\x1e\x16\xc3\xf1\xc7c\x1d$\xc0\xf9\x82\xc8\xc3\x02x\
-\xc0\x8b\xaf\xb10`\xb7\x88\x99\x92\x16\x8e\xf5\x15\xd4}\
-\x96\xc4\xe8\x04M\x93\x9a\xc1Nq$\x08@\x93y\xf7\
-\xfb\xf7\x91\xde\x8b\xe3\xb3]\xda&\x058\x00?&\xea\
-\xf5\x84\x8fF\xae\xf7p\xcfS\xcd\xd4\x22Z\xa1\xedw\
-\xac\x84T\x93\x16\xe9^$5\x90zC\x93\xb6c\x0e\
-\xe1\xca\xcb\x9f\x11\xb3\xcd\x0fK:I\x81s\x0ax\xaf\
-\xa8\xe7\xef\xe2j\x93\x0f\x11\xdf\xa4G\x0d\x00\xac\xbe!\
-\xf7.\xf7\x1a\xa17\xd5'\x18\xd9\xe7\x82\xe8\xa3s\x8c\
-\xd75\xa7\x80\xcf\x89A\xf3\xf3Hn]\x9f(\xc3\xc0\
-\x15\x8f\x1e\x8f\xf6\xba\x01x\x07.%q\x81\xf6e\xb6\
-\xb1\x0c\xb3Nx\xbe\xcf\x8aI\xe9\xba+j\xf4\x1fN\
-N\xf1\x5c}\xd3\x81\xfak]\xcf\xdb\x01\x8e\xab?W\
-\xdc\xb8\xe5\xa3\xc4\xea:\x8b\xb6\xe1g\xce\x0e\xc98E\
-{\xbb\xa8\xd7Y\x5c\x22~\x95\xf6{\x03\xa8\x9e\xec3\
-\xc4\xd5+\xf1jR\x04\xb1Z\xe0\xfb\xf4\xd191\x13\
-\x99yA\xfc)1h\x00~\x88\x84\xfdHS\x81\xf3\
- \xf0\xeb\xe2\xf0\xd1#^\xef\xec\xc5\xbe\xc2}6\xc5\
-\x96xA\x12\xd0\xa4\x00\xe6r\xe4\xa5\x0e\xf9 \xca\xe3\
-\xe2\xd1\xfd8\xf0\xdbCFQ\xda\xf0\xfc\x1cp\xa3\xa8\
-\xf7_\xc1\xdd\x11\xebL\xc4\xc4\xc4\xcc\x8c^\xf0\xf5\xd4\
-\x05\xffm&jQ\xb3\x14>o:LM\xf1\x5c\x9b\
-9\xb4\x0d\xaf\x1b\xdcM\xa4\x1e#(+\x8f\xb6\x1d\x7f\
-\xd4f\x0a\x08t\x0f\xe0\xe4\xc0\xdb\xc4\xbd?\x82\xabk\
-\xbd\x89\xf8\x06\x8b}\xa1>\x849\xebS\xa2:\x84\xc8\
-_to\xc20^s\x93\xf7l\xefO:\xc3_N\
-\x05M\xc1\x1e}Z\xb1\xc2\xea-\xa2\xde_\x02\xee\xf6\
-*\xffB\x84q$\xcc!a\xad.q\xad\x12\x9e\x97\
-\xc6\x91l\x04\x0c)\x9bP\xa7\xee|n<hNy\
-\x83#\xdf+\xff_\x03\xff\xb1\x0f\x00\xb2\x05\xae\xfd\x07\
-\x80o\x03^.\xea\xfd0\xf0M\xb8\xc8\xf2vO`\
-4\xc5]X\xf0\x5c\xd2\xe8q\x8c\x11\xa4\xb7\x88\xeeb\
-\x0e\xdb\xd1\xb7m\xb7\x09\xebE\xc3i\x0f\x9a\x89x\xfe\
-\x1e\x04~pH\xe2O5u'\x89\xdd~\xbah#\
-\xe0Gq+$\x9e\x1f@\xeb,\xa2{$!\x00Z\
-4\x8a\xc4\x1dN\xd13M}%\xaew\x1e0\xcdo\
-!\xdd\xbf\x0f\xdc:\x95\xdb\xfa\x98\xa8E4N\x9d$\
-\xdf$&\xc7)\xf0\x9f\xbd\xb9:B\xbf\xf4\xc3\x90\x97\
-\x84tu\xa8b\x18\xcfp\xa8V\x00\xe8\xa8\x17\x0d\x1f\
-M\x02\x0d\xc0w-\x02\x9a!\x80\x03./\xfe\x96\xa4\
-/\xfd+\xde\xcb:\x82\xec\xb6\x8d{\xd9\x86\xba\x89\xfd\
-\xa5j\xc6\x8f\xd9\x11\xdc\x82\x81\xdfD\xba\xc5l\xd1\xfe\
-*~s\xa4EZ6\xd0\xd79\xe9\xbf\xc6_\x13\x1f\
-\xf1\xb0\xa7\xd9\xe3\xcc6f\xd6=\xf4\x894h\xb7H\
-\xf2\xb2\xafh%\xa2[R\xfbZ\xdc}\xc1\x0f\xe26\
-\xa5\xb9?\xf9\xd3\xfc#q\x1c\xee\x12\x01\x07\x5cA\xe2\
-s\xc0_\x10\x1f\xf1\x15?\x18/\xc7E\x98\xb7#\xa0\
- \x0180L\xc6;u\xf2\xf7\x0a8\x16\x97\x10P\
-\xc0\xef\x01\x7f\x98\xfcI\xfe\x09\xf0\xef\x86\x9a\xec!\x81\
-\x83\xbf\x0e6\x81\xb7&9\xf6O\x00\xaf\xf4W\xd2\x0e\
-\xf3\xb7!\xdc\x0b\xe0\xd0\x02\xcc\xbe.\xb2\x8d<\xd7\x17\
-8\xc5}2\x0f{\xcf\xe9w\x10\xa6!+\xed}\xc0\
-\xcf\x0e9\xd1C\x03\xa7p\xf3.\x00\xdf+>\xe2<\
-.D~;.\xca\x5c\xdc\x8cB#\x0f\xfb\xa7\xf4\x89\
-\xad\xeal\xf3\xaa\xea\x7f\xd3\xe1y\xa5\x82\xa8\xe9u\xe3\
-\xc3\x17k>\x16\xf61\x5c*2\xad\xfd\x0b\xe0=C\
-O\xf2^\x00\x07\xdc^;_'%\xc2\x5c\x18;\x0b\
-\xdc\xe9\x07k\x87\xf9\x1b\x95\xa6h\x1fH\xdf\xdeUu\
-\x00\xc1v\x80\xa9\x8b}l\xa2\xf92~f\x8aD\xc0\
-\x03~D\xd3M\xe5{\x90\x96\xc3\x5c\xe28N\xac\xfd\
-(\xf0\xab\xc9G\xed\xf72\xfbf\x1f\xab8\x17P\xb6\
-$\xe8\x17\xbb5@\x9f5P]\xb9\xaa\xbe%\x12\xf5\
-\xd8\x8e\x09\xb4\x8c\xc5\xe5\x9c>\xdd\x8be\x00~\x12\xf8\
-\xc0\xe5pF\x87jo\x03\xfe;\xd5\x82RY\xbb\x1b\
-\xf8N\x0f\xa4)\xb3}x5\x8b\xd5\xee\xd4\x03\x11\xd2\
-]\xc8m\x87\xe9\xeaJ~v\x01(|\xee\x00\xae\x8e\
-\xe6O\xbd\xc3\xfcX\xef1\xff\xeb4\xac\xf7\xbe\xda\x80\
-\x03\xf0jo\xa1\xef\xe8u\xf4\x9b\x81o\xf6\x83\xba\x1b\
-\x84\xaeR\xa3\xc7RM\x94\x22^\xdb@\xd1\x04\x90z\
-?\x130\xec\x0an\xbd\xd3#H\xd6\x95\xb4\xb5\xe7\x80\
-\xbf\x84d=\xdcU\x02\x9cbx>\x0c|_\xef3\
-|?p\x97w\xdd\x8dg Cs%a\xec\xde\x12\
-\xb1<Tl7\xf5&\xd0 4SE\x95\xc0\x01\x1f\
-\xcc{\x06W\xab\xfd\x00\xd2\x82\xf2\xa6\xf6\x00\xae\x88\xe5\
-\xf4\xa5\x98\xcc\xec\x12\x02g\x82\xdb\xf9`\xe4\x0dPz\
-\xfb\xaa\xf7\xd9Vp\x89\xbdU\xef\xc2\x1bf\xbbJI\
-\xd6X\xa7\xeeG#\x15\xb86\xe2A\x19\xcf\x9a7x\
-\xf0?\xe5\xbd\xa5Ox\xf3\xd4?\x82\xfes\xde<]\
-\xb8T\x93y\xb9\x82\xea?\x80\xcbZ\xdd\xb2\xd0Y^\
-\x0f\xdc\x83\x8b@\x8f\xfd\xc4l5\x80(u\xab\xdb\x98\
-\xb9\xb2\x02\xcd\x13\xb2\xce\xc8\xf3m\xe6}\xcdg}\xf0\
-\xf3\x8b\x0b\x8f\xe39\xe0\xef\xed\xb5\x9e\xb9\x92\x80\x83\xbf\
-\xee~\x91\x05R\xfbe;\xeaAt\xa7g\xa1ef\
-i\x8c\x1d\xe6oF\x9br#\x91\x18\xab4i\x97b\
--\xd3R\x10\xa7z\xce\x9b\xa4\x22\xbe\xbex\xfb\x98\x07\
-\xcd\xb3\x97c\xf2\xae\x844\xde;\x80\x7f\x0b\x9c\x18\xe4\
-l/\x01^\xe1\x83\x89\xeb\x9e\x89V\x82\xc9\x9dxF\
-2=G\xa2nN\xb4g\x94\xf0^^;\xb8\xb2\x91\
-\x0d/xOz\xb34L;\x83[\xd7\xfdk\x97s\
-\xd2\xae\x94\xfc\xef*\xf0~\xe0\x9d\x83\x7f\xbbWz_\
-\xee\xb0\xe7\xb8\xcc\x03ii@\xe5\xb6\xe1\xd5\xc5y\xdc\
-:\xfa\xa7q7\xac\x9c\x0e>N\xbf\x0c\xbc\xcb\xbf\x0b\
-\xd7\x81SU-\xef\x07\xbeg\xcf\xde\xe1\xa0\xe7\xb6\xc3\
-\xfe\xefUf\xcbx\xea\xf7u2\x0d\xdaf\xe2AR\
-\x00\xe5\x8c7A\x1b{:.\x9f\x01\xfe1n\xc1\xcb\
-\xf5\xd6\xd1\xde\xee\xa5\xa3}\x91?\x1e\x01\xfe\xceu8\
-\xa4\xb7\x1f\xc1\xc5P_l\x80y\x14\xf8\x07\xd7\xa7\x7f\
-\xf1\xf67p\xab\xd2\xafu\xc0|\xf6:\xc3\xec\x9d\x06\
-\xfaE\x1f\x0d\xb9V\xc0\xb2\xe9cZ\xf7^\x9f\xdeK\
-\x13\x03\xfa1\x5cY\xd3\xd5\x0a\x98\xfbp\x9bV\x1d\xb9\
->\x9d\x97\xa7\xbd\x0cWB\xf0\x09\x5c\xf1\xe9\x95\x0a\x94\
-\x09\xeeFa?\x0d|\xe3\xd5>\xe8\xea\x1a\x03\xd1-\
-\xc0\xb7{w\xfe\x0d\xc0\xb7\x5c\xe6\xef\xf8\x10.S}\
-\x1f\xae\xb2\xe6\xe9ke\xa0\xd55\xceF/\x01^\x03\
-\xbc\x0e\x97W\x7f%\xae4~u\xe0\xf7\xd9\xc1e\x9f\
-\x1e\xc5\xdd\xc3\xfds\xb8\xf4\xe5\xc9ku`\xafu\xe0\
-4\xb5bQ\xce\x09\x5cb\xe2\x04.\xd7~\x10W\xe8\
-\xb0\x8a+\x5c-6h\xd9`\x16\x1b\xde\xf4\x7f\x7f\xdd\
-\xb3\xc7I\xff\xfbi.Q9\xc3\x15\x03\x1ck-\xd7\
-\xdb\xf5\x96\xda\xfe\xff\x00!\x17\x05V\xd9p\x180\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x06\x84\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
-\x00\x00\x06KIDATx\x9c\xed\x9bYlTU\
-\x18\xc7\x7f\xdf\xcc\xd0\x22\x14d\x09\x02\xc6\xc4\xc4\x07\x84\
-\x98\x98(qa\xb3,\xd1XcT `@\xd4\x08\
-\x9d\x11(3eS\x9e\x04\xe4\x8d@(\x9d\xa1\x85v\
-@\x08\x041\xacbP\xa2\x89\x14\xd9\xdc\xc0\x07\x13\x8d\
-\xf5\xc1\x07\xa3\xa1\x8a\xb6( L;s?\x1f\xbaM\
-\xdb\x99\xce\xd2s\xa65\xf2{\xba\xf7\x9e3\xdf6w\
-9\xe7\x7f\xcf\x85\xdb\xfc\xbf\x11\xdb\x0e6\xbd\xac\x03\xfb\
-\xf7g\xb2\x0a\xe3\x05\xc6\x00c\x81\x11\x0aC\x81\x81-\
-\xddn\x084\x00W\x80\x1f\x1c\xa5V\x84K\x91\x9b\x9c\
-\x7fc\x9f\xdc\xb0\x19\x9f\x95\x02T,\xd5QN\x94y\
-\x0a\xb3\x80\xc7\x80~Y\x9ajD\xf8\x12\xe5\xa8\xe3p\
-`\xf9N\xf9\xcd`\x98\x80\xe1\x02\x04\xbdZ\xa8.V\
-\x8b\xf24\xe01i\x1b\x88\x02'\x1da\xf3\xf2*9\
-c\xca\xa8\x91\x02\x84\x8au\xba\x0a\x1b\x10&\x99\xb0\x97\
-\x12\xe1\xac\x08k\xfd;\xe4t\xcfM\xf5\x802\x9f\x8e\
-v\xc3F`AOme\x83\x0a'$\xc6\x92\xc0N\
-\xf9%[\x1bY\x07]\xee\xd5\xb9\x22T\x03wfk\
-\xc3\x10W\x11\xbc\x81*9\x9c\xcd\x8f3.@\xd0\xaf\
-\xf9D(\x03\x96d\xe3\xd0\x22\x15\xe4\xb3*\x10\x92H\
-&?\xca\xa8\x00\x15K\xb5 \x16\xe5\x08\xf0TF\xa1\
-\xe5\x8e\x1a\xf2y!\x10\x92\xbf\xd3\xfdA\xda\x05\xd8\xbe\
-X\xefjr8\x09<\x9cUh\xb9B\xb8D#E\
-\x81\xddr%\xbd\xeei\x10\xf4\xeb`\x22\xd4\xd0\xd7\x93\
-o\xe7\xdbX#\x85+\xf6\xc8\xd5T\x1d]\xa9:\xb4\
-\x5c\xf3\xef\xf3\xdfI\x1e\xe0Aw\x1e\x87\xd7\xcf\xd1\xbc\
-T\x1dS\x16@o\xb1\x15\x98f\x22\xaa\x1c3c\xf8\
-\x106\xa7\xea\xd4\xed%\x10\xf2\xe9\x1c\x85\x83\xe6b\xea\
-\x05\x84\xf9\x81*9\x90\xbc9\x09\xa1\x85z\xb7z\xf8\
-\x1es\xcf\xf9\x08\x90o\xc8V&\x5cu{\x18WR\
-)u\x89\x1a\x93^\x02\xeaa\x0b\x06\x079\xaaL\x07\
-\xfe0e/\x03\x86D\xa3lJ\xd6\x98\xb0\x00\xa1b\
-\x9d\x0e\xbch2\x8a\xd2\xb0\x5cp)S\x81\x9fM\xda\
-M\x07\x81\x97\x82^-L\xd4\x96\xb0\x00\xea\xe2m\x1b\
-\x81,\x0b\xcbw1x\x1c\xf8\xc6\x86\xfdn\x10$q\
-N]\x0a\x10Z\xacS\x81\xc9\xb6\x22YQ-\x97\xdd\
-\x1e\x0a\x81\x93\xb6|$\xa10X\xacS:\x1f\xecR\
-\x00GYe;\x92\x92J\xb9\x9e\x0f\xcf\xa3\xec\xb5\xed\
-\xab\x03.Vw>\xd4\xe1)\xd02\xdc\xfd\x15\xf3b\
-\x06\x81j\xe9\xf2\xc4QT\x82>\xd6\x09\xac3\xed/\
-\x09Q\xc7\xe1\x9exe\xa9\xc3\x19\xd0\xa8,\xc0B\xf2\
-\xc9\x10DK\xabe\xbd\x08\x0b\x81\xa6\x1c\xb8\xf4\xb8\x5c\
-\x1do\xee\x1d\x0a \xca\xcc\x1c\x04\xd1\x05\x7f\x95\xecv\
-)\xb3\x00\xab\x02(\x00\x9drl+@\x95O\x07\x00\
-\x8fZ\x0f \x09\xcb\xc2r\xc2Q\xa6\x01\xc6\x85\xcf\x0e\
-\x08\x13[r\x05\xe2\x0a\xd0\xa8L\x01RN\x1el\xb2\
-<,_\xc7\xdcL\x04~\xb4\xe8&\xaf)N\xbbl\
-+\x80\x0a\xe3-:M\x9b\x15\xdb\xe5\xa7h\x8c\x09\x08\
-gm\xf9p\xe2f\xb6\xed\xf7\x00\xe5~[\x0e3e\
-\xe5.\xa9'\x8f'\x11;\x131\x8d\xcb\xb5\xbd\x00.\
-\xc6\xd8p\x96-\x81\x90DF\xd53\x1f\xd8f\xda\xb6\
-\x90\xa8\x00\xcah\xd3\x8ez\xca\xdcC\x12\x0bT\x8b_\
-\x94\xe5\x80c\xca\xae\xc0\xa8\xd6\xed\xf8\xc7\xe0 S\x0e\
-L\xe3\x0fK\xb9(s\x81[&\xec)\x0cn\xdd\x8e\
-/@\x81\x09\xe3\xb6\xf0\x87\xe5\x88*3\x80?\x0d\x98\
-k\xfb\xb3SJb}\x09\x97\x9b<\xc0m\xd4f\xdc\
-\xf6u\x93\x86M\x13\xf2\xealm\x96\xe5\x87\x180w\
-\xadu\xc3\x95\xe8`_#\xe4\xd5Rm~$\xf67\
-aO\xa0\xed\xc5\x89'\xee\xe8e\x94{M80\xc5\
-\xc19\xea\xae\x1b\xcaV\x85e&\xed*\xb4\xe9\x83\xed\
-g\x80cu\xf8\x991A\xbf\xe6\xd7\x0d\xe3]\x0c'\
-\x0f\xa0P\xdb\xba\x1d\x7f\x06\xd4&\xec\xdd\x0blY\xa4\
-\xc3\x88p\x1cK\xca\x94H\xa2\x02\xc0E\x1b\xce2\xa5\
-l\x89\xde\xe7\x8eq\x12,\x8eL\x1d.\xb5n\xb6]\
-\x02\xf9p\x8ef\xed\xbe\xd7\xd8\xea\xd5G\xdc1.`\
-3y\x88D\x0b8\xdf\xba\xd3V\x80\xd7\xab\xe5\x1f\x84\
-\xaf,:\xee\x96m^}\xd6%\xd4\x00#-\xbb\xba\
-\xb0\xb2Ln\xb6\xeetV\x84\x8eYv\x9e\x90\xa0W\
-\x17:\xc21\xda\x97\xcd\xd9\xe4h\xfcN\x87\x02x\x5c\
-\xec'7\xda\x1c\xd0,\x8a\x96\xfbt=\xc2.r\xa3\
-EF\x1d\x87C\xf1\x07:\x14`\xc9\x0e\xf9]\x85\x8f\
-s\x10\x08U>\xed\x17\xf2\xb2'\x87\x8a0(\x1fv\
-^k\xd8e. N\xeaW\xca=\xa5b\xa9\x16D\
-\xe08\xc2+\xb6}\xc5\xa3\xd25\xb7.\x05\x08\x84\xe5\
-3\x9brT\x99OG\xc7\xa2\x9c\x01\x8al\xf9HB\
-Mi\xb5\x9c\xeb|0\xe1lP\x84\xb5\x80\x9a\x8e`\
-\x9bW\x1fp\xc3\x17\xc0C\xa6m\xa7@\x15\xd6&j\
-H\xba>\xa0\xdc\xa7\xfb\x05\xe6\x1b\x8c`\x92\x08\x1f\x00\
-\xc3M\xd9L\xdf9{\x03ay5QSR=\xc0\
-\xe3a\x15p\xd5T\x0c\x22\x9c\xa27\x92\x87\x06Gy\
-3Yc\xd2\x02\x94TJ\x1d\x82\xd7` \xbd\xb1:\
-D\x11\x8a\xbb[e\xde\xad\x22\xd4\xb2\xfc\xb4\xc2xX\
-\xb9\xa3<P%G\xbb\xeb\x90R\x12\xabo`%\xf0\
-\xa9\xb1\x90r\xc7'\xf5\x0d\xacI\xd5)\xad\x85\x92\x1b\
-\x17\xea\xa0;\xfaQ\x83\xf6\x8d\xb7Gip\xd1\xeda\
-ZI\xa5\xa4\x94\xf9\xd2\x12E\xd7\xbc#\xd7h\xa4\x08\
-i\x9fF\xf6a.\xd2\xc43\xe9$\x0f\x19\xa8\xc2\x81\
-\xddr\xc5\xedf*9\x1a*g\x85p\x8a|f\xa4\
-\xbbN\x182\x94\xc5K*\xe5z}=\xcfa\xe1u\
-U\x0fQ\x15\xca\xeb\xeb)\xcad\xa58\xf4\xe0\x83\x89\
-\x90Wg\xab\xb0\x1332uOhPeQiX\
-\xb2\x9a\xcag\xfdb\xc4\x1f\x96#n\x0f\xe3\x80}X\
-\x186\xa7\xc9!\xc7a\x5c\xb6\xc9\x83\xa1\xef|\x82^\
--Ta\x83\xc0\x13&\xec\xa5D9\xad\xc2[\x89&\
-7\x99b\xf6\xb3\xb9b\x9d\xd2\xb2\x14\xad\x88\xec\xbf\x15\
-LF\x13\xcaG\xe2f\x93\x7f\x87\x9cO\xdd==\xac\
-|\xe9\x15|MG\xd0\x8fy(3\x11&\x90\xfd0\
-8\x82\xf2\xb9\xba8*\x8d\xbc\x97\xc9\xdd=]\xac\x7f\
-\xeaV\xe5\xd3\x01M\xc2$U\xc6;0F`\xac\xc0\
-Hm\xbey\xb6\xbe\x91\xbe&\xf0\x97B\x9dB\xad\x08\
-\xb58\x5c\x8a\x16p>^\xc0\xbc\xcdm\xcc\xf3/S\
-h\xdd\xd8\xe8\x0f\xd1\x84\x00\x00\x00\x00IEND\xae\
-B`\x82\
->>>>>>> eb94b4c7a8cb73d97e5730e6117a92f534196ecc
-\x00\x00\x02\xa1\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
-\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
-\x00\x00\x00\x09pHYs\x00\x00\x00\xb1\x00\x00\x00\xb1\
-\x01\xc6-I\x8d\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00\x02\x1eID\
-ATX\x85\xbd\xd7=kTA\x14\xc6\xf1\x9f\x10D\
-0\xc4\x08\x82\xadi,\x94\x94\x0a\x9a\xc6J\x93E\xd1\
-U\x22\xeb\x0b\xfa\x01\xd4\xc4N\xf3%\x8c}P\x04\x89\
-\x11[\x11\x04Q\xf0\x15\x0b\xbfB\x12\xb4P\xd1\x98B\
-\xd0(\xc4\xd5bv\xe5\xee\xcddw6\xb97\x0fL\
-\xb1{\xe7\xdc\xff\xb9g\xce\x9c9C\xf1\xea\xc7\x04\xde\
-b\x11\xbf0\x8f\xdb\x18*\x81\xd7\xa2\x93\xf8\x86\xbfm\
-\xc6\x0cz\xcb\x80_A\xbd\x03\xbc9\xde\x15\xed\xc4X\
-\x17\xf0l$J\x83\xff\xc1$\xf6a\x005\xccE\x9c\
-XwN\xc4\xe0K\xa8D\xe6\xf6E\x9c\xb8U\x06|\
-\xb8\x8dM-7\x7fv#\xe1\x84\xe5h\xb1\xe9Y\x03\
-\xbc\x0f_q\x01;q\x00\x87p\x1e\x8f;\xd8\xee\xc8\
-\xfd\xfe\xb9\x06~T\x9b\x12\xe7Mj\x8d\xc0\xebn\x22\
-\xb0\x05\xa7\x840\xefj@?\xe0\x09\x1e\xe0G\x07\xfb\
-\x11\xa1Vd\xf50\x15^\xc1{\xab\xef\xe9O8\xdd\
-\xc6\xfe\xb0\x90#Y\x9bElO\x81_\xc6r\x1bx\
-s\xd4\x853 \x05^\xc7h\x0a\xbc\xdb\x0aWG5\
-c?\xbc\x0a|<\x05>\x1e\x81\xd7q\x17g\x85\x90\
-O\x09U\xaf\xf9\xfc\x0b\x06\x1b\xf6G\x8a\x86/\xe1x\
-d\xeeA\xbc\xc4S\xec)\x02~5\x02\xff\x8dc\x8d\
-\xe7{\xf1\x0c\xaf\x1a\xf0\xbcN\x94\x09\x1f\x14\xc2\x9c=\
-t\xa6\x84\xe58\x87{\xe2y\xb1\xae\xb0g\xcbk5\
-2\xa7SR\x8e\xa5\xc0\xabZ\x93\xa9\xf9\xe5G#s\
-\xaf':\xb1\x8cK)\xf0~+\xdb\xa8\xd5\xe0M\x8d\
-\xe2c\x1b\xf8\xbc\xce\x07\xd3\x7fMD<\x1fI\xb0\xdb\
-\x8a\x8b\x98\x16\x12\xf2\x05\xee\x08G\xee\xe6T8\xa1{\
-\xcd:p#\xd1.\xf5\x00j\xab\x1e\xec\xce\xfd\x97\xd2\
-\xab\x0d\x0b\x05\xe9\xb9\xf0\x01\x9f\x85\x1cz\x84\xef\xdd:\
-\x91\xdf\xb3\x03\x09\xf0\xd8>O\xca\xf6\x98\xf2}Zm\
-#\xe1\x84\x1bK\xf6\x85sB\xd7\x93W\xa5\x0c8\xa1\
-5\xceo\xa39\x9c\x11\x96c?nZY'\x0a\x81\
-7u?\xe2D!\x15.U\xbd\xc2u)\x15\x9eo\
-\xad\x0asb\xa6\x03|A8\xedJ\xd5\x90pc\x99\
-\x15\xae\xd6\x0bx\x83k\xd8V4\xec\x1f\x0a\x15]\xe0\
-gp\xb4J\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x07\x1c\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00@\x00\x00\x00@\x08\x03\x00\x00\x00\x9d\xb7\x81\xec\
-\x00\x00\x02OPLTE\xff\xff\xff\xff\xff\xff\x80\x80\
-\x80\xaa\xaa\xaa\xb6\xb6\xb6\xbf\xbf\xbf\xc6\xc6\xc6\xb9\xb9\xb9\
-\xc4\xc4\xc4\xc3\xc3\xc3c\x80\xaa\xb8\xb8\xb8Y\x80\xa6\xbf\
-\xbf\xbf`\x80\xaa\xbf\xbf\xbf\xbd\xbd\xbd\xbf\xbf\xbf\xbd\xbd\
-\xbd\xc1\xc1\xc1\xbc\xbc\xbc\xbd\xbd\xbd^\x80\xae\xbf\xbf\xbf\
-\xbf\xbf\xbf\xc1\xc1\xc1\xbe\xbe\xbe\x5c\x80\xad\xbd\xbd\xbd\xbf\
-\xbf\xbf\xbd\xbd\xbd\xbe\xbe\xbe\xbf\xbf\xbf\xc0\xc0\xc0\xbd\xbd\
-\xbd\xbf\xbf\xbf^~\xab\xc0\xc0\xc0\xbe\xbe\xbe\xc0\xc0\xc0\
-]}\xab\x5c~\xac\xbf\xbf\xbf\xbf\xbf\xbf\xbf\xbf\xbf\xbf\
-\xbf\xbf\xc0\xc0\xc0\xbf\xbf\xbf\xbf\xbf\xbf\xc0\xc0\xc0\xbf\xbf\
-\xbf\xc0\xc0\xc0^}\xac\xbf\xbf\xbf\xbf\xbf\xbf\xbe\xbe\xbe\
-\xbe\xbe\xbe\xc0\xc0\xc0\xbf\xbf\xbf\xbf\xbf\xbf\xc0\xc0\xc0\xbe\
-\xbe\xbe\xbf\xbf\xbf]\x7f\xad\xc0\xc0\xc0\xbf\xbf\xbf\xbf\xbf\
-\xbf]}\xac\xbf\xbf\xbf]~\xac\xbf\xbf\xbf\xc0\xc0\xc0\
-\xbf\xbf\xbf\xbf\xbf\xbf\xbf\xbf\xbf\xbf\xbf\xbf\xbf\xbf\xbf]\
-~\xac\x9c\xa7\xb8\xbf\xbf\xbf\xc0\xc0\xc0\xbf\xbf\xbf\xbf\xbf\
-\xbf\xc0\xc0\xc0\xbf\xbf\xbf\xc0\xc0\xc0\xbf\xbf\xbf\xc0\xc0\xc0\
-]~\xac\xbf\xbf\xbf\xbf\xbf\xbf]~\xad\xc0\xc0\xc0]\
-~\xad\xbf\xbf\xbf\xbf\xbf\xbf\xc0\xc0\xc0\xbf\xbf\xbf\xbf\xbf\
-\xbf]~\xac\xbf\xbf\xbf\xbf\xbf\xbf\xc0\xc0\xc0\xbf\xbf\xbf\
-]~\xac_\x80\xb1a\x82\xb3c\x83\xb2d\x82\xade\
-\x83\xadi\x89\xb8l\x8b\xc8mmmnnnoo\
-oqqqs\x92\xc4v\x94\xdawwwxxx\
-x\x96\xdezzz{{{{\x92\xb2{\x98\xe3{\
-\x99\xdf}}}~~~~\x9c\xea\x7f\x9d\xd0\x80\x9d\
-\xed\x82\xa0\xdd\x83\xa1\xd5\x84\x84\x84\x84\xa1\xd5\x84\xa2\xd6\
-\x85\x85\x85\x8b\x8b\x8b\x8e\x8e\x8e\x93\xaf\xe9\x94\x94\x94\x94\
-\xb0\xe6\x94\xb0\xe7\x95\x95\x95\x96\x96\x96\x96\xb2\xe8\x97\x97\
-\x97\x98\x98\x98\x99\x99\x99\x9b\x9b\x9b\x9d\xa8\xb8\x9d\xa9\xb8\
-\xa2\xbe\xf8\xa3\xbe\xf7\xa3\xbe\xf8\xa4\xa4\xa4\xa4\xbf\xf8\xa7\
-\xa7\xa7\xa8\xa8\xa8\xa8\xc2\xfc\xa9\xa9\xa9\xab\xc5\xff\xac\xac\
-\xac\xac\xb2\xbb\xb0\xb0\xb0\xb6\xb9\xbd\xb7\xb7\xb7\xb8\xb8\xb8\
-\xb8\xba\xbe\xbf\xbf\xbf\xc0\xc0\xc0\xc2\xc2\xc2\xc3\xc3\xc3\xc4\
-\xc4\xc4\xc5\xc5\xc5\xc6\xc6\xc6\xc8\xc8\xc8\xc9\xc9\xc9\xcc\xcc\
-\xcc\xcd\xcd\xcd\xcf\xcf\xcf\xd0\xd0\xd0\xd1\xd1\xd1\xd2\xd2\xd2\
-\xd4\xd4\xd4\xd6\xd6\xd6\xd7\xd7\xd7\xd8\xd8\xd8\xda\xda\xda\xdb\
-\xdb\xdb\xdc\xdc\xdc\xdd\xdd\xdd\xde\xde\xde\xdf\xdf\xdf\xe0\xe0\
-\xe0\xe1\xe1\xe1\xe2\xe2\xe2\x83_R\xb9\x00\x00\x00ht\
-RNS\x00\x01\x02\x03\x07\x08\x09\x0b\x0d\x11\x12\x12\x14\
-\x14\x18\x18\x1b\x1c\x1f!\x22#&(,-/26\
-8:?@EFHIIOUXY_dg\
-hiklmtuxx|\x82\x8a\x8d\x8f\x90\x91\
-\x92\x9f\xa7\xa9\xab\xae\xaf\xaf\xb0\xb0\xb5\xb7\xbc\xbf\xc0\xc4\
-\xce\xd1\xd2\xd5\xd6\xd7\xd9\xdc\xdd\xdf\xe1\xe4\xe8\xea\xeb\xed\
-\xee\xf2\xf4\xf5\xf7\xf8\xfa\xfb\xfc\xfd\xfe\x1c\x07\xa9;\x00\
-\x00\x04\x14IDATx\x9c\x9d\x96\xfdC\x0cA\x1c\
-\xc6/\x12%\x0a\x95\xbc\x87s*\x92\xc8[$\x95\x12\
-\xee\xbc\x95\xb7^.\x94n\xbde\x91\xf7\xd7N$D\
-\xb8p\xde\xd7kSIT\x92\xe4\xa5\xdb?\xcc\xcc\xec\
-\xec\xb6\xbb77\xbb\xdd\xf3\xcb\xcd\xdb\xe7\x99\xf9\xce|\
-w\xe6,\x16\x9a\x16\xed\x02\xc0e\x9fN\xed3\xa3\xc9\
-\x95\x00i\xfb\xc8`\x0d\x96\x02I\xf1\xc1\x1a\xac#\x06\
-\xc9\xc1\x1a\xec$\x06k\x86\x03E/\x9b\x1fF\x8ac\
-\x09\x0f\xecJ\xe7\xc2\x05\xa1\x06\xfc\xdc\xfd\x00\x14\xce\x94\
-\xca\xb3e\x83\xf2\x11\xb8\x1e\x92\xe2\x84;\x1a\xc5\xe6\x0f\
- \xa0j\x15ZD\xc2&\xd9\x00d\xc4\xc0\xfa\xc4\x8d\
-\xb8\xbc\x83\xe5\x10\xbd\x9f\x10\x85\xb3\xd3\xb6\x03\x95\x5c\x05\
-64\xbd6 \x8a\x96\x013\x9a\x1a\xd8`\xbe\x19\xbe\
-rL`\x83\xb0B\x13\x06\x99\xacM\x9cYe\xc8\x17\
-\x8df\x19XV\xe9\x86w|m\xd76\xb8f1y\
-M\x10\xed\xbd\xbf|\xa2(\xfe\xeb\xefn5\x19\x00\x92\
-\x92=\xe0\xdb\xa0(k\xa0Cn,f\x07\x00\x95F\
-F\xb6\xfd\x14U\xf2\xf5\x90\xe6\xaaIF\x06r\xfeh\
-x\xa8.\xd2\xbe\xd2\x80O\x90\xd7\xaf\xe3\xc5A\xb2\x99\
-\xa5\xa3X\xf8\xb89$\xff\xdb\xa5\xf8\xbb\x9b\x1b\xce4\
-\xbc\x95\xca\xfd\xc4z\xf5\x8c0:<e\xf9\xfa\xdd\xca\
-\x06\xf6b\xe6\xe3#\x8f\xa7\xe1\x04\x7fK\x0a\xa7S\xee\
-<\xb8u\xed\xe2p?~\xd1A\xf5i\xffBD\xcf\
-C\x0f\xd4\x0d\x9e\xbf--G=\xa0\xd8\xef\x9a\xdb\xa5\
-I\x17t\xfeb3\xe2=\x8fN\xf1|\x1b\xaa\xf6i\
-Fd\xe8\x0d4\xbd\x1dx\xca\xfb\xd8\xc0s\x9e\xe7\xdf\
-\xa0\xea\x1f\xcd\x90|\xa6\xc1Wl\xd0$\x19\x5c\xe5\xf9\
-f\x9c\x0bl\x03\x97\xba\xb7]mp\x96\xe7\xdf\xe3t\
-\xd4\x18\xe4\xe8\x0d\xec\x9a\xee\x7f\x88x\x8e\xf9\xbb'\xf8\
-\x93\xdd\xa8\xfaC3b\x89\xde`\xba\xe6\x0a\xebG\xc4\
-_\xbc\x09\x17x\xfe\xa5&\x17\xb1\xb2\xfd\xcfqd|\
-\xf2\x1a{9\xe9\xc7S\x8a\xbdM\x9e\x87W\xf8\x93/\
-\xf1\x99\xf8>\x93\xbe\xbd\x1bV\xd8&\xf8\xe1D#2\
-\xa4A\xad\x03R\x02\x7fz\xd5\xfc^2\x13\xbf\x13~\
-^ VR\x0c\xd9\xcc\x0e\x9f\xee[\xf8M\xee\x84m\
-l\xdeb) \x13\xf5hy\xdf\x17\xd2\x9ejd`\
-\x93\xb7\xa9kP=\xbf\xcc;\xf1\x95\x1c\xe9\xe08G\
-$\xdd e(\x19\xfa\x95\xe9\xbf+w\xda\xbeX4\
-(\x9d\x83J\xa7\xf2\x13\x9d`H\x9d\xdd}\x7f|\x03\
-?\xba>\xab\xda6\x87\xc0Q\xb9\xc8 \x97\xc6\x87l\
-\x04,}x\xdc\x02\xd2\xe0\xb0=\xc8`\x0f&\x22\x92\
-\xc6\xd3\x03\xa0\xe9\xddQ\xee\xd8\x93\xf2XK\x1c\x87\x15\
-\x07\x81\xc4\x12\xael\xda\x10\x1f\xedd\xf1\x1f\x8e\x22\xec\
-\xe2\x96\xac\x0a\xc9\xa0\x22\xcb\x9a\x87~\xcb\x86\xd6\xb0\x90\
-\xb9\x80\xc7\x5c\x00%)\x06\x0b\x94\xc1\xc5\xfa7\xce\xb9\
-\x0f\xb4\x1c\xa3\xf3%\x11\x8aA(\xf9\xa2\x5c\x99\xa3'\
-\xad,U\xe1\xdbR\xc7\xc4n\x06O\x08Q]\xdf\xe8\
-\xf56\xd6W\x93j\xa2j\x13\xa3v\xa0\xe1E\xf8\xfd\
-\x1b\xb5Z\xe1q\xfe\x87\xa4\x95_\xc4@\xedk\x01\xeb\
-u-\xae\xe6i\xce1\xca\x0e*3\xc9\xf35C\xe6\
-\xf7\x92\xce\xd8-\x08\xb8'(\xba\x87\xeaV]*L\
-U\xfe?\x84\xc9\x17\xf5\x06\xb9%\x0b\xcd\x0f\xc1g\xd7\
-kj\xea^\xc0\x02ZC\x16-\xa1$m%\x06+\
-H=\x0e\x9e_5\x5c\xff\x9dK\xee\xd3\x87\xb8#\x0f\
-`\x14p\x1f*\xe2\x02\x1a\xac%\x066X\x8eL\xcf\
-\xc5\xf9wS\x10\x9e^s\xbb\xdd\xe78\xee\x08\x5cC\
-=\xce\xc9\xdct\xfa\x97\xb5\x98\x18\xa0\xfb\xc7A\xb6\xbc\
-Q\x10\xae\xbb\x91\x0es\x5c\x9d 4\x92f\x07\xd5 \
-\xbc\x18\xf3\xd9\xa8,\x1f\xbaW\x10.c\x83\xe3\x1cW\
-#\x08^\xb9\x9d\x1eC|F~~\xce\x92\xf0\xe0\x0d\
-T\x0a*\x04\xb5\x82\xdaD\xbd\x86}\x8c~\x1an\x22\
-\xf9\xc9j&\x95Y\xca3\xfe\x98\x98J4\xfe\x9c\x99\
-\x8a(1\xbcP\xd8J\xa2\xf3\xea+\x8d\xad\xf1e8\
-d+\xe3R5\xd0\xb42\xae\x04\x05\x1c\xf8Z7\x5c\
-C\x92\x14.\xceI\xea\xc3bR\x81\x9f6\x93b<\
-\xae\xe6Dy\xde\xff\x03\xac\xe4\x92\x18\xbbW\x94\x03\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00t\xec\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x8f\x00\x00\x00\x8e\x08\x06\x00\x00\x00\x08?[6\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x0aMiCCPPho\
-toshop ICC profi\
-le\x00\x00x\xda\x9dSwX\x93\xf7\x16>\xdf\xf7\
-e\x0fVB\xd8\xf0\xb1\x97l\x81\x00\x22#\xac\x08\xc8\
-\x10Y\xa2\x10\x92\x00a\x84\x10\x12@\xc5\x85\x88\x0aV\
-\x14\x15\x11\x9cHU\xc4\x82\xd5\x0aH\x9d\x88\xe2\xa0(\
-\xb8gA\x8a\x88Z\x8bU\x5c8\xee\x1f\xdc\xa7\xb5}\
-z\xef\xed\xed\xfb\xd7\xfb\xbc\xe7\x9c\xe7\xfc\xcey\xcf\x0f\
-\x80\x11\x12&\x91\xe6\xa2j\x009R\x85<:\xd8\x1f\
-\x8fOH\xc4\xc9\xbd\x80\x02\x15H\xe0\x04 \x10\xe6\xcb\
-\xc2g\x05\xc5\x00\x00\xf0\x03yx~t\xb0?\xfc\x01\
-\xafo\x00\x02\x00p\xd5.$\x12\xc7\xe1\xff\x83\xbaP\
-&W\x00 \x91\x00\xe0\x22\x12\xe7\x0b\x01\x90R\x00\xc8\
-.T\xc8\x14\x00\xc8\x18\x00\xb0S\xb3d\x0a\x00\x94\x00\
-\x00ly|B\x22\x00\xaa\x0d\x00\xec\xf4I>\x05\x00\
-\xd8\xa9\x93\xdc\x17\x00\xd8\xa2\x1c\xa9\x08\x00\x8d\x01\x00\x99\
-(G$\x02@\xbb\x00`U\x81R,\x02\xc0\xc2\x00\
-\xa0\xac@\x22.\x04\xc0\xae\x01\x80Y\xb62G\x02\x80\
-\xbd\x05\x00v\x8eX\x90\x0f@`\x00\x80\x99B,\xcc\
-\x00 8\x02\x00C\x1e\x13\xcd\x03 L\x03\xa00\xd2\
-\xbf\xe0\xa9_p\x85\xb8H\x01\x00\xc0\xcb\x95\xcd\x97K\
-\xd23\x14\xb8\x95\xd0\x1aw\xf2\xf0\xe0\xe2!\xe2\xc2l\
-\xb1Ba\x17)\x10f\x09\xe4\x22\x9c\x97\x9b#\x13H\
-\xe7\x03L\xce\x0c\x00\x00\x1a\xf9\xd1\xc1\xfe8?\x90\xe7\
-\xe6\xe4\xe1\xe6f\xe7l\xef\xf4\xc5\xa2\xfek\xf0o\x22\
->!\xf1\xdf\xfe\xbc\x8c\x02\x04\x00\x10N\xcf\xef\xda_\
-\xe5\xe5\xd6\x03p\xc7\x01\xb0u\xbfk\xa9[\x00\xdaV\
-\x00h\xdf\xf9]3\xdb\x09\xa0Z\x0a\xd0z\xf9\x8by\
-8\xfc@\x1e\x9e\xa1P\xc8<\x1d\x1c\x0a\x0b\x0b\xed%\
-b\xa1\xbd0\xe3\x8b>\xff3\xe1o\xe0\x8b~\xf6\xfc\
-@\x1e\xfe\xdbz\xf0\x00q\x9a@\x99\xad\xc0\xa3\x83\xfd\
-qanv\xaeR\x8e\xe7\xcb\x04B1n\xf7\xe7#\
-\xfe\xc7\x85\x7f\xfd\x8e)\xd1\xe24\xb1\x5c,\x15\x8a\xf1\
-X\x89\xb8P\x22M\xc7y\xb9R\x91D!\xc9\x95\xe2\
-\x12\xe9\x7f2\xf1\x1f\x96\xfd\x09\x93w\x0d\x00\xac\x86O\
-\xc0N\xb6\x07\xb5\xcbl\xc0~\xee\x01\x02\x8b\x0eX\xd2\
-v\x00@~\xf3-\x8c\x1a\x0b\x91\x00\x10g42y\
-\xf7\x00\x00\x93\xbf\xf9\x8f@+\x01\x00\xcd\x97\xa4\xe3\x00\
-\x00\xbc\xe8\x18\x5c\xa8\x94\x17L\xc6\x08\x00\x00D\xa0\x81\
-*\xb0A\x07\x0c\xc1\x14\xac\xc0\x0e\x9c\xc1\x1d\xbc\xc0\x17\
-\x02a\x06D@\x0c$\xc0<\x10B\x06\xe4\x80\x1c\x0a\
-\xa1\x18\x96A\x19T\xc0:\xd8\x04\xb5\xb0\x03\x1a\xa0\x11\
-\x9a\xe1\x10\xb4\xc118\x0d\xe7\xe0\x12\x5c\x81\xebp\x17\
-\x06`\x18\x9e\xc2\x18\xbc\x86\x09\x04A\xc8\x08\x13a!\
-:\x88\x11b\x8e\xd8\x22\xce\x08\x17\x99\x8e\x04\x22aH\
-4\x92\x80\xa4 \xe9\x88\x14Q\x22\xc5\xc8r\xa4\x02\xa9\
-Bj\x91]H#\xf2-r\x149\x8d\x5c@\xfa\x90\
-\xdb\xc8 2\x8a\xfc\x8a\xbcG1\x94\x81\xb2Q\x03\xd4\
-\x02u@\xb9\xa8\x1f\x1a\x8a\xc6\xa0s\xd1t4\x0f]\
-\x80\x96\xa2k\xd1\x1a\xb4\x1e=\x80\xb6\xa2\xa7\xd1K\xe8\
-ut\x00}\x8a\x8ec\x80\xd11\x0ef\x8c\xd9a\x5c\
-\x8c\x87E`\x89X\x1a&\xc7\x16c\xe5X5V\x8f\
-5c\x1dX7v\x15\x1b\xc0\x9ea\xef\x08$\x02\x8b\
-\x80\x13\xec\x08^\x84\x10\xc2l\x82\x90\x90GXLX\
-C\xa8%\xec#\xb4\x12\xba\x08W\x09\x83\x841\xc2'\
-\x22\x93\xa8O\xb4%z\x12\xf9\xc4xb:\xb1\x90X\
-F\xac&\xee!\x1e!\x9e%^'\x0e\x13_\x93H\
-$\x0e\xc9\x92\xe4N\x0a!%\x902I\x0bIkH\
-\xdbH-\xa4S\xa4>\xd2\x10i\x9cL&\xeb\x90m\
-\xc9\xde\xe4\x08\xb2\x80\xac \x97\x91\xb7\x90\x0f\x90O\x92\
-\xfb\xc9\xc3\xe4\xb7\x14:\xc5\x88\xe2L\x09\xa2$R\xa4\
-\x94\x12J5e?\xe5\x04\xa5\x9f2B\x99\xa0\xaaQ\
-\xcd\xa9\x9e\xd4\x08\xaa\x88:\x9fZIm\xa0vP/\
-S\x87\xa9\x134u\x9a%\xcd\x9b\x16C\xcb\xa4-\xa3\
-\xd5\xd0\x9aigi\xf7h/\xe9t\xba\x09\xdd\x83\x1e\
-E\x97\xd0\x97\xd2k\xe8\x07\xe9\xe7\xe9\x83\xf4w\x0c\x0d\
-\x86\x0d\x83\xc7Hb(\x19k\x19{\x19\xa7\x18\xb7\x19\
-/\x99L\xa6\x05\xd3\x97\x99\xc8T0\xd72\x1b\x99g\
-\x98\x0f\x98oUX*\xf6*|\x15\x91\xca\x12\x95:\
-\x95V\x95~\x95\xe7\xaaTUsU?\xd5y\xaa\x0b\
-T\xabU\x0f\xab^V}\xa6FU\xb3P\xe3\xa9\x09\
-\xd4\x16\xab\xd5\xa9\x1dU\xbb\xa96\xae\xceRwR\x8f\
-P\xcfQ_\xa3\xbe_\xfd\x82\xfac\x0d\xb2\x86\x85F\
-\xa0\x86H\xa3Tc\xb7\xc6\x19\x8d!\x16\xc62e\xf1\
-XB\xd6rV\x03\xeb,k\x98Mb[\xb2\xf9\xec\
-Lv\x05\xfb\x1bv/{LSCs\xaaf\xacf\
-\x91f\x9d\xe6q\xcd\x01\x0e\xc6\xb1\xe0\xf09\xd9\x9cJ\
-\xce!\xce\x0d\xce{-\x03-?-\xb1\xd6j\xadf\
-\xad~\xad7\xdaz\xda\xbe\xdab\xedr\xed\x16\xed\xeb\
-\xda\xefup\x9d@\x9d,\x9d\xf5:m:\xf7u\x09\
-\xba6\xbaQ\xba\x85\xba\xdbu\xcf\xea>\xd3c\xeby\
-\xe9\x09\xf5\xca\xf5\x0e\xe9\xdd\xd1G\xf5m\xf4\xa3\xf5\x17\
-\xea\xef\xd6\xef\xd1\x1f704\x086\x90\x19l18\
-c\xf0\xcc\x90c\xe8k\x98i\xb8\xd1\xf0\x84\xe1\xa8\x11\
-\xcbh\xba\x91\xc4h\xa3\xd1I\xa3'\xb8&\xee\x87g\
-\xe35x\x17>f\xaco\x1cb\xac4\xdee\xdck\
-<abi2\xdb\xa4\xc4\xa4\xc5\xe4\xbe)\xcd\x94k\
-\x9af\xba\xd1\xb4\xd3t\xcc\xcc\xc8,\xdc\xac\xd8\xac\xc9\
-\xec\x8e9\xd5\x9ck\x9ea\xbe\xd9\xbc\xdb\xfc\x8d\x85\xa5\
-E\x9c\xc5J\x8b6\x8b\xc7\x96\xda\x96|\xcb\x05\x96M\
-\x96\xf7\xac\x98V>VyV\xf5V\xd7\xacI\xd6\x5c\
-\xeb,\xebm\xd6WlP\x1bW\x9b\x0c\x9b:\x9b\xcb\
-\xb6\xa8\xad\x9b\xad\xc4v\x9bm\xdf\x14\xe2\x14\x8f)\xd2\
-)\xf5Sn\xda1\xec\xfc\xec\x0a\xec\x9a\xec\x06\xed9\
-\xf6a\xf6%\xf6m\xf6\xcf\x1d\xcc\x1c\x12\x1d\xd6;t\
-;|rtu\xccvlp\xbc\xeb\xa4\xe14\xc3\xa9\
-\xc4\xa9\xc3\xe9Wg\x1bg\xa1s\x9d\xf35\x17\xa6K\
-\x90\xcb\x12\x97v\x97\x17Sm\xa7\x8a\xa7n\x9fz\xcb\
-\x95\xe5\x1a\xee\xba\xd2\xb5\xd3\xf5\xa3\x9b\xbb\x9b\xdc\xad\xd9\
-m\xd4\xdd\xcc=\xc5}\xab\xfbM.\x9b\x1b\xc9]\xc3\
-=\xefA\xf4\xf0\xf7X\xe2q\xcc\xe3\x9d\xa7\x9b\xa7\xc2\
-\xf3\x90\xe7/^v^Y^\xfb\xbd\x1eO\xb3\x9c&\
-\x9e\xd60m\xc8\xdb\xc4[\xe0\xbd\xcb{`:>=\
-e\xfa\xce\xe9\x03>\xc6>\x02\x9fz\x9f\x87\xbe\xa6\xbe\
-\x22\xdf=\xbe#~\xd6~\x99~\x07\xfc\x9e\xfb;\xfa\
-\xcb\xfd\x8f\xf8\xbf\xe1y\xf2\x16\xf1N\x05`\x01\xc1\x01\
-\xe5\x01\xbd\x81\x1a\x81\xb3\x03k\x03\x1f\x04\x99\x04\xa5\x07\
-5\x05\x8d\x05\xbb\x06/\x0c>\x15B\x0c\x09\x0dY\x1f\
-r\x93o\xc0\x17\xf2\x1b\xf9c3\xdcg,\x9a\xd1\x15\
-\xca\x08\x9d\x15Z\x1b\xfa0\xcc&L\x1e\xd6\x11\x8e\x86\
-\xcf\x08\xdf\x10~o\xa6\xf9L\xe9\xcc\xb6\x08\x88\xe0G\
-l\x88\xb8\x1fi\x19\x99\x17\xf9}\x14)*2\xaa.\
-\xeaQ\xb4Stqt\xf7,\xd6\xac\xe4Y\xfbg\xbd\
-\x8e\xf1\x8f\xa9\x8c\xb9;\xdbj\xb6rvg\xacjl\
-Rlc\xec\x9b\xb8\x80\xb8\xaa\xb8\x81x\x87\xf8E\xf1\
-\x97\x12t\x13$\x09\xed\x89\xe4\xc4\xd8\xc4=\x89\xe3s\
-\x02\xe7l\x9a3\x9c\xe4\x9aT\x96tc\xae\xe5\xdc\xa2\
-\xb9\x17\xe6\xe9\xce\xcb\x9ew<Y5Y\x90|8\x85\
-\x98\x12\x97\xb2?\xe5\x83 BP/\x18O\xe5\xa7n\
-M\x1d\x13\xf2\x84\x9b\x85OE\xbe\xa2\x8d\xa2Q\xb1\xb7\
-\xb8J<\x92\xe6\x9dV\x95\xf68\xdd;}C\xfah\
-\x86OFu\xc63\x09OR+y\x91\x19\x92\xb9#\
-\xf3MVD\xd6\xde\xac\xcf\xd9q\xd9-9\x94\x9c\x94\
-\x9c\xa3R\x0di\x96\xb4+\xd70\xb7(\xb7Of+\
-+\x93\x0d\xe4y\xe6m\xca\x1b\x93\x87\xca\xf7\xe4#\xf9\
-s\xf3\xdb\x15l\x85L\xd1\xa3\xb4R\xaeP\x0e\x16L\
-/\xa8+x[\x18[x\xb8H\xbdHZ\xd43\xdf\
-f\xfe\xea\xf9#\x0b\x82\x16|\xbd\x90\xb0P\xb8\xb0\xb3\
-\xd8\xb8xY\xf1\xe0\x22\xbfE\xbb\x16#\x8bS\x17w\
-.1]R\xbadxi\xf0\xd2}\xcbh\xcb\xb2\x96\
-\xfdP\xe2XRU\xf2jy\xdc\xf2\x8eR\x83\xd2\xa5\
-\xa5C+\x82W4\x95\xa9\x94\xc9\xcbn\xae\xf4Z\xb9\
-c\x15a\x95dU\xefj\x97\xd5[V\x7f*\x17\x95\
-_\xacp\xac\xa8\xae\xf8\xb0F\xb8\xe6\xe2WN_\xd5\
-|\xf5ym\xda\xda\xdeJ\xb7\xca\xed\xebH\xeb\xa4\xeb\
-n\xac\xf7Y\xbf\xafJ\xbdjA\xd5\xd0\x86\xf0\x0d\xad\
-\x1b\xf1\x8d\xe5\x1b_mJ\xdet\xa1zj\xf5\x8e\xcd\
-\xb4\xcd\xca\xcd\x035a5\xed[\xcc\xb6\xac\xdb\xf2\xa1\
-6\xa3\xf6z\x9d\x7f]\xcbV\xfd\xad\xab\xb7\xbe\xd9&\
-\xda\xd6\xbf\xddw{\xf3\x0e\x83\x1d\x15;\xde\xef\x94\xec\
-\xbc\xb5+xWk\xbdE}\xf5n\xd2\xee\x82\xdd\x8f\
-\x1ab\x1b\xba\xbf\xe6~\xdd\xb8GwO\xc5\x9e\x8f{\
-\xa5{\x07\xf6E\xef\xebjtol\xdc\xaf\xbf\xbf\xb2\
-\x09mR6\x8d\x1eH:p\xe5\x9b\x80o\xda\x9b\xed\
-\x9aw\xb5pZ*\x0e\xc2A\xe5\xc1'\xdf\xa6|{\
-\xe3P\xe8\xa1\xce\xc3\xdc\xc3\xcd\xdf\x99\x7f\xb7\xf5\x08\xeb\
-Hy+\xd2:\xbfu\xac-\xa3m\xa0=\xa1\xbd\xef\
-\xe8\x8c\xa3\x9d\x1d^\x1dG\xbe\xb7\xff~\xef1\xe3c\
-u\xc75\x8fW\x9e\xa0\x9d(=\xf1\xf9\xe4\x82\x93\xe3\
-\xa7d\xa7\x9e\x9dN?=\xd4\x99\xdcy\xf7L\xfc\x99\
-k]Q]\xbdgC\xcf\x9e?\x17t\xeeL\xb7_\
-\xf7\xc9\xf3\xde\xe7\x8f]\xf0\xbcp\xf4\x22\xf7b\xdb%\
-\xb7K\xad=\xae=G~p\xfd\xe1H\xaf[o\xeb\
-e\xf7\xcb\xedW<\xaet\xf4M\xeb;\xd1\xef\xd3\x7f\
-\xfaj\xc0\xd5s\xd7\xf8\xd7.]\x9fy\xbd\xef\xc6\xec\
-\x1b\xb7n&\xdd\x1c\xb8%\xba\xf5\xf8v\xf6\xed\x17w\
-\x0a\xeeL\xdc]z\x8fx\xaf\xfc\xbe\xda\xfd\xea\x07\xfa\
-\x0f\xea\x7f\xb4\xfe\xb1e\xc0m\xe0\xf8`\xc0`\xcf\xc3\
-Y\x0f\xef\x0e\x09\x87\x9e\xfe\x94\xff\xd3\x87\xe1\xd2G\xcc\
-G\xd5#F#\x8d\x8f\x9d\x1f\x1f\x1b\x0d\x1a\xbd\xf2d\
-\xce\x93\xe1\xa7\xb2\xa7\x13\xcf\xca~V\xffy\xebs\xab\
-\xe7\xdf\xfd\xe2\xfbK\xcfX\xfc\xd8\xf0\x0b\xf9\x8b\xcf\xbf\
-\xaey\xa9\xf3r\xef\xab\xa9\xaf:\xc7#\xc7\x1f\xbc\xce\
-y=\xf1\xa6\xfc\xad\xce\xdb}\xef\xb8\xef\xba\xdf\xc7\xbd\
-\x1f\x99(\xfc@\xfeP\xf3\xd1\xfac\xc7\xa7\xd0O\xf7\
->\xe7|\xfe\xfc/\xf7\x84\xf3\xfb%\xd2\x9f3\x00\x00\
-;+iTXtXML:com.ad\
-obe.xmp\x00\x00\x00\x00\x00<?xp\
-acket begin=\x22\xef\xbb\xbf\
-\x22 id=\x22W5M0MpCehi\
-HzreSzNTczkc9d\x22?\
->\x0a<x:xmpmeta xml\
-ns:x=\x22adobe:ns:m\
-eta/\x22 x:xmptk=\x22A\
-dobe XMP Core 5.\
-5-c021 79.154911\
-, 2013/10/29-11:\
-47:16        \x22>\x0a\
-   <rdf:RDF xmln\
-s:rdf=\x22http://ww\
-w.w3.org/1999/02\
-/22-rdf-syntax-n\
-s#\x22>\x0a      <rdf:\
-Description rdf:\
-about=\x22\x22\x0a       \
-     xmlns:xmp=\x22\
-http://ns.adobe.\
-com/xap/1.0/\x22\x0a  \
-          xmlns:\
-xmpMM=\x22http://ns\
-.adobe.com/xap/1\
-.0/mm/\x22\x0a        \
-    xmlns:stEvt=\
-\x22http://ns.adobe\
-.com/xap/1.0/sTy\
-pe/ResourceEvent\
-#\x22\x0a            x\
-mlns:photoshop=\x22\
-http://ns.adobe.\
-com/photoshop/1.\
-0/\x22\x0a            \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22\x0a    \
-        xmlns:ti\
-ff=\x22http://ns.ad\
-obe.com/tiff/1.0\
-/\x22\x0a            x\
-mlns:exif=\x22http:\
-//ns.adobe.com/e\
-xif/1.0/\x22>\x0a     \
-    <xmp:Creator\
-Tool>Adobe Photo\
-shop CC (Windows\
-)</xmp:CreatorTo\
-ol>\x0a         <xm\
-p:CreateDate>201\
-8-07-30T16:31:32\
-+09:00</xmp:Crea\
-teDate>\x0a        \
- <xmp:MetadataDa\
-te>2018-07-30T16\
-:31:32+09:00</xm\
-p:MetadataDate>\x0a\
-         <xmp:Mo\
-difyDate>2018-07\
--30T16:31:32+09:\
-00</xmp:ModifyDa\
-te>\x0a         <xm\
-pMM:InstanceID>x\
-mp.iid:fb48f00e-\
-ff8b-7d44-b66b-7\
-47567e34287</xmp\
-MM:InstanceID>\x0a \
-        <xmpMM:D\
-ocumentID>xmp.di\
-d:741e72f7-4fd5-\
-6640-a64a-3696ec\
-a5775b</xmpMM:Do\
-cumentID>\x0a      \
-   <xmpMM:Origin\
-alDocumentID>xmp\
-.did:741e72f7-4f\
-d5-6640-a64a-369\
-6eca5775b</xmpMM\
-:OriginalDocumen\
-tID>\x0a         <x\
-mpMM:History>\x0a  \
-          <rdf:S\
-eq>\x0a            \
-   <rdf:li rdf:p\
-arseType=\x22Resour\
-ce\x22>\x0a           \
-       <stEvt:ac\
-tion>created</st\
-Evt:action>\x0a    \
-              <s\
-tEvt:instanceID>\
-xmp.iid:741e72f7\
--4fd5-6640-a64a-\
-3696eca5775b</st\
-Evt:instanceID>\x0a\
-                \
-  <stEvt:when>20\
-18-07-30T16:31:3\
-2+09:00</stEvt:w\
-hen>\x0a           \
-       <stEvt:so\
-ftwareAgent>Adob\
-e Photoshop CC (\
-Windows)</stEvt:\
-softwareAgent>\x0a \
-              </\
-rdf:li>\x0a        \
-       <rdf:li r\
-df:parseType=\x22Re\
-source\x22>\x0a       \
-           <stEv\
-t:action>saved</\
-stEvt:action>\x0a  \
-                \
-<stEvt:instanceI\
-D>xmp.iid:fb48f0\
-0e-ff8b-7d44-b66\
-b-747567e34287</\
-stEvt:instanceID\
->\x0a              \
-    <stEvt:when>\
-2018-07-30T16:31\
-:32+09:00</stEvt\
-:when>\x0a         \
-         <stEvt:\
-softwareAgent>Ad\
-obe Photoshop CC\
- (Windows)</stEv\
-t:softwareAgent>\
-\x0a               \
-   <stEvt:change\
-d>/</stEvt:chang\
-ed>\x0a            \
-   </rdf:li>\x0a   \
-         </rdf:S\
-eq>\x0a         </x\
-mpMM:History>\x0a  \
-       <photosho\
-p:DocumentAncest\
-ors>\x0a           \
- <rdf:Bag>\x0a     \
-          <rdf:l\
-i>xmp.did:8915d4\
-8c-bdcd-1b49-ae4\
-0-df7992d0e26a</\
-rdf:li>\x0a        \
-       <rdf:li>x\
-mp.did:c20cb7ad-\
-9914-d646-af28-8\
-4e609cfd16f</rdf\
-:li>\x0a           \
- </rdf:Bag>\x0a    \
-     </photoshop\
-:DocumentAncesto\
-rs>\x0a         <ph\
-otoshop:ColorMod\
-e>3</photoshop:C\
-olorMode>\x0a      \
-   <photoshop:IC\
-CProfile>sRGB IE\
-C61966-2.1</phot\
-oshop:ICCProfile\
->\x0a         <dc:f\
-ormat>image/png<\
-/dc:format>\x0a    \
-     <tiff:Orien\
-tation>1</tiff:O\
-rientation>\x0a    \
-     <tiff:XReso\
-lution>720000/10\
-000</tiff:XResol\
-ution>\x0a         \
-<tiff:YResolutio\
-n>720000/10000</\
-tiff:YResolution\
->\x0a         <tiff\
-:ResolutionUnit>\
-2</tiff:Resoluti\
-onUnit>\x0a        \
- <exif:ColorSpac\
-e>1</exif:ColorS\
-pace>\x0a         <\
-exif:PixelXDimen\
-sion>143</exif:P\
-ixelXDimension>\x0a\
-         <exif:P\
-ixelYDimension>1\
-42</exif:PixelYD\
-imension>\x0a      \
-</rdf:Descriptio\
-n>\x0a   </rdf:RDF>\
-\x0a</x:xmpmeta>\x0a  \
-                \
-                \
-                \
-                \
-                \
-                \
-  \x0a             \
-                \
-                \
-                \
-                \
-                \
-       \x0a        \
-                \
-                \
-                \
-                \
-                \
-            \x0a   \
-                \
-                \
-                \
-                \
-                \
-                \
- \x0a              \
-                \
-                \
-                \
-                \
-                \
-      \x0a         \
-                \
-                \
-                \
-                \
-                \
-           \x0a    \
-                \
-                \
-                \
-                \
-                \
-                \
-\x0a               \
-                \
-                \
-                \
-                \
-                \
-     \x0a          \
-                \
-                \
-                \
-                \
-                \
-          \x0a     \
-                \
-                \
-                \
-                \
-                \
-               \x0a\
-                \
-                \
-                \
-                \
-                \
-                \
-    \x0a           \
-                \
-                \
-                \
-                \
-                \
-         \x0a      \
-                \
-                \
-                \
-                \
-                \
-              \x0a \
-                \
-                \
-                \
-                \
-                \
-                \
-   \x0a            \
-                \
-                \
-                \
-                \
-                \
-        \x0a       \
-                \
-                \
-                \
-                \
-                \
-             \x0a  \
-                \
-                \
-                \
-                \
-                \
-                \
-  \x0a             \
-                \
-                \
-                \
-                \
-                \
-       \x0a        \
-                \
-                \
-                \
-                \
-                \
-            \x0a   \
-                \
-                \
-                \
-                \
-                \
-                \
- \x0a              \
-                \
-                \
-                \
-                \
-                \
-      \x0a         \
-                \
-                \
-                \
-                \
-                \
-           \x0a    \
-                \
-                \
-                \
-                \
-                \
-                \
-\x0a               \
-                \
-                \
-                \
-                \
-                \
-     \x0a          \
-                \
-                \
-                \
-                \
-                \
-          \x0a     \
-                \
-                \
-                \
-                \
-                \
-               \x0a\
-                \
-                \
-                \
-                \
-                \
-                \
-    \x0a           \
-                \
-                \
-                \
-                \
-                \
-         \x0a      \
-                \
-                \
-                \
-                \
-                \
-              \x0a \
-                \
-                \
-                \
-                \
-                \
-                \
-   \x0a            \
-                \
-                \
-                \
-                \
-                \
-        \x0a       \
-                \
-                \
-                \
-                \
-                \
-             \x0a  \
-                \
-                \
-                \
-                \
-                \
-                \
-  \x0a             \
-                \
-                \
-                \
-                \
-                \
-       \x0a        \
-                \
-                \
-                \
-                \
-                \
-            \x0a   \
-                \
-                \
-                \
-                \
-                \
-                \
- \x0a              \
-                \
-                \
-                \
-                \
-                \
-      \x0a         \
-                \
-                \
-                \
-                \
-                \
-           \x0a    \
-                \
-                \
-                \
-                \
-                \
-                \
-\x0a               \
-                \
-                \
-                \
-                \
-                \
-     \x0a          \
-                \
-                \
-                \
-                \
-                \
-          \x0a     \
-                \
-                \
-                \
-                \
-                \
-               \x0a\
-                \
-                \
-                \
-                \
-                \
-                \
-    \x0a           \
-                \
-                \
-                \
-                \
-                \
-         \x0a      \
-                \
-                \
-                \
-                \
-                \
-              \x0a \
-                \
-                \
-                \
-                \
-                \
-                \
-   \x0a            \
-                \
-                \
-                \
-                \
-                \
-        \x0a       \
-                \
-                \
-                \
-                \
-                \
-             \x0a  \
-                \
-                \
-                \
-                \
-                \
-                \
-  \x0a             \
-                \
-                \
-                \
-                \
-                \
-       \x0a        \
-                \
-                \
-                \
-                \
-                \
-            \x0a   \
-                \
-                \
-                \
-                \
-                \
-                \
- \x0a              \
-                \
-                \
-                \
-                \
-                \
-      \x0a         \
-                \
-                \
-                \
-                \
-                \
-           \x0a    \
-                \
-                \
-                \
-                \
-                \
-                \
-\x0a               \
-                \
-                \
-                \
-                \
-                \
-     \x0a          \
-                \
-                \
-                \
-                \
-                \
-          \x0a     \
-                \
-                \
-                \
-                \
-                \
-               \x0a\
-                \
-                \
-                \
-                \
-                \
-                \
-    \x0a           \
-                \
-                \
-                \
-                \
-                \
-         \x0a      \
-                \
-                \
-                \
-                \
-                \
-              \x0a \
-                \
-                \
-                \
-                \
-                \
-                \
-   \x0a            \
-                \
-                \
-                \
-                \
-                \
-        \x0a       \
-                \
-                \
-                \
-                \
-                \
-             \x0a  \
-                \
-                \
-                \
-                \
-                \
-                \
-  \x0a             \
-                \
-                \
-                \
-                \
-                \
-       \x0a        \
-                \
-                \
-                \
-                \
-                \
-            \x0a   \
-                \
-                \
-                \
-                \
-                \
-                \
- \x0a              \
-                \
-                \
-                \
-                \
-                \
-      \x0a         \
-                \
-                \
-                \
-                \
-                \
-           \x0a    \
-                \
-                \
-                \
-                \
-                \
-                \
-\x0a               \
-                \
-                \
-                \
-                \
-                \
-     \x0a          \
-                \
-                \
-                \
-                \
-                \
-          \x0a     \
-                \
-                \
-                \
-                \
-                \
-               \x0a\
-                \
-                \
-                \
-                \
-                \
-                \
-    \x0a           \
-                \
-                \
-                \
-                \
-                \
-         \x0a      \
-                \
-                \
-                \
-                \
-                \
-              \x0a \
-                \
-                \
-                \
-                \
-                \
-                \
-   \x0a            \
-                \
-                \
-                \
-                \
-                \
-        \x0a       \
-                \
-                \
-                \
-                \
-                \
-             \x0a  \
-                \
-                \
-                \
-                \
-                \
-                \
-  \x0a             \
-                \
-                \
-                \
-                \
-                \
-       \x0a        \
-                \
-                \
-                \
-                \
-                \
-            \x0a   \
-                \
-                \
-                \
-                \
-                \
-                \
- \x0a              \
-                \
-                \
-                \
-                \
-                \
-      \x0a         \
-                \
-                \
-                \
-                \
-                \
-           \x0a    \
-                \
-                \
-                \
-                \
-                \
-                \
-\x0a               \
-                \
-                \
-                \
-                \
-                \
-     \x0a          \
-                \
-                \
-                \
-                \
-                \
-          \x0a     \
-                \
-                \
-                \
-                \
-                \
-               \x0a\
-                \
-                \
-                \
-                \
-                \
-                \
-    \x0a           \
-                \
-                \
-                \
-                \
-                \
-         \x0a      \
-                \
-                \
-                \
-                \
-                \
-              \x0a \
-                \
-                \
-                \
-                \
-                \
-                \
-   \x0a            \
-                \
-                \
-                \
-                \
-                \
-        \x0a       \
-                \
-                \
-                \
-                \
-                \
-             \x0a  \
-                \
-                \
-                \
-                \
-                \
-                \
-  \x0a             \
-                \
-                \
-                \
-                \
-                \
-       \x0a        \
-                \
-                \
-                \
-                \
-                \
-            \x0a   \
-                \
-                \
-                \
-                \
-                \
-                \
- \x0a              \
-                \
-                \
-                \
-                \
-                \
-      \x0a         \
-                \
-                \
-                \
-                \
-                \
-           \x0a    \
-                \
-                \
-                \
-                \
-                \
-                \
-\x0a               \
-                \
-                \
-                \
-                \
-                \
-     \x0a          \
-                \
-                \
-                \
-                \
-                \
-          \x0a     \
-                \
-                \
-                \
-                \
-                \
-               \x0a\
-                \
-                \
-                \
-                \
-                \
-                \
-    \x0a           \
-                \
-                \
-                \
-                \
-                \
-         \x0a      \
-                \
-                \
-                \
-                \
-                \
-              \x0a \
-                \
-                \
-                \
-                \
-                \
-                \
-   \x0a            \
-                \
-                \
-                \
-                \
-                \
-        \x0a       \
-                \
-                \
-                \
-                \
-                \
-             \x0a  \
-                \
-                \
-                \
-                \
-                \
-                \
-  \x0a             \
-                \
-                \
-                \
-                \
-                \
-       \x0a        \
-                \
-                \
-                \
-                \
-                \
-            \x0a   \
-                \
-                \
-                \
-                \
-                \
-                \
- \x0a              \
-                \
-                \
-                \
-                \
-                \
-      \x0a         \
-                \
-                \
-                \
-                \
-                \
-           \x0a    \
-                \
-                \
-                \
-                \
-                \
-                \
-\x0a               \
-             \x0a<?\
-xpacket end=\x22w\x22?\
->&W\xe8\x15\x00\x00\x00 cHRM\x00\x00z\
-%\x00\x00\x80\x83\x00\x00\xf9\xff\x00\x00\x80\xe9\x00\x00u\
-0\x00\x00\xea`\x00\x00:\x98\x00\x00\x17o\x92_\xc5\
-F\x00\x00.\xe2IDATx\xda\xec\x9dy\xbc$\
-Wu\xdf\xbf\xf7VU\xf7\xdbf\x1f\xcd&Fh$\
-\x8d6\x18I\xc86\xc4,&`\x88q0\xc6\x18\xe4\
-|\xbc\x02\xb6\xe3}I\x0c\xf2\xfeI\xe2\x18\x93\x8fM\
-\x82c'1\xc4vL\x08\x8e\x89\x1c\x13b\x10\xc1`\
-d@\xc6\x0ek\x10H\x80\x00\x09\xad#\xcd\x22\xcd\xfe\
-^\xbf\xee\xaa\xba7\x7f\xdc[U\xb7\xaak\xb9\xd5\xef\
-\xcdHHs?\x9f\xfe\xf4V]\xaf_\xdd_\x9f\xf3\
-;\xbfs\xee\xb9\x82'\xcf\xd8\x05\x5c\x09\x5c\x05\x5ca\
-o\xbb\x80\xdd\xc0<\xa0z\x9cK\x021p\x048\x04\
-|\x05\xf8*\xf0%\xe0N\xe0kO\x86\x0b*\x9e\xc0\
-\xff\xdb\x01\xe0\xf9\xc0\xb3\x80\xeb,X\xa2s\xf4\xb7\xef\
-\x01>\x07|\x12\xb8\x15\xf8\xbb\xf3\xe0y|\x8fM\xc0\
-\x8b\x81o\x05\xbe\x05\xb8\xfaq\xf4\xdd\xee\x07>\x06\xdc\
-\x02|\xd8\x82\xeb\xfcx\x8cG\x08\xfc\x00\xf0?\x80\x13\
-\x80\xfe:\xb9\xfd\x0d\xf0\xd3\xc0\xf6\xf3Sx\xee\xc7\xd5\
-\xc0\x1b\x81\xfb\xbe\x8e\x00Sw;\x05\xfc\x17\xe0\x05\xe7\
-\xa7\xf4\xec\x8e\xfd\xc0O\x00\xef\xfb:\x07L\xd3\xed3\
-\xc0/\x03\xdf|~\xaa\xd7o\x5c\x04\xbc\xe3\x09\x0a\x98\
-6\xb7v\x1eDk\x18;\x807\x01\xe3'\x19p\xdc\
-\xdb_\x00\xdfx>\xda\xf2\x1fC\xe0\x97\x80\x1b\x81\xa5\
-s\xf2\x17\x03\x98\x0f`8\x94\xccK\xc9\x9c\x12\x04\x80\
-T\x1a\xa5\x15\xb1\xd2\xac*\xcdJ\x0c#\x0d\xc9\xb9\xbf\
-&o\x03~\xc3r\xbc\xf3\xe0i\x18?`\x89\xf0\xde\
-\xf5\xfe7\x83\x0dK\xec\xda\xb2\xc8\x9eM\x1b\xb9p\xd3\
-\x22O\xd9\xb4\x81\xadsC\xb6,\x0c\xd94?\xc7\x92\
-\x0c\x99\x1b\x86\x0c\x83\x80H\x0b\x02-\x10Z\xa3\xb4&\
-\xd5\x9a\x89\x8a\x19\xad\x8e\x18\x8d&\x9c\x1e\x8d8\xb6r\
-\x86\xe3\xa7V8|\xfa\x14\x0f>z\x92{\x8f\x9d\xe2\
-\xc11L\xce\xde\xb5\x89\x81\xdf\xb2 :\x0f\x1eg,\
-\x01\xff\x0dx\xc5\xba\x9c-Z`\xeb\xee\xed\x5c\xbe{\
-;\x97m\xdf\xcc\xa5[7q\xd1\xc6%v--\xb0\
-u8`1\x8c\x08\xb4 \xd5\x10\xa7\x9aXk\x12!\
-P\x1a\x14\x02-\x05Z\x00B \xec-\x10\x92@\x06\
-\x04\x81$\x92\x82P\x0bBRd<au\xb4\xcc\x89\
-\x93'9t\xfc\x18\xf7\x1f}\x84\xbb\x0e\x1d\xe5\xceC\
-G\xb8\xf3\xc8\x19\x8e\xac\xff\xb5\xba\x1d\xf8^\xe0\x0b\xe7\
-\xc1\x03?\x03\xfc*&M0\x9b\xd8\xb3q;K[\
-6p\xf1\x05K\x5c\xb3s\x07\x17m\xdb\xc6e\x17l\
-\xe4\xe2\x85!\x8bZ\xc3$e\x92(F\x0a\x12!Q\
-\x81D\x04\x01RJ\x84\x94\x08!\x0cP\x9c\xc7\x08\x81\
-@\xd8+\x94]&\x8d\xd6\xda2\x12\x8d\xd6&\xa3!\
-\xa4$\x0c#\xe6\xa2\x88\x05)\x88\x92\x09\xab\xa7Or\
-\xf8\xc8\x11n\xbb\xf7\x01n;z\x9c\x83G\x1e\xe1\x0b\
-\x0f=\xc2\xa3\xebw\xdd\xde\x08\xfc\x01p\xf0\xc9\x08\x9e\
-\x7f\x00\xfc\x09&\xd7\xd4{\x0c\xe6\x16\xd9\xb4g/W\
-^~\x11\xd7\xef\xde\xca\x95\x1b\x86\x5c<\x17\xb0I\x81\
-\x8a\x13\x92\x14V\x09H\xc3\x10\xc2\x00)\x03d \x11\
-2@\x06\x81\x01J~\x0b\xac\x95\x91\x08)r\x8b\x93\
-_\x9e\x02;\xe6N[>\xab\x0c\x80\xb4\xd6h\x95\xa2\
-S\x85R)Z+\x84\x0c\x98\x1b\x0c\xd9\x18\x08\x22\x95\
-0Y^\xe6\xe0C\x0f\xf1\xe9\xbb\xbe\xc6G\xee\xbc\x9b\
-[\x0f\x9fX\x0f\xee4\x02~\x0a\xf8\xafO&\xf0\xfc\
-\x22\xf0\xdb\xb3|p\xf3\xf6\x9dl\xbep/\x97_\xb2\
-\x9bg\xed\xd8\xc8\xd5\x91b[\x123P\x92\x91\x0e\x99\
-\x84!\x22\x0a\x91A@\x10\x84\xc6\xc2\x04\x01\x22\x08,\
-p$\x22\x08s \x09!\x11\x81\x04)\x8d\xa5\xc9\xac\
-\x0f\x02!\xaa\x97H\x1b\xfchc\x81\x84\xd6h\xe5\x80\
-G){KQiv\x9f\xa2\x92\x04\x0d,\xcc\xcd\xb1\
-m\x10\x92\x9e:\xc1\x97\xef\xb9\x97\xff\xfd\xa9\xdbx\xcf\
-]\x079\xbd\xf6\xeb\xf9v\xe0G\x80\xf4\x89\x0c\x9e\x01\
-p\x13\xf0]}?\xb8}\xd7\x85l\xbdh\x1fW_\
-\xbc\x83\xeb6F\x5c\xc2\x98=\x1a\xb4\x8a8\x13\x86\x10\
-\x86\x04a\x88\x0c\x0dpd\x18\xe5\xa0\x91A\x80\xb4@\
-\x122@\x86\xf6\xb9\x10\x06@R\x96\xdc\x96y\x8e\x01\
-\x93\xbdJZg\xf8\xd1\x8e\xfbr\xc0\x93\x16\xe0QJ\
-\xa1\xd2\xd4\x00*IPib\x9e\xa7)i\x1c\x83\x14\
-l]Zbi\xb2\xc2W\xbf\xfa5\xde\xff\xd9\xcf\xf3\
-\xee;\xef_+?\xba\x13x9&\xc3\xff\x84\x03\xcf\
-\x00\xf8\x04&\xc3\xed=6l\xdc\xcc\xce\xfdWs\xe5\
-\xbe\x9d\x5c\xbf\xa0\xb9BL\xd8%\x02&i\xc4r\x14\
-!\x07!A`A\x13\x86\xc8\xc0\x82'\x8a\x0a\xd0d\
-\x80\xca\x00\x14\x04\x042@d\xd6\xc7\xba/\x84@\x0a\
-\x09\xb2\xe0<\xbar\xb1\xb4\x03\x1c\x1c\xe0(kqr\
-\xeb\x93Z\xab\x93\xa6\xa8$F\xa7\x09*Is \xa5\
-\xf1\x84Ti6-.\xb0M'\xdcw\xf7\xdd\xdc\xfc\
-\xc9\xcfr\xd3]\x0f\xad\x85\x17\x9d\x06\x9e\x0d\xdc\xf1D\
-\x02\xcf~LZa\xbf\xef\x07d\x10\xb2\xf5\xa9\xfb\xd9\
-w\xe9E<w{\xc4\xf5r\xcc\x852d9\x8d\x18\
-\x85!\xc1 \x22\x08\x22d\x14Z\xa0\x84\xb9E1@\
-\x8a\xec\xad\x00Mv\x1fdn\xac\xc4}\x82\xdc\xea\x08\
-i\x81#D\xc5i\x91\x87\xef\x85\xd5Q\xe8\xccEY\
-\xd0\x180\xa5\x05\x80\x92\x04\x9d$\xa4i\x92[\xa24\
-IPq\x82J&$i\xca\x86\xc5%\xb6\xab\x09_\
-\xfb\xd2\x97x\xe7\xdf~\x9c\x9b\x8e\xad\xcez\xad5\xf0\
-J\xe0\xddO\x04\xf0|\x1f\xf0\xc7\x98\x82+\xaf/\xb4\
-\xb4\xe3)\xec\xbdt/\xcf\xde\xbd\x85+\xe4\x98\xeb\x06\
-\x92q\x1aq&\x8a\x08\xa2(wOA\x18\x19\xe0\x84\
-!2\x03\x92\x05O\x10\x0d,\xa8\xa4\x05\x8d\x03\xae \
-@d\x80\x92e\xeb\x93\x81\xc7\xf8-1\xcdx4\x90\
-\x93dU\xb8\xaa4\xb1\xf7\x164Ib\xdcW\x12;\
-\xe0I\xd1\xf6\xb9Jb\x0b\xa0\x18\x95&$\x93\x09J\
-i6o\xda\xc8\xd2\xf1\xc3\xfc\xf5\xdf\x7f\x8a\xf7\xdcv\
-7\x1f/xz\xdf\xf1\xaf\xce\xb6&t\xb6\xc1\xf3&\
-\xe0\xf5\xde!\xf7`\x8e\x1d\xfb\xaf\xe2\x19\x17o\xe7[\
-\x17\x12\xae$E\xea!'\x82\x01\x0c\x22\xc2\xb0\xb02\
-Ad\xc0\x12\x84\x03\xc7\xd2\x98\xf7\x0d\xb8\x06%0\x19\
-\x1ed\x81\xe3\xb87\x03\xa0\xc0\x10\xe5\xdc}\xc9\x5c\xdf\
-q\xfc\x95\x05\x8f\x89\xb2\x94V\xc6m9.\xaaD\x90\
-\x95\xb9O\x93\x04\x9d\xc4\xc6\xea\xc4\xd6\xe2\xa4\x164\xf1\
-\xa4\xb0@\xa9\x01U2\x1eC\x14q\xc1\xdc\x80\xf1]\
-w\xf2\x91[n\xe5]'\xd5\xac\xa2\xce\x87\x81\x17~\
-=\x82\xe7\x0f\x80\x9f\xf4>zn\x89\xcb\x0e<\x9d\x17\
-\xef\x1a\xf2\xfcp\xc2f\x1dq\x8c\x01\x0c\x8d\xb5\x91a\
-qo,K\xf6Z\x01\x12\xf7}\x99\xb9\xb5\xb0\xc2\x87\
-\x9c\xe7B:\xe0q\xc3\xf8\x0c8\x19xr\xf4hk\
-q\xb4qK*\x0b\xd1St\x9aX\x10%\x05\x802\
-\xf74\x89\xed\xeb\x064\x19\x80\xd2\xf1\xd8\xdc\xc7q\x01\
-\xa08&\x8dc\xd2dB\xb4\xb8\x91\xe1\xf1\xc3<\xf0\
-\xa1[\xf8\xeb\x83\xcb\xbc[\xc2D\xf5\x9e\x87O\x02\xcf\
-\xb5\x0a\xf5zgu\xce\xca\xf8c\xe0\xc7\xfc!<\xe4\
-\xba\xeb\x0f\xf0\xea=!\xcfS\x13\x924\xe2d\xe6\x86\
-\xec\xa4\x07n4\xe5X\x9f \xb2V'\x8a\x8c\x1b\xcb\
-\xacO\x14\xe5\xf7\xc6\xd5\x0d\x08\xa2\x90`0\xc8\xdd]\
-\xe6\xda\x82(\x22\x8c\x06\x04\xceMF\x11\xa1{\xce\xec\
->\x0b\xfdC\xcb\x9d\xb2\xd0^Z\x9d\xc8Q\xa5M\xbc\
-\x96\x9b-\xc3\x99J\xec\xc4\x00R\xe0\x08\x8f\x99u\xd3\
-\x9ax\xf9\x0cjq#\xc3\x8b\x9f\xcaE\xc7\x1f\xe2\xaa\
-3c\xee\x0f\xe1D\xbf\x80\xfcB\xe0e\xc0\x1f\xcd\xee\
-\x01\xcf\x1dx~\xb5\x8f\xab\x82\x88k\xbf\xe1j~v\
-O\xc8\xfeq\xccQ= \x1e\x84\x84A@\x10\x86\x88\
-\xd0L`\xe0X\x8e\xecq\xc9\x22e\x13\x9d\x01+\x8c\
-\x90\x19P\xc2\xc8X\xa2\xfc\xf1\xc0\x80i\x10!\xa3A\
-\x01\xb0\xc1\x80`00\xa0\xc98\x93\xfdL\x10\x1a\xde\
-$B\x1b\xfaKiEE\x0b\x18p\x94ik\xadD\
-&(f\xc6K\x97\x95j@+Ur\x89\xf9\xeb\xa9\
-\x02!\x88G\xcb\x84\x839\xd8\xbb\x97\xc1\x91\x07\xb8v\
-5\xe6P\x08G\xfa)\x8c\xbb05\xdd\x7f\xfex\x06\
-\xcf\xab\x80\xb7\xf6\xf1\x9a\xcf\x7f\xc6\xe5\xfc\xfc\x9e9\x96\
-V\x12\x8e\x0a\xe3\x82\xb2\xd0;\xe7&\x19w\x09Bc\
-i\x82\xcc\x0a9\x04\xba\x16X\xa1q]\x83\xc2z\x08\
-\x0b2\x03\x9c\x880\x8c\x1cK30 \x8b\x069\xbf\
-\xca,\x9e\xc8\xce\xefFh\x81\x0d\xed]\x0fgAT\
-\xb20\xaa,.\xda'\xb9:M~o\xdf\xcf\xb8\x94\
-V\x08\x0d\xf1\xea\x88\xe1`\x88\xd8\xb9\x93\xe5\x83\xf7\xf3\
-l\x14:\x82\xaf\xf6\xcb\xc2^\x05l\x04>\xf8x\x04\
-\xcf\x8fb\x8a\xb6\xbcU\x9f\xd7^{1\xaf\xd9\xb1\x01\
-\xb5\x1cs\x22\x18\x10F5\xdc$\xa8{-si\xd6\
-\xea4Y$\x97'\xe5\x04\xdbZ\x98h\x90\x83(\x88\
-\x06\x8e\xd5\x19\x12\x0e\x07\x04\x83!\xe1\xa0\xec\xc6\xa4\xab\
-V\x8b\xcc]Ye:\xcf\x83\x15\xb1\x99\xa8\x0a\x8a\xf9\
-\xbd*\x87\xfaJA\xfe\x9a\x05\x95*@\x04\x10\xaf\xae\
-\xb0\xb0\xb8\x81d~\xc0\xa1{\x1f\xe6\x99\x8b\xf0\xd4\x81\
-\x01\xd0\xaa\xbf3\xfaf`\xa7\x95M\x1e7\xe0y%\
-\xf0\xa7}\xfe\xea\xeb\x9e\xb6\x8dW\xee\xd8\xc9\xa1S1\
-\xcbQH\x149\x96&#\xb4\x8d \x0a\x1c\xebS\xb6\
-H.\x90\x82\xdc\x85\x15:O`\xc3x\xe3\xe2\xc22\
-/\x1a\x0c\x08\x87C\x82\xc1\x9c\x05\xcf0\x07ZN\xb0\
-\x85M[8\xa6&\x0b\xdb\x0b\x8bR\xb6\x22\xca\x82\xa2\
-xM\xe7\xa01\x9fs\xc2\xfe\xec}\xabX\xa3\x8bc\
-\xe2\xd1\x88\xa5-\xdbX^~\x94\x83\x87V8\xb0\x01\
-\xbei\x0e\xbe8\x81S\xfeD\xfa\x9b\x80\xad\xc0_\xad\
-u\xd2\xe5:\x00\xe7\x00\xa6\xe2\xcd\xcfQE\xf0\xfa\xbd\
-!/X\xd8\xc6\x97O\xae2\x09\x05A\x9eKr\xc3\
-\xe3\xe2\xb9\xc0IV\xbaIK!LXm\xc3\xeb\xec\
-q9S\xeed\xcc\x9d\xf7\x0au9\xc8\xa3,\x03<\
-K\xa0\x07\x03\xc2\xb9y\xa2\x85\x05\xc2\xb99\x82\xc1 \
-\x07\xaa\x90\x01\xd2\xe5;\xa2\xf2\xdds\xce\x93\x91f\xdf\
-\x8b\xd3u\xa4&\x9d\x8c\xd9q\xc9~\x86\x8b\x82\xbbV\
-`(\xe0\x97\xb6\xc2e\x83^s\xf6s\xc0\x8f?\xd6\
-\xe0\x99\x07>\xea{\xf0p\x1e~a\x1b|\xc3\xdcf\
-\xee\xd7\x01\x08=}\xe1+\xbfj*\x80)J&\x98\
-r\x15\xa22\x11.\x10\xc1\x05\x9c\x03PD\x9e\x8e \
-\x8f\x9a\x84\xb1T\xae\x1e\xe4\x86\xefm\x93,\x1c\xb75\
-\x8b8\x9ce\xec\x1bN\x1e\xaf\x8e\x98\xdb\xb0\x91M{\
-v\xa2\xc7p$5\xd9\xd0\x1b\xb7\xc0\xbe~K\x1a\xdf\
-\x8a\xa9lx\xcc\xc0\xf3A`\x8b\xaf\xabz\xedf8\
-\xa0%\x87\x06\x0b\xe84n\xfcM\xfa\x5c\xf4\xd9\x05*\
-]y\x5c\xe4\xa8PF\xf83\xcapB:\x19\x93\xac\
-\x8eH\xc6c\xab\x04\xa7y\xfaAg\x22a\xa6\xfdd\
-\x5c\xc6qOZ\xabR.\xacz\x8f\x93\xe6@\x93/\
-x\xd6y\xd45},\x02\x92\xc9\x84\x0d\xdbw\x12\x0e\
-A*x4\x85\x89\x86\x9f\xde\x0c\x8b\xfd.\xcc-\xac\
-\xa1\xd4w-\xe0y\x83\x15\x9f\xbc\xfe\xca\x0d;\xe0\xda\
-1\x1c\x0c\xe7\x88\xa2(/\xa4\xea\x9a\xde\xfc\x02\xbbI\
-\xed\xfc\x18]:8\x8fh\xdc\x09\xd0N\x94\x83\x99\xdc\
-RZ\xc1If\xaa45\xaa\xefdB:^%\x1e\
-\x8d\x88G#\x92\xd1\x88d2&\x9d\x8cI\xe3\x89\x11\
-\xfb\x92,S\x9eLe\xd4s`\xd9\xbfe8\x8e.\
-\x91c\x17t\x19\x89\xcen\xae I\xe584$\xab\
-\xab\x0c\x16\x16\x99\xdb8O\x1a\x1b\xe2z8\x81\x05\x01\
-7n\x85\x81?\x80\x16\x80\x0f\x9ck\xc2\xfc\x0c\xe0\xbf\
-\xfb\xe5\x1c\xe0\xfbw\xc0\x8b\x14<4\x86\xb9MKD\
-\xc39c=\x02YT\xf3\xe5EZVC\x09\xac\x8e\
-\x128\xaao \x91\x96\xb4J)m\x81\x97\x9b\xd04\
-7ioBH\xa3\x1c\x93q\x1fYp)7B\xb2\
-$\x15\xad\xf3\xecx\x91B\x88Q\xc9\x84t\x12\xa3&\
-\x13\xa3\xfe\xc6\x93<?\xa5\x12\xab\x10'\xb1\xbdO\xac\
-\xbal\xcea\x12\xa1\xb1y\x1e\x17\xc9\xd2\xbcT#\x89\
-\x8bdj\x9e\x17K\x1dp\x9a$+N\xb25\x8dc\
-\x820d\xbc\xb2\xcc\xe8\xc42Ad<\xefI\x0d\xbb\
-\x03\xb8~\x0e>\xe7\x1f\x85\xed\x05\x0e\x03\x9f>W\xe0\
-\xf98\xb0\xd9\xc7\xb7\xdc\xb0\x13^\x0a\xdc\xb7\x0a:\x80\
-\xb9\xa5%\x8204\xe5\x0f\xa5\xc9\x0eJ\x13\x8f\xf3\x9e\
-!\xb7\x05 \xa4\xad\xf8\x13\xd9q\xc2\x11\xec\x90\xd3\xe4\
-\xda\xad\xcd\xc9\x1eU@\x93G?\xa9\xb1@\xa9\x05\x81\
-\x8a'E\xca\xc0\x82D\xc5\x93\xfcy\x9a\x81\xc8&8\
-\x95\x93\xecTq\x969/@\x95\x95h\x18+\x17[\
-\x10\x15\xe9\x8c\xd2c\xfb\x1ei\x8aN,x\x12\x032\
-\x01LV\x96\x19\x9d8\x85\x0c\x0b7rR\xc1\xde\x08\
-\x0e\x0c\xe0c\xab\xde\xad?\xbe\x03\xb3B\xe3d\x1f\x10\
-\x843\x00\xe7w\x81\xa7\xfa\x1c\xf8\xbc\xed\xe6[\xdd\xb3\
-\x0aJf>\xd2\x98r!D\x85/\x14&ZiM\
-\xe0h S7\x9d\xa2\x95,\xf2J2\xb0\x85W\x02\
--$:\x15(\x0b>\x95\x14$7\xfb\xa5d\x17\xb4\
-\xd0YLm\x8f\xb2V\x8f\xac8,K-8\xe1x\
-Q)X.\xb9(O\xb8\x05PV\xbf\x93'?\xcd\
-M;\xdcI\xa9\xb4dy\xf2\xec\xbc*J=t\x9a\
-\xa2t\x9a\xff\xed,\xfc7?\x18Jy\x8fP\xc0}\
-1\x5c\x1c\xc1On\x82\xdf?\xe1=\xaf7\x03\xd7\x9c\
-M\xcbs\x0d\xa6\xe4\xb1s\x5c\xb2\x09~f\x1e\x0e\x8f\
- \x96y\xac\xc3`n\x1e\x19\x86\x80Df\xf9 \xd7\
-MIkY\xf2\xca>\x99\xdf\xe7%\xa2BN\x17\xac\
-K'\x1a\x83<\xdf4\xcd\x91u^^\x91\x0bq\x19\
-\x17Q\xa9\x03\x8c$\xb7>:\xb3,I\x82\xce3\xe1\
-\xae%2\xafg\xaeL[\x8bd\xce\x11\x93:Y\xf3\
-\xc2B\xc5\xd3\x16)wsi\x0eB\x9d\xbd\xa6\x92\xdc\
-\xea\xa84\x01\xad\x0b\xcb#\xcb\x11\x84\x14pB\xc1\xd3\
-\x86\xe6_\xff\xb2\x9f\x12\xbd\x13\xb3v\xfe\xe3g\xcb\xf2\
-\xbc\xcb\xe7\xa0\xc5y\xf8\xc9\x0d\xb0\xbc\x02#Y\xb0r\
-\x0d\xb6tA\x810\xbf.\xa1\xdb,KAd\x85\x94\
-\xe8T\xa2\xb2p:\x15\xa8$1\xae+\x11\xb9CR\
-Y\x18-\x05L@\x87\x8euS\x0a\x1d\x86\xa6\xfeX\
-)c\x99,o\xc2u\x859/rb\xb2R\xda@\
-\xe7\x11\x97.\xd5\xef\x14\x93n\x80\x90\x16\x00K\xcaV\
-)\xcd^\x8b\xcb\xc7\xe7$\xdc\x82\xaf\xc4\x85\x1c\x82\x8e\
-\x10\xa8$\xae\xc9\xb6\x16\xd1\xe8\xfd1\xbcb\x09\xee\x89\
-\xe1\xf3c\xaf\xf9}\xb3\x15{\x8f\xae7x\xfe\x19p\
-\x99\x8f-{\xcd\x16\xd84\x86\x07\x5c\xd3&\x8c\x02\xef\
-\x82\xa7\x04\x984E\xc9\x00\x91\xa6\xc6\xe5\x88\x14\x9dJ\
-\xb4\x94h\x15\x18\xdfo-\x92\x96\x02%$\x221\xee\
-\xc9\xd5vt)$\xd3H\xb7dT\x85\xb9K\x90A\
-\x9a\xf3,-\x0b\xab\x96\x81\xa7Z\xf8^\xaf\x0e\xa7E\
-\x01\x98c=\x0a\xde\x92\x16%\x17%w\x96q\x9e\xa4\
-pkIB\x9a:\xbc\xc9)\xf50\xa0,\xbbI\x19\
-\x04$\x93I\x91k\xad\x01O\x0c<\x92\xc2\x8fl\x82\
-_{\x04\xce\xf8\x11\xa0?\x05\xbem=\xdd\xd6>\xe0\
-\xfd>\x07>{3\xbc<\x80\xfb\x93\xc2k\xe4S\xa0\
-\x0c\x9d\x08\xa3\x81\xf9\xc1\x88\x8ar,\x8bI\x13SB\
-\xa0p.\x8c\xa8O@f\xf9\xa1b\x8d\x8c\x95\xf7\xb3\
-\x90\xd9\x9dt\xa7\xc6\xd8\x12\xd2\x8c\xb3\xe8\xc4u+q\
-A\x883\x92<\x99\x90\xda\x08,\xcd\x08t\xfe8\x9e\
-&\xd9\xf6\xb9\x9aL\x8a\xf3Mb\x03\x968.Gn\
-\xae\xeb+Y-\xe3\x0aS\xe7\xd8\xe5c\x8f\x90\xc6)\
-2h\x06\xd0H\xc1\xf6\x006\x07\xf0Y?\xebs)\
-\xa6\x88\xfe\x8e\xf5\xb2<\x7f\xe6s\xd0\xc6y\xb8a\x01\
-\x0e\x8d\x1aL\xa9\x84\xc4^\x14\x09\xc6j\xa4N=L\
-\x5c\x84\xcf\xae\xd4/\x84\xe3\x8erCP\x00$\xb7^\
-a`\xc8\xb8\xb5n2Hm\x223q\x0a\xe0e^\
-\x04\x96\xf1+\xaa)\x0dQ@4gH\xa5\xf2Sm\
-\xf8Q\x16\xdag\x048\xd3\x8aT\x92Gmn$V\
-\x94\xa2\xbau\xcc\x8e\xb5qKV-\x87J]\x8e\x14\
-\x9b2V\xad5\xf1\xca2\x93\x95q\x1ei5Z\x07\
-\x01\x0f&\xf0-\xf3\xf0\xb91|\xda\xaf4\xfa\x1d6\
-\xe5\x14\xaf\xd5\xf2<\x1f\xf8u\x1f!\xf05\xdb\xe0\xe2\
-\xc48L\xd9\x90\xbaQ\x0a\x02)\x08\xc2\xd0\x14\x98\xcb\
-r\xda\xa1\x9c#*V1\x88\x16\xa5Y;\xa5\x0f\xb9\
-\xc5Q\xaeJKN\x8c\xa9Fq\xb9\x8eb\x0a\xd4\xcd\
-\xbd\x9d\xe0$-\xb8IVs\x9c\xb9\x98lbK\x93\
-\xeb\xf0\x98\xcc\xda\xc4q\xf9=\x97(\xc7\x99N\x94E\
-k1\xdaqei)\xfcOQ\xa9\xf9\x0eBkV\
-N\x1cg\xbc<!\xf0\xfc\xf9\xc7\xc05C\x13\xbe\xc7\
-\xdag6\x19\x02\x1fZ+x\xfe\x0fpA\xd7A\xd7\
-n\x82WE\xf0@<\xed\xae\xaa\x821:%\x0cC\
-\xd0\x22\xcfe\x89\xac.&\x7fMO\xe5\x0b\x85\xcex\
-\x8dF\xb8\xe2\xb2SDe@\x93\x15W)\xc7]\xa5\
-\x15b\x9eY\x0b'\xc2J\xd2r\x01{\xc9\x85%\xa5\
-\xe2u\x9d\x03*\xae\x01\x89\x15\x12\xe32\xa8\xd2\x12h\
-\x8a\xd7\xb4\x05\xd4\x14p\x5c\xa2\x9d\x1d\xabR\x92\xd5U\
-\xce\x1c;\x96[s\x9fT\xce\xaa\x86]\x01\xccKo\
-\xf2\xfc\x1c\xe0\xf7\x80\xd5Y\xc1\xf3\xed\x96(\xb7\x9b\xc6\
-\x01\xfc\xd4&PcX\x15\xedy'! M\x0d\xf7\
-\x91A\x00J\x97\xeb\x85\xf3\xcf\x8b\x0c-\x95D\xa4\x03\
-\x1c\xad\xc9\x9e\xb89\xa0\xac^&\xaf\x8f\xb1\xc0\xc1\x01\
-\x10i\x8aVI)_U\x05\x8erV;\xe8\xd4\x86\
-\xe4\x0e\x00t\x92\xa03N\x93L\xec\x84O\x1c\xb59\
-\x13\x12\xe3\x12\xa7I\x1d\x90)\x07<\xaa\x02.\xd7\xd2\
-ed[\xa0Y>q\x9c\xc9J\xecmu2Sr\
-Z\x19\xebs\xc7\x04\x8e\xfb\x91\xe7a[\xfa\x22\xf0\xf0\
-}O\xe9\xfa\x0b/\xd9b\xaa\x8c\x1e\xd2\xfe\xc92\x95\
-\xa6\x04V\xdb\xd1Z\x97\xd7\x86;\xdaL\xce\x95\x15y\
-Y\xa7p\xf3[\x9a\x12h\x0a\x10\x95\xdd\x94K\x96\xc9\
-,\x8e\x05\x90N\xdd<\x95\x05\x85cit\x0e\x96\xca\
-d\xc7\x13\xfb\xd8\x02\xc7\x02,\xb5\xda\x8fK\xb8\xd3)\
-\x12n\xcf\xe9hEeu\xda\x89\xd0\xecg\xd1\x9a\xc9\
-h\x85\xe5\xe3\xa7\xb0\xcb\xeb{\x0d\x05\xcc\x09\xb80\x84\
-\xbf\xf3\xe3>W\xd1\xb2,\xbc\x0d\xbb{|R\xf6\xbb\
-\x16\xe0\xa5\x03xx\xd5\x903\xdf\xb2\x15\xa5`\xbc\xb2\
-\xcap\x1e\x02\x1d\x91\xba\xc9L\xa5 ,\x5cL\xa05\
-:0\xdcD\x86!:H\x91\xa9\xb9\xe9 E\xb9\x15\
-~AbR\x1c\x81)\x19\xd5\xd2\xe4\xc7\xb4#8*\
-\xb7\xae'\xd7uh\xac\xbf\xd1n\xb9\x84\xab\x8a+\x03\
-R\xb3.\xbd\xe0R\xcaiz\xa0\x1c\x8b\x96\x87\xda\xd9\
-2d7\xbcwB{\xd7\xc5\xe9\xd4\xf0.my\xd8\
-\xca\xf1\x13~\xa5?\x0d\xd6\xe7p\x0aW\x0e\xe1\xf9\x0b\
-\xf0\xd1\x95\xce\x8fl\xc6\x14\xcf\xbf\xb7/x~\xc5\xc7\
-\x99\xbeb\x09\x06\x13\x18\x89~r\xb5\x94\x90*\xcdx\
-4b8\xa7\x918e\x97ah\xeaw\xb3\x09\xd1\xda\
-\xae\xbb\xb2\x93\x10\x06\xa8 E\xa6I^YHP\x14\
-u))!\x08\xd1A\x80\xb4\xb59*\xcb\x8b\xc9\xe9\
-\x821\xeaj\x8a2\x089BJ]i\x85r\xca8\
-J\xfaO\xaa\x8a$k\xe2.\x08LP\xa9\x22us\
-\x5c\x99\x18\xe8\x82\xc9\x96\x80\x14\x89\xd3\x84\xe5\x93\xa7\x88\
-'i/wU\xc7\x7f\x1eI\xe0\xe5\x8b\xf0\xa9\x11\xac\
-t\x93\xe7\x7f\xd7\x04\x9e\xa6\xf9\x1e\xd8P\xad\xf5k\xee\
-[\x82\x1b\xe6\xe0\xa1\xa4\x9d$\xb7Y #\x1c&\x04\
-\xb6\xb9\x80\x89\x98t\xa9\xdc\xa6\x10\xe9\x8a\x92\x8b\xec8\
-a]\x14Z#\xac%\xc0\x86\xd2\xc2\xad\xd3IS\xc3\
-y\xaa$\xd9\xb5\x0a\xf6\x97^\xb8\xadL\xe5M\x9c,\
-x\xf1^\x91\xd84\xaeL'18\xe4Z;\xdcF\
-\x97\x12\xa4e\xfd\xa8\xaa\xdf\x14Q\xdb$w\x9f\xa3\xd3\
-\xa7\x89\xe3\xb5\x01''\xcf\xc0\x9e\xd0\x90\xe8\xaft\xaf\
-\xe6\xdaf5\xbe\x83\xbe\x96\xe7\x07-Yj\xfd\x16/\
-Z\x00\x15\x17A\xd3L\xff\x8c\x84T\xc1x<f\xa0\
-\x152\x08s\x97\xa0\x83\x14\x15*\x02\xad\xackR\xc6\
-\x9a\xa4)\x84\x01\xa8\x10\x11\x18\xf6\xad\x83\x04\xed\x94t\
-\x10d\xd6H\xe6VG\xb8\xb94'\x0dQH\x058\
-\x22\xa5\xc3\xa9\x1c\xd1QW\x8a\xb9\x8a\x16+e\x09@\
-\xe5\xe9\x0bU\x88\x91\x19`3=(\xb74\x8e2\x9d\
-5DH&9\xa0WWVHbE\xb0N\x15\xe7\
-Y\xfd\xcfs\xe7\xe1\x96\x15\xd3g\xb1c\xbc\x1e\xf8\x1e\
-_\xf0\xfcl\xd7\xd9v/\xc0u!\x1c^\x9d\xcd\xff\
-V]\x98R\x9a\xc9xB\x18*\x82\x8c\xef\x04\x01\xd2\
-N\x86\x0c\x03[\xe9\x17\x147\x99\x22\xc2\x00\x9d\xe5\xa7\
-,\xbf\xc1\x82G\xcb\x22\xa9*\x02+\x08\xba\xadT\xa6\
-\x5c\x96\xfb+p2[\xba\xb8\xcf\xb5#\xa7\x8a\x10\xad\
--X* \xb2\xdd3J\x80\xc9\xb2\xe4J\x91\x96\xb8\
-\x8e]\x9e\xec\x80*\x8d'\x8cWWQ\x8aF\x15y\
-\xd6\xb1\xac\xe1\x92\x08\x9e3\x0f\x1f\xea\xe6>7\xd8\x8a\
-\xc33]\xe0\xb9\x02\xb8\xb6\xebl/\x98\x83A\x02\xa9\
-X\x9f*z!\x8c\xb7\x89c\xd3  \x08R\xab\x18\
-\xa7H\xa5\x10i\x80\x0a\x13\x08Bs%\xed\xaaM\xa5\
-\x8c\xb5A\x06h[\x5c\x96\x01G\xba\x05\xf1R\xa2\xed\
-R\x19)D\x8d\xe5\xa1$\x0b\xb8\xcdU\x8a\xa8N\x15\
-I\xd2\x86\x95\x10\x86\x07\x15e\x13EAW\xd1\xf4)\
-_\xd7\x9e\xbb\xc2\xb4\xc8_Y2\x1dO&L&\xa6\
-)\x94\x94\xac\xfb\x08\x80c)<k\x0e>\xbc\xe2\xd5\
-\x15\xea\x07\x81\xb7t\x81\xe7u\x9di\x88\x08\xae\x0d\xe1\
-h<\x1b\xd7i\xe5@@\x92*R\xa5\x08\x93\x84 \
-4\xaa/A\x08\x89\x01\x8dqS\xa1\x01Ih\xd6P\
-i\xbb\x8aS\xe7\x16\xc7\xb1<\xceR`,\x88\xdc\x04\
-\xa8\xeb\xb2\xdctZ9\xe9\xa8K%\xae\xd5\xa55\x94\
-\xa2\xadr\xf6]\x95\xc0S\xb4bQIj\x1a \xd8\
-\xf6,*IH\x92\x84$IIR\x9dU\x99\xac\xef\
-\x1aag\x9cV&l\x7fj\x04_\xeb\xe6>\xaf\xeb\
-\x02\x8f\xc0\xb4Di\x1d\x17\x0d`\x93\x80Cg\xa1M\
-\x82\x1b\xe8\xa4JC\x9c@\x9a\x22\x82\x04\x15\x04\x06D\
-\x81D\xc8\xc4\x00)\xb1\x9d\xbd\x82\x00m-\x8d\x96\x12\
-Yr[\xe5\xae_z\xaa\xd2\xb0\xa9\x8d\x1c\x15\xf2\xae\
-K\xcb\x82K\xdd\xc1\xaa\xdc'5\xf7*-\xea\xa4K\
-.,\xcf\x94[\x17\x95\xa6$iJj\xbdd\x10\xe4\
-%\xcbS%I\xeb5\xb4-\x1e\xbbf\xe8\x05\x9eK\
-1\x8d\xb9nk\x02\xcf\x8b\x80\xc5\xae\xb3\x5c7\xcfY\
-\xed~'\x1d\x10ia\xf8P\xa2\x12\x824A[\xd0\
-\xc8 @\x07\x01\xa9\xed3\xa8\x9drV\xe5\x94\xb1\x96\
-\xc0ck\x99\x85(\xb4\x1dw\x0d\xd84vD\x89\xf3\
-\xe8&\xd2\xec\x84\xec\xa5\xf0\xdd\xf6*,\x00\xe3\x14\xda\
-+\x85Nb\x03\x18\xa5m\x1b_c\xc9\xb3 3\xb3\
-\xc4y\x1d\xff:\x83H`\x9a&\x5c7\x84\x9b\x97!\
-\xe9>\xf9?i\x03\xcfww}za\x00W\x87p\
-l\xc2\xba7h\x11\xeeM\x14\x8f\x0bKD\xae\x0c\x07\
-\xd2\xf2\x9704u@\x160\x19\x88\xb4S\x03m\xda\
-\xc5U\x0a\xbd\x5c\xebS[\xf6\xe1\xfeB\xf5\xf4j\xd0\
-<\x8fV,\x0f\xd6\x95\xa6O\xca-[-\xe9?)\
-J\x99\xe6\xe0\x99\xa5\x11\x8eN\xe6\xac\xc2)a8\x13\
-\xda\xd7\x13@\xcb\xda\xb8\xae\xab\x07^9\xafW\xb8\xfa\
-_\x15</\xed\xfa\xf4\xd3\xe7\xcc\xa6\x10\x0f\x88\xf5\xc5\
-\x8e\xac\x80f\x0aL\x8e\xaa\xaa\xadK\xd3\xca*\xcd\xd2\
-4\xd9V6\xa2RAQL\x9fV\xc5\xc0\xbc\xab\x85\
-(w\xb5pk\x83D\x9d\xd7*\x96\xbe\xe4\xadtu\
-\xa5J\xb1r\x8fJK\x96Fim\x02\xc6\xcc\x8aT\
-*e]\x8e%\x1d\x90\x08{\xac\x06\xa4^\x7f\x00i\
-\x9bq\xf7\x00\xcf\x15\xc0\xc5\xc0\xbdU\xf0\x5c\x81G\xdb\
-\xfe\xab#\x88\xd3\xb3\x0b\x1c\xf7F\x8d5*\x05\xd2\x1a\
-T\xaa\xd1\xd8t\x85\x00iWf(Y\x90d\x95Y\
-\x9a*\xe7q\x22,\xdd\xc1y\xdc\xde9\xe6a\xb1\xce\
-\x5c\xb9\x0d.\x95Bie+C\x0a\x97\xa4\xed\xe9]\
-`\xb8\xae\xa8\xac-\x15\xe5&\xbab\x85\xe4:\xba1\
-\x01\x1cOa\x7fd\xd6{M\xbaO\xf8\x12l'\x94\
-\xb0\x8f\xcb\xda8\x84+B8\x1e\xaf\x8f\xcb\x12-\xa0\
-itaUp\xc9\xf2WQ\xd62(\x95\x22H\xf3\
-\xcfJ\xbb\xfc&\xe39\xd9-\xafht\xc4\xc1\xa9\x1a\
-\x12\xbb\xd2#wW\x968k\xabz\x17\xf7\xf5[\xd7\
- \xcau\xdcUK#\x1a@TWb*\x00%\xa6\
-\xb9\xfcZ\xc6\xc8\xba\xae\x03C\xf8Lw\xc2\xf4\xe5u\
-\xe0\xe9\xdcm\xee\x8a\x01l\x17\xf0\xe0:\xb8,\xe9\x03\
-\x1cQ\xef\xbehqq%\x9dO\x17|7\xd5V\xbb\
-\x11\xe6\xbej\xc1*\x0d\xe4\xea<\xd7\xd4\xe4O\xddW\
-\xbeo\xd5\xb2\xe8\xca\xf9\xb5\x03\x12\xc1\xb45i\x22\xcc\
-\xd2q{\xd9{j\x1d<\xc0\x15\x91\x17x\xbe\x05\xb3\
-\xd1o\x1c:\x9a\xd13\xbb>\xb5/4\x22\xef\xb9\x02\
-N\x1f\xd0\xd4\x81\xc0-\x94\x12\xd4?\xa6fb\xdb~\
-\xcdbZ\x7f\xaesre\xbe\xa2k\x80\xd3`I\xea\
-@T.\x97\xac\xf9B\xda\x01\xd4\x8c\x1e\xe0\x94],\
-(\xba\xcf\xb1\x00\x5c\x0f|\x22\xbb\xbcO\xc7\xec\x0e\xdc\
-*I\xee\x0daY\xad\xcdM5\x01Gz\xb81\x99\
-5\xb4p>#k\xceQw\x5c\xf5x\xe9\xdc\x02{\
-\x93=o\xad\xdf\xa1\xf2\xffd\xdf\xa7\xee}\xf7{7\
-\xfe\xa0\xec9\xa4\x87[\x9fe\xac(\xd8\x19\xc0n\xbf\
-\xc4\xeb3]\xb7\xf5\x8c\xae\xa3\xb7\x87\xb0S\xc2J\xb2\
-6\xf0T\xffYY\xe3\xa6d\xd5\x9at\x10i\x1ax\
-Q\xdd}\xab\x15\x12\xcd\x96\xa9de\xf4\xb4A\xa8{\
-<u/\x9c\xe7\xba&\xa2\xaa\xb14N\x1d\x5c\xc1\x9f\
-t\x8d\x9b\xca\xae\x9d\x9e\xcd\x85\xa5\xc0\x92\x84\x8bBS\
-%\xd1%\xf5\xb9\xe0\xe9\xcce=%\x84\x8d\x02\x0e\xad\
-\xd1UI\xe1\xef\xa6\xea^\xa7\x85\x17\xd5\xb9\xb1Z\x00\
-\x89n7\xd6\xe6\xb2j\x0a\x1emw\xf8\xb2\x0bt9\
-\xcf\x94\xcb\xaah7U\xdc\xb8|HzD\x5c\xda\xd1\
-\x87fqa\xd9\xf7}JDK\xd5r>\xaeq\xc1\
-s}gJ\x222_x-\xd6F\xf6\xe07m|\
-\x88\x0ePU\x1f#\xda-\x113\x98|]\xc7}D\
-\x05 \x15\x0eS\x05P\x06\x90\xa0B\x8ak\xbf\x98\xae\
-\xe7:S?Ra\xc18C$\xb6\xa2\x8c\x91\xf0\x18\
-\xd7\x00\x1b\xb3C/\xefB\xc0\xce\x00\xc6jF\xe0\xd0\
-\x0d\x1c\x1f\xceSG\x98e\x13p\xc4\xf4\xf7\xf0!\xcf\
-\xa2'hhrQ\x94\x93\x9a\xa2\x814\xeb\x1aKT\
-\xbb[\xad\x98\x8e\xbaT\x03\xb0d\xf6^O\x00\x8d4\
-l\x93\xc6}u\xac.\x1d\x00\xfbCL\xad\xf2\xaeV\
-\x97#`\xabX\x03x\x1a,\x8b\xa4\x9f\xc5i\xd5{\
-:\xdc\x18=\x00\xe4\xe5\xba\x1a8\x0e\x0d\xa1\xb9v2\
-\xf5\xa2\xc9\x90TD\xc2\xa6\xc8\xaa\xaaBkQ,Y\
-[\x0b\x80b\x0d\x1b\xa4Ya\xea\xb14y_\xe8\xa3\
-*o\x0ca\xa3\x84I\x8fd\xa8l\x03\xc9\x1a\x81\xd3\
-\xa4>w\x85\xeetp\x9f>\x96\xa7\xaar\xb7\x11f\
-jHs\x97\x8aL\x9b@\xd8\xe4\xae\xea\x00\x84?x\
-\x14\xa6A\xe6Vi\xf3\x0f\x1e\xe0\xe9\x5cZ\xb3E\x98\
-\x96e\xa7g\x00N_\x8bS}\x0f\xe7\xf8:p\xc8\
-\x06>S\xeb\xaa\xc4\xda9O\x9d\xa7\x10-\x5c\xa7\x09\
-L\xf55C\xf5\x84Y\xd5\xfc\x1f\xb5\xe0\xaay]8\
-:\x90\xf2\xf8a\x84\xc2\xack\xf7\x18\x17\x84].\x0b\
-`Ch\x9c\x9c\x9a\xc1UIO\xe0\xf4\xb5D\xde\xa4\
-Y4G]\xa2\xc3-\xcd\xcay\xa8\x84\xe4MV\xa8\
-\x89\xeb\xd0\x12Yu\xba*\x9a\xddW\x97\x00\x98\xbd\xbf\
-\xc9\xafrq!\xe3<\x9d\x96'\xf4\x04\x8e\xec\x03\x9c\
-\xbe\x11\x98'\xa1\x86\xfa$j\x17\xf7\xa9\xba\xb2\xba\x88\
-JV\xacE\x17\xd7\x11\xa2\xbc\x08\xc4\x05\x99\xea\xc3u\
-\xea\x88\xb1\xfd\x9c\x0b\xa2j\xb4U\xb2\xba\x1e\xfc'\xd1\
-\x86\xa2x\x8c\x0d!\xb0\xbd\x13b\x94\x96\x8e\xb7[\x9d\
-\x06\xf7#k\xd4b\xd1\xc3}u\x96k4\x80\xa6\x11\
-@\xa2\xdb\xe24\xb96!j\x80\xa5\x9b\xc5\xc1*!\
-\xce\x22\xaf\xa6\xb2\x8b\xa6\x04k\x9d\xb5\xa9\xe3;U\x0b\
-\x94=\x97\xa2p\x83\xbaE,\x9c\x13\xfe\x96\xa7\xb3r\
-p\x10u\x13\xaeF\x0bRg)Z\xd2\x0f\xbe\x91\x96\
-\xf4P\x98}8\xcfZCu]\xa3N\xd7\x01\xa9\x0a\
-\x92Y\x08s\x131\xae{\xbd\xca\x7fJA\x82n\x9e\
-\xcfD\x9bf\x08\x1ec\x10Z\xc3\xd2:\x86\x1d|\xc7\
-G\xec\xa3C\xf3\x913\xb8\xa9\xb6\xcc{5\xa2\x124\
-\xeb>k!\xcc\xb5.\xab\xc2y\xaa \xa9Z\x19\x9f\
-\xb0\xbc\x8b\x18W\x01T\x0d\xd5E\xc5\xa56\x11he\
-E\x1c\x8f\x04i\x14\xdac\xdb!\xa6\xdb\xdd\xb1l\x22\
-\xafu9,\xd1\x0f\x00}\xb8\x0f\x1di\x8b\xb5\x92f\
-\xed!\xfcv\xa1M4X\x19AC\xbeJ\xd7[y\
-\xd5\x12\xceS!\xefU\xaeE\x0b\x81V\x98\x9e\x03\xa1\
-\xe8\xec\xe3\x13\x84xp\xe1@\xb5\x83\xa7n\x82e\x03\
-pj\xad\xce\x1a-\xd1,z\x8fh \xc9>V\x86\
-\x0a\x01\xaeZ\x9e\xea}\x16U\xa9\x1a\xb4UKLk\
-\x95\xe5\x9a\x90]6p\xa0\xda\xd0\xdc\xba\xaa\xba\xd7t\
-\xcd/D\xfaYb\x19\xf61\xd5\xde<G\xf8\xbf\xe6\
-\x96(\xd0`\xc5\xfa$P\xa1=|\xf7\xe1=\xde\x96\
-H\xd4DW\xba\x1e<\x19A\xa6\x86\x14W\xf5\x22\xdd\
-\x905\xaf\xcb\x98Oq\x9d\x8ae\xa9\x82\xaa\xfa\xda\xac\
-Yx\xac\xd5\xe9\xfc\xac\x12\xed<\x87\x16\xb2,{D\
-`\x8dV\xac\xc2]dE$l\x8d\xbe*\xd1\x95X\
-Cn\xab)7Y\xad\x0el\xf2gue\x17M\xc5\
-_\xb5\xd1\xad\x07\x80D\xc3\xb1y\xc4\xe5L\xb8h\xf8\
-^\x9e\xb90\x1d\xe2\xb1\xebm\x5c\xb3\xa4\xd8;\xa9)\
-\xd6!\x93>c\xb9\x06=j|\xfaX \xdd\x05\xa0\
-j8\xaf\xcbdYUC~\xcftC\x1b\xb0\x1a\xdd\
-q%\x02\xd35\xfc\xc7u_\xd9\xf7K\xbb\x11\xa4B\
-<\xaa7\xc6\xa29Zi\xd3]\xda\x96\xd0H\xd6\x18\
-\xbe{\xaa\xcf\xe0\x11\xc2W\xcd{\xdb\xcfM\xfbe\xd4\
-\xa7\x92\xa2u*q\x171\x16\xf5.\xac\x0a,\xdd\x92\
-\x86h\xe2mU\x0b$\x9c\xef\x16k\xaf5\x9dq\x08\
-,w\x82'5;\xf4\xe9\x1e\x00hTyE7\xe0\
-\xea\x5c\xd5,\xa1\xbb\xec\x8a\xb4\xc4\x0c\xa1\xba\x98\x9e\x8c\
-6\x81\xd0\x05\x103\xa8\xc8u\xaeJW\xc2\xf5\x1c\x08\
-\x1d\x5c\xc7\x8d\xd2tuN\xb2e\xce\xc2{\xb7\x9cI\
-\x08\x1c\xf7\x02\x8fh'\xa3S5\xc9\xa2\xa1F\x97n\
-W'\xfb&U\xf1XiQ\xc3}:S\x15-\xdc\
-G\xb4\xe8:\xb5\x89\xd0\x1aR\xdcV\xb7\xa3\x1a\xf2[\
-n\xa5\xa0j\x0b\xd1\x1b\x5cSS\xaa\x22\xbbF!\xa6\
-\xf1\xb7\xc7X\x0d\x81\x87\xbb\x8e:! \xc1s\xd5C\
-\xcf\x9b\xf4\x00\xce\xac\x11\x184/\x16\x5c\x8b\xc2\x5cW\
-\xd3\xa3k\x220\xddP\xdc\xd5%\x02V\xc1B\x87U\
-\x99\xb2\xa6\xba\xfe\x87\xd1T\x9a\x9bY$\xa1\x0dx\xce\
-\xf8Y\x9e3!p\xa4\xeb\xa8\xd3q\x01\x1e<\xd3\x0f\
-\xb4\x1c#\x1b\x8e\x9b\x158M%\x1b\xa2\xa5\x5c\xa3\x0d\
-(\xc2\x138\xd0ne\x9a\x5cQv\xacjse5\
-`\xa9\x8d\xa0*\x5c\xa7\xee5\xd75U\xdd\x9e\xfb\xfd\
-\x85u[\x9e;%\x8fBjz\xcdU\xc7I\x8c\x1f\
-\x0c\x9c\x7f\xb8q\x82j\x220\xc4\xda\xb4\xa0\xba\xf0\x9e\
-\x9e\x09\xd4NW%zF[\xba\x1ePu\x8b\xfd\x94\
-(\x97gT]\x85r\xdc\x8a\xea\x0a\xcd\xab\x11T\x0d\
-\xd0\xf2\xb2\x10]\x7f\x1d\x5c\x8e$\xf4ta\xff)\xbf\
-\xa2\xbf\x13^\xe09\x9e\x98n\x0a\x1b\x04\x8c=#\xad\
-\xba\x5c\x16\xb4\xe7\xb9X\x87H\xab\xad\xe2\xb0*30\
-\x03\xef\xa9\xab\xd9\x81\xe6\xa5\xc1\xa5\xecyC\x19\xa9t\
-\x92\xa5\xd2\x03@\x8d\xe0\xaf\xa9\x93v\xbf\xb3\xa8\x90e\
-\xdd\x10i\x1d\xf3\xb3<\xf7\x87\x98\x8a\xc3eZ\xb2\xeb\
-ce\xb6\x1f\xbc@\x9a\x85\xf0\x8d:K\x87\xe5\xe8S\
-aX\xc7\x85`}\xea|\xd6B\x98\x9b\xd6j5U\
-\x06zGU\xce\x09\xab\x00\xd25zMS\xc2ST\
-\x5c\x9a\xae\xb1HB\xd7[\xad@\x98\x22\xf8G\xfd,\
-\xcf=\xd2\xea<wu\xfd\xdc\x8e\xa6\xb0 \xfdt\x9e\
-\xae\xf0\xb8\x97%\xe9\xb0D\x92b\xa5\xa5\xacqc\xae\
-\xa5qWm6\xad\xfa\xec\xb3J\xb4\xf6\xd6\xb2\xeas\
-\xea\xb8\x1e\x0a\xbbWtY#\x8a\xca\x96:\xed\xea\xdc\
--\x08\xb3\xad\x80'x\xbe\x92\xe5\xb6>O\xc7\xc2\xbf\
-\x07\xd2\xa2\xc3{\x97\x92,\xfb\xa8\xcd\xa2\x7f\xe8.=\
-\x81\xe7v\xa7h\xe5@\x9ez\xcfT\xa4\xa5\xbbu\x1d\
-Es\x06[V\x96\xd3\xa86W\xe5\x19Y5YT\
-\xe9d\xcd\xab\xd6';vI\x9a=\xb9<\xbc\xd6=\
-\xc0\xc1\x0c<\xb7w\x1d\xfd`\x02#\x0ci\xf6R\x95\
-{\x86\xf3x\x8a\x8f\xb2\xe3uh_\xa6\x03\xf5%\x1b\
-\xb3\xa4'\xea\xeav\xea\x92\xc7\xaaf\xf9p\x9d\x1f\xac\
-\xcbz\xd7\x9d\xa7I%\xaeK\x80j'-\xd1hu\
-\xec\xfb\x11p\xd0o9\xf9\xedYb\x14\x9c>s\x8d\
-\xe0\x89\xe1Qe\x9a\xf1\x8e\x1b\x847<\xf3L\x8d\xf5\
->3\xe6\xbb\xda\x80\xd3\x95\xb6\x98\x9907\xe4\xb2t\
-M1\xbbK\x88u\x9d\xc8\xd7\xa4\xcd\xd4U\x03\xd6\x84\
-\xdcM\xbcF\xd7\xcc\x85\xae\xe4\xb9\xdc\xf7\xc6\xdaly\
-\xe51>\x87c\xcd>CG2u\x92\xc0\xc1\xd4\x14\
-Gw\xea'\x1e\x8b\xf3dC\x88\xdf\xe6\xefe\x0f\xe0\
-\xd4\x16\xdb\x8b\xf6n\x16\xd2\x87w\xd1|\x8e*\xe7\x91\
-\xe0_\x83-f\xfb>u\x5c\x90\x96\x1f\x8dl\x98\xb3\
-9i\xfa2\xdf\xe3\x07\x9eO\xbb\xe09\x06|\xa1\xd3\
-\xd1%0\x1fT\x98}Gh,Z\xca)D\x97\x0b\
-\xec \x85S\x17\xa7\xc9r\xf5\x04\xa6l\xb8uM0\
->\x7fW\xd4w\x03i\xac\x12\xf0\xa8\xbc\xac\xfd\x11\x8b\
-\xf6dp\xf5\xefm\x92\x96\x9a\xf8\xa9\xcb\x1fw\xc1\x03\
-\xf0\xd1\xaeO|q\x0c\xcbN\xd7N\xd1\xa0\x9f\xb4\xf1\
-\x1a:\xf2`M\xbf\x94:\xd2,\x1d\xe2Y\x1b\x15\x89\
-\xf6H\xa9\xd4\xcb\xa7\xd2\xff\xa6\xc9\xc2\x94\x8e\x15\xed\xd1\
-\x97h\xf8n\xd9y\x9a\x00$;\x94\xf8\xda\xc8S\xf8\
-\xebnU\xb0iL$\xed\xb9\xff\xfa\xedYV\xc2\x05\
-\xcf_v}\xea\xbe1\xdc\x9d\x9au\x5c>\x99\xf1V\
-\xb2KO\xbdF\xf8\xe7\xc6\xa4h\x994*\xd6\xa4e\
-\xe2\x03'@h\x05GM\xe3%Y\xf3}\xea\xbe\xbb\
-\x8f\x05\x9a9\x9f(\xbaCy0E\xec\xc7S\xf8\x8c\
-\xdf\xf6\x91\xefuI|6n\xb5\x5c\xb8\x95-~q\
-\x0c\x9b\x82\x82\xacu\xf5\xc3\x11]YmQ\x9f\xa8\xeb\
-,\xd7\xe8\x93\xf6\xa0\xbe\xf3\x96l\xe1>]\xcf\xfb\xf0\
-\xaaV\xc5\xbc\x09@\x9e\x11m\xa7\x86\xd6E\x11\x04l\
-\x0d\xe0\xee\xd8hy\x1e\xe3\x03u\xe0\x19\x03\x1f\xee\xfa\
-\xe4g\xc7\xb0\x22\x1aB\xf6\x86\x04)\x9eVJ6\xf9\
-\xf3\x86\xd7d\x9dXH\xf7b\xc2\xa6rXY%\xe5\
-\xa2\xcc]\xda\xdc_]\xe9\x89\xf4\xb4\x94MA\x87\xf4\
-\xe4:\xad\xf9;Q\x13\xc19\xef+\xab\xef\xdc\xee\xb7\
-m\xe4)\xe0cu\xe0\x01x\x8f\x8f\xeb\xfajjZ\
-\xae\xf8d\xa6\xfb,\xfe\xa3\x85\xd4\xca\x19\x5c\x9dt@\
- ;\xce+\x1d\xa0\xd4\xba\xbc\xca\xfb\xa2\xcb2\x09?\
-WK[\xf2\xd7\x83\xbf4\xa5\x88\xba>\x9b\xdd\x0f1\
-\xaa\xf2\xa7\xfc\x5c\xd6_\xb9\x0aC\x15<\xef\xee\xfc\xb8\
-\x82O\xae\xc2R\xd8N\x94\x9b\xc2x:\x92\x95}W\
-]\xcc\x9c@\xad\x90_\x1f^&;>\xdbG,\x9d\
-\xb2Nk\xa8<\xc0\xb3\x82\xa0\x1a\xfdjL\xab\x8b;\
-\xc6\xde.\xeb]U\x01\xd4\x1d\x87\x5c\xb3\xd44\xeeX\
-\x9dv]t\xf8c/W\xd4\x91\xc4\xec\xa3\x5c\xcb6\
-W\xd3\xd0\x9d\xb4o\xf7\xd3)\xd2\xdc\xe4\xd6\x84?\xc1\
-\xad\x0b\xa7}xd_\x00g\xe7\x1a\x00\x7f\xef\xe7\xb2\
-V\xa9\xec5Z\xb7*\xf9M>j\xf3\xdd\x09l\x97\
-\xd3\xd9\x5c\x98\xcd\x0a\xcc\x5c\x9d\xd8\x10m5&#E\
-;`\xdat\x9e6PU\xdb\xdd\xca\xba\x10\x7f\x1d\xff\
-gf\xbc\x96\xee\xe7\xe6\x84\xc9\x1a\xdc\xe1\xe7\xb2\xfe\x04\
-\x93\xa1j\x05\xcf{\xe8\xea\xe3\xa4\xe0C\xab\xa6c\x98\
-\xed\xae\xdf\xf8k\xe9\x8a\x12f\x0d\xd7\x991\x0f\xd6\xd4\
-'\xb9\x89\x1b\xd5Fk\x0dQ[W\x99\xae\x17\x80\x84\
-G Bw\xd7\x8f\xbaz\x9f\x12Q\x16\xb0+\x80\xdb\
-V\xcd\xa6m\x1e\xe3-uy\xbb\xba\xf1\xf6\xae3}\
-l\x19\xeeR\xd3\xc4\xb9i\xfd\x10\x0d\xd1ASV\xbb\
-k\xd5\x85\x14k_\xa6#E\xb7\x90(\x9b\x5cU\x8b\
-~\xd3\x95&\xe9L\x12\x0b\x8f\x0aH\x8f\x16\xc3m\xc4\
-9[\xed\xf9\xbee/\xe0|\x09\xb8\xc3\x17<\xbf\xd7\
-\xc9\x9b\x13\xf8\xc0\x08v\x0e\x8a5>^k\xb9D\x87\
-d\xdea\x99\xba\x22\x11\xaf\xc2\xb3\x16\x0b\xe5C\x98\xbd\
-\x01\xd1\xa36\xa7\xf3\x7f\xf2IIx\x94\x9fd\xe1\xf9\
-\x85!|bl\xf4\x1d\x8f\xf1\xef\x9b*\x06\xea\xc6]\
-\xc0';\xd5\xa2\xd3\xf0\x00\xe5\xeePm\xff$\x0d\xe5\
-\x00m@\xf2\x16\xc3\xfa\xbc\xd6\xd1p\xc1\xd7\xf2x\xe5\
-\xd0|\xdcoC\xd5\x01=A!D{\xa5@v\x1f\
-X\xbe\xf3.\xbf&\x93\xaa\xc9\x13\xb5\xb5\xf1\xb9\xb1\xeb\
-\xacq\x02o?\x03\xdb\x07L\x17`\xb7\xf0\x9bY\xc9\
-^\x97\x89n\xcb\x11\xc9\x96<\x93\xa8\x90e\xd1\x90\x14\
-\x955\xf9\xaf\xda\xd4\x87\x0f\x07\x12\xdd`\xectE\x1e\
-\xdc\xb2z\xbc\xd2fC\xda\xf7\xaf\xc0\x9d~\xb9\xac7\
-4e\x1e\xba\xcaW\x0e\x01;\xbb*\xa4~k7\x5c\
-\xaf\xe1A\x05Q5D\x16\x1d\x89J1=\xc1u\x09\
-\xd1\xea9\xba\x14\xdd\xa9M>\x9a\x1a%\xd4\x08k]\
-\xf5<\xd9\xbdv\xf7\xae\xc5\xd9\xc1\x8f\xf2VFY\xdf\
-\xc0\xeaq\xee&n\xd9\xebJO?\xae\xfbL\xdd9\
-T\xc3\xf3\xfc\xb1\xb58C\x01\xaf>\xe4E\x945\xa6\
-F,\xedky\x00\xfe\xc8\xe7\xf4\x7fr\x12\xc2\xc84\
-\x81\xea2\xb5\xadVI\xd4\x93\xed\xbe\x05\xed\xbd\x9a-\
-\x88\x062\xdc\xe1\xb6|v\xa9\xe9\x13E\xe1\xc1\x85j\
-]\xbfhw]\xee{\x09fc\x92?;\xe5\x1da\
-\xddJ\xcb\xb2\xf5.\xf0\xbc\x11\x8f5\xefw/\xc3_\
-\x8ea\xdf\xa0\xd8!\xb7\xab\x8dI\xaf\xb4FG\x88\xdf\
-\xa7KGS\xa3)\x9f\x04i\xe3\xeb\xa2\xfd\xf5.\xb0\
-4\x85\xdc\xa2\x85#\xb6\x09\xb0u\xefi`O`\x5c\
-\xd5\xbb\xce\xe0;\xfeE\xdb\x9b]\xe0\x19Y\x9f\xd7\xad\
- \x1d\x87#\xd2\xec\x04\xa8\x1b.D\x97\x98\xd8\xa4M\
-@{\xc5bg\xf6\xd9W\x87\xa9\xa9\xf1\x11\xa2^A\
-\xf6R\x87\xf1Xe\x22\xba\xa3':\x9e\xb7\xbe'\x0a\
-\x92\xbc%\x80\xffp\xc2\xbb\xff\xce'\xad\xe5\x99\x19<\
-\x00\xbf\x09tR\xab\x95\x09\xfc\xfe)\xd85\x9c^\xd1\
-\xe8\xbb\x1e\xdc\xb7\x14\xc1\xd72U\xbb\xc7C\xb3\xb8'\
-\x1bJ*\xbc\xdd\x14\x0d\x9b\xa9\x09\xff\xccx-\x10<\
-~\x80]\xef\xc5\x1a\xae\x1c\xc0\xbbO\xc3mco\xab\
-\xf3c]\x07\xf8\x80'\x05~\xd0\xcbA\x9e\x80\x9b\xc7\
-pI\x98\xed\xe9Y?ixp\x02\xe8XP\xd8P\
-t/\x1b\x8e\x97\x0d\xf9\xae&\xee\xd3\xe4\xbed\x8b\xb8\
-\xe8\xc5cf\x8d\x1e\xdb~h5o\xbaE\xfa\xbbC\
-\xf8\xd2\x04\xfe\xe3Io\xe0\xbc\x0d[\xe4\xbeV\xf0\x00\
-\xfc9\xf0A\x9f\x03\xff\xd31X\x89`\x9b(:\x9c\
-w\x04k\xadrzg&\xbe\x92\xaa\xc0\xb7\x84\xa3#\
-d\xf6\x22\xcd\xc2o\x99u\xdd\x0f\x87\x86\x90\xbb+#\
-\xde\xb6T\xba\xce\xd2\x07\xc0\xae\x10\xde|\xdc\xbbu\xca\
-I\xe0\x87}\x0e\x94\xf8\x8f\x1f\xf29\xe8\xf8\x04\xdep\
-\x02\xf6\xccA\xa8\x9b;K\x80\x1f\x1f\xa2C$k\x15\
-\xcdZD8\x974\xcb6u\xba\x01 \xad{\xa5\x0a\
-\xff\x22\x7f\x9fR\x8a\xce\xbcU\xc3\xf5J4\x5c>0\
-\xd1U\x0fw\xf5\x1a\xdf\x03\x83\x1e\xe0Y\xb6i\xf9\x17\
-u\x1dx\xdf*\x0c\xe7\xe1\xc5\x038bW\x9a\xd6\xd5\
-\xe0\xb4\xea0\xa29K^;\xf1\x0dz\x92h\xd1\x8e\
-j\xa3+Q\xc3m\xec\x83\xc6u\xee\x0d\xdbF\xba\x1a\
-\x90\xdb(\xb2\xda\xab\xa7\xeeq\xd7\xfbm\xe7\xd1\x96\xe7\
-\xec\x8b\xe0+1\xbc\xfe\xa8\xf7\x1c\x7f\x04\xf8\x15\xdf\x83\
-g\xd9\x10\xf7\xcbt\xed\x0cha\xf9\x96\x0b\xe1\x9b\x14\
-|%\x81\xa1\xac_U j\x94\xd9)\xf1Pt\x0b\
-\x8bu\xa2b\xadP\x89_\x872\xf7\xe2LM\x8e\x9e\
-\xde\xd7SUEA\x8a\x0e_\xaa\xf2\xbc*\xe8u\x09\
-~\xaa\x22:\xaa\x8eccL\xb9\xcc@\xc0\xf7<\x0c\
-\x0f\xfbo*|\x01\xf0\x88\xef\xc1r\x06\xf0|\x87\xd7\
-Q)\xdcx\x18\x0e\x0f\xe0\xb2\xb0\xdcM\x5c\x88nW\
-\x84\x87+\xf2\x8d<\xfa4\xd9\xf4Z\x0c(\xfcv\x18\
-\xf4\xfd\x95v\xadX\xed\xb3\xb5A\xa2\xcdfk\xbbB\
-x\xdd\xd1^\xc0\xf9\xf1>\xc0\xe9\xeb\xb6\xb2q\xcc\xba\
-\xb0\x7f\xd4u\xe0$\x85\xbf\x9d\xc0\x0b7\xc0\x85\x98\xbe\
-/\xa1\xe8^\xb75Ed\xbb\xda\xaft\xb8\xac\xda\xca\
-\xbf\x86(lj\xe5\xa7\xa0v\xff\x8a\xae\x19\xd5u\xee\
-\xac\xd2\x0c\x93\xb5\xb8-1\xfd<\xb1Z\xce\xd6\x00n\
-|\x04n\x1dy\xcf\xe9\xbb\x80_\xea\x0b\x84\xb5\xec\xe3\
-~\x07\xf04\x9f\x03\xb7\xcd\xc3;w\xc3\xa6\x89\xe9\xb6\
-\x91\xb9\xb0Y\xdd\x92\xfb<\xe8\xca\x9f\x89\xe6Exm\
-y1W\x99\xcd\xd3\xcbz:\x87\xd5\x95Kj}\xbf\
-\xc5m\xa5-y\xae\xb4\xe6\xf8\x18\xd3|kO\x08?\
-}\x04\xfef\x85\xbeF\xa4w#x\xb9\x06\xf0\xbc\xd8\
-\xf7\xc0GG\xf0\xda#\xa0\x07\xb0[L\xd7\xff\xf8\xa2\
-\xba\xa9\x98\xbb+B\xeb\x5cv\xdb\x11\xba\xcb\x86\xf7|\
-\xd2\x02bF\xb7$<#\xae\xcc\xfa\xcc\x09\x93~\xb8\
-\xf1ho\xe0|73\xee \xb0\x16\xf0<\x0c|\xa7\
-\xef\xc1\x07\xcf\xc0\x8d'`\xe7\x02l\xd5\xc6\xc4\xfa\x9a\
-\xbe\xae\x8b\xd8g\xa35:\xd2!>\xb9-\x9f\xbf1\
-\xeb\xe8\xfb\xbfd]7\xae\x19\xc0[N\xc2\xcd\xcb\xbd\
-\xfe\xdc\x9b\xf1Y1\xb3\x8e\x9c\xc7\x1d_\xb1\xdf\xfd\xf9\
->\x07\xdf?\x82;\x03x\xd5\x06\x08\x12S(\x1d\xb6\
-\xa8\xcdu\xfd\x9b\xbb\x8e\x15\xa2y}\xfb\x94$ \xfc\
-\xf6\xc8(\xfd\xcaE=W\xe9\x0a\x9d}Bl\x9f\xcf\
-\xb8\x8fSL\x09\xcc\xd3\x86\xf0\x87'\xe0w\x8e\xf7\x9a\
-\xbb\x8f\x00\xdf\xb7\x96\xc9\x0f\xd6\xe1\xc7\xf2\x11\xe0\xe9\xc0\
-\xd5>\x07\xdf\xbd\x02\xb7K\xf8\xae\x8dpAjZ\x98\
-I\xd9#3.\xfcJ\x1f\xba\xf4\xa3\xa6\xf5_S|\
-H\xacM\x9b\xe9\x0b\xb0.\x00e\xf7\x13m\xc2\xf1\xfd\
-\x03\xf8\xbd\xe3\xf0o\xfa\x01\xe7\x01\xe0\x1b\x99}\xc3\x9b\
-5\xbb-w\xdc\xd0\xc7\xfc}\xf4\x11\xf8\xde\xa3\xf0\xc5\
-\x10\x9e6\x07R5\xff\x17b\xbd}@\x0fW\xe9\xb3\
-\x88n]|U\xcf\x11k\x03\x1a!\xe0\x17\x8e\xc2\x9b\
-\xfa\x01\xe7\xab\xc0\xb3)\x98\xc3cjy\xb2q\x13p\
-\x1dp\xa5\xcf\xc1GV\xe1\xcfG\xb0c\x11\xbem\x0e\
-VbX\x15E\xf4T\xb7w\xfaZ-\x0f=\xac\x18\
-\xbe\xaa\xb0\xeeo=|\xddX\xf5\xb5,\xb2\xbaf\xce\
-\xac\xb5z\xeda\xf8\xd8\xa8\xd7\x1c=\x08\x1c\x00\x1e]\
-\x8f\x09\x0f\xd6\xf9Gq\x13\xf02<\xb6\xdb\xce\x84\xc4\
-[N\xc1\xb1y\xf8\xcey\x08c8e\xb7(l\xd4\
-\x81\x84_]\xafoS\xcd\x92\x86S\x01\x8foz`\
-\x16\xf7\xd3\xd7\x0df\xfc\xe6\xca\x01\xfc\xcf3\xa6\x8c\xf4\
-x?\xa7s\x0a\xb8\x06\x8f\xbdF\xce\xb5\xdbr\xc7K\
-\x80\x13\xdeGkx\xdbA\xf8\x993\xb0\xb8\x04W\x08\
-HU\xbd\xaf\x07\x8f>\xc7-d\xb6V\xc8\xab\xb1\x22\
-Su\xc5\x95\xd4\x04\x0d<\x86\x8e\xbf\xe7\xfb\xbd\xa7\xc4\
-V\xcbo\x0e\xd8\x88\xeag\x8fxmiT\x1d\xff\x18\
-S\x93\xce\xe3\x19<\x8f\x00\xd7\xf75\x8d\xef=\x04\xdf\
-~\x04\xfe\xdf\x1c<c\x1e\x96\x94\xbfS\xd6=\xdeo\
-#\xa1\xa5\x96\xffu\xc0i\xb1\x16M \xf2\xf9\xaeM\
-\x9f\xc9\x0c\xcb5Cs\xff\xa3\x87\xe17fs8\xaf\
-\x04\xfen\xbd':\xe0\xec\x8c\x13\xc0;\xed\x97\xde\xe4\
-\xfb\xa1c\xabp\xd32$\xf3\xf0\xdc%\xd8\xa7a9\
-\x81\xb1\xac\xb4\xb2k\xdb\xffBt\xac\xbelX3U\
-\xd5{j-\x99n_=\x81^\x9f\x90<\xb3*\xfb\
-\x22S\xc8\xf5\xdee\xf8\xe1\xc3\xf0\x89\xd5\x99\xe6\xe2e\
-xt}{<\x81'\xf3\xb1o\xc3\xa4\xb5\xae\xf5\xfe\
-T\x0a\xff\xf7$|0\x81\xd3!|\xe3\x06\xb801\
-\x0b\xf2\xf3\x82\xaf\x8eP\x1e:*\x14E\xf7r\xe7\xea\
-\xce\xc2\xd5\x89V\xd4,\xb7\xa9Z\xb4\xaa\x1b\xd4\xdd\x04\
-9\xd6\xb03\x84\x8b\x22\xb8\xf9\x0c\xfc\xe61\xf8\xb7\xc7\
-\xbdW;\xb8\xe3\xd3\xc0K\xe9\xa8C~\xbc\x82\x07\xcc\
-b\xb1,\x84\xff\x87\xbd|\xdf*|\xf4\x14\xfc\x8d\x86\
-\xab6\xc0\xb3\x07\x10\xc4\x06\x91U}\x06\xd1\xbd\xd8\xad\
-\x0a\x9e.\xe5Z7\xb8\xb2\xec\xbej\x85\xba@\xd1e\
-y\x12\x0d\x8b\x12\x0e\x0c\xe1pj2\xe2o<\x06w\
-\xc53]\xf7\xff\x85\xa9\xbb:t6'\xf7l\x83'\
-\x97v0K\x98\xbf\xbb\xef\x07\x8f\x8e\xe0\x9dg\xe0\x81\
-\x08.]\x84o\x08!J\xe0\xa4-Q\xac\xab\xdc\xeb\
-\x02S\x93\xb5i\xcazOM\xbc\xae\x01\x86\xee\x09\x22\
-]\x80fC\x00W\x0d\xcc\xb6T\xff\xf9$\xfc\xf8a\
-\xf8\xf4\xea\xcc\xd7\xfaM\xc0?=\x17\x93z\xae%\xae\
-W\x02\x7f13\xd2\x17\xe1\xb5[\xe0\xfb\x97\xe0\x9b\x81\
-\xf1\x08\xee\xb3;\x94\x85-\xabJk\xdb\xf0z\xecS\
-:\x05\xa0\xa6\xad\x1d\xa9)\x06\xabd\xd7\xab\x85a\xb1\
-2]\xb9\xf6\x84\xf0\xb5\xd8\x84\xdf\x7fx\xc2<^\xc3\
-\xf8\x97\xc0\xbf>W\x93\xf9\x18\xe8\xa3\x1c\x00\xfe\x0c\x93\
-\xd2\x98m,\xc0\x0d[\xe0\x87\x16\xe1%!\x88\x11<\
-\x98\xdane\xa2\xa1\x8e\xa7\xa3\xafs\xdbJ\x05:\x88\
-n\xb5B\xb0\x0e<Y\xf9DV\x90\xbeA\xc2\xed\x13\
-\xb8\xe94\xbc\xfd\xa4i\xa0\xbd\x86\xb1\x0a\xbc\x1a\xb3P\
-\x81'2x\xb2\xf1VL\xf5\xda\xecc\x0e^\xbe\x15\
-^\xbe\x00/\x8c`\xaf\x06\x99\xc2(6]\xa6c\xab\
-X7&Mi\xef\xf1\xe7\x05 =M\x9a3\xa0\xa4\
-\xf6\xefl\x91\xb0\xd9\xfe\xc1\xd3\x1a>\xb5\x0a\xef9\x03\
-o;\xe9\xbd%c\x17%x5p\xdf\xb9\x9e\xc0\xc7\
-\x12<XR\xf7\xcf\xad\x80\xb5&\xb5\xea\xa9\x1b\xe1\x99\
-!\xec\x1b\xc2\x0b\x96\xe09\x01l\xb0\x05\xbd'S8\
-\x83\xdd5F\x94\xbb\xc7W\x8b\xbf\xaa\x9d\xd1\xdd\xc7m\
-\xb5\xcc\x99\x85\x11\x1a\xe6\x85\xa9\xe8\x0b\x02\xb3~\xed\xb6\
-1\xdc\xbabR\x0a_\x98\xc0'F\xebr\xed\xee\x04\
-~\x0b\xf8\xd3\xc7j\xf2\x1ek\xf0d\xe3G\xf1i\xaa\
-\xe0;\x86\xf0\x8c%x\xde\x22<k\x00\xd7Fp\x89\
-\x80\xf9\xbcD\x0fV\x94Qn\xc7v\x87\x98l\xefT\
-\xd9Qt\xa5u\x01\xbc\x00\xd3qb\xc9M\xc5kx\
-85\x8b\xec>;\x86\x0f-\xc3-+\x86\xe3\xac\xe3\
-\xf8\x1d\xe0\x97\xd7 d?\xa1\xc0\x03&\xef\xf2\xbb\xc0\
-\x0b\xd7;\x9e\x5c\x9c\x87\xa7\x0f\xe1i\x91\xc9\x0d\x1d\x18\
-\xc0~\x09\x9bC\xd8\x96\x11\x11E\xf3F\x9e\x19r*\
-fiU\xc3#\x0a\xee\x9d\xc0\x97c\xd3D\xe0\x8bc\
-\xb8c\x02\xf7\x8f\xcf\xca5\xba\x07\xf89\xe0\xe6\xc7\xc3\
-\x84=\x9e\xc0\x93\x8d\x1f\xb0\x11\xc3\xbe\xb3)Pl\x88\
-`\xc7\x00.\x12\xb0y\x0e\xf6&\xb0i\x00\x8b\x91q\
-w\xf3\x0a\x22[*2\x96pF\x1a~rf\x15\x8e\
-\x02\x87R8\x12\x1b\xa2~tr\xd6m\xc0\x08\xf8m\
-\xeb\xa6\x12\xce\x8fN\xfd\xe9\x171\xbcW?\xc9o\xbf\
-\x0f\xec>\x0f\x89\xfec\x09\xf85\x8cR\xfdd\x03\xcd\
-[\x81K\xcfC`\xed\xe3)\x98\x96\x1f\xef{\x82\x03\
-\xe63\x98^\x90\xd7\x9f\x9f\xf2\xb3'2\xbe\x19S\x15\
-\xf7D\x00\xcc\x08x\x07=\x962\x9d\x1fk\x1f\x11\xa6\
-\xfa\xffC_\xa7\xa0\xf9\x1c\xf0\xf3\xc0\xae\xf3S\xf9\xd8\
-\x8e\xcb\x80\x9f\xc0\xd4\xad\x9c|\x1c\x03\xe6\xef\x81_\xc7\
-\xd4z\x7f\xdd\x0f\xf1\x04\x04\xd2f\xe0y\x98r\xd8\xe7\
-`rh\xc1c\xf4]\xee\xc2\xec\x22t\x0b\xf0\xb7<\
-\x06)\x84\xf3\xe0Y\xdb\xc8\x8a\xd1\x0eX ]\x0e\xec\
-\xa7\xd8S~\xbd\xc6\xbd\x16,_\xb0.\xe9\xf3\x98E\
-\x91O\xd8\xf1\xff\x07\x00\xef7\xf4\xa2\x11V\xce\xaf\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-<<<<<<< HEAD
-=======
-\x00\x00j|\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x8e\x00\x00\x00\x8e\x08\x06\x00\x00\x00\xe7\xfd0\x08\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x0aMiCCPPho\
-toshop ICC profi\
-le\x00\x00x\xda\x9dSwX\x93\xf7\x16>\xdf\xf7\
-e\x0fVB\xd8\xf0\xb1\x97l\x81\x00\x22#\xac\x08\xc8\
-\x10Y\xa2\x10\x92\x00a\x84\x10\x12@\xc5\x85\x88\x0aV\
-\x14\x15\x11\x9cHU\xc4\x82\xd5\x0aH\x9d\x88\xe2\xa0(\
-\xb8gA\x8a\x88Z\x8bU\x5c8\xee\x1f\xdc\xa7\xb5}\
-z\xef\xed\xed\xfb\xd7\xfb\xbc\xe7\x9c\xe7\xfc\xcey\xcf\x0f\
-\x80\x11\x12&\x91\xe6\xa2j\x009R\x85<:\xd8\x1f\
-\x8fOH\xc4\xc9\xbd\x80\x02\x15H\xe0\x04 \x10\xe6\xcb\
-\xc2g\x05\xc5\x00\x00\xf0\x03yx~t\xb0?\xfc\x01\
-\xafo\x00\x02\x00p\xd5.$\x12\xc7\xe1\xff\x83\xbaP\
-&W\x00 \x91\x00\xe0\x22\x12\xe7\x0b\x01\x90R\x00\xc8\
-.T\xc8\x14\x00\xc8\x18\x00\xb0S\xb3d\x0a\x00\x94\x00\
-\x00ly|B\x22\x00\xaa\x0d\x00\xec\xf4I>\x05\x00\
-\xd8\xa9\x93\xdc\x17\x00\xd8\xa2\x1c\xa9\x08\x00\x8d\x01\x00\x99\
-(G$\x02@\xbb\x00`U\x81R,\x02\xc0\xc2\x00\
-\xa0\xac@\x22.\x04\xc0\xae\x01\x80Y\xb62G\x02\x80\
-\xbd\x05\x00v\x8eX\x90\x0f@`\x00\x80\x99B,\xcc\
-\x00 8\x02\x00C\x1e\x13\xcd\x03 L\x03\xa00\xd2\
-\xbf\xe0\xa9_p\x85\xb8H\x01\x00\xc0\xcb\x95\xcd\x97K\
-\xd23\x14\xb8\x95\xd0\x1aw\xf2\xf0\xe0\xe2!\xe2\xc2l\
-\xb1Ba\x17)\x10f\x09\xe4\x22\x9c\x97\x9b#\x13H\
-\xe7\x03L\xce\x0c\x00\x00\x1a\xf9\xd1\xc1\xfe8?\x90\xe7\
-\xe6\xe4\xe1\xe6f\xe7l\xef\xf4\xc5\xa2\xfek\xf0o\x22\
->!\xf1\xdf\xfe\xbc\x8c\x02\x04\x00\x10N\xcf\xef\xda_\
-\xe5\xe5\xd6\x03p\xc7\x01\xb0u\xbfk\xa9[\x00\xdaV\
-\x00h\xdf\xf9]3\xdb\x09\xa0Z\x0a\xd0z\xf9\x8by\
-8\xfc@\x1e\x9e\xa1P\xc8<\x1d\x1c\x0a\x0b\x0b\xed%\
-b\xa1\xbd0\xe3\x8b>\xff3\xe1o\xe0\x8b~\xf6\xfc\
-@\x1e\xfe\xdbz\xf0\x00q\x9a@\x99\xad\xc0\xa3\x83\xfd\
-qanv\xaeR\x8e\xe7\xcb\x04B1n\xf7\xe7#\
-\xfe\xc7\x85\x7f\xfd\x8e)\xd1\xe24\xb1\x5c,\x15\x8a\xf1\
-X\x89\xb8P\x22M\xc7y\xb9R\x91D!\xc9\x95\xe2\
-\x12\xe9\x7f2\xf1\x1f\x96\xfd\x09\x93w\x0d\x00\xac\x86O\
-\xc0N\xb6\x07\xb5\xcbl\xc0~\xee\x01\x02\x8b\x0eX\xd2\
-v\x00@~\xf3-\x8c\x1a\x0b\x91\x00\x10g42y\
-\xf7\x00\x00\x93\xbf\xf9\x8f@+\x01\x00\xcd\x97\xa4\xe3\x00\
-\x00\xbc\xe8\x18\x5c\xa8\x94\x17L\xc6\x08\x00\x00D\xa0\x81\
-*\xb0A\x07\x0c\xc1\x14\xac\xc0\x0e\x9c\xc1\x1d\xbc\xc0\x17\
-\x02a\x06D@\x0c$\xc0<\x10B\x06\xe4\x80\x1c\x0a\
-\xa1\x18\x96A\x19T\xc0:\xd8\x04\xb5\xb0\x03\x1a\xa0\x11\
-\x9a\xe1\x10\xb4\xc118\x0d\xe7\xe0\x12\x5c\x81\xebp\x17\
-\x06`\x18\x9e\xc2\x18\xbc\x86\x09\x04A\xc8\x08\x13a!\
-:\x88\x11b\x8e\xd8\x22\xce\x08\x17\x99\x8e\x04\x22aH\
-4\x92\x80\xa4 \xe9\x88\x14Q\x22\xc5\xc8r\xa4\x02\xa9\
-Bj\x91]H#\xf2-r\x149\x8d\x5c@\xfa\x90\
-\xdb\xc8 2\x8a\xfc\x8a\xbcG1\x94\x81\xb2Q\x03\xd4\
-\x02u@\xb9\xa8\x1f\x1a\x8a\xc6\xa0s\xd1t4\x0f]\
-\x80\x96\xa2k\xd1\x1a\xb4\x1e=\x80\xb6\xa2\xa7\xd1K\xe8\
-ut\x00}\x8a\x8ec\x80\xd11\x0ef\x8c\xd9a\x5c\
-\x8c\x87E`\x89X\x1a&\xc7\x16c\xe5X5V\x8f\
-5c\x1dX7v\x15\x1b\xc0\x9ea\xef\x08$\x02\x8b\
-\x80\x13\xec\x08^\x84\x10\xc2l\x82\x90\x90GXLX\
-C\xa8%\xec#\xb4\x12\xba\x08W\x09\x83\x841\xc2'\
-\x22\x93\xa8O\xb4%z\x12\xf9\xc4xb:\xb1\x90X\
-F\xac&\xee!\x1e!\x9e%^'\x0e\x13_\x93H\
-$\x0e\xc9\x92\xe4N\x0a!%\x902I\x0bIkH\
-\xdbH-\xa4S\xa4>\xd2\x10i\x9cL&\xeb\x90m\
-\xc9\xde\xe4\x08\xb2\x80\xac \x97\x91\xb7\x90\x0f\x90O\x92\
-\xfb\xc9\xc3\xe4\xb7\x14:\xc5\x88\xe2L\x09\xa2$R\xa4\
-\x94\x12J5e?\xe5\x04\xa5\x9f2B\x99\xa0\xaaQ\
-\xcd\xa9\x9e\xd4\x08\xaa\x88:\x9fZIm\xa0vP/\
-S\x87\xa9\x134u\x9a%\xcd\x9b\x16C\xcb\xa4-\xa3\
-\xd5\xd0\x9aigi\xf7h/\xe9t\xba\x09\xdd\x83\x1e\
-E\x97\xd0\x97\xd2k\xe8\x07\xe9\xe7\xe9\x83\xf4w\x0c\x0d\
-\x86\x0d\x83\xc7Hb(\x19k\x19{\x19\xa7\x18\xb7\x19\
-/\x99L\xa6\x05\xd3\x97\x99\xc8T0\xd72\x1b\x99g\
-\x98\x0f\x98oUX*\xf6*|\x15\x91\xca\x12\x95:\
-\x95V\x95~\x95\xe7\xaaTUsU?\xd5y\xaa\x0b\
-T\xabU\x0f\xab^V}\xa6FU\xb3P\xe3\xa9\x09\
-\xd4\x16\xab\xd5\xa9\x1dU\xbb\xa96\xae\xceRwR\x8f\
-P\xcfQ_\xa3\xbe_\xfd\x82\xfac\x0d\xb2\x86\x85F\
-\xa0\x86H\xa3Tc\xb7\xc6\x19\x8d!\x16\xc62e\xf1\
-XB\xd6rV\x03\xeb,k\x98Mb[\xb2\xf9\xec\
-Lv\x05\xfb\x1bv/{LSCs\xaaf\xacf\
-\x91f\x9d\xe6q\xcd\x01\x0e\xc6\xb1\xe0\xf09\xd9\x9cJ\
-\xce!\xce\x0d\xce{-\x03-?-\xb1\xd6j\xadf\
-\xad~\xad7\xdaz\xda\xbe\xdab\xedr\xed\x16\xed\xeb\
-\xda\xefup\x9d@\x9d,\x9d\xf5:m:\xf7u\x09\
-\xba6\xbaQ\xba\x85\xba\xdbu\xcf\xea>\xd3c\xeby\
-\xe9\x09\xf5\xca\xf5\x0e\xe9\xdd\xd1G\xf5m\xf4\xa3\xf5\x17\
-\xea\xef\xd6\xef\xd1\x1f704\x086\x90\x19l18\
-c\xf0\xcc\x90c\xe8k\x98i\xb8\xd1\xf0\x84\xe1\xa8\x11\
-\xcbh\xba\x91\xc4h\xa3\xd1I\xa3'\xb8&\xee\x87g\
-\xe35x\x17>f\xaco\x1cb\xac4\xdee\xdck\
-<abi2\xdb\xa4\xc4\xa4\xc5\xe4\xbe)\xcd\x94k\
-\x9af\xba\xd1\xb4\xd3t\xcc\xcc\xc8,\xdc\xac\xd8\xac\xc9\
-\xec\x8e9\xd5\x9ck\x9ea\xbe\xd9\xbc\xdb\xfc\x8d\x85\xa5\
-E\x9c\xc5J\x8b6\x8b\xc7\x96\xda\x96|\xcb\x05\x96M\
-\x96\xf7\xac\x98V>VyV\xf5V\xd7\xacI\xd6\x5c\
-\xeb,\xebm\xd6WlP\x1bW\x9b\x0c\x9b:\x9b\xcb\
-\xb6\xa8\xad\x9b\xad\xc4v\x9bm\xdf\x14\xe2\x14\x8f)\xd2\
-)\xf5Sn\xda1\xec\xfc\xec\x0a\xec\x9a\xec\x06\xed9\
-\xf6a\xf6%\xf6m\xf6\xcf\x1d\xcc\x1c\x12\x1d\xd6;t\
-;|rtu\xccvlp\xbc\xeb\xa4\xe14\xc3\xa9\
-\xc4\xa9\xc3\xe9Wg\x1bg\xa1s\x9d\xf35\x17\xa6K\
-\x90\xcb\x12\x97v\x97\x17Sm\xa7\x8a\xa7n\x9fz\xcb\
-\x95\xe5\x1a\xee\xba\xd2\xb5\xd3\xf5\xa3\x9b\xbb\x9b\xdc\xad\xd9\
-m\xd4\xdd\xcc=\xc5}\xab\xfbM.\x9b\x1b\xc9]\xc3\
-=\xefA\xf4\xf0\xf7X\xe2q\xcc\xe3\x9d\xa7\x9b\xa7\xc2\
-\xf3\x90\xe7/^v^Y^\xfb\xbd\x1eO\xb3\x9c&\
-\x9e\xd60m\xc8\xdb\xc4[\xe0\xbd\xcb{`:>=\
-e\xfa\xce\xe9\x03>\xc6>\x02\x9fz\x9f\x87\xbe\xa6\xbe\
-\x22\xdf=\xbe#~\xd6~\x99~\x07\xfc\x9e\xfb;\xfa\
-\xcb\xfd\x8f\xf8\xbf\xe1y\xf2\x16\xf1N\x05`\x01\xc1\x01\
-\xe5\x01\xbd\x81\x1a\x81\xb3\x03k\x03\x1f\x04\x99\x04\xa5\x07\
-5\x05\x8d\x05\xbb\x06/\x0c>\x15B\x0c\x09\x0dY\x1f\
-r\x93o\xc0\x17\xf2\x1b\xf9c3\xdcg,\x9a\xd1\x15\
-\xca\x08\x9d\x15Z\x1b\xfa0\xcc&L\x1e\xd6\x11\x8e\x86\
-\xcf\x08\xdf\x10~o\xa6\xf9L\xe9\xcc\xb6\x08\x88\xe0G\
-l\x88\xb8\x1fi\x19\x99\x17\xf9}\x14)*2\xaa.\
-\xeaQ\xb4Stqt\xf7,\xd6\xac\xe4Y\xfbg\xbd\
-\x8e\xf1\x8f\xa9\x8c\xb9;\xdbj\xb6rvg\xacjl\
-Rlc\xec\x9b\xb8\x80\xb8\xaa\xb8\x81x\x87\xf8E\xf1\
-\x97\x12t\x13$\x09\xed\x89\xe4\xc4\xd8\xc4=\x89\xe3s\
-\x02\xe7l\x9a3\x9c\xe4\x9aT\x96tc\xae\xe5\xdc\xa2\
-\xb9\x17\xe6\xe9\xce\xcb\x9ew<Y5Y\x90|8\x85\
-\x98\x12\x97\xb2?\xe5\x83 BP/\x18O\xe5\xa7n\
-M\x1d\x13\xf2\x84\x9b\x85OE\xbe\xa2\x8d\xa2Q\xb1\xb7\
-\xb8J<\x92\xe6\x9dV\x95\xf68\xdd;}C\xfah\
-\x86OFu\xc63\x09OR+y\x91\x19\x92\xb9#\
-\xf3MVD\xd6\xde\xac\xcf\xd9q\xd9-9\x94\x9c\x94\
-\x9c\xa3R\x0di\x96\xb4+\xd70\xb7(\xb7Of+\
-+\x93\x0d\xe4y\xe6m\xca\x1b\x93\x87\xca\xf7\xe4#\xf9\
-s\xf3\xdb\x15l\x85L\xd1\xa3\xb4R\xaeP\x0e\x16L\
-/\xa8+x[\x18[x\xb8H\xbdHZ\xd43\xdf\
-f\xfe\xea\xf9#\x0b\x82\x16|\xbd\x90\xb0P\xb8\xb0\xb3\
-\xd8\xb8xY\xf1\xe0\x22\xbfE\xbb\x16#\x8bS\x17w\
-.1]R\xbadxi\xf0\xd2}\xcbh\xcb\xb2\x96\
-\xfdP\xe2XRU\xf2jy\xdc\xf2\x8eR\x83\xd2\xa5\
-\xa5C+\x82W4\x95\xa9\x94\xc9\xcbn\xae\xf4Z\xb9\
-c\x15a\x95dU\xefj\x97\xd5[V\x7f*\x17\x95\
-_\xacp\xac\xa8\xae\xf8\xb0F\xb8\xe6\xe2WN_\xd5\
-|\xf5ym\xda\xda\xdeJ\xb7\xca\xed\xebH\xeb\xa4\xeb\
-n\xac\xf7Y\xbf\xafJ\xbdjA\xd5\xd0\x86\xf0\x0d\xad\
-\x1b\xf1\x8d\xe5\x1b_mJ\xdet\xa1zj\xf5\x8e\xcd\
-\xb4\xcd\xca\xcd\x035a5\xed[\xcc\xb6\xac\xdb\xf2\xa1\
-6\xa3\xf6z\x9d\x7f]\xcbV\xfd\xad\xab\xb7\xbe\xd9&\
-\xda\xd6\xbf\xddw{\xf3\x0e\x83\x1d\x15;\xde\xef\x94\xec\
-\xbc\xb5+xWk\xbdE}\xf5n\xd2\xee\x82\xdd\x8f\
-\x1ab\x1b\xba\xbf\xe6~\xdd\xb8GwO\xc5\x9e\x8f{\
-\xa5{\x07\xf6E\xef\xebjtol\xdc\xaf\xbf\xbf\xb2\
-\x09mR6\x8d\x1eH:p\xe5\x9b\x80o\xda\x9b\xed\
-\x9aw\xb5pZ*\x0e\xc2A\xe5\xc1'\xdf\xa6|{\
-\xe3P\xe8\xa1\xce\xc3\xdc\xc3\xcd\xdf\x99\x7f\xb7\xf5\x08\xeb\
-Hy+\xd2:\xbfu\xac-\xa3m\xa0=\xa1\xbd\xef\
-\xe8\x8c\xa3\x9d\x1d^\x1dG\xbe\xb7\xff~\xef1\xe3c\
-u\xc75\x8fW\x9e\xa0\x9d(=\xf1\xf9\xe4\x82\x93\xe3\
-\xa7d\xa7\x9e\x9dN?=\xd4\x99\xdcy\xf7L\xfc\x99\
-k]Q]\xbdgC\xcf\x9e?\x17t\xeeL\xb7_\
-\xf7\xc9\xf3\xde\xe7\x8f]\xf0\xbcp\xf4\x22\xf7b\xdb%\
-\xb7K\xad=\xae=G~p\xfd\xe1H\xaf[o\xeb\
-e\xf7\xcb\xedW<\xaet\xf4M\xeb;\xd1\xef\xd3\x7f\
-\xfaj\xc0\xd5s\xd7\xf8\xd7.]\x9fy\xbd\xef\xc6\xec\
-\x1b\xb7n&\xdd\x1c\xb8%\xba\xf5\xf8v\xf6\xed\x17w\
-\x0a\xeeL\xdc]z\x8fx\xaf\xfc\xbe\xda\xfd\xea\x07\xfa\
-\x0f\xea\x7f\xb4\xfe\xb1e\xc0m\xe0\xf8`\xc0`\xcf\xc3\
-Y\x0f\xef\x0e\x09\x87\x9e\xfe\x94\xff\xd3\x87\xe1\xd2G\xcc\
-G\xd5#F#\x8d\x8f\x9d\x1f\x1f\x1b\x0d\x1a\xbd\xf2d\
-\xce\x93\xe1\xa7\xb2\xa7\x13\xcf\xca~V\xffy\xebs\xab\
-\xe7\xdf\xfd\xe2\xfbK\xcfX\xfc\xd8\xf0\x0b\xf9\x8b\xcf\xbf\
-\xaey\xa9\xf3r\xef\xab\xa9\xaf:\xc7#\xc7\x1f\xbc\xce\
-y=\xf1\xa6\xfc\xad\xce\xdb}\xef\xb8\xef\xba\xdf\xc7\xbd\
-\x1f\x99(\xfc@\xfeP\xf3\xd1\xfac\xc7\xa7\xd0O\xf7\
->\xe7|\xfe\xfc/\xf7\x84\xf3\xfb%\xd2\x9f3\x00\x00\
-;+iTXtXML:com.ad\
-obe.xmp\x00\x00\x00\x00\x00<?xp\
-acket begin=\x22\xef\xbb\xbf\
-\x22 id=\x22W5M0MpCehi\
-HzreSzNTczkc9d\x22?\
->\x0a<x:xmpmeta xml\
-ns:x=\x22adobe:ns:m\
-eta/\x22 x:xmptk=\x22A\
-dobe XMP Core 5.\
-5-c021 79.154911\
-, 2013/10/29-11:\
-47:16        \x22>\x0a\
-   <rdf:RDF xmln\
-s:rdf=\x22http://ww\
-w.w3.org/1999/02\
-/22-rdf-syntax-n\
-s#\x22>\x0a      <rdf:\
-Description rdf:\
-about=\x22\x22\x0a       \
-     xmlns:xmp=\x22\
-http://ns.adobe.\
-com/xap/1.0/\x22\x0a  \
-          xmlns:\
-xmpMM=\x22http://ns\
-.adobe.com/xap/1\
-.0/mm/\x22\x0a        \
-    xmlns:stEvt=\
-\x22http://ns.adobe\
-.com/xap/1.0/sTy\
-pe/ResourceEvent\
-#\x22\x0a            x\
-mlns:photoshop=\x22\
-http://ns.adobe.\
-com/photoshop/1.\
-0/\x22\x0a            \
-xmlns:dc=\x22http:/\
-/purl.org/dc/ele\
-ments/1.1/\x22\x0a    \
-        xmlns:ti\
-ff=\x22http://ns.ad\
-obe.com/tiff/1.0\
-/\x22\x0a            x\
-mlns:exif=\x22http:\
-//ns.adobe.com/e\
-xif/1.0/\x22>\x0a     \
-    <xmp:Creator\
-Tool>Adobe Photo\
-shop CC (Windows\
-)</xmp:CreatorTo\
-ol>\x0a         <xm\
-p:CreateDate>201\
-8-07-30T16:32:07\
-+09:00</xmp:Crea\
-teDate>\x0a        \
- <xmp:MetadataDa\
-te>2018-07-30T16\
-:32:07+09:00</xm\
-p:MetadataDate>\x0a\
-         <xmp:Mo\
-difyDate>2018-07\
--30T16:32:07+09:\
-00</xmp:ModifyDa\
-te>\x0a         <xm\
-pMM:InstanceID>x\
-mp.iid:0efe4c7b-\
-5305-c947-9e2c-2\
-ae9038c7712</xmp\
-MM:InstanceID>\x0a \
-        <xmpMM:D\
-ocumentID>xmp.di\
-d:f7a84e3d-8817-\
-3242-9f25-4c2cfd\
-eaa977</xmpMM:Do\
-cumentID>\x0a      \
-   <xmpMM:Origin\
-alDocumentID>xmp\
-.did:f7a84e3d-88\
-17-3242-9f25-4c2\
-cfdeaa977</xmpMM\
-:OriginalDocumen\
-tID>\x0a         <x\
-mpMM:History>\x0a  \
-          <rdf:S\
-eq>\x0a            \
-   <rdf:li rdf:p\
-arseType=\x22Resour\
-ce\x22>\x0a           \
-       <stEvt:ac\
-tion>created</st\
-Evt:action>\x0a    \
-              <s\
-tEvt:instanceID>\
-xmp.iid:f7a84e3d\
--8817-3242-9f25-\
-4c2cfdeaa977</st\
-Evt:instanceID>\x0a\
-                \
-  <stEvt:when>20\
-18-07-30T16:32:0\
-7+09:00</stEvt:w\
-hen>\x0a           \
-       <stEvt:so\
-ftwareAgent>Adob\
-e Photoshop CC (\
-Windows)</stEvt:\
-softwareAgent>\x0a \
-              </\
-rdf:li>\x0a        \
-       <rdf:li r\
-df:parseType=\x22Re\
-source\x22>\x0a       \
-           <stEv\
-t:action>saved</\
-stEvt:action>\x0a  \
-                \
-<stEvt:instanceI\
-D>xmp.iid:0efe4c\
-7b-5305-c947-9e2\
-c-2ae9038c7712</\
-stEvt:instanceID\
->\x0a              \
-    <stEvt:when>\
-2018-07-30T16:32\
-:07+09:00</stEvt\
-:when>\x0a         \
-         <stEvt:\
-softwareAgent>Ad\
-obe Photoshop CC\
- (Windows)</stEv\
-t:softwareAgent>\
-\x0a               \
-   <stEvt:change\
-d>/</stEvt:chang\
-ed>\x0a            \
-   </rdf:li>\x0a   \
-         </rdf:S\
-eq>\x0a         </x\
-mpMM:History>\x0a  \
-       <photosho\
-p:DocumentAncest\
-ors>\x0a           \
- <rdf:Bag>\x0a     \
-          <rdf:l\
-i>xmp.did:8915d4\
-8c-bdcd-1b49-ae4\
-0-df7992d0e26a</\
-rdf:li>\x0a        \
-       <rdf:li>x\
-mp.did:c20cb7ad-\
-9914-d646-af28-8\
-4e609cfd16f</rdf\
-:li>\x0a           \
- </rdf:Bag>\x0a    \
-     </photoshop\
-:DocumentAncesto\
-rs>\x0a         <ph\
-otoshop:ColorMod\
-e>3</photoshop:C\
-olorMode>\x0a      \
-   <photoshop:IC\
-CProfile>sRGB IE\
-C61966-2.1</phot\
-oshop:ICCProfile\
->\x0a         <dc:f\
-ormat>image/png<\
-/dc:format>\x0a    \
-     <tiff:Orien\
-tation>1</tiff:O\
-rientation>\x0a    \
-     <tiff:XReso\
-lution>720000/10\
-000</tiff:XResol\
-ution>\x0a         \
-<tiff:YResolutio\
-n>720000/10000</\
-tiff:YResolution\
->\x0a         <tiff\
-:ResolutionUnit>\
-2</tiff:Resoluti\
-onUnit>\x0a        \
- <exif:ColorSpac\
-e>1</exif:ColorS\
-pace>\x0a         <\
-exif:PixelXDimen\
-sion>142</exif:P\
-ixelXDimension>\x0a\
-         <exif:P\
-ixelYDimension>1\
-42</exif:PixelYD\
-imension>\x0a      \
-</rdf:Descriptio\
-n>\x0a   </rdf:RDF>\
-\x0a</x:xmpmeta>\x0a  \
-                \
-                \
-                \
-                \
-                \
-                \
-  \x0a             \
-                \
-                \
-                \
-                \
-                \
-       \x0a        \
-                \
-                \
-                \
-                \
-                \
-            \x0a   \
-                \
-                \
-                \
-                \
-                \
-                \
- \x0a              \
-                \
-                \
-                \
-                \
-                \
-      \x0a         \
-                \
-                \
-                \
-                \
-                \
-           \x0a    \
-                \
-                \
-                \
-                \
-                \
-                \
-\x0a               \
-                \
-                \
-                \
-                \
-                \
-     \x0a          \
-                \
-                \
-                \
-                \
-                \
-          \x0a     \
-                \
-                \
-                \
-                \
-                \
-               \x0a\
-                \
-                \
-                \
-                \
-                \
-                \
-    \x0a           \
-                \
-                \
-                \
-                \
-                \
-         \x0a      \
-                \
-                \
-                \
-                \
-                \
-              \x0a \
-                \
-                \
-                \
-                \
-                \
-                \
-   \x0a            \
-                \
-                \
-                \
-                \
-                \
-        \x0a       \
-                \
-                \
-                \
-                \
-                \
-             \x0a  \
-                \
-                \
-                \
-                \
-                \
-                \
-  \x0a             \
-                \
-                \
-                \
-                \
-                \
-       \x0a        \
-                \
-                \
-                \
-                \
-                \
-            \x0a   \
-                \
-                \
-                \
-                \
-                \
-                \
- \x0a              \
-                \
-                \
-                \
-                \
-                \
-      \x0a         \
-                \
-                \
-                \
-                \
-                \
-           \x0a    \
-                \
-                \
-                \
-                \
-                \
-                \
-\x0a               \
-                \
-                \
-                \
-                \
-                \
-     \x0a          \
-                \
-                \
-                \
-                \
-                \
-          \x0a     \
-                \
-                \
-                \
-                \
-                \
-               \x0a\
-                \
-                \
-                \
-                \
-                \
-                \
-    \x0a           \
-                \
-                \
-                \
-                \
-                \
-         \x0a      \
-                \
-                \
-                \
-                \
-                \
-              \x0a \
-                \
-                \
-                \
-                \
-                \
-                \
-   \x0a            \
-                \
-                \
-                \
-                \
-                \
-        \x0a       \
-                \
-                \
-                \
-                \
-                \
-             \x0a  \
-                \
-                \
-                \
-                \
-                \
-                \
-  \x0a             \
-                \
-                \
-                \
-                \
-                \
-       \x0a        \
-                \
-                \
-                \
-                \
-                \
-            \x0a   \
-                \
-                \
-                \
-                \
-                \
-                \
- \x0a              \
-                \
-                \
-                \
-                \
-                \
-      \x0a         \
-                \
-                \
-                \
-                \
-                \
-           \x0a    \
-                \
-                \
-                \
-                \
-                \
-                \
-\x0a               \
-                \
-                \
-                \
-                \
-                \
-     \x0a          \
-                \
-                \
-                \
-                \
-                \
-          \x0a     \
-                \
-                \
-                \
-                \
-                \
-               \x0a\
-                \
-                \
-                \
-                \
-                \
-                \
-    \x0a           \
-                \
-                \
-                \
-                \
-                \
-         \x0a      \
-                \
-                \
-                \
-                \
-                \
-              \x0a \
-                \
-                \
-                \
-                \
-                \
-                \
-   \x0a            \
-                \
-                \
-                \
-                \
-                \
-        \x0a       \
-                \
-                \
-                \
-                \
-                \
-             \x0a  \
-                \
-                \
-                \
-                \
-                \
-                \
-  \x0a             \
-                \
-                \
-                \
-                \
-                \
-       \x0a        \
-                \
-                \
-                \
-                \
-                \
-            \x0a   \
-                \
-                \
-                \
-                \
-                \
-                \
- \x0a              \
-                \
-                \
-                \
-                \
-                \
-      \x0a         \
-                \
-                \
-                \
-                \
-                \
-           \x0a    \
-                \
-                \
-                \
-                \
-                \
-                \
-\x0a               \
-                \
-                \
-                \
-                \
-                \
-     \x0a          \
-                \
-                \
-                \
-                \
-                \
-          \x0a     \
-                \
-                \
-                \
-                \
-                \
-               \x0a\
-                \
-                \
-                \
-                \
-                \
-                \
-    \x0a           \
-                \
-                \
-                \
-                \
-                \
-         \x0a      \
-                \
-                \
-                \
-                \
-                \
-              \x0a \
-                \
-                \
-                \
-                \
-                \
-                \
-   \x0a            \
-                \
-                \
-                \
-                \
-                \
-        \x0a       \
-                \
-                \
-                \
-                \
-                \
-             \x0a  \
-                \
-                \
-                \
-                \
-                \
-                \
-  \x0a             \
-                \
-                \
-                \
-                \
-                \
-       \x0a        \
-                \
-                \
-                \
-                \
-                \
-            \x0a   \
-                \
-                \
-                \
-                \
-                \
-                \
- \x0a              \
-                \
-                \
-                \
-                \
-                \
-      \x0a         \
-                \
-                \
-                \
-                \
-                \
-           \x0a    \
-                \
-                \
-                \
-                \
-                \
-                \
-\x0a               \
-                \
-                \
-                \
-                \
-                \
-     \x0a          \
-                \
-                \
-                \
-                \
-                \
-          \x0a     \
-                \
-                \
-                \
-                \
-                \
-               \x0a\
-                \
-                \
-                \
-                \
-                \
-                \
-    \x0a           \
-                \
-                \
-                \
-                \
-                \
-         \x0a      \
-                \
-                \
-                \
-                \
-                \
-              \x0a \
-                \
-                \
-                \
-                \
-                \
-                \
-   \x0a            \
-                \
-                \
-                \
-                \
-                \
-        \x0a       \
-                \
-                \
-                \
-                \
-                \
-             \x0a  \
-                \
-                \
-                \
-                \
-                \
-                \
-  \x0a             \
-                \
-                \
-                \
-                \
-                \
-       \x0a        \
-                \
-                \
-                \
-                \
-                \
-            \x0a   \
-                \
-                \
-                \
-                \
-                \
-                \
- \x0a              \
-                \
-                \
-                \
-                \
-                \
-      \x0a         \
-                \
-                \
-                \
-                \
-                \
-           \x0a    \
-                \
-                \
-                \
-                \
-                \
-                \
-\x0a               \
-                \
-                \
-                \
-                \
-                \
-     \x0a          \
-                \
-                \
-                \
-                \
-                \
-          \x0a     \
-                \
-                \
-                \
-                \
-                \
-               \x0a\
-                \
-                \
-                \
-                \
-                \
-                \
-    \x0a           \
-                \
-                \
-                \
-                \
-                \
-         \x0a      \
-                \
-                \
-                \
-                \
-                \
-              \x0a \
-                \
-                \
-                \
-                \
-                \
-                \
-   \x0a            \
-                \
-                \
-                \
-                \
-                \
-        \x0a       \
-                \
-                \
-                \
-                \
-                \
-             \x0a  \
-                \
-                \
-                \
-                \
-                \
-                \
-  \x0a             \
-                \
-                \
-                \
-                \
-                \
-       \x0a        \
-                \
-                \
-                \
-                \
-                \
-            \x0a   \
-                \
-                \
-                \
-                \
-                \
-                \
- \x0a              \
-                \
-                \
-                \
-                \
-                \
-      \x0a         \
-                \
-                \
-                \
-                \
-                \
-           \x0a    \
-                \
-                \
-                \
-                \
-                \
-                \
-\x0a               \
-                \
-                \
-                \
-                \
-                \
-     \x0a          \
-                \
-                \
-                \
-                \
-                \
-          \x0a     \
-                \
-                \
-                \
-                \
-                \
-               \x0a\
-                \
-                \
-                \
-                \
-                \
-                \
-    \x0a           \
-                \
-                \
-                \
-                \
-                \
-         \x0a      \
-                \
-                \
-                \
-                \
-                \
-              \x0a \
-                \
-                \
-                \
-                \
-                \
-                \
-   \x0a            \
-                \
-                \
-                \
-                \
-                \
-        \x0a       \
-                \
-                \
-                \
-                \
-                \
-             \x0a  \
-                \
-                \
-                \
-                \
-                \
-                \
-  \x0a             \
-                \
-                \
-                \
-                \
-                \
-       \x0a        \
-                \
-                \
-                \
-                \
-                \
-            \x0a   \
-                \
-                \
-                \
-                \
-                \
-                \
- \x0a              \
-                \
-                \
-                \
-                \
-                \
-      \x0a         \
-                \
-                \
-                \
-                \
-                \
-           \x0a    \
-                \
-                \
-                \
-                \
-                \
-                \
-\x0a               \
-             \x0a<?\
-xpacket end=\x22w\x22?\
->\xc6%\xb0\xc9\x00\x00\x00 cHRM\x00\x00z\
-%\x00\x00\x80\x83\x00\x00\xf9\xff\x00\x00\x80\xe9\x00\x00u\
-0\x00\x00\xea`\x00\x00:\x98\x00\x00\x17o\x92_\xc5\
-F\x00\x00$rIDATx\xda\xec\x9d{\x94$\
-W}\xdf?\xf7Vu\xcf\xcc\xee\xcc\xae\xf6\xa1}H\
-\xbb\xabee\xbd\x01\xf1\x16\x02\xc7`\x10\x18p\xb0\x13\
-G\xc4\x0e\xb6!\xc6&6\xf6\x09\x8e\x13\x8eC\x82\x89\
-1\xc6\xc1\xe7\xc4'\x8e\xf1+\xb6\x8fs\xccS\xc7!\
-\xf8\x89!\xc6 ,\xd0\x03)\x02Y\xc2z\xd9B\xac\
-\x10#i\x1f\xda]\xed\xce\xce\xeetW\xdd\x9b?\xee\
-\xad\xea[\xd5\xf5\xb8\xb7\xbagw\xb5\xda;\xa7Nw\
-\xd7T\xd5LW}\xeb\xfb\xfb\xfe^\xb7\x04\xcf\x8c1\
-\x0f|\x07p\x85].\x02v\xd8e\x0b\x10\x05\x1eO\
-\x01\x07\x80o\xdb\xe5[\xc0}\xc0\x03\xc0C\xc0Sg\
-\xfb\x09\x15g\xe9\xf7\xba\x08x1\xf0r\xe0j\xe0y\
-\xc0\x86S\xf4\xb7\x8f\x02w\xdb\xe5\x16\xe0\x0e\xe0\xe1s\
-\xc09s\xbf\xc7w\x01\xaf\x07^\x01\xbc\xf4\x0c\xfb\xff\
-\xee\x04\xbe\x04|\x16\xb8\x09\x18rn\x9c\xd6\xf1\xdd\xc0\
-\xef\x00{\x01\xfd4Y\x16\x81\xdf\x07\xbe\xe7\xdc\xe5;\
-\xb5c7\xf0\x1e\xe0\xebO#\xb0\xd4-\x0f\x02\xef\x07\
-.=wYWo\xbc\x12\xb8\xc1\x0aS}\x16.\x7f\
-r\x8e\x85\xa6;\xfe\x15\xf0\x95\xb3\x14,U\xcb]\xc0\
-\x8f\x9d\xbb\xec\xdd\xc7\x0f\xd9\x93\xa8\x9f\xa1\xcb\xfdg2\
-\x80\xceD\xaf\xea5\xc0\xfb\x80\x97\x9d\x8ao\x1f\xad\x8d\
-\x88\xd6E\xf4\x16zDs\x11\xb2/\x11\x91@K\x8d\
-\xd2\x8a$I\x18\x0e\x87\xa4+)\xea\x84\x82%\xe0\xc8\
-)\xf5\x8b\xbe\x06\xfc\x12\xf0\x17\xe7\x80S=v\x02\xbf\
-\x0a\xbcy\x9a\x07\xed\xd1c\xddy\xebX\xd8\xb1\xc0\xfc\
-\x8ey\xe6\xb7\xcf\xb3p\xc1\x02s\x9b\xe7\xe8\xaf\xeb3\
-\xb30Co\xbeG\xbc&&\x8ecd$\x11B\x80\
-\x00\xad-x\xd2\x84$I\x18\x0c\x07\x0c\x96\x07,\x1f\
-]\xe6\xd8\xa1c\x1c=t\x94\xa5}K\x1cy\xf4\x08\
-G\xbe}\x84\xf4\x91\xd4\x80ju\xc6\x9f\x02\xef\x06\xfe\
-\xe1\x1cpF\xe3\xe7\x80\xff\x0a\xccNz\xa0\xf5\xacg\
-\xd3\x8eMl\xbct#\x1b/\xdb\xc8\xfa\x8b\xd7\xb3\xb0\
-s\x81\xb9\xf3\xe7\xe8\xad\xeb\x11\xf5\x22H\x81\xc4\xb2F\
-\xf6^\x81\xd0\xc2\x9e\x14\x81\x10b\xf4*\x04RH\xb3\
-\xc4\x12\x11\x0bdO\xa2b\xc5P\x0eYN\x97yj\
-\xe9)\x8e\xec;\xc2\xbeo\xedc\xff?\xeeg\xdf}\
-\xfb8z\xefQ\x13_\x9e\xde\xd0\xc0\x7f\x01>\xf0L\
-\x07\xce\xf3\x80\x0f\x01\xff\xa4\xeb\x01f\x98a\xf3\x9a\xcd\
-l\xbdd+[\xae\xde\xc2\x86+60\xff\x1d\xf3\xc4\
-[b\xf4\xacF\xa7\x1a}R#\x06\x02\x99J\x22\x22\
-\xa4\x94#  \x91R\x16@\x92\xfdT_9\x0d\x80\
-\xd2\xca|\xd6\x1a!\x04Q\x14\x11\xf7c\xe4\x9cd\xd8\
-\x1frd\xe5\x08\x07\x1e?\xc0\xa3\xf7?\xca\xe2\xd7\x16\
-Y\xfc\xda\x22\xc9\x83\xc9\xb4\xce\xdbW\x81w\x02\xb7>\
-\x13\x81\xf3n\xe0\x83]v\x94H\xb6\xcdmc\xc7\xee\
-\x1dl}\xd1V\xd6_\xbd\x9e\xfe\xc5}\xf4\x06\x8d\x92\
-\x0aV Z\x89\x88UL$\xa3\xd1\x22\xa2\x1c0\xee\
-\xfb\x8cQ\xcaL\x93\xb1\x8f\x0b\x18\xad-pPh\xad\
-\x8d9C\xa1\x94BiE\xaaS\xb4\xd6H!\xe9\xcf\
-\xf6\x91\xf3\x92\x93\xbd\x93\xec\x7fr?{\xef\xdd\xcbC\
-7?\xc4\xa3\x7f\xfb(<6\x95s\xf8\x01\xe0\xbd\xcf\
-\x14\xe0l\x01>\x0a\xbc6t\xc7\xb5\xbd\xb5\xec<o\
-';.\xdb\xc1\xa6k6\xd1{v\x8fd[\x02\xb3\
-\x16('cba\xc0\x12\xcb8\x07K$\xa3|}\
-\x194M\xe0)\x9c!=b\x1c\xadu\xfe\xaa\xb4\x1a\
-[R\x9d\x9aE\x99EiE/\xee\xd1?\xaf\xcf\x89\
-\x99\x13,>\xb6\xc8\x037?\xc0}\x9f\xb9\x8f\xc1W\
-\x07\x93\x9e\xcf[\x81\x1f\xc6D\xcf\xcfZ\xe0\x5cg\x83\
-x\x9bCvZ\x98]`\xf7\x86\xdd\xec\xb8r\x07\x0b\
-\xd7,\xa0.W\xa8\xad\x8aHD\xf4\x96{\xc4*&\
-\x96q\x0e\x96\xf2\xfb\x0c<9\x90\x841W\x11\x16@\
-\xd2\x02\x07\xe9\xc589h2\xa6)1\x8e\xd2\xca\x80\
-F\xa7$*\xc9\xdf\x0f\xd5\x10\xad43\xb33\xc8M\
-\x92}\xc7\xf7q\xff\xed\xf7s\xcf\x9f\xdd\xc3\x89\x9bN\
-Lr^\x97-x\xfe\xecl\x04\xce\xcf\x02\xff#H\
-\xbf\xf4f\xd8\xb3a\x0f\xbb.\xdb\xc5\xdak\xd72\xbc\
-j\x08\xdb\xa1\x97\xf4\x0c`DL/\xea\xe5@\xc9\x17\
-\xd1\x02 \xfb*\x91D2\x1a\xb1M\x09<@\x0e\xa0\
-\xccD\xb9L\xa3\xd1#\xb0\xa8q\xd0\xa4\xca\x02\xc7\x02\
-(\x03\xd1P\x0dI\xd2\x84^\xd4\xa3\xbf\xb9\xcf\x01u\
-\x80{n\xbf\x87\xbb\xfe\xf8.\xf4-z\x92s\xfc\xde\
-S%\x9cO\x15p~\x07xG\x90o\xben'{\
-v\xefa\xdd\xcb\xd61|\xc1\x10\xb9K\xd2\x1bZ\xc0\
-\xc8\x988\x8a\xe9I\xf3>\x03O$\xa2\xc2\xe7\x02p\
-\xc48\x80\xcaz\xa7`\xae\x10cg\xa7l\xa2\xaa\x80\
-\xd3\x04\x9a$MHt\x92\x7f\x1e\xa6C\x86\xe9\x90X\
-\xc6\xccl\x9ea1Y\xe4\x8e/\xde\xc1\xde\x8f\xef5\
-\x95=\xdd\xc6\xc7\x80\x1f}\xba\x03G\x00\x7f\x85)w\
-\xf0\xd31\xf1Z.\xd9r\x09\xdb\xae\xddFzm\x0a\
-\x97\x9bXL\xefX\xcf\x00\xc5\x02\xc6}\x9f\x01\xa4\x92\
-}JK\xaeyd\x5c\x00M$#\x04#\xe6)0\
-\x8e\xb6L\xe3\xe8\x9b\x82\xa6q\xc0\xe2\x82\xc6]r\xa6\
-q\xd6e\x9f3\x00\xcd\xc6\xb3\xe8M\x9a{\x0f\xdd\xcb\
-m\x7f~\x1b\xc3?\x19\xc2\xc1N\xe7\xfdf\xab!O\
-<\x1d\x81\xb3\x16\xf8\x22\xa6\xa0\xcaO5\xf7\xb6p\xe9\
-U\x972\xfb\x9aY\x92\x97$\xf4\xd6\xf6\xe8\x1d\xe9\x11\
-\xeb\x98~\xafo\xc0!{9@zQo\xc4:\x15\
-@\xca\xd6g@q\xdfW\x99\xad\xccM\x1f\x13\xc85\
-\xa28\x03\x89\xd2\xaa\xc0.U\xc0)\x83%\x07\x8c\x03\
-\x9eA:@)\xc5\xfc\xec<\xfb\x16\xf6q\xd3\xdf\xdf\
-\xc4\x81O\x1e\x80\x1b;\x9d\xff\x07l\x98\xe3\xe0\xd3\x09\
-8\xe7\x01\xb7\x01\x97\xfb\xee\xb0\xa3\xb7\x83=\xaf\xde\x03\
-\xff\x14\xf4\x1eM\xffh\x9f\xde\xa0g\xbc\x91\xa8_`\
-\x9a\x0c09p\x5c\xb3U\xf5\xb9\x8ay\x1c\xf3U\xf6\
-\xb6r\xd0\x08#\x8e\xb5\xa1\x9c\x9ci\xb4\xd6\xb9\xe7\xa4\
-\x94\xaa\xd71U\x80IKL\xa3\x86c\xaf\x83t\xc0\
-\xac\x98e87\xe4\xcbK_f\xefM{\xe1S\xc0\
-\xe3\xc1\xd7\xe1\xdb\x98\xa2\xb6\xc5i_\xe0h\x15@\xb3\
-\xde\x06\xa8\xbckLv\xcd\xedb\xf7\x8f\xec&\xb9>\
-Al\x14\xf4\x9e4\x9eR/\xb2\xec\x12\xc5\xb5\x80q\
-\x99'\xdb>\x03X?\xea\xe7\xeb\xdc\xf7\xd9\xe7l\x9d\
-\xfb\xde\xdd\xb6/\xfb\x05\xb3\xe8\xba\xf9R\x1a\xa0\x09\xe9\
-\x987gAP4y\x0d\xdeY\xf9U 8\x99\x9e\
-D$\x82g\xc9g\xb1t\xc1\x12\x87/;\x0c+\x98\
-\xeaf\xff\xb1\xcez[7\x00\xc7\xced\xe0\xac\xb1\xa0\
-\xb9\xc4w\x87\x0b\xd7_\xc8\xce\x7f\xbf\x93\xc1\xab\x06\xc8\
-\x15I\xefh\x8f8\xf6\xd0,Q\x5c\x00I\x19T\xb9\
-9\x93\xbdZ\xf0\xf4\xa2\x1e3\xf1\xcc\x18\x98\xfaq\xbf\
-\xb0_\x99\xa9\xc6@CQ\x13\x95\xc1R\x10\xd7\xba\x06\
-8\xd9{\xfb\x19`\x90\x0eHU\xca\xeeh7\x87\xf4\
-!\x8e^y\x146\x02\xf7\x04]\x93yLi\xcaG\
-\xac\xdb>\x95\x11O\x198\xb7\x840\xcd\xa6m\x9b\xb8\
-\xe0=\x17\xb0r\xd1\x0a\xf1\x81\x98HG\xc8X\x16\xbd\
-\x9e,= eQ\x97\xb8\x8b\xa3U\xdc\xc5\xf5\xbe\xc6\
-\x84\xb5\xa3\x81\x5cP\xb8\xde\x96\xcb\x12e]\x93\x88\x04\
-\xa9$\x09\xc9\xc8\x03\x13&\xe7U\xd0B\xd2\x8ah\xa1\
-\x88d\x94\x0bj)%R\xcb\xd1+\xc5`\xa4\x10\x82\
-HF\xac$+\xa4\x22\xe5\x9a\x0d\xd7\xb0\xb4w\x89#\
-/;\x02\x17\x02\xbfGHBu;\xa6\xa6\xe9\xd9\xd3\
-\x12\xcc\xd3d\x9c\x1b\x81k}7\x9e\xdd=\xcb\x9e\xf7\
-\xefAmQ\xc8'$=1b\x1a\xd7\xb5\xae\x12\xb9\
-\x99\x89*\xb0RT\xc3Ju\x9a\xc85I\xf1\xb8\xd9\
-r\xd9)\x961Q\x14\x155\x90c\x8e\xca\xac\x92\xeb\
-\xa1,-Qb\x931\xcf\x0c5\xfe\xde\xbej4\x03\
-5 \x12\x11\x9b\xe76\xf3\xc8\xb7\x1eAo\xd7p\x0d\
-\xa6w\xe2\xb0\xf7\xf5\xd9\x00\xbc\x0eS\xef<\xf1\x90S\
-\x02\xcd\x0d\x98\xc2q\xbfq\x05\x5c\xf8\xfe\x0ba-\xe8\
-\xc74B\x0a\xb3\x94\xb2\xd1\x19\xed\x17b,6H\xe7\
-\xb2B!{\xed\xb0T\x16!.\xac\xb3\xa2\xd8\x05^\
-\x06\xaa~\xd4g&\x9aa6\x9ee\xae7\xc7\x5cl\
-\x97\xde\x1c\xb3\xd1\xec\x08P.K\x89\xf1<\x98\x90\xa2\
-\xf8\x7fR\x9f\x07+$U\xb3,G\xc9\xa3\x93H\x8e\
-\x0f\x8e\xb30\xb3\xc0\xe5\xdb.7\x92w\x16\xf8\x0f\xc0\
-\xf3\x83\xae\xd3\x0b1\x9d\x16g\x04p\xde\x87\xa9\xd6\xf3\
-\x1b\xcf\x85\xf3~\xfe<\xd6\xc85\x0c\xf7\x0dM\x89B\
-9\xc1X.k\xa8Z\xe7\x80j\x0c@\xce\x05+\xbc\
-/\xe5\xa7\xca\xe6\xcf\x05\xd0l<\xcb|\x7f\x9e\xb5\xfd\
-\xb5\xb9\x0e\x8ael\xf6\xc9\xccYE\x8a\x22\x07I)\
-\x80X\xce\xb8\x8fe\xdf[\xfc[!\x04\xc7\x06\xc7\xd8\
-\xb5n\x17\x0b\xe7-\xc0\x13\xd6\xe8\xbc\x83\xd0\x92\xb7\xd7\
-\x01\xbfq\xba\x81\xf3F\xe0\x17\x83\xf0\xfe3\xb0>Y\
-Or(1ES\xa53\xe6R\xbf\xeb\x16\xbbwh\
-\xd5\xb6\x99\xeb\x5c\xb80c\xd7F\x8c}v\x7f\xc6X\
- \xfb\xfbn\x16\xc0\x0d\x062\x9e\x1e(\xac\xd3\xc5\xf5\
-\xee\xef\xca\xfbf\xa2\xd9\xfd\x1b\xe5\xa1\xb4\x02a\xa2\xea\
-D\x98\xd6\xbf\xc3\xc0\xdb\x08-Ly'\xf0\xd6\xd3%\
-\x8e/$\xa4\x9c\xf1\xf9\xc0O\xc0\x9a\xe55\xcc\x88\x19\
-\xd2(%\x12Q\xe3\x85\x9dd\xb4^T{\xb1\xca\x9a\
-\x22Q\x09\x08s\x91\x86\xe90\xd7\x22Y,\xc6\x0d\xfa\
-\x15\xb4\x89\x8d\xef\xb8\xeb\xdcd\xe8\x98\xeb\xdd\xa4}\xca\
-\xda(\x03\x9d\x86\x13\xc3\x13l\x9c\xddH\x7f\xb6\xcf`\
-0\x80\xe3\x16\xa0o\xc5\x14\xa5\xf9W\xe8\xfc\x11p;\
-\x1d\x93\x1b\x93\x00\xe7s!\x9a\x86\x9f\x04\x9e\x8295\
-g\x1c\xc4\xf2]\xd6v\x17f\xbf\xd7\xd5\xb9\xa3\xc2R\
-\xca'\xe5\x17\xcf\xf1\x8c\xa4\xb2\xe6J\x8dLK\xfe{\
-\x95\x22\xa5,\xdc\xe9J)\x12]\x0a\xee\xa5I\x1e\xfc\
-\xcb\xd2\x0dY\x96\xdcMET\x95^\x94\xc5q\x13\x90\
-\xdcu\x892\xc9\xd1\xf3f\xcfc\xff\xc9\xfd\xd0\xb3N\
-\xf6ALi\xfbIL\x95\xb2\xdf\xf8<\xa6\x7f\xfe\x94\
-\x01\xe7C\xc0\x95^[^d\xcc\x13Kf\xe9\xad\xef\
-\x91\xaa\x94HF\x05W\xb7\x12\x0c\x15'2\xf76*\
-\xb6\xab\xac\x8dQi\x0e\x90\x84\xa4h\x86R\x9b\x87\xb2\
-\xfbF:\x22QI.\xc2\x0b\xcc\xe4\xd4\xda\xe4\xc9\xca\
-t\x14\x15\xce2\xde\x85\xfcTE]N\x9e\xcfr\x00\
-\xe5n\x973W)i\xea\xb2Z\xaaS\xd6\xf4\xd6\x8c\
-L\xb1\xb4\xe0\x91\xc0\xdbm\x0d\xc2\x83\xdeV\xe3\xe36\
-H\xb8\xea\xee\xf8\xab\x80\xdf\xf6\x8e[\xfe\xbc\x15~\x87\
-@\xf4\x04\xeb\xfa\xeb\xc6<\x9dB)g\x8d7TU\
-xU\xbbTx+\xa2\xa8Ts\xd0\xe6w?\x0e0\
-tu~i\xa0\x06&%`_\xb3\xf4A!\xffd\
-S\x07n\xfa!QNV\xbct\xec\x8c\xc5\x0a\xc9Q\
-=\xced\xee\xab\xd2\x8a\x95d\x85C'\x0e\x8d\xbe\x8f\
-\xb0l\x13\xdb$\xc3\x9d\xde\xe1\xbe\xe7\x00\xf7bf\xdb\
-XU\xc6\xf9\xa4\xf7\x96\xef\xb0\xb1\xe4\xc7\x0dD\xb3\xbc\
-\x8f{\x07\xe7\x94\xed\xd0ue|\xa3jQ&\xb0\x96\
-\xbdV\x99\xa0,(\xe7\x0a\xd4\xbc\x1cB\xa5\xc42\xce\
-\xf7\x8b\xc4\xa86\xa7\xaa\x9c\x22+\xda*\x17i\xd5%\
-2\xabX\xa8\x00\x0c\x95\x16\x97\x12\xf3\xb8\x01G\xf7U\
-\xa3\xf38\xd2\x18\x0d\x1c\xc6\xd4X\xfe\x0c\xf0+\xf8\xb6\
-\xf1|\xcc\xea\xd5\xc1j\x01\xe7C\x98\xa0w\xfb\xf8a\
-\x1bC~\xc4~!\xed\xe8\x05W{dfGi\x03\
-\x82*`\xd8\xf7\xa9H\x89TD**4JE<\
-\xc4\x15\x95\xae\x06\xca\x8e\x1f\x89h\x04\x1a\x8a)\x84\xfc\
-N\xd6\x8c\x99I\xa5\xd4\xd8\x85\x0e\xc9\x84\xe7`\xaa`\
-\xa1T\xa59\x0b\xb9\xd5\x83\xee\xabF\x93\xaa\xb4\xde\x86\
-\xec\x07vY\xcd\xe3\x17\xee\x9b\xb1b\xf9\xcd\xaba\xaa\
-\xae\x04>\xec\xb5\xe5\xb5\xc0\xf567[\xba+f{\
-\xb3\xc42.\xb8\xdb\xb5f\xc6\x8d\x91\x08*\xe3:e\
-W\xbc\xca3+0\x0d#vK\x19\x89\xd9D;\x19\
-\xee\xb2\xa9JG\x1a&\xcfd\x97\xca!\xb2u\x05\xb6\
-Q\xc9\xf8\xba\xb4\xfa\xb8c`\xd3I\xed\xabF\xb34\
-X\xe2\xe8\xc9\xa3\xd5\x01\x15iS\x9aWYm\xf9M\
-o\x93\xf57\xc0\xa3\xd3f\x9c\x1b\xbc\xb6\xdaj\xd9\xe6\
-\x805\x11b\xa4+\xb46^\x81\xd2\x0a\x81h4A\
-.\xab\x08\xe5\x04\xfbT1\xc0\xa6GU\xe4\xa3\xccs\
-\xe9\xc7\xd5/\x91\x8e\x88TD\x22\x92Q O\xc9B\
-\xa4\xba\x10\x03\xca\x98\xd2\xedj\xd05e\xa2\xba\xa8k\
-\x5c&\xca\x01\xa2\x93\x5c\x03\xb9:\xa9\x5c\xf4UU\x08\
-\x96-\x02\xc1\xc9\xe4$\xe8\xc6x\x84\x09\x12\xbe\x093\
-G\xd8#\xde\xd7\xf8\xa2i2\xce\x8f\xe0[\xfa\xf9o\
-\xad(>R\x1d^\x94R\xd2\x8f\xfac\x11``d\
-&\x5c\x06\xa9\xa8\xffuM\xc9X\x06\xba\x04\x98B\x0b\
-\x8b.\xe6\x842S\xe3\x9a\x86&\xc6),\xa9\x15\xc9\
-iq]\xceJ\xa5}\x9a\xd8\xc7e\xaf*\x81\xed\xfe\
-_C5Di\xc5\xc1\x13\x07\x19&\xc3\xfa\x10\xae\xb0\
-\xfa\xa6o\xc3!\xb7\x8c\xb4^KI\xccQ\x9b\x10\x9d\
-\x188\x02\xf8\xb2\xb5\x83\xcd\xe3{m\x04s\xb1>&\
-\xadP\xccD3c\x91\xe1\x82Y\xd2\x14\xcd\x93\x0b\x14\
--j\xc3\xf3e\xa6\xc9Dm\xd6\xeb\x943\x0fi\xa1\
-\x10\xab\xa0+t\xb5V)\x14[\xa5%\xf0\xa8\x8a\xdf\
-\xd9\x82\xac\x0c\x00\x035(\x80\xc7=f\x13#\x15\x8a\
-\xbe\xf4\x10\xad5'\x92\x13\x1c\x5c>8\xf2\xa6\x9a\xae\
-\xdcq\xabwbo\xbf\xe9:\xe0\xd7\xdad\xb5\x0fp\
-\xde\x83O\xcd\xf0\x85\xc0\x8fW\x98\xa8\xd2\x17\xd1J#\
-\xa5\xa4'{\xb9w0\xe66\x97_[\x22\xc4n8\
-\xdf\xf5\x9a4F\xc7d\xa0\xc9\xcd\x8b\xae\xf0d\xca^\
-\x92Nj+\xf6\x5c \x94MN\x06\x18\xf7\xc2\x0f\xd2\
-A\x81\x89\xaa\x98\xac\xce#s5\xcf05\xd7\xf2\xf0\
-\xc9\xc3\x9cX9\xe1\x970\x92\x16<\xcf\xc1\xcc\x7fq\
-\xd8k\x8f\x05\xe0\xff\xb6\xb1I\x9b\xda>j\x09\xafy\
-\xfc;[\xbe\xb5\xaf%\x03\xa6!\x8a\x22\xd6\xcf\xac7\
-\x89\xc5\xa8T\x1bSW\xf6\x19\xc5\xa6\xf4\x22\x1a/>\
-\xaf\xec\xa9r\xb3\xd6Y23\x8b\x0fQ\xdf\x887\x96\
-\x03+\x17\xaaW\x14\xab\x17Zc\xca\xa0\xac\xd0>m\
-K\xd9\x1b\xcb\xd6)\xa5\x18\xaa!\x8b\xc7\x16Q\xa9\xf2\
-\xcf4*L'\xdb\xe3\x84\xf4\xcen2\xd1\xb7n\x8c\
-\xf3\x0b\xc0\xab[\xff\xc4K\x807`\xdaZe\xbb\xe1\
-\xd3\xca\xb0C,c\xc3:Y\x22QT''kM\
-Q\xb9\x82\xce\xd15)N\x14V\x8f\x9b\xa8\x5c\xdbd\
-\x01?\xbb\x14\xdaY\x1c]1T\xc6T$*a\xa8\
-\x87c\xe6\xa4\xaav\xb8l\xde\xf2\xc0ay?5\xae\
-\x87\xaa\x00\xa4\xd1<y\xe2I\x93\xa3\x0a\xf1\x873\x93\
-u\xb1I\xfbx\xf6|.\x00\x9f\xe9\xc28\xb1\xfd3\
-k\x1a\x0f\xdf\xc3\xb4\x81\xad\xb5\xdc\xe4\x93\xa7\xb4 Y\
-\xe8/\xd0\x8bL\x81VUwBm\x91y\x05\xe3d\
-\xec\x92\xb7\xbdT\xf5\x8cKY\xecf(7\xe0\x09\xc6\
-[\x7f\x9d\x9c\x99+\xb4+S\x1cj\xbc\xc7*\xf3\x22\
-\xcb\x8c\xd3\x14\xff\xa9b\x1f\x8d\xe6\xf8\xe08\x87\x8e\x1f\
-j\xd76u\xe7|\xad}\xfd%\xef\xa8\xf2:jj\
-\x95\xa3\x16\xff\xe8\x8d\xad\x87~\x8d\x8d\xdb\xec\xc3\x9f:\
-m`-\xd1I\x9e!\x1fKp\xd6\xfc\xb8\xf9\xadB\
-\xba\xc0e\x1a\xd4\x98\x10\xce\xdfc\xb5\x0cE3R\x10\
-\xc7\x15)\x87\xa1\x1a\x92\xe8Q\xdaa\xa8\x8b\x0c\xe1\x8a\
-\xe4\x82`\xd65\xdeUIH7\xb1P\xaa\xd3Q\x8a\
-Aw,\x86\x11\x98b\xf7\xed\x8c\xe6\xfb\xf2\x83\xdb\x8d\
-\xa1\x8c\xf3\x84\x8d\xca\xd4\x8fy\xccl-\xca\xe6I\xc2\
-k\x1f\x90R\xb2\xa6\xb7&g\x8f\x9e\xec\x11EQe\
-\x95]U\x8bo\xb9\xce8\xafWv*\xfe\xdc\xfcW\
-\x81e*\xf4M9\x88X\x06\xab\xabur\xe6q4\
-N\x1e\xf1.7\xeae\xef\xd3\x22\xd3\x94Y\xa8\xdcb\
-\xa3\xb4\xd15\x87\x97\x0f\xa3\x94\x9a\xbc\x82\xaaom\xc8\
-/\x03O\xb6n}\xdc\xba\xe8\xa9o\x00\xf0\x0d\xad\xa0\
-\x013\x0f\xe8FL\xcbF\xc7\xbb@)\xc5\xf2p\x99\
-\xd9x6\xf7\xb4b\xe2\xb1\xd4@\xac\xe3\xd1E\x92)\
-11))\x91\xfb\xa3\x9d\x9epm\xcd\x93v\x92\xa3\
-zT-X\x08\xf8\x89\xf1I\x06\xc6\xd8\xcf\xe9\x1d\xcf\
-\xd3$\xa54D\xa5XV\xa5\xfe+'\x90\x97\xa8\x84\
-4M\xc7\x83\x86\x96\xf1\x94V\x0c\xd2\x01\xc7V\x8eM\
-\x074\xd8\x1b\xfc|\x9b\xaan\xcf:\xae\xb5\xe1\xdc\x8f\
-\xf82\xce\x8d\xb4\xd5\x10\xcfYm\x131y\xdd\xbc\x8d\
-\xdb\xcc\xc439\xd3\xb8\x1d\x97\xe5.\x84\xfc}T\xf2\
-\x9c\x1c\xd6\x11R\x8cOg\xe22\x8e\xf4\xc8\xa23>\
-/\x8e\xcb4n\xae\xad\xaa\x9c\xa3\xfcZf\xa0$M\
-j\x01\x94\x81fi\xb0d\xfe\xf64['{\xd6_\
-\xfe\x00>\x9d\x12\x7fGEes\x15\xe3\x5c\x80O\xe1\
-\xf9Km\x16\xb6+\xdb\x94=-\xad9\x99\x9c$\x95\
-)\xfd\xa8O\xa4#\x94\x1a\xb5\x94\xa4\xda\xb0K\x81i\
-D\x89e\x88\x90\xda\xf6\x81kQ,\xcf\x10\x12\xa1\x9d\
-\x82w]\xed\x82\xd7\x01\xc7\x15\xc7n\x9c(c\xc1&\
-\xe6qYg,#^\x9a\x9c U\xc6\x9c\xad$+\
-&\xad\xe0\x134\x09\x1d+\xd6\x9e|'\xf0\xe9\xd6\xad\
-\x9f\x87\xe9\xc8}\xa0\x0d8\xff\xdaKh\xbd\xd4\xfa\x5c\
-\xd3\xea\x93\xb0'g\x98\x1a1\xd8\x93\xbd\xa2I\x12&\
-\xc7\xe4\x9a\xa7l\x9a\x92\xfc\xb3\x05Mn\x9e\xa4c\x9e\
-\xc4x\xb7D\xa1\xae\xd8\xa9kv\xf3Tu\xc0qM\
-V\x15\xeb\x14J#T\xd1\xd3r\x01\x94\xa4I\x81\x85\
-\x86jhz\xa9\x92tu@\x93\x85\xf8\x0e\x01/\xc2\
-\xd4q\xb6\x17S\xbc\x1d\xd3S\xd1h\xaa\x1e\xa4\xad\xa9\
-\xee\xb9\xb6\xde\xe3qVgXw=\x13\xc9Q\xe4\x98\
-\xa5\x8aE\x0aI\x14\x8d&\x0e(4\xd5IQ=\xa1\
-\x80\xa8iM\xa93U\xa5\xfeq\xb72\xb0<\x9d[\
-\x9dHv\xcb1\x94R\xb9y\xcaf6\x1d\xa6C\x93\
-\x7f\xd2\xcey\xd0\xabx\x8ew\x00\x7f\xe8\x93\x99b\x1f\
-\xb0\xad\x89q\xae\xc2\xa7\x13\xf3\xc5Vg\xebU\xbc#\
-\x04\xf9\x9d\x18\x89(7S\x05v\xb1\x828\x9f]K\
-\xdaL\xb7v*\x07\xf5\xb8\x99*\x83\xa7\x9c8-\x9c\
-\x5c\x0f\x81\x9cG\x92\xd5x\xb9\x86\x0b\x9eB\x9c\xc71\
-SY\xb2\x13e\xbf{\x198\xab\x05\xa0\x93\x96u\xda\
-\x81\x93\x19\xb6\x9b\xeb\x80s}\xeb!6\x00\x97\xd9\x9c\
-\xc7j\x80F8\xe6O8\x00\xb2\xb5\xbe\x91\x8eF\xfa\
-\x06\x074\xba\x1a09\xeb\xb8\xe5\xa6U\xcdq-\x1a\
-\xc7e\x9c\x8ci\xb2\xc2\xb4Z\x91\xecN\xef\x96\xbdO\
-K.z\x9a\x8en@Y\xc34Y\x15\xa3\x9e\xf2y\
->l\xa3\xc9\xdb\xbd\xac\xc7\x9b\x9a\x80\xf3\xfd\xad\xbb_\
-\x8d\x99\xc4dq\xca\xc0\x11\x15\x0bE\x10e\xd5\x80\xc3\
-t\x98\x03&\xd7:\x22*6\xe0\x89Rt\xd8\xba\xe0\
-nAXV\x22Z\xdb\xabU\x02\x8c\x0b\x9c,\xf0\x88\
-\xa6\xd8\x1e\xa3\x15Z\x8d2\xf2U&*c\xa6<\x98\
-We\x9a\x84\x93,v\xb7\x9b&\xfb\xa4\xd6\xe1~\x9e\
-\x17p\xbe\x0f3\x1d\xdf\x18p\xb6\xe2\xd3Pz\x99U\
-\xe5buY\xa6\x16H\xf6}\xe6\xc5\x0c\xd5\xb0\xd8\xbc\
-\xaf\xc7\x8b\xdc\x0bf\xaa\xa6\xaa\xb0)\x86\x93\xbb\xe3\x82\
-\xea\x16\x1c\xa7&9+\xeb,\xb0\x8ee\x9b\xb1\x9b\xa4\
-\x0e0\x9aqPUi\x94i\x9c\xf7e\x9b\x9cno\
-\x0c\xde\xedzW.p\xda\xa7\x8f]gk;\xa69\
-\xd3\x8a\xf4\x03J\xedzF \xca2\xc1\x99\xbb]\xe8\
-\xe3\x16\xb2\xd6\x9b\xaa\xd47\xe5\xeb\xa4G\xf5\xcbn\x1c\
-\xa7\xce\xbb\xca\x19\xa5|\x5c\x17\x18\xa2\x060\xd4l_\
-^\xd4\x14\xce\xff\x12\xa3'\x93\xeeo\xdd\xfa\xb5U\xc0\
-y\xa5\x17\xdbl\xb2\xc9\x88\xd50M\xc2\x93q\xa8`\
-(\xe7wY\x1dNJ\x9a\xd3\xbd\xabe\xc6@#\x9a\
-\xc5qY\xe7d&\xca\x05\xd3\x18\x0b\xb8\xff\x97.\xb1\
-K\x15xt\x03X\x9an\xbaIM\xd7\xd0\x82\xe6r\
-/\xe0\xbc\x0a\xd3\xb0P\x00\xce+Zw\xbbx\x8a\x14\
-)\x1c\x13\xe5\xcb4u\xbf\xa3\x9a\x89\xca`*\xd4(\
-\xd7\xd1\xbd\x0e\xfc\x1eu\x9f\xeb\xc0P\xc52\xb4\xb0\x0e\
-\x15ByZ\xa6K\xd88\xce\x1e\xccSC\x9b\xc7\xcb\
-\xcb\x1ag\x9b\x85E\xf3\xd8i\xd3^\xd3\xd03]\x98\
-\xa6i]\x1dxD\x8d\xb9\x08I\xf7\xfah\x8c:\xd6\
-\xd1\x15\xcc#\x1at\x8d\x8f\x99\x925f\xab+x\x8e\
-[s\xd5\xa3\xad\x0fk\xb3\x0d\xd9\xdc\x9b\x11~\xfb\x84\
-H\xdb-\xa5\x9d8\xc5\xa0\xc9\xf6\x91-\xebd\xc5\xf1\
-\xdb\xd6\xc9\xd2q\xa4\xc7\xe2\xfb\xf7\x9b\xf6\xf3\xf9^\xb2\
-\xc39\xea\xea\xb0\xacXH\xec\xf2\xda\xfa\x1a\x97q\xae\
-\xf2b\x9b\xf9\x09\x18\xc7\x074\xd2\xd3\x5c51N\x1d\
-\xd3\x08O\x13\xe3k\x9et\xc5\xe7*\x86\x11-,\x13\
-b\xa6|\x1c\x8d.\xcc\xa30I\xeb\x0b\x81o\xb4n\
-}\xa5\x0b\x9c\xab[7\xdf6\x01\xa2E\xcd\x9d5\x89\
-\xa9j\x02\x8c\x0fh\xba\x9a+\xdd\x00\xa0:\xd0\xd0\x00\
-\x10\xd1\x10\xf0k\xf2\xa8\xea<\xab\xae\xe0I\xadUi\
-\x1f/p\x81\xd3>\xf3\xc4\x05\x96\xd2&u\xb7\xbb\x98\
-\xaaI\xf5N\x13\xe3\xb4\xb5\x97\xe8\x16\x01,\x1a\xde\xeb\
-@\xf7\xdb7\x86S\xe5Y\xa9\x09\xc1s\xb2\x9c\x8d\xaa\
-\x1d\x97f\xc0\x99\xb1\x86\xa8~D6\xd5\xb0\xd2\x81i\
-B@\x13\xeaa\x852N\x17\xb6\x11\x1e\xacC\x8d\xbb\
--:\xb8\xdf\x93\x9a\xa9\xae\xe0\x19\xd8\x8c\xc0\x1a\xda\xea\
-\x91\xb7\x03\x9bc\x1b\x11\x5ch\xdct\xa3\xddb\x18\x08\
-\x1a\xe9\x01\x1a\xe9\x11\x08\xac\x8b\xddta\x9cI\xb5\x8e\
-\xae0S4\xb8\xddm\x1a\xa7j]\x93\x99R\x0d.\
-\xf9$\xe0\x19\xdak|>m\xed\xc2\x12\xb84\xb6\x1e\
-|\xf3\xd8ds\x1aG\xa6\x08\x9aIM\x96\xaf@n\
-3Q\xa2\x03\x8b\xd6\xb1L\x1b\xe3\xf8\xb8\xde\xb4\x98)\
-Y2e\xaa\x05<\xc23\xce\xa303\x99n\xc0\xa7\
-\xcf|w\xece\xd9\xd6\xe1?=A\x88\xeb8-\x0f\
-\xab\x8b\x99\x9a\xc4\xb3\xaa\x13\xc8M1\x1b*\xde\xab)\
-\x98)\xd1\xc2<\xee\xfb\xb6I\x0a\xa2V\xdb\x93\x8d\xf3\
-c|\x9eV\xb76@\xacM\xca\x22\x92\xe9\x88\xe4&\
-\xc6\xe9b\xaet\x8bK\xae\x1b\x5c\xec:\x8d#\x1bL\
-WW\xf3\xd4\xc4\xae\xda\xe3\xda\xcd{\x01gsl\xc9\
-\xa9y\xcc{\xde\x91\xd2\xc3L\xc9\x09\x01\x13b\xb2\xba\
-\x82\xc7\xe7\xce\xd6\x1e1\x9c\x90\x14\x83ONJ\x06\x80\
-\xa7\xea\xfb\xd5\xed\xef\xba\xe4~\x8c\xb3\xd1\x0f8k\xa8\
-\xe8\xac\xa9a\x1a\x19\xc8&\xd3\x0a\x0aN\x0a\x9eI\xe2\
-8!\x8c3\xa9\x17\xe5\xabm\xea\xcc\x95h\xf8\xbb)\
-m}\xbb\xd9X\x881\x0dW\xcdc\xb6\x05\xa9>\xa0\
-\x08\x01\xcdj\x99\xab.\xb1\x1c\x9f\xc8\xb1\xf6x\xf5\x11\
-\xc6!\xe5\x13M\xf1\x9b2#V\xb1\x8en\x10\xc8\xed\
-cm\xec\x85\xb1\xbe\x07pB/\xb2<E\xe6JT\
-\xfc\x9f\x93\x80\xc7\x87q\xda\x5c\xf1\x103\xd5\xc42M\
-\xac\xd9\x06\xa2\xba\xca\x00?'h6\x0b\x00\xd2\x1a\x00\
-\xd4\x9e\x91\xe1\xba\x8bw:\xdd\xf3&\xe6\x99&\xe3T\
-i\x9bi\xe6\xa4dG\x13U\xe5\xa2W\x1d\xcb\xbf/\
-\xbd\x1f{aLtd\x1a_0t\x01R\xa8\xde\x09\
-\x0d\x06\x86\x04\x01\xdb\xb4M\x9b\x99R\x0d&K\x05\x9a\
-(\x9fx\x95\xf0L\xa94@8\xa6k\x01bW\x17\
-[\x9eB\x93\xd5\xc5\xbb\xd2\x0di\x06\x9f\xecw[\xed\
-M\x15@\x9a*\xf9d\xa0\x89\x9a\x148\x9e\xb7N\xec\
-\x95HP5\xff\xe84\xb2\xdb]\xbd,\x98, \x18\
-\x1aI\x165A\xbcr\x00\xb0I8w\xedR\xe8\xca\
-2>\xc0)\x83\xc7\x8fF\x92\x18\x9f\x09J\x92\x1a\x91\
-9)\x18|\xd9\xc7GKI\xcf\x14D\x1bHD\x80\
-0n\x13\xc7\xba\x01\x84u&I4\x5c\xbcP\x96\xa9\
-\xfa\xae\xba\xe6\xdcd\xcc\x97z\x01g\x10c\xea\xdc\x9b\
-\xc7JI4M\xca*\xd3\xd29]Er\x17\xf0h\
-j\xbb<\x83t\x8dh0I\xbac\x1e*\x048e\
-\x00\x95?\xfb%\xb2\x97c|\xe6\xa1\x5c\xa6\xbd\xefI\
-N\x09@\xa1`c\x0a\xe0\xf1\x11\x85Mu8\x10\x9e\
-\x09\xef\x9a\x87\x12\x9eA><o\x18Q\xf2\xb4\xfcJ\
-\x83\x97\xfc\x80s\xbc\xe2\xee\xa7A\x80N\x0b\x14]4\
-PSP\xd0\x87qBLU\x97\x80_H\x9f\x94\xec\
-\xc8:\xa1\xc0\xc9\xfeo?\xfb\x03p$\xc6wB\xaf\
-\x94\xe9V\xed\x9d\x0aO\x0b\xc2\x93\x9em\x0c\xd0\xe4v\
-O\xca8m\x99\xee\xaeB\xb8\xc9\xfb+\xebD\xbff\
-\xcb'c\xcc\x94\xd6-\xc4T\xb2\x89\xa1\xd5y\x92n\
-\xe5\x14!\xb9/\x02\x00\xb4Z)\x07&\xccI\xc9\x1a\
-\xf6\x09\xc9CU\xad+\x07\x02\xdd\xb4CY\xe7\xf85\
-#\x1c\x8c\xf1yZ\xc8aLiaT\xf1\x0f\xb5\xd9\
-\xcci\xc7x\xa6i\xae\xba0\x8f\x0e`\x22\x9f\x9c\x94\
-\xf2\x8c\x12\x87\x98(\xdf4H\xf9\x5c%\x98\xc9\xb2\xda\
-\xc7\xe31\xa6!B5\x06\x9b\x0fZ\x0a[k\x01$\
-*\xc2\xd7\xa1\xcc\xb2\x9a\xb5:\xbeZ\xcc\xc7\xcdm\xd2\
-7M`\xc23\xcd\xd0\x94\x87\xf2IZ\x86\x0a`\xdd\
-\xa0o\xb2g{\xb6\x8f\x87$\xa6c\xf8\x89V\x8ds\
-\x8c\xd1\xc4\xfcUf\x82@\xc1L@n\xcb\xc7d\x85\
-\xa47B\x1a\xe4B\xf7\x93S\xfa\xbf\x9a\xce\x07\x1do\
-\x94&\xef\xb7\x8f\x99\xe0\xfcP+h\x8e\x01\x0fg,\
-\xf3p\xeb\xe6\x070M[u\x81@\x19\xf0e\xa6Q\
-f\xe1\xdb\x05Y\xd7QY\xd5uY\xb7\x8f\x0fH\x84\
-'\xe8\xa4\x07@'1\xd5u\xecO\xcb\x0d;k\xdd\
-\xa4\xf6\x00\xe0\xb7\x80A\x06\x9c\xbbZ7_\xc4\xf4\x16\
-\xb7y'\xa7\xc2$\xb5\x9d\x5cZNh[\xdbo[\
-K\xafh\xd8\xbe\x0a\x884\x00MNx.\xc0\xbf2\
-\xa0\xe9<\xcd\xdak\xdc>\xee\x81Qf\xbc\xfdIF\
-\x8f;\x02\x99\x0e_\xa4k\xa49\xc4U\xef\x12\x0c\x0c\
-\x0d\xd7\xd7\x89\xd0I\xdcp_!\xdc%\x22,\x1a\xdc\
-\xf2\xf2\xba\xc7\xbc\x80s\xb7\x0b\x9c\xf6G\x9c\x7f\xd3\xda\
-\xbfY',-<ip5#\xcd!\xc7\xa1\x03x\
-\x9aR\x0e\xd3,\x0d\xf5\xc9C\xd5\xe5\x9b|\x05q\xdd\
-\xba\x18\xd3\xfa\xb4\xd7\x9fq\xa4\x03\x9c\xa5\xd6\xb4\xc3c\
-\x8c\xaa\xe0\xa7\x15\xbd\x9d\xc4\x84\xc9\x06\x01\xd8\xa6\x8b\xda\
-L\x95\x088fW1\xdc\xd5c\x9cF\x85\x80\xfb~\
-\xde\xbaG\xed\x1eU\x0a\xdc\xe6\x02'\xc1<\xe2\xbcy\
-<\x8c)4\xf5\xd58\xab\x99\xb7\xf2\x11\xc0mS\x8d\
-H\x8fc\xb5i\x22_q-\x09\xef\x15\xf3\x0d\xacN\
-rSb\x81\xf3\xb0\x17\xdb\xdck\xb9\xa9\x10\xbb\xf9b\
-\xebn\x0f\xd8$X\xc4tjo\xa6]*\x1a\xe2\xf2\
-JO\xcf\xcaw\xff\x10\xb1+\x03\xbd\xa8\xd50\xcf\xee\
-6)\xa5\x09\xf7k\xc7\x17]\x19\x96\x8d\xcf\xb7\xee\xf6\
-\x0d\xcc\xb3\xc4\xe7\x03h\xd0\xe7Nh\x8b9T\xbd\xa7\
-\xc5\x1c\xf9\xba\xe1\xa2\xc5U\xf6e\xacI&Bj\x8a\
-\xdbter<\xa5\xc3Z+A\xfc\x80\xf3\xf9*\xe0\
-\xdc\xda\x1ap\xd6\x16<\xeb<M\x14\x9ez\xa7..\
-\x02aIS\x9f \xa1\xech\xae|\x18\xc7\xd7Lu\
-\xa9Ij3G\xb4\xc8\x87\xbau\xeb\xed5m\x7f\x9e\
-\xc3\x10\xe7\xa1g\xe54C\xfbl\xb7w1\xf6 z\
-\xaf\xa81\x01\x14\x0a\xab\x93~\xf0\x8d\xe9t5s\xa1\
-1\x19\xd9\xf1\x7f\x0e\x15\xc8My\xb8(s\xb0[\xc7\
-\xdf\xe2L\x80R\x06\xce\x9fz\xc9\xa3\xbd\x14\xdb\xf8\xda\
-\xcaJi\xc8oua\x97\x90\xc8r\x9b\xb9\x12\xf8\xcd\
-\x03\xe8#\xac\xa7\xe9\x19\xfa\xb8\xda\xd0\xde\xcd!Z\xcc\
-\xd4\xa2W\xf8w\x0c\x1be\xe0|\xdazX\xf5C\x01\
-_e\xd48\xdc\x84p\xdf\xbb\xa0\x09H2\xc0n\xfb\
-\xb2\x86\xf4\x10\xaa!\x8c\x13\xa2\xaf\x9a<\xa4\xaeA\xd3\
-6IP\xb5\xaf\xc6\xcc\x85s\x17\xbe\x13f}\xaa\x09\
-8\xcb\xc0_\xb6\x1e\xe2\xcb6!6\xe3\xc14>f\
-\xc8\x17Hm3\x8av\xa1\xfci0\x8e\x8f\xbe\x9a\x86\
-\x99\xf5\x8d\x90\xe3\x01\x9e\xacM\xe1K^\xa0\xf9\x12\xa5\
-\xe9\xb3\xabJ)~\xaf\xf50\xfb,\xebl\xf1\x88\xc0\
-v5C]\xbc\x09\xd9\xc1\x5cI\x8fDd\xa8\xe0\x9d\
-\xa4\x82\xd1W\xfb\x11\xc0BTD\x9e\xb7`\x1e\x9a\xf8\
-M/\xe0\xfc~U\x96\xa4<\xfe\x1a\x9fr\xd2\xcf\x95\
-\x8e\xd0e\x96,_\xb0L#\xca\xec;G\xb2\xf4d\
-(\xd1\x12h\x9cd\x12\xf0In\xa8\xb6\xf3\x9f]\xb3\
-\x19\xe0o\xbc@\xb3B\xc5c_\xeb\x8a\xb7\xfe\xa0\xf5\
-p\xf7[\xc4nm\xb8#\x08\x00\x10t\x0b\xecM\x12\
-plKMHO\xc0\xac\x86\xe7\xd75}\xe0s\xee\
-7\xdb\xb4\xf6\x9d^\xc0\xf9X\x95\xb3^\x07\x9c\xdf\xf4\
-:\xe4\x9f\xdb\xa4\xa7\xe8\xc0:]E\xb4\x8ff\x09\x89\
-\xe3\x08\x0f\xa6\xe8\x1a\x97\x99\x04$!A\xd5&\x89P\
-\xe5\x8a\xaf\x03\xfe\xc2;\xfd\xfaku\x09\xfd\xaa\xf1\x18\
-\xf0\x99\xd6C\xfe\x9d\xd5:\xdb\xa9\x9e\xea\xac-\xd3+\
-:\xb0\x8do\x9c\xc8G\x9cv\x99\x8e_N\x01P\xa1\
-q+:\xbc\xaf\x03\xd9V\x1bR\xb9\xd9\x0b4\xb7\xd7\
-\xc5\x94\x9b&\xb5\xf8\x05\xafC\xdf\x80)\xf0\x8a;\xea\
-\x9c\xa6\xbb\x08\xba'=\xbbLT\x19\x92j\xe8\xfaL\
-\x0a\xdf`\x1e\x1d\x01\xd3t\xde\xa5M\x17}\xc2\x9bm\
-\xdeS\xf7\x0b\xd9\x12#\xbe\xbd\xf5\xd0\xf7\xd9@\xf4N\
-Fe\x87u\x17\xdf\x07@\xa1\xde\x14\xf8\xf5n\xf9\xa4\
-\x13B\x92\x9b\xa1\xc9\xd4\xd0\xf9{B\xcdV\x1b\xd3+\
-\xcc\xb3\x1an\x05\xfe\x9f\x17h\x1e\x04\xbe\xd0\x058\x00\
-?\xe7\xf5'>l#@\xf3\x9e\x11M\x1f\xcdC\xcb\
-\xb6\xa1\xe6\xca\xa7\x86W\x06\x82\xabk.\xca\xd73\xf2\
-\xd9\xce\x07t`\xea\xc55\xe6q\xd1~\xe3]M\xbf\
-l\x03\xcem\xc0\x1d\xad\x7fb?\xf0q\xcb:u}\
-G\x04\xb0\x0c-'\xa8\xcb\x85\x91\x1d\xcc\xd5$s3\
-\x87Dw\x9b\xbc\xd2IDp\xf6{e\xaf\xcd'\xf1\
-\x99\xfc\x1a\xe0\x1fm\x16\xa13p\x00~\xca\xebO\xfd\
-o\xe0\xeb\x8ePnb\x0d_\xcd\xe3k\xd2\xf0\xb8\x80\
-t0W!I\xd06\x86\x98$7\xd7\x05@\xc21\
-Q[m~\xf1\xa3\xdel\xf3\x8e\xb6\x0d|\x80s\x97\
-\x97\x87\x05\xf0\xeb\xd6=\x9fc\xbc\xce\xd5\xd7\xe3\xf21\
-S!!\xf7PF\xf1m[\xf1y\xf8Y\x1d`B\
-5KW]\xa31\xfdR\xeb\xed\xb5\x19x]\xc5\xaf\
-4i\x9b\x10\xe0\x00\xbc\xcdk\xab\x7f\xb0\xc1\xe9\x8b\xa8\
-\x7f\xb0\xa9\xcfg_35\x89\xa8\xf6-\xb7\x08a\x1c\
-\x9f\xac\xb6/\x9b\x840v\xdd>\x1a\xf3\xa4\x8e\x8f\xe2\
-\xd3\x8e\x90\x8d\x1f\xf5\xd9(\xf2<X\xd6\x8a\xfe\xca\xd6\
--\xbf\x8ey\xde\xdeU\x98\xae\x88( \xd9\xe7S\x8e\
-\xd9\x96\x9c\xf4-\xf1\xf4i\xbc\xf3\xe9;\xaf[W5\
-\xcam\xc3:\xf0w\xba\xe2}\xdd\xe7\x04\xf3\xa8\xc4{\
-\x81_\xf4\x06\xcdo\xdbHq\xeb\x08}v\xca\x22\xe6\
-\x91g\xcdc\xa3Ey\xcff\xbdb\xc2\x8b\xbe}\x12\
-\x90rJ\x00\x12\x0d\xde\x08\x15\x17\xb4\xfc\x00U\xf7\xbd\
-\xfb\xda\xb6N\xd5\xac\xd35\xbfk\xdb/\xfb\x9cX\xf3\
-\xd4\xb7\xfc\xe1\xd7hw\x14\xf3\xc4*\xaf\xa6\x1e\x19\x08\
-\x9c\xeb\xbd\xb6:\x04\xbc\xd7\xfe\x1bkk\xe0\xea;\xa1\
-Q\xa8\x06\x9a$\xef\xe5\x9bU\x9fV\xffV\x88f\x11\
-\x9e\xe7P[\x9d\xb9\xc52\xcd\xa2\xf7\xb5}3\x01\x9d\
-`\xa1\xc0\xb9\xcd[\x9b\x7f\x0d\xf8o\x98\xc7\xa8IO\
-\xbe\x13\x01'\xd7Wd\xfb\x96!L\x92\xdd\x86\xc9\xd2\
-\x01>B\xb7m\xbd\xdbd\xb7\x07\xf8-L\xdd\x94\xdf\
-\xf8\x0c\xf0W!@\x08\x05\x0e\xc0\x8f\xe13\xa7\x016\
-n\xf0\x09\xe0\xb2\x0e\xfa\xc0\xf7\xc4\xfa\x0a\xc6.\xe5\x9c\
-\x93\xe4\xa1B\x01\xd3\xb6\x0d\x1e\xe7P\xdbs\xfd\x97\xc0\
-\xff\xf2\xbe\x9e+\xc0\x0f\x86\x82\xa0\x0bpR\xe0\xf5\xde\
-[\xff*\xa6\xc2\xe7R\xaa\xe7KnSZ\x22\xe0\xc4\
-\xf9\xd0\x7f\xd7Bv\x1f]\xd4e\xde\x9d\x90m\x9a~\
-\x97\xdas|KS\x86\xa9r|?\xbe3\xffu\xf0\
-\xaa\xaaD\xf2I\xe0:\xaf\xad?\x87y@\xf5\x0b0\
-m\xa6Q`\x1c\xc5\xa7\x0e&\xa4 =\xb4\x11\xcfg\
-B\xc9:oH\xd7\x88k<\xbc#_ojhA\
-s\x0f\xf0o\xf0\x9d\xab\x18+&\xfeg\x17\x00t\x05\
-\x0e\x16\xdb/\x01.\xf1\xda\xfa\xb3\xc0\x0b-\x80\x9ed\
-:\xcf\xb5\xea\x022\x1f\x0f\xac\xc9\x1d\xa7\x83k\xac\xa7\
-\xb0\xae\xee\xb8\x89\x05\xcd\xbd\xc0O\xe03\xdd\xb9\xabW\
-\x7f\xa8\xeb\xc5\x97L6\xde\x88\xcf\x1c\x82\x19\x95\xbe\xdd\
-\xc6%\xaf\xa8\xb8[\xbb\x04\x07BtS\xa8\x98\x96-\
-\xe0\xe9\x22v\xbb~Gj\xfc\x9d\x14\xb8\x1c\xf8{\x1b\
-\xa2=\xee}\xb4\xc3\xc0k'\xb9\xf0\x93\x02G\x01\xaf\
-\xc0\xfb\x09\x00\xc0\x8fcj]\xaf\xa4\xf9qF\x93\x9e\
-\xf4.z\xc2gfS\xdf\xffC\xac\x02\xf8\xcb \xba\
-\xd2\xde\x88o\x09V)\xdf\xddE\xd7L\x138`\xea\
-\xe4\xaf\x0b\xbas~\x1aS\x00v\x05&\xaf\x95r\xfa\
-\x86h\xf0\xe8\xe4*\x00z\xd2\x91b\x0a\xcd\xaf\xc2\xe4\
-\xaf\xdf\x12d\x9e\x00~\x00\xdf\xde\xcdU\xd28\xee\xd8\
-\x8b\xc9T\xfd\x0b\xef=\xbe`\xbf\xf0\xeb\x18\xcd\xe8\x1d\
-\xb1zu\xbc\x93\xd4\xfeNK\xb3L\xba\x7f\x82y\x06\
-\xfc\x85\xc0\x87l\x905l\xfc4!9\xf2S\x00\x1c\
-\xac\xa5\xdd\x0f|\xaf\xf7\x1ewb*Z\xaf\xc3$2\
-\x0e\x05\xb8\xbc\x93>\xaf\xd3\xa7*/D\xf4\xae&\xa0\
-\x94e\x9a,\x98\xfa\x1f\x09)\xc8\xca\xc6\x7f\xc6\xe4\xc8\
-9\xd3\x80\x93Aa)Hx}\xc3q\xd7_\x88\xc9\
-\x98\xa4\xa7\x10 m\x9e\x13\x1d<\x9di\xaeK-#\
-_\xe1xN_\x0a\xbe.\x1f\x00\xde?\xcd\x0b=m\
-\xe0dn\xde2\xf0\x1a\xef=\x8e\x00\x7f\x8c\xc9k\xbd\
-\xda\xda\xf0\xa7J\xa6\x8bU\x02M[\xa4\xd6\xbd\xeb\xbb\
-\x02\xa8+x\x86\xc06k\x9a\xfe\xc8z\xa5\xfb\x82\xaf\
-\xc7\xaft2j\xa7\x018`J\xa2\x0f\x07E\x98\x01\
-n\xc2\x14\xbf\xbf\x10x6f*\xe6!\xfeS\xd22\
-\x05\xc0\x88\x06s\xd2\x06\x1a\xa6\x00\x96\xcc\xfb\xec[W\
-\xfb\x09\xe0\xdd\x98N\xb7\xf0\x87`\xbe\x17x\xdfj\x5c\
-\xe0\xd5\x02\x0e\x98\x0e\x89G\x80\x7f\x16\xb4\xd7C\xc0\xff\
-\xb1\xde\xd6K1Y\xde\xa7\x18=\x00l\x1a\xac\xd2\x96\
-\x92\xd0-\xe6JQ\xfd8\xc5I\xd9'eT|\x95\
-\xb5\xb1\xfc\x14!EX\xee\xf8Y\x1b\x19>e\xce\xe8\
-\xb4\xc7\xeb1=\x9f\xbd\xe0=_\x8c\xe9\xb3x\x1df\
-\xee\xc1E\x0b\x9e\x08\xbfI\x02|\xeas\x9aj\x94\xeb\
-\xc0SW\x87\xd3T;\xd3\xf49\xb5\xaf\xdb\x81\x05\xeb\
-q\xfe:!\xd9\xed\xf2\xf8\x97T\xf4{?\xdd\x80\x83\
-\x13u\xd8\xddi\xef\x1f\xb0w\xde\xb5Vz?n\xd7\
-\xc7\x81\x00\xf2-\xe8\xaa\xd39u\x0f'\xf3)\xe4\xaa\
-\x02O\xc60[1\xb5Kw`Jo?\xd1\xf9<\
-\xef\x07\xbe\x0f\x9f~\xb8\xa7\x09p\xb0\xd2\xf7S\xc0\xf7\
-t>\xc2[\x80\xb7\x02\xd7X\xed\xf3\x98\xd5\x03q\x07\
-\xc0\xf8>{B7\x80Gu\x04Pj\xff\xfevk\
-\x92\xef\xb4\xd1\x95?\x9c(\x18z\x0b\xf0\xcf\xf1y\xfe\
-\xd8\x19\xaeq\xcac\x88\xa9g\x8d\x81\xef\xeat\x84\xbb\
-\x81\x8f0\x9a\xc0\xf2\xd9\xd6\xe3\x180\x9aUJ\x96.\
-\xbco\xc9C\x1d\xc3\xe0!z\xdb\x16\x1c\xd0\xcc\x03\xcf\
-\xb2\xb7\xd1\xad\x98\xb2\x93wa\xba+u\xe7s\xfb\x1b\
-\xd6<-\x9f\xce\x80\xfb\xa9\x18o\xb0\xf7\xd7\xb6\x89\x8e\
-\xf2JL1\xebu\x98\x0cqb\xc9\xfa\x84\x03\xa2&\
-]CIp\xcb\x06\x0f\xab\x0d0ML\x93\x95r\xf6\
-1\x13Q\x7f\xc1:\x00\x9f\x9b\xf8<>e\x9d\xf4O\
-\x9e\xea\x0bx\xba\x80\x83\xb5\xea\xbf\xcb\x04\xa9\xfd|l\
-\xb3\x12\xfc\xb5V\x07\xed\xb2\xdfl\xc9\x06\x14\x87\xb4\xf7\
-L\xe1\x11\x08l\xd3:\x19Pz\x96\x11\xb3\x96\xe8\xc7\
-0\xc9\xc8\xbf\xc6\x94\x97<:\x95\xf3\xf7i\x0b\x9a'\
-N\xc7\xc5;\x9d\xc0\xc9\xc6\x9b\x80\xff\x0e\xec\x98\xca\xd1\
-.\xb2\x1a\xe8;\xadWv\xb9\x85hv\xd1\x97-#\
-%\xa5\xb3\xd0\xf6xE]c\xc2b\xabS\xd68\xfb\
-\x1e\xc3\xb4\xec\xdfi=\xa3;l\x98a:\xe3\xa05\
-n\x1f>\x9d\x17\xedL\x00\x0e\xf6\xb4\x7f\x10x\xe7\xd4\
-\xbf\xdds\x81\xe7[=\xf4\x1c\xcbF;(N\x900\
-\xc98\x81\x99m\xfe[\x98l\xdd\xd71\xf3\x06\xddM\
-\xdb\xfc\xad]\xc6\x1f\xd8p\xe0\xa1\xd3}\xc1\xce\x14\xe0\
-\xb8\x91\x9b\x0fb\x12\x0f\xab3\xd6\xd9\x00\xdbE\xd6\xab\
-\xd9\x8aI\xb0n\xb6\xf0\x9dc4\xdf\x0f\xd6\xcb\x19Z\
-\x80,c\xaa\x17\x1f\xc3\x84\xfe\x1f\xb7!\xce\x87\xb1\x8f\
-\xc6X\xb5q+\xf0\x9f\xe8\x92\xa5z\x86\x8d\xeb\xed}\
-\xab\x9f\xe1\xcb\xfd6\x08qn\x04\x8e\xb7Z\xd2\x7f\xa6\
-\x01\xe6\x01\xe0'\xcf]\xfe\xc9\xc7\x0fbR\xa0g;\
-`\xber\x8eaVO\x03\xfd.&\xf3~\xb6\x80e\
-\xc9\xc6\xb4^~\xee\xf2\x9e\x9a\x18\xd0\xdbld\xe4\xe9\
-\x0a\x98\x1b1\x19\xb8\xf3\xcf]\xce\xd33.\xc6\x94\x10\
-|\x16S\xc5|\xa6\x02e\x88yP\xd8\xbb\x185E\
-?m\x878\xcb@\xb4\x0dx\x99u\xe7\xaf\xc1\xf4\x8e\
-\x9e\xce\xefx7&S}#ff\xe1\xc5\xb3\xe5D\
-\x8b\xb3\x9c\x8dv\xda\xb0\xdf\x8b0]H\x97c:O\
-\xd7L\xf9\xef\xac`&\x5c|\x00S\xc3\xf8ULC\
-\xee\xde\xb3\xf5\xc4\x9e\xed\xc0\xa9\x1a\x9bl\xc8o\x87\x0d\
-\x03\xee\xc0L\x05\x95e\x97\xd6`\xca\xa9\xd6\xdb\xf3s\
-\xd4.\xcb\x8c\xb2_\x87-{\xec\xb5\xaf\x8b\x9c\xa2r\
-\x863e\xfc\xff\x01\x00;\x1e\xe6.\x87\x062\xaf\x00\
+F\x00\x00.\xe2IDATx\xda\xec\x9dy\xbc$\
+Wu\xdf\xbf\xf7VU\xf7\xdbf\x1f\xcd&Fh$\
+\x8d6\x18I\xc86\xc4,&`\x88q0\xc6\x18\xe4\
+|\xbc\x02\xb6\xe3}I\x0c\xf2\xfeI\xe2\x18\x93\x8fM\
+\x82c'1\xc4vL\x08\x8e\x89\x1c\x13b\x10\xc1`\
+d@\xc6\x0ek\x10H\x80\x00\x09\xad#\xcd\x22\xcd\xfe\
+^\xbf\xee\xaa\xba7\x7f\xdc[U\xb7\xaak\xb9\xd5\xef\
+\xcdHHs?\x9f\xfe\xf4V]\xaf_\xdd_\x9f\xf3\
+;\xbfs\xee\xb9\x82'\xcf\xd8\x05\x5c\x09\x5c\x05\x5ca\
+o\xbb\x80\xdd\xc0<\xa0z\x9cK\x021p\x048\x04\
+|\x05\xf8*\xf0%\xe0N\xe0kO\x86\x0b*\x9e\xc0\
+\xff\xdb\x01\xe0\xf9\xc0\xb3\x80\xeb,X\xa2s\xf4\xb7\xef\
+\x01>\x07|\x12\xb8\x15\xf8\xbb\xf3\xe0y|\x8fM\xc0\
+\x8b\x81o\x05\xbe\x05\xb8\xfaq\xf4\xdd\xee\x07>\x06\xdc\
+\x02|\xd8\x82\xeb\xfcx\x8cG\x08\xfc\x00\xf0?\x80\x13\
+\x80\xfe:\xb9\xfd\x0d\xf0\xd3\xc0\xf6\xf3Sx\xee\xc7\xd5\
+\xc0\x1b\x81\xfb\xbe\x8e\x00Sw;\x05\xfc\x17\xe0\x05\xe7\
+\xa7\xf4\xec\x8e\xfd\xc0O\x00\xef\xfb:\x07L\xd3\xed3\
+\xc0/\x03\xdf|~\xaa\xd7o\x5c\x04\xbc\xe3\x09\x0a\x98\
+6\xb7v\x1eDk\x18;\x807\x01\xe3'\x19p\xdc\
+\xdb_\x00\xdfx>\xda\xf2\x1fC\xe0\x97\x80\x1b\x81\xa5\
+s\xf2\x17\x03\x98\x0f`8\x94\xccK\xc9\x9c\x12\x04\x80\
+T\x1a\xa5\x15\xb1\xd2\xac*\xcdJ\x0c#\x0d\xc9\xb9\xbf\
+&o\x03~\xc3r\xbc\xf3\xe0i\x18?`\x89\xf0\xde\
+\xf5\xfe7\x83\x0dK\xec\xda\xb2\xc8\x9eM\x1b\xb9p\xd3\
+\x22O\xd9\xb4\x81\xadsC\xb6,\x0c\xd94?\xc7\x92\
+\x0c\x99\x1b\x86\x0c\x83\x80H\x0b\x02-\x10Z\xa3\xb4&\
+\xd5\x9a\x89\x8a\x19\xad\x8e\x18\x8d&\x9c\x1e\x8d8\xb6r\
+\x86\xe3\xa7V8|\xfa\x14\x0f>z\x92{\x8f\x9d\xe2\
+\xc11L\xce\xde\xb5\x89\x81\xdf\xb2 :\x0f\x1eg,\
+\x01\xff\x0dx\xc5\xba\x9c-Z`\xeb\xee\xed\x5c\xbe{\
+;\x97m\xdf\xcc\xa5[7q\xd1\xc6%v--\xb0\
+u8`1\x8c\x08\xb4 \xd5\x10\xa7\x9aXk\x12!\
+P\x1a\x14\x02-\x05Z\x00B \xec-\x10\x92@\x06\
+\x04\x81$\x92\x82P\x0bBRd<au\xb4\xcc\x89\
+\x93'9t\xfc\x18\xf7\x1f}\x84\xbb\x0e\x1d\xe5\xceC\
+G\xb8\xf3\xc8\x19\x8e\xac\xff\xb5\xba\x1d\xf8^\xe0\x0b\xe7\
+\xc1\x03?\x03\xfc*&M0\x9b\xd8\xb3q;K[\
+6p\xf1\x05K\x5c\xb3s\x07\x17m\xdb\xc6e\x17l\
+\xe4\xe2\x85!\x8bZ\xc3$e\x92(F\x0a\x12!Q\
+\x81D\x04\x01RJ\x84\x94\x08!\x0cP\x9c\xc7\x08\x81\
+@\xd8+\x94]&\x8d\xd6\xda2\x12\x8d\xd6&\xa3!\
+\xa4$\x0c#\xe6\xa2\x88\x05)\x88\x92\x09\xab\xa7Or\
+\xf8\xc8\x11n\xbb\xf7\x01n;z\x9c\x83G\x1e\xe1\x0b\
+\x0f=\xc2\xa3\xebw\xdd\xde\x08\xfc\x01p\xf0\xc9\x08\x9e\
+\x7f\x00\xfc\x09&\xd7\xd4{\x0c\xe6\x16\xd9\xb4g/W\
+^~\x11\xd7\xef\xde\xca\x95\x1b\x86\x5c<\x17\xb0I\x81\
+\x8a\x13\x92\x14V\x09H\xc3\x10\xc2\x00)\x03d \x11\
+2@\x06\x81\x01J~\x0b\xac\x95\x91\x08)r\x8b\x93\
+_\x9e\x02;\xe6N[>\xab\x0c\x80\xb4\xd6h\x95\xa2\
+S\x85R)Z+\x84\x0c\x98\x1b\x0c\xd9\x18\x08\x22\x95\
+0Y^\xe6\xe0C\x0f\xf1\xe9\xbb\xbe\xc6G\xee\xbc\x9b\
+[\x0f\x9fX\x0f\xee4\x02~\x0a\xf8\xafO&\xf0\xfc\
+\x22\xf0\xdb\xb3|p\xf3\xf6\x9dl\xbep/\x97_\xb2\
+\x9bg\xed\xd8\xc8\xd5\x91b[\x123P\x92\x91\x0e\x99\
+\x84!\x22\x0a\x91A@\x10\x84\xc6\xc2\x04\x01\x22\x08,\
+p$\x22\x08s \x09!\x11\x81\x04)\x8d\xa5\xc9\xac\
+\x0f\x02!\xaa\x97H\x1b\xfchc\x81\x84\xd6h\xe5\x80\
+G){KQiv\x9f\xa2\x92\x04\x0d,\xcc\xcd\xb1\
+m\x10\x92\x9e:\xc1\x97\xef\xb9\x97\xff\xfd\xa9\xdbx\xcf\
+]\x079\xbd\xf6\xeb\xf9v\xe0G\x80\xf4\x89\x0c\x9e\x01\
+p\x13\xf0]}?\xb8}\xd7\x85l\xbdh\x1fW_\
+\xbc\x83\xeb6F\x5c\xc2\x98=\x1a\xb4\x8a8\x13\x86\x10\
+\x86\x04a\x88\x0c\x0dpd\x18\xe5\xa0\x91A\x80\xb4@\
+\x122@\x86\xf6\xb9\x10\x06@R\x96\xdc\x96y\x8e\x01\
+\x93\xbdJZg\xf8\xd1\x8e\xfbr\xc0\x93\x16\xe0QJ\
+\xa1\xd2\xd4\x00*IPib\x9e\xa7)i\x1c\x83\x14\
+l]Zbi\xb2\xc2W\xbf\xfa5\xde\xff\xd9\xcf\xf3\
+\xee;\xef_+?\xba\x13x9&\xc3\xff\x84\x03\xcf\
+\x00\xf8\x04&\xc3\xed=6l\xdc\xcc\xce\xfdWs\xe5\
+\xbe\x9d\x5c\xbf\xa0\xb9BL\xd8%\x02&i\xc4r\x14\
+!\x07!A`A\x13\x86\xc8\xc0\x82'\x8a\x0a\xd0d\
+\x80\xca\x00\x14\x04\x042@d\xd6\xc7\xba/\x84@\x0a\
+\x09\xb2\xe0<\xbar\xb1\xb4\x03\x1c\x1c\xe0(kqr\
+\xeb\x93Z\xab\x93\xa6\xa8$F\xa7\x09*Is \xa5\
+\xf1\x84Ti6-.\xb0M'\xdcw\xf7\xdd\xdc\xfc\
+\xc9\xcfr\xd3]\x0f\xad\x85\x17\x9d\x06\x9e\x0d\xdc\xf1D\
+\x02\xcf~LZa\xbf\xef\x07d\x10\xb2\xf5\xa9\xfb\xd9\
+w\xe9E<w{\xc4\xf5r\xcc\x852d9\x8d\x18\
+\x85!\xc1 \x22\x08\x22d\x14Z\xa0\x84\xb9E1@\
+\x8a\xec\xad\x00Mv\x1fdn\xac\xc4}\x82\xdc\xea\x08\
+i\x81#D\xc5i\x91\x87\xef\x85\xd5Q\xe8\xccEY\
+\xd0\x180\xa5\x05\x80\x92\x04\x9d$\xa4i\x92[\xa24\
+IPq\x82J&$i\xca\x86\xc5%\xb6\xab\x09_\
+\xfb\xd2\x97x\xe7\xdf~\x9c\x9b\x8e\xad\xcez\xad5\xf0\
+J\xe0\xddO\x04\xf0|\x1f\xf0\xc7\x98\x82+\xaf/\xb4\
+\xb4\xe3)\xec\xbdt/\xcf\xde\xbd\x85+\xe4\x98\xeb\x06\
+\x92q\x1aq&\x8a\x08\xa2(wOA\x18\x19\xe0\x84\
+!2\x03\x92\x05O\x10\x0d,\xa8\xa4\x05\x8d\x03\xae \
+@d\x80\x92e\xeb\x93\x81\xc7\xf8-1\xcdx4\x90\
+\x93dU\xb8\xaa4\xb1\xf7\x164Ib\xdcW\x12;\
+\xe0I\xd1\xf6\xb9Jb\x0b\xa0\x18\x95&$\x93\x09J\
+i6o\xda\xc8\xd2\xf1\xc3\xfc\xf5\xdf\x7f\x8a\xf7\xdcv\
+7\x1f/xz\xdf\xf1\xaf\xce\xb6&t\xb6\xc1\xf3&\
+\xe0\xf5\xde!\xf7`\x8e\x1d\xfb\xaf\xe2\x19\x17o\xe7[\
+\x17\x12\xae$E\xea!'\x82\x01\x0c\x22\xc2\xb0\xb02\
+Ad\xc0\x12\x84\x03\xc7\xd2\x98\xf7\x0d\xb8\x06%0\x19\
+\x1ed\x81\xe3\xb87\x03\xa0\xc0\x10\xe5\xdc}\xc9\x5c\xdf\
+q\xfc\x95\x05\x8f\x89\xb2\x94V\xc6m9.\xaaD\x90\
+\x95\xb9O\x93\x04\x9d\xc4\xc6\xea\xc4\xd6\xe2\xa4\x164\xf1\
+\xa4\xb0@\xa9\x01U2\x1eC\x14q\xc1\xdc\x80\xf1]\
+w\xf2\x91[n\xe5]'\xd5\xac\xa2\xce\x87\x81\x17~\
+=\x82\xe7\x0f\x80\x9f\xf4>zn\x89\xcb\x0e<\x9d\x17\
+\xef\x1a\xf2\xfcp\xc2f\x1dq\x8c\x01\x0c\x8d\xb5\x91a\
+qo,K\xf6Z\x01\x12\xf7}\x99\xb9\xb5\xb0\xc2\x87\
+\x9c\xe7B:\xe0q\xc3\xf8\x0c8\x19xr\xf4hk\
+q\xb4qK*\x0b\xd1St\x9aX\x10%\x05\x802\
+\xf74\x89\xed\xeb\x064\x19\x80\xd2\xf1\xd8\xdc\xc7q\x01\
+\xa08&\x8dc\xd2dB\xb4\xb8\x91\xe1\xf1\xc3<\xf0\
+\xa1[\xf8\xeb\x83\xcb\xbc[\xc2D\xf5\x9e\x87O\x02\xcf\
+\xb5\x0a\xf5zgu\xce\xca\xf8c\xe0\xc7\xfc!<\xe4\
+\xba\xeb\x0f\xf0\xea=!\xcfS\x13\x924\xe2d\xe6\x86\
+\xec\xa4\x07n4\xe5X\x9f \xb2V'\x8a\x8c\x1b\xcb\
+\xacO\x14\xe5\xf7\xc6\xd5\x0d\x08\xa2\x90`0\xc8\xdd]\
+\xe6\xda\x82(\x22\x8c\x06\x04\xceMF\x11\xa1{\xce\xec\
+>\x0b\xfdC\xcb\x9d\xb2\xd0^Z\x9d\xc8Q\xa5M\xbc\
+\x96\x9b-\xc3\x99J\xec\xc4\x00R\xe0\x08\x8f\x99u\xd3\
+\x9ax\xf9\x0cjq#\xc3\x8b\x9f\xcaE\xc7\x1f\xe2\xaa\
+3c\xee\x0f\xe1D\xbf\x80\xfcB\xe0e\xc0\x1f\xcd\xee\
+\x01\xcf\x1dx~\xb5\x8f\xab\x82\x88k\xbf\xe1j~v\
+O\xc8\xfeq\xccQ= \x1e\x84\x84A@\x10\x86\x88\
+\xd0L`\xe0X\x8e\xecq\xc9\x22e\x13\x9d\x01+\x8c\
+\x90\x19P\xc2\xc8X\xa2\xfc\xf1\xc0\x80i\x10!\xa3A\
+\x01\xb0\xc1\x80`00\xa0\xc98\x93\xfdL\x10\x1a\xde\
+$B\x1b\xfaKiEE\x0b\x18p\x94ik\xadD\
+&(f\xc6K\x97\x95j@+Ur\x89\xf9\xeb\xa9\
+\x02!\x88G\xcb\x84\x839\xd8\xbb\x97\xc1\x91\x07\xb8v\
+5\xe6P\x08G\xfa)\x8c\xbb05\xdd\x7f\xfex\x06\
+\xcf\xab\x80\xb7\xf6\xf1\x9a\xcf\x7f\xc6\xe5\xfc\xfc\x9e9\x96\
+V\x12\x8e\x0a\xe3\x82\xb2\xd0;\xe7&\x19w\x09Bc\
+i\x82\xcc\x0a9\x04\xba\x16X\xa1q]\x83\xc2z\x08\
+\x0b2\x03\x9c\x880\x8c\x1cK30 \x8b\x069\xbf\
+\xca,\x9e\xc8\xce\xefFh\x81\x0d\xed]\x0fgAT\
+\xb20\xaa,.\xda'\xb9:M~o\xdf\xcf\xb8\x94\
+V\x08\x0d\xf1\xea\x88\xe1`\x88\xd8\xb9\x93\xe5\x83\xf7\xf3\
+l\x14:\x82\xaf\xf6\xcb\xc2^\x05l\x04>\xf8x\x04\
+\xcf\x8fb\x8a\xb6\xbcU\x9f\xd7^{1\xaf\xd9\xb1\x01\
+\xb5\x1cs\x22\x18\x10F5\xdc$\xa8{-si\xd6\
+\xea4Y$\x97'\xe5\x04\xdbZ\x98h\x90\x83(\x88\
+\x06\x8e\xd5\x19\x12\x0e\x07\x04\x83!\xe1\xa0\xec\xc6\xa4\xab\
+V\x8b\xcc]Ye:\xcf\x83\x15\xb1\x99\xa8\x0a\x8a\xf9\
+\xbd*\x87\xfaJA\xfe\x9a\x05\x95*@\x04\x10\xaf\xae\
+\xb0\xb0\xb8\x81d~\xc0\xa1{\x1f\xe6\x99\x8b\xf0\xd4\x81\
+\x01\xd0\xaa\xbf3\xfaf`\xa7\x95M\x1e7\xe0y%\
+\xf0\xa7}\xfe\xea\xeb\x9e\xb6\x8dW\xee\xd8\xc9\xa1S1\
+\xcbQH\x149\x96&#\xb4\x8d \x0a\x1c\xebS\xb6\
+H.\x90\x82\xdc\x85\x15:O`\xc3x\xe3\xe2\xc22\
+/\x1a\x0c\x08\x87C\x82\xc1\x9c\x05\xcf0\x07ZN\xb0\
+\x85M[8\xa6&\x0b\xdb\x0b\x8bR\xb6\x22\xca\x82\xa2\
+xM\xe7\xa01\x9fs\xc2\xfe\xec}\xabX\xa3\x8bc\
+\xe2\xd1\x88\xa5-\xdbX^~\x94\x83\x87V8\xb0\x01\
+\xbei\x0e\xbe8\x81S\xfeD\xfa\x9b\x80\xad\xc0_\xad\
+u\xd2\xe5:\x00\xe7\x00\xa6\xe2\xcd\xcfQE\xf0\xfa\xbd\
+!/X\xd8\xc6\x97O\xae2\x09\x05A\x9eKr\xc3\
+\xe3\xe2\xb9\xc0IV\xbaIK!LXm\xc3\xeb\xec\
+q9S\xeed\xcc\x9d\xf7\x0au9\xc8\xa3,\x03<\
+K\xa0\x07\x03\xc2\xb9y\xa2\x85\x05\xc2\xb99\x82\xc1 \
+\x07\xaa\x90\x01\xd2\xe5;\xa2\xf2\xdds\xce\x93\x91f\xdf\
+\x8b\xd3u\xa4&\x9d\x8c\xd9q\xc9~\x86\x8b\x82\xbbV\
+`(\xe0\x97\xb6\xc2e\x83^s\xf6s\xc0\x8f?\xd6\
+\xe0\x99\x07>\xea{\xf0p\x1e~a\x1b|\xc3\xdcf\
+\xee\xd7\x01\x08=}\xe1+\xbfj*\x80)J&\x98\
+r\x15\xa22\x11.\x10\xc1\x05\x9c\x03PD\x9e\x8e \
+\x8f\x9a\x84\xb1T\xae\x1e\xe4\x86\xefm\x93,\x1c\xb75\
+\x8b8\x9ce\xec\x1bN\x1e\xaf\x8e\x98\xdb\xb0\x91M{\
+v\xa2\xc7p$5\xd9\xd0\x1b\xb7\xc0\xbe~K\x1a\xdf\
+\x8a\xa9lx\xcc\xc0\xf3A`\x8b\xaf\xabz\xedf8\
+\xa0%\x87\x06\x0b\xe84n\xfcM\xfa\x5c\xf4\xd9\x05*\
+]y\x5c\xe4\xa8PF\xf83\xcapB:\x19\x93\xac\
+\x8eH\xc6c\xab\x04\xa7y\xfaAg\x22a\xa6\xfdd\
+\x5c\xc6qOZ\xabR.\xacz\x8f\x93\xe6@\x93/\
+x\xd6y\xd45},\x02\x92\xc9\x84\x0d\xdbw\x12\x0e\
+A*x4\x85\x89\x86\x9f\xde\x0c\x8b\xfd.\xcc-\xac\
+\xa1\xd4w-\xe0y\x83\x15\x9f\xbc\xfe\xca\x0d;\xe0\xda\
+1\x1c\x0c\xe7\x88\xa2(/\xa4\xea\x9a\xde\xfc\x02\xbbI\
+\xed\xfc\x18]:8\x8fh\xdc\x09\xd0N\x94\x83\x99\xdc\
+RZ\xc1If\xaa45\xaa\xefdB:^%\x1e\
+\x8d\x88G#\x92\xd1\x88d2&\x9d\x8cI\xe3\x89\x11\
+\xfb\x92,S\x9eLe\xd4s`\xd9\xbfe8\x8e.\
+\x91c\x17t\x19\x89\xcen\xae I\xe584$\xab\
+\xab\x0c\x16\x16\x99\xdb8O\x1a\x1b\xe2z8\x81\x05\x01\
+7n\x85\x81?\x80\x16\x80\x0f\x9ck\xc2\xfc\x0c\xe0\xbf\
+\xfb\xe5\x1c\xe0\xfbw\xc0\x8b\x14<4\x86\xb9MKD\
+\xc39c=\x02YT\xf3\xe5EZVC\x09\xac\x8e\
+\x128\xaao \x91\x96\xb4J)m\x81\x97\x9b\xd04\
+7ioBH\xa3\x1c\x93q\x1fYp)7B\xb2\
+$\x15\xad\xf3\xecx\x91B\x88Q\xc9\x84t\x12\xa3&\
+\x13\xa3\xfe\xc6\x93<?\xa5\x12\xab\x10'\xb1\xbdO\xac\
+\xbal\xcea\x12\xa1\xb1y\x1e\x17\xc9\xd2\xbcT#\x89\
+\x8bdj\x9e\x17K\x1dp\x9a$+N\xb25\x8dc\
+\x820d\xbc\xb2\xcc\xe8\xc42Ad<\xefI\x0d\xbb\
+\x03\xb8~\x0e>\xe7\x1f\x85\xed\x05\x0e\x03\x9f>W\xe0\
+\xf98\xb0\xd9\xc7\xb7\xdc\xb0\x13^\x0a\xdc\xb7\x0a:\x80\
+\xb9\xa5%\x8204\xe5\x0f\xa5\xc9\x0eJ\x13\x8f\xf3\x9e\
+!\xb7\x05 \xa4\xad\xf8\x13\xd9q\xc2\x11\xec\x90\xd3\xe4\
+\xda\xad\xcd\xc9\x1eU@\x93G?\xa9\xb1@\xa9\x05\x81\
+\x8a'E\xca\xc0\x82D\xc5\x93\xfcy\x9a\x81\xc8&8\
+\x95\x93\xecTq\x969/@\x95\x95h\x18+\x17[\
+\x10\x15\xe9\x8c\xd2c\xfb\x1ei\x8aN,x\x12\x032\
+\x01LV\x96\x19\x9d8\x85\x0c\x0b7rR\xc1\xde\x08\
+\x0e\x0c\xe0c\xab\xde\xad?\xbe\x03\xb3B\xe3d\x1f\x10\
+\x843\x00\xe7w\x81\xa7\xfa\x1c\xf8\xbc\xed\xe6[\xdd\xb3\
+\x0aJf>\xd2\x98r!D\x85/\x14&ZiM\
+\xe0h S7\x9d\xa2\x95,\xf2J2\xb0\x85W\x02\
+-$:\x15(\x0b>\x95\x14$7\xfb\xa5d\x17\xb4\
+\xd0YLm\x8f\xb2V\x8f\xac8,K-8\xe1x\
+Q)X.\xb9(O\xb8\x05PV\xbf\x93'?\xcd\
+M;\xdcI\xa9\xb4dy\xf2\xec\xbc*J=t\x9a\
+\xa2t\x9a\xff\xed,\xfc7?\x18Jy\x8fP\xc0}\
+1\x5c\x1c\xc1On\x82\xdf?\xe1=\xaf7\x03\xd7\x9c\
+M\xcbs\x0d\xa6\xe4\xb1s\x5c\xb2\x09~f\x1e\x0e\x8f\
+ \x96y\xac\xc3`n\x1e\x19\x86\x80Df\xf9 \xd7\
+MIkY\xf2\xca>\x99\xdf\xe7%\xa2BN\x17\xac\
+K'\x1a\x83<\xdf4\xcd\x91u^^\x91\x0bq\x19\
+\x17Q\xa9\x03\x8c$\xb7>:\xb3,I\x82\xce3\xe1\
+\xae%2\xafg\xaeL[\x8bd\xce\x11\x93:Y\xf3\
+\xc2B\xc5\xd3\x16)wsi\x0eB\x9d\xbd\xa6\x92\xdc\
+\xea\xa84\x01\xad\x0b\xcb#\xcb\x11\x84\x14pB\xc1\xd3\
+\x86\xe6_\xff\xb2\x9f\x12\xbd\x13\xb3v\xfe\xe3g\xcb\xf2\
+\xbc\xcb\xe7\xa0\xc5y\xf8\xc9\x0d\xb0\xbc\x02#Y\xb0r\
+\x0d\xb6tA\x810\xbf.\xa1\xdb,KAd\x85\x94\
+\xe8T\xa2\xb2p:\x15\xa8$1\xae+\x11\xb9CR\
+Y\x18-\x05L@\x87\x8euS\x0a\x1d\x86\xa6\xfeX\
+)c\x99,o\xc2u\x859/rb\xb2R\xda@\
+\xe7\x11\x97.\xd5\xef\x14\x93n\x80\x90\x16\x00K\xcaV\
+)\xcd^\x8b\xcb\xc7\xe7$\xdc\x82\xaf\xc4\x85\x1c\x82\x8e\
+\x10\xa8$\xae\xc9\xb6\x16\xd1\xe8\xfd1\xbcb\x09\xee\x89\
+\xe1\xf3c\xaf\xf9}\xb3\x15{\x8f\xae7x\xfe\x19p\
+\x99\x8f-{\xcd\x16\xd84\x86\x07\x5c\xd3&\x8c\x02\xef\
+\x82\xa7\x04\x984E\xc9\x00\x91\xa6\xc6\xe5\x88\x14\x9dJ\
+\xb4\x94h\x15\x18\xdfo-\x92\x96\x02%$\x221\xee\
+\xc9\xd5vt)$\xd3H\xb7dT\x85\xb9K\x90A\
+\x9a\xf3,-\x0b\xab\x96\x81\xa7Z\xf8^\xaf\x0e\xa7E\
+\x01\x98c=\x0a\xde\x92\x16%\x17%w\x96q\x9e\xa4\
+pkIB\x9a:\xbc\xc9)\xf50\xa0,\xbbI\x19\
+\x04$\x93I\x91k\xad\x01O\x0c<\x92\xc2\x8fl\x82\
+_{\x04\xce\xf8\x11\xa0?\x05\xbem=\xdd\xd6>\xe0\
+\xfd>\x07>{3\xbc<\x80\xfb\x93\xc2k\xe4S\xa0\
+\x0c\x9d\x08\xa3\x81\xf9\xc1\x88\x8ar,\x8bI\x13SB\
+\xa0p.\x8c\xa8O@f\xf9\xa1b\x8d\x8c\x95\xf7\xb3\
+\x90\xd9\x9dt\xa7\xc6\xd8\x12\xd2\x8c\xb3\xe8\xc4u+q\
+A\x883\x92<\x99\x90\xda\x08,\xcd\x08t\xfe8\x9e\
+&\xd9\xf6\xb9\x9aL\x8a\xf3Mb\x03\x968.Gn\
+\xae\xeb+Y-\xe3\x0aS\xe7\xd8\xe5c\x8f\x90\xc6)\
+2h\x06\xd0H\xc1\xf6\x006\x07\xf0Y?\xebs)\
+\xa6\x88\xfe\x8e\xf5\xb2<\x7f\xe6s\xd0\xc6y\xb8a\x01\
+\x0e\x8d\x1aL\xa9\x84\xc4^\x14\x09\xc6j\xa4N=L\
+\x5c\x84\xcf\xae\xd4/\x84\xe3\x8erCP\x00$\xb7^\
+a`\xc8\xb8\xb5n2Hm\x223q\x0a\xe0e^\
+\x04\x96\xf1+\xaa)\x0dQ@4gH\xa5\xf2Sm\
+\xf8Q\x16\xdag\x048\xd3\x8aT\x92Gmn$V\
+\x94\xa2\xbau\xcc\x8e\xb5qKV-\x87J]\x8e\x14\
+\x9b2V\xad5\xf1\xca2\x93\x95q\x1ei5Z\x07\
+\x01\x0f&\xf0-\xf3\xf0\xb91|\xda\xaf4\xfa\x1d6\
+\xe5\x14\xaf\xd5\xf2<\x1f\xf8u\x1f!\xf05\xdb\xe0\xe2\
+\xc48L\xd9\x90\xbaQ\x0a\x02)\x08\xc2\xd0\x14\x98\xcb\
+r\xda\xa1\x9c#*V1\x88\x16\xa5Y;\xa5\x0f\xb9\
+\xc5Q\xaeJKN\x8c\xa9Fq\xb9\x8eb\x0a\xd4\xcd\
+\xbd\x9d\xe0$-\xb8IVs\x9c\xb9\x98lbK\x93\
+\xeb\xf0\x98\xcc\xda\xc4q\xf9=\x97(\xc7\x99N\x94E\
+k1\xdaqei)\xfcOQ\xa9\xf9\x0eBkV\
+N\x1cg\xbc<!\xf0\xfc\xf9\xc7\xc05C\x13\xbe\xc7\
+\xdag6\x19\x02\x1fZ+x\xfe\x0fpA\xd7A\xd7\
+n\x82WE\xf0@<\xed\xae\xaa\x821:%\x0cC\
+\xd0\x22\xcfe\x89\xac.&\x7fMO\xe5\x0b\x85\xcex\
+\x8dF\xb8\xe2\xb2SDe@\x93\x15W)\xc7]\xa5\
+\x15b\x9eY\x0b'\xc2J\xd2r\x01{\xc9\x85%\xa5\
+\xe2u\x9d\x03*\xae\x01\x89\x15\x12\xe32\xa8\xd2\x12h\
+\x8a\xd7\xb4\x05\xd4\x14p\x5c\xa2\x9d\x1d\xabR\x92\xd5U\
+\xce\x1c;\x96[s\x9fT\xce\xaa\x86]\x01\xccKo\
+\xf2\xfc\x1c\xe0\xf7\x80\xd5Y\xc1\xf3\xed\x96(\xb7\x9b\xc6\
+\x01\xfc\xd4&PcX\x15\xedy'! M\x0d\xf7\
+\x91A\x00J\x97\xeb\x85\xf3\xcf\x8b\x0c-\x95D\xa4\x03\
+\x1c\xad\xc9\x9e\xb89\xa0\xac^&\xaf\x8f\xb1\xc0\xc1\x01\
+\x10i\x8aVI)_U\x05\x8erV;\xe8\xd4\x86\
+\xe4\x0e\x00t\x92\xa03N\x93L\xec\x84O\x1c\xb59\
+\x13\x12\xe3\x12\xa7I\x1d\x90)\x07<\xaa\x02.\xd7\xd2\
+ed[\xa0Y>q\x9c\xc9J\xecmu2Sr\
+Z\x19\xebs\xc7\x04\x8e\xfb\x91\xe7a[\xfa\x22\xf0\xf0\
+}O\xe9\xfa\x0b/\xd9b\xaa\x8c\x1e\xd2\xfe\xc92\x95\
+\xa6\x04V\xdb\xd1Z\x97\xd7\x86;\xdaL\xce\x95\x15y\
+Y\xa7p\xf3[\x9a\x12h\x0a\x10\x95\xdd\x94K\x96\xc9\
+,\x8e\x05\x90N\xdd<\x95\x05\x85cit\x0e\x96\xca\
+d\xc7\x13\xfb\xd8\x02\xc7\x02,\xb5\xda\x8fK\xb8\xd3)\
+\x12n\xcf\xe9hEeu\xda\x89\xd0\xecg\xd1\x9a\xc9\
+h\x85\xe5\xe3\xa7\xb0\xcb\xeb{\x0d\x05\xcc\x09\xb80\x84\
+\xbf\xf3\xe3>W\xd1\xb2,\xbc\x0d\xbb{|R\xf6\xbb\
+\x16\xe0\xa5\x03xx\xd5\x903\xdf\xb2\x15\xa5`\xbc\xb2\
+\xcap\x1e\x02\x1d\x91\xba\xc9L\xa5 ,\x5cL\xa05\
+:0\xdcD\x86!:H\x91\xa9\xb9\xe9 E\xb9\x15\
+~AbR\x1c\x81)\x19\xd5\xd2\xe4\xc7\xb4#8*\
+\xb7\xae'\xd7uh\xac\xbf\xd1n\xb9\x84\xab\x8a+\x03\
+R\xb3.\xbd\xe0R\xcaiz\xa0\x1c\x8b\x96\x87\xda\xd9\
+2d7\xbcwB{\xd7\xc5\xe9\xd4\xf0.my\xd8\
+\xca\xf1\x13~\xa5?\x0d\xd6\xe7p\x0aW\x0e\xe1\xf9\x0b\
+\xf0\xd1\x95\xce\x8fl\xc6\x14\xcf\xbf\xb7/x~\xc5\xc7\
+\x99\xbeb\x09\x06\x13\x18\x89~r\xb5\x94\x90*\xcdx\
+4b8\xa7\x918e\x97ah\xeaw\xb3\x09\xd1\xda\
+\xae\xbb\xb2\x93\x10\x06\xa8 E\xa6I^YHP\x14\
+u))!\x08\xd1A\x80\xb4\xb59*\xcb\x8b\xc9\xe9\
+\x821\xeaj\x8a2\x089BJ]i\x85r\xca8\
+J\xfaO\xaa\x8a$k\xe2.\x08LP\xa9\x22us\
+\x5c\x99\x18\xe8\x82\xc9\x96\x80\x14\x89\xd3\x84\xe5\x93\xa7\x88\
+'i/wU\xc7\x7f\x1eI\xe0\xe5\x8b\xf0\xa9\x11\xac\
+t\x93\xe7\x7f\xd7\x04\x9e\xa6\xf9\x1e\xd8P\xad\xf5k\xee\
+[\x82\x1b\xe6\xe0\xa1\xa4\x9d$\xb7Y #\x1c&\x04\
+\xb6\xb9\x80\x89\x98t\xa9\xdc\xa6\x10\xe9\x8a\x92\x8b\xec8\
+a]\x14Z#\xac%\xc0\x86\xd2\xc2\xad\xd3IS\xc3\
+y\xaa$\xd9\xb5\x0a\xf6\x97^\xb8\xadL\xe5M\x9c,\
+x\xf1^\x91\xd84\xaeL'18\xe4Z;\xdcF\
+\x97\x12\xa4e\xfd\xa8\xaa\xdf\x14Q\xdb$w\x9f\xa3\xd3\
+\xa7\x89\xe3\xb5\x01''\xcf\xc0\x9e\xd0\x90\xe8\xaft\xaf\
+\xe6\xdaf5\xbe\x83\xbe\x96\xe7\x07-Yj\xfd\x16/\
+Z\x00\x15\x17A\xd3L\xff\x8c\x84T\xc1x<f\xa0\
+\x152\x08s\x97\xa0\x83\x14\x15*\x02\xad\xackR\xc6\
+\x9a\xa4)\x84\x01\xa8\x10\x11\x18\xf6\xad\x83\x04\xed\x94t\
+\x10d\xd6H\xe6VG\xb8\xb94'\x0dQH\x058\
+\x22\xa5\xc3\xa9\x1c\xd1QW\x8a\xb9\x8a\x16+e\x09@\
+\xe5\xe9\x0bU\x88\x91\x19`3=(\xb74\x8e2\x9d\
+5DH&9\xa0WWVHbE\xb0N\x15\xe7\
+Y\xfd\xcfs\xe7\xe1\x96\x15\xd3g\xb1c\xbc\x1e\xf8\x1e\
+_\xf0\xfcl\xd7\xd9v/\xc0u!\x1c^\x9d\xcd\xff\
+V]\x98R\x9a\xc9xB\x18*\x82\x8c\xef\x04\x01\xd2\
+N\x86\x0c\x03[\xe9\x17\x147\x99\x22\xc2\x00\x9d\xe5\xa7\
+,\xbf\xc1\x82G\xcb\x22\xa9*\x02+\x08\xba\xadT\xa6\
+\x5c\x96\xfb+p2[\xba\xb8\xcf\xb5#\xa7\x8a\x10\xad\
+-X* \xb2\xdd3J\x80\xc9\xb2\xe4J\x91\x96\xb8\
+\x8e]\x9e\xec\x80*\x8d'\x8cWWQ\x8aF\x15y\
+\xd6\xb1\xac\xe1\x92\x08\x9e3\x0f\x1f\xea\xe6>7\xd8\x8a\
+\xc33]\xe0\xb9\x02\xb8\xb6\xebl/\x98\x83A\x02\xa9\
+X\x9f*z!\x8c\xb7\x89c\xd3  \x08R\xab\x18\
+\xa7H\xa5\x10i\x80\x0a\x13\x08Bs%\xed\xaaM\xa5\
+\x8c\xb5A\x06h[\x5c\x96\x01G\xba\x05\xf1R\xa2\xed\
+R\x19)D\x8d\xe5\xa1$\x0b\xb8\xcdU\x8a\xa8N\x15\
+I\xd2\x86\x95\x10\x86\x07\x15e\x13EAW\xd1\xf4)\
+_\xd7\x9e\xbb\xc2\xb4\xc8_Y2\x1dO&L&\xa6\
+)\x94\x94\xac\xfb\x08\x80c)<k\x0e>\xbc\xe2\xd5\
+\x15\xea\x07\x81\xb7t\x81\xe7u\x9di\x88\x08\xae\x0d\xe1\
+h<\x1b\xd7i\xe5@@\x92*R\xa5\x08\x93\x84 \
+4\xaa/A\x08\x89\x01\x8dqS\xa1\x01Ih\xd6P\
+i\xbb\x8aS\xe7\x16\xc7\xb1<\xceR`,\x88\xdc\x04\
+\xa8\xeb\xb2\xdctZ9\xe9\xa8K%\xae\xd5\xa55\x94\
+\xa2\xadr\xf6]\x95\xc0S\xb4bQIj\x1a \xd8\
+\xf6,*IH\x92\x84$IIR\x9dU\x99\xac\xef\
+\x1aag\x9cV&l\x7fj\x04_\xeb\xe6>\xaf\xeb\
+\x02\x8f\xc0\xb4Di\x1d\x17\x0d`\x93\x80Cg\xa1M\
+\x82\x1b\xe8\xa4JC\x9c@\x9a\x22\x82\x04\x15\x04\x06D\
+\x81D\xc8\xc4\x00)\xb1\x9d\xbd\x82\x00m-\x8d\x96\x12\
+Yr[\xe5\xae_z\xaa\xd2\xb0\xa9\x8d\x1c\x15\xf2\xae\
+K\xcb\x82K\xdd\xc1\xaa\xdc'5\xf7*-\xea\xa4K\
+.,\xcf\x94[\x17\x95\xa6$iJj\xbdd\x10\xe4\
+%\xcbS%I\xeb5\xb4-\x1e\xbbf\xe8\x05\x9eK\
+1\x8d\xb9nk\x02\xcf\x8b\x80\xc5\xae\xb3\x5c7\xcfY\
+\xed~'\x1d\x10ia\xf8P\xa2\x12\x824A[\xd0\
+\xc8 @\x07\x01\xa9\xed3\xa8\x9drV\xe5\x94\xb1\x96\
+\xc0ck\x99\x85(\xb4\x1dw\x0d\xd84vD\x89\xf3\
+\xe8&\xd2\xec\x84\xec\xa5\xf0\xdd\xf6*,\x00\xe3\x14\xda\
++\x85Nb\x03\x18\xa5m\x1b_c\xc9\xb3 3\xb3\
+\xc4y\x1d\xff:\x83H`\x9a&\x5c7\x84\x9b\x97!\
+\xe9>\xf9?i\x03\xcfww}za\x00W\x87p\
+l\xc2\xba7h\x11\xeeM\x14\x8f\x0bKD\xae\x0c\x07\
+\xd2\xf2\x9704u@\x160\x19\x88\xb4S\x03m\xda\
+\xc5U\x0a\xbd\x5c\xebS[\xf6\xe1\xfeB\xf5\xf4j\xd0\
+<\x8fV,\x0f\xd6\x95\xa6O\xca-[-\xe9?)\
+J\x99\xe6\xe0\x99\xa5\x11\x8eN\xe6\xac\xc2)a8\x13\
+\xda\xd7\x13@\xcb\xda\xb8\xae\xab\x07^9\xafW\xb8\xfa\
+_\x15</\xed\xfa\xf4\xd3\xe7\xcc\xa6\x10\x0f\x88\xf5\xc5\
+\x8e\xac\x80f\x0aL\x8e\xaa\xaa\xadK\xd3\xca*\xcd\xd2\
+4\xd9V6\xa2RAQL\x9fV\xc5\xc0\xbc\xab\x85\
+(w\xb5pk\x83D\x9d\xd7*\x96\xbe\xe4\xadtu\
+\xa5J\xb1r\x8fJK\x96Fim\x02\xc6\xcc\x8aT\
+*e]\x8e%\x1d\x90\x08{\xac\x06\xa4^\x7f\x00i\
+\x9bq\xf7\x00\xcf\x15\xc0\xc5\xc0\xbdU\xf0\x5c\x81G\xdb\
+\xfe\xab#\x88\xd3\xb3\x0b\x1c\xf7F\x8d5*\x05\xd2\x1a\
+T\xaa\xd1\xd8t\x85\x00iWf(Y\x90d\x95Y\
+\x9a*\xe7q\x22,\xdd\xc1y\xdc\xde9\xe6a\xb1\xce\
+\x5c\xb9\x0d.\x95Bie+C\x0a\x97\xa4\xed\xe9]\
+`\xb8\xae\xa8\xac-\x15\xe5&\xbab\x85\xe4:\xba1\
+\x01\x1cOa\x7fd\xd6{M\xbaO\xf8\x12l'\x94\
+\xb0\x8f\xcb\xda8\x84+B8\x1e\xaf\x8f\xcb\x12-\xa0\
+itaUp\xc9\xf2WQ\xd62(\x95\x22H\xf3\
+\xcfJ\xbb\xfc&\xe39\xd9-\xafht\xc4\xc1\xa9\x1a\
+\x12\xbb\xd2#wW\x968k\xabz\x17\xf7\xf5[\xd7\
+ \xcau\xdcUK#\x1a@TWb*\x00%\xa6\
+\xb9\xfcZ\xc6\xc8\xba\xae\x03C\xf8Lw\xc2\xf4\xe5u\
+\xe0\xe9\xdcm\xee\x8a\x01l\x17\xf0\xe0:\xb8,\xe9\x03\
+\x1cQ\xef\xbehqq%\x9dO\x17|7\xd5V\xbb\
+\x11\xe6\xbej\xc1*\x0d\xe4\xea<\xd7\xd4\xe4O\xddW\
+\xbeo\xd5\xb2\xe8\xca\xf9\xb5\x03\x12\xc1\xb45i\x22\xcc\
+\xd2q{\xd9{j\x1d<\xc0\x15\x91\x17x\xbe\x05\xb3\
+\xd1o\x1c:\x9a\xd13\xbb>\xb5/4\x22\xef\xb9\x02\
+N\x1f\xd0\xd4\x81\xc0-\x94\x12\xd4?\xa6fb\xdb~\
+\xcdbZ\x7f\xaesre\xbe\xa2k\x80\xd3`I\xea\
+@T.\x97\xac\xf9B\xda\x01\xd4\x8c\x1e\xe0\x94],\
+(\xba\xcf\xb1\x00\x5c\x0f|\x22\xbb\xbcO\xc7\xec\x0e\xdc\
+*I\xee\x0daY\xad\xcdM5\x01Gz\xb81\x99\
+5\xb4p>#k\xceQw\x5c\xf5x\xe9\xdc\x02{\
+\x93=o\xad\xdf\xa1\xf2\xffd\xdf\xa7\xee}\xf7{7\
+\xfe\xa0\xec9\xa4\x87[\x9fe\xac(\xd8\x19\xc0n\xbf\
+\xc4\xeb3]\xb7\xf5\x8c\xae\xa3\xb7\x87\xb0S\xc2J\xb2\
+6\xf0T\xffYY\xe3\xa6d\xd5\x9at\x10i\x1ax\
+Q\xdd}\xab\x15\x12\xcd\x96\xa9de\xf4\xb4A\xa8{\
+<u/\x9c\xe7\xba&\xa2\xaa\xb14N\x1d\x5c\xc1\x9f\
+t\x8d\x9b\xca\xae\x9d\x9e\xcd\x85\xa5\xc0\x92\x84\x8bBS\
+%\xd1%\xf5\xb9\xe0\xe9\xcce=%\x84\x8d\x02\x0e\xad\
+\xd1UI\xe1\xef\xa6\xea^\xa7\x85\x17\xd5\xb9\xb1Z\x00\
+\x89n7\xd6\xe6\xb2j\x0a\x1emw\xf8\xb2\x0bt9\
+\xcf\x94\xcb\xaah7U\xdc\xb8|HzD\x5c\xda\xd1\
+\x87fqa\xd9\xf7}JDK\xd5r>\xaeq\xc1\
+s}gJ\x222_x-\xd6F\xf6\xe07m|\
+\x88\x0ePU\x1f#\xda-\x113\x98|]\xc7}D\
+\x05 \x15\x0eS\x05P\x06\x90\xa0B\x8ak\xbf\x98\xae\
+\xe7:S?Ra\xc18C$\xb6\xa2\x8c\x91\xf0\x18\
+\xd7\x00\x1b\xb3C/\xefB\xc0\xce\x00\xc6jF\xe0\xd0\
+\x0d\x1c\x1f\xceSG\x98e\x13p\xc4\xf4\xf7\xf0!\xcf\
+\xa2'hhrQ\x94\x93\x9a\xa2\x814\xeb\x1aKT\
+\xbb[\xad\x98\x8e\xbaT\x03\xb0d\xf6^O\x00\x8d4\
+l\x93\xc6}u\xac.\x1d\x00\xfbCL\xad\xf2\xaeV\
+\x97#`\xabX\x03x\x1a,\x8b\xa4\x9f\xc5i\xd5{\
+:\xdc\x18=\x00\xe4\xe5\xba\x1a8\x0e\x0d\xa1\xb9v2\
+\xf5\xa2\xc9\x90TD\xc2\xa6\xc8\xaa\xaaBkQ,Y\
+[\x0b\x80b\x0d\x1b\xa4Ya\xea\xb14y_\xe8\xa3\
+*o\x0ca\xa3\x84I\x8fd\xa8l\x03\xc9\x1a\x81\xd3\
+\xa4>w\x85\xeetp\x9f>\x96\xa7\xaar\xb7\x11f\
+jHs\x97\x8aL\x9b@\xd8\xe4\xae\xea\x00\x84?x\
+\x14\xa6A\xe6Vi\xf3\x0f\x1e\xe0\xe9\x5cZ\xb3E\x98\
+\x96e\xa7g\x00N_\x8bS}\x0f\xe7\xf8:p\xc8\
+\x06>S\xeb\xaa\xc4\xda9O\x9d\xa7\x10-\x5c\xa7\x09\
+L\xf55C\xf5\x84Y\xd5\xfc\x1f\xb5\xe0\xaay]8\
+:\x90\xf2\xf8a\x84\xc2\xack\xf7\x18\x17\x84].\x0b\
+`Ch\x9c\x9c\x9a\xc1UIO\xe0\xf4\xb5D\xde\xa4\
+Y4G]\xa2\xc3-\xcd\xcay\xa8\x84\xe4MV\xa8\
+\x89\xeb\xd0\x12Yu\xba*\x9a\xddW\x97\x00\x98\xbd\xbf\
+\xc9\xafrq!\xe3<\x9d\x96'\xf4\x04\x8e\xec\x03\x9c\
+\xbe\x11\x98'\xa1\x86\xfa$j\x17\xf7\xa9\xba\xb2\xba\x88\
+JV\xacE\x17\xd7\x11\xa2\xbc\x08\xc4\x05\x99\xea\xc3u\
+\xea\x88\xb1\xfd\x9c\x0b\xa2j\xb4U\xb2\xba\x1e\xfc'\xd1\
+\x86\xa2x\x8c\x0d!\xb0\xbd\x13b\x94\x96\x8e\xb7[\x9d\
+\x06\xf7#k\xd4b\xd1\xc3}u\x96k4\x80\xa6\x11\
+@\xa2\xdb\xe24\xb96!j\x80\xa5\x9b\xc5\xc1*!\
+\xce\x22\xaf\xa6\xb2\x8b\xa6\x04k\x9d\xb5\xa9\xe3;U\x0b\
+\x94=\x97\xa2p\x83\xbaE,\x9c\x13\xfe\x96\xa7\xb3r\
+p\x10u\x13\xaeF\x0bRg)Z\xd2\x0f\xbe\x91\x96\
+\xf4P\x98}8\xcfZCu]\xa3N\xd7\x01\xa9\x0a\
+\x92Y\x08s\x131\xae{\xbd\xca\x7fJA\x82n\x9e\
+\xcfD\x9bf\x08\x1ec\x10Z\xc3\xd2:\x86\x1d|\xc7\
+G\xec\xa3C\xf3\x913\xb8\xa9\xb6\xcc{5\xa2\x124\
+\xeb>k!\xcc\xb5.\xab\xc2y\xaa \xa9Z\x19\x9f\
+\xb0\xbc\x8b\x18W\x01T\x0d\xd5E\xc5\xa56\x11he\
+E\x1c\x8f\x04i\x14\xdac\xdb!\xa6\xdb\xdd\xb1l\x22\
+\xafu9,\xd1\x0f\x00}\xb8\x0f\x1di\x8b\xb5\x92f\
+\xed!\xfcv\xa1M4X\x19AC\xbeJ\xd7[y\
+\xd5\x12\xceS!\xefU\xaeE\x0b\x81V\x98\x9e\x03\xa1\
+\xe8\xec\xe3\x13\x84xp\xe1@\xb5\x83\xa7n\x82e\x03\
+pj\xad\xce\x1a-\xd1,z\x8fh \xc9>V\x86\
+\x0a\x01\xaeZ\x9e\xea}\x16U\xa9\x1a\xb4UKLk\
+\x95\xe5\x9a\x90]6p\xa0\xda\xd0\xdc\xba\xaa\xba\xd7t\
+\xcd/D\xfaYb\x19\xf61\xd5\xde<G\xf8\xbf\xe6\
+\x96(\xd0`\xc5\xfa$P\xa1=|\xf7\xe1=\xde\x96\
+H\xd4DW\xba\x1e<\x19A\xa6\x86\x14W\xf5\x22\xdd\
+\x905\xaf\xcb\x98Oq\x9d\x8ae\xa9\x82\xaa\xfa\xda\xac\
+Yx\xac\xd5\xe9\xfc\xac\x12\xed<\x87\x16\xb2,{D\
+`\x8dV\xac\xc2]dE$l\x8d\xbe*\xd1\x95X\
+Cn\xab)7Y\xad\x0el\xf2gue\x17M\xc5\
+_\xb5\xd1\xad\x07\x80D\xc3\xb1y\xc4\xe5L\xb8h\xf8\
+^\x9e\xb90\x1d\xe2\xb1\xebm\x5c\xb3\xa4\xd8;\xa9)\
+\xd6!\x93>c\xb9\x06=j|\xfaX \xdd\x05\xa0\
+j8\xaf\xcbdYUC~\xcftC\x1b\xb0\x1a\xdd\
+q%\x02\xd35\xfc\xc7u_\xd9\xf7K\xbb\x11\xa4B\
+<\xaa7\xc6\xa29Zi\xd3]\xda\x96\xd0H\xd6\x18\
+\xbe{\xaa\xcf\xe0\x11\xc2W\xcd{\xdb\xcfM\xfbe\xd4\
+\xa7\x92\xa2u*q\x171\x16\xf5.\xac\x0a,\xdd\x92\
+\x86h\xe2mU\x0b$\x9c\xef\x16k\xaf5\x9dq\x08\
+,w\x82'5;\xf4\xe9\x1e\x00hTyE7\xe0\
+\xea\x5c\xd5,\xa1\xbb\xec\x8a\xb4\xc4\x0c\xa1\xba\x98\x9e\x8c\
+6\x81\xd0\x05\x103\xa8\xc8u\xaeJW\xc2\xf5\x1c\x08\
+\x1d\x5c\xc7\x8d\xd2tuN\xb2e\xce\xc2{\xb7\x9cI\
+\x08\x1c\xf7\x02\x8fh'\xa3S5\xc9\xa2\xa1F\x97n\
+W'\xfb&U\xf1XiQ\xc3}:S\x15-\xdc\
+G\xb4\xe8:\xb5\x89\xd0\x1aR\xdcV\xb7\xa3\x1a\xf2[\
+n\xa5\xa0j\x0b\xd1\x1b\x5cSS\xaa\x22\xbbF!\xa6\
+\xf1\xb7\xc7X\x0d\x81\x87\xbb\x8e:! \xc1s\xd5C\
+\xcf\x9b\xf4\x00\xce\xac\x11\x184/\x16\x5c\x8b\xc2\x5cW\
+\xd3\xa3k\x220\xddP\xdc\xd5%\x02V\xc1B\x87U\
+\x99\xb2\xa6\xba\xfe\x87\xd1T\x9a\x9bY$\xa1\x0dx\xce\
+\xf8Y\x9e3!p\xa4\xeb\xa8\xd3q\x01\x1e<\xd3\x0f\
+\xb4\x1c#\x1b\x8e\x9b\x158M%\x1b\xa2\xa5\x5c\xa3\x0d\
+(\xc2\x138\xd0ne\x9a\x5cQv\xacjse5\
+`\xa9\x8d\xa0*\x5c\xa7\xee5\xd75U\xdd\x9e\xfb\xfd\
+\x85u[\x9e;%\x8fBjz\xcdU\xc7I\x8c\x1f\
+\x0c\x9c\x7f\xb8q\x82j\x220\xc4\xda\xb4\xa0\xba\xf0\x9e\
+\x9e\x09\xd4NW%zF[\xba\x1ePu\x8b\xfd\x94\
+(\x97gT]\x85r\xdc\x8a\xea\x0a\xcd\xab\x11T\x0d\
+\xd0\xf2\xb2\x10]\x7f\x1d\x5c\x8e$\xf4ta\xff)\xbf\
+\xa2\xbf\x13^\xe09\x9e\x98n\x0a\x1b\x04\x8c=#\xad\
+\xba\x5c\x16\xb4\xe7\xb9X\x87H\xab\xad\xe2\xb0*30\
+\x03\xef\xa9\xab\xd9\x81\xe6\xa5\xc1\xa5\xecyC\x19\xa9t\
+\x92\xa5\xd2\x03@\x8d\xe0\xaf\xa9\x93v\xbf\xb3\xa8\x90e\
+\xdd\x10i\x1d\xf3\xb3<\xf7\x87\x98\x8a\xc3eZ\xb2\xeb\
+ce\xb6\x1f\xbc@\x9a\x85\xf0\x8d:K\x87\xe5\xe8S\
+aX\xc7\x85`}\xea|\xd6B\x98\x9b\xd6j5U\
+\x06zGU\xce\x09\xab\x00\xd25zMS\xc2ST\
+\x5c\x9a\xae\xb1HB\xd7[\xad@\x98\x22\xf8G\xfd,\
+\xcf=\xd2\xea<wu\xfd\xdc\x8e\xa6\xb0 \xfdt\x9e\
+\xae\xf0\xb8\x97%\xe9\xb0D\x92b\xa5\xa5\xacqc\xae\
+\xa5qWm6\xad\xfa\xec\xb3J\xb4\xf6\xd6\xb2\xeas\
+\xea\xb8\x1e\x0a\xbbWtY#\x8a\xca\x96:\xed\xea\xdc\
+-\x08\xb3\xad\x80'x\xbe\x92\xe5\xb6>O\xc7\xc2\xbf\
+\x07\xd2\xa2\xc3{\x97\x92,\xfb\xa8\xcd\xa2\x7f\xe8.=\
+\x81\xe7v\xa7h\xe5@\x9ez\xcfT\xa4\xa5\xbbu\x1d\
+Es\x06[V\x96\xd3\xa86W\xe5\x19Y5YT\
+\xe9d\xcd\xab\xd6';vI\x9a=\xb9<\xbc\xd6=\
+\xc0\xc1\x0c<\xb7w\x1d\xfd`\x02#\x0ci\xf6R\x95\
+{\x86\xf3x\x8a\x8f\xb2\xe3uh_\xa6\x03\xf5%\x1b\
+\xb3\xa4'\xea\xeav\xea\x92\xc7\xaaf\xf9p\x9d\x1f\xac\
+\xcbz\xd7\x9d\xa7I%\xaeK\x80j'-\xd1hu\
+\xec\xfb\x11p\xd0o9\xf9\xedYb\x14\x9c>s\x8d\
+\xe0\x89\xe1Qe\x9a\xf1\x8e\x1b\x847<\xf3L\x8d\xf5\
+>3\xe6\xbb\xda\x80\xd3\x95\xb6\x98\x9907\xe4\xb2t\
+M1\xbbK\x88u\x9d\xc8\xd7\xa4\xcd\xd4U\x03\xd6\x84\
+\xdcM\xbcF\xd7\xcc\x85\xae\xe4\xb9\xdc\xf7\xc6\xdaly\
+\xe51>\x87c\xcd>CG2u\x92\xc0\xc1\xd4\x14\
+Gw\xea'\x1e\x8b\xf3dC\x88\xdf\xe6\xefe\x0f\xe0\
+\xd4\x16\xdb\x8b\xf6n\x16\xd2\x87w\xd1|\x8e*\xe7\x91\
+\xe0_\x83-f\xfb>u\x5c\x90\x96\x1f\x8dl\x98\xb3\
+9i\xfa2\xdf\xe3\x07\x9eO\xbb\xe09\x06|\xa1\xd3\
+\xd1%0\x1fT\x98}Gh,Z\xca)D\x97\x0b\
+\xec \x85S\x17\xa7\xc9r\xf5\x04\xa6l\xb8uM0\
+>\x7fW\xd4w\x03i\xac\x12\xf0\xa8\xbc\xac\xfd\x11\x8b\
+\xf6dp\xf5\xefm\x92\x96\x9a\xf8\xa9\xcb\x1fw\xc1\x03\
+\xf0\xd1\xaeO|q\x0c\xcbN\xd7N\xd1\xa0\x9f\xb4\xf1\
+\x1a:\xf2`M\xbf\x94:\xd2,\x1d\xe2Y\x1b\x15\x89\
+\xf6H\xa9\xd4\xcb\xa7\xd2\xff\xa6\xc9\xc2\x94\x8e\x15\xed\xd1\
+\x97h\xf8n\xd9y\x9a\x00$;\x94\xf8\xda\xc8S\xf8\
+\xebnU\xb0iL$\xed\xb9\xff\xfa\xedYV\xc2\x05\
+\xcf_v}\xea\xbe1\xdc\x9d\x9au\x5c>\x99\xf1V\
+\xb2KO\xbdF\xf8\xe7\xc6\xa4h\x994*\xd6\xa4e\
+\xe2\x03'@h\x05GM\xe3%Y\xf3}\xea\xbe\xbb\
+\x8f\x05\x9a9\x9f(\xbaCy0E\xec\xc7S\xf8\x8c\
+\xdf\xf6\x91\xefuI|6n\xb5\x5c\xb8\x95-~q\
+\x0c\x9b\x82\x82\xacu\xf5\xc3\x11]YmQ\x9f\xa8\xeb\
+,\xd7\xe8\x93\xf6\xa0\xbe\xf3\x96l\xe1>]\xcf\xfb\xf0\
+\xaaV\xc5\xbc\x09@\x9e\x11m\xa7\x86\xd6E\x11\x04l\
+\x0d\xe0\xee\xd8hy\x1e\xe3\x03u\xe0\x19\x03\x1f\xee\xfa\
+\xe4g\xc7\xb0\x22\x1aB\xf6\x86\x04)\x9eVJ6\xf9\
+\xf3\x86\xd7d\x9dXH\xf7b\xc2\xa6rXY%\xe5\
+\xa2\xcc]\xda\xdc_]\xe9\x89\xf4\xb4\x94MA\x87\xf4\
+\xe4:\xad\xf9;Q\x13\xc19\xef+\xab\xef\xdc\xee\xb7\
+m\xe4)\xe0cu\xe0\x01x\x8f\x8f\xeb\xfajjZ\
+\xae\xf8d\xa6\xfb,\xfe\xa3\x85\xd4\xca\x19\x5c\x9dt@\
+ ;\xce+\x1d\xa0\xd4\xba\xbc\xca\xfb\xa2\xcb2\x09?\
+WK[\xf2\xd7\x83\xbf4\xa5\x88\xba>\x9b\xdd\x0f1\
+\xaa\xf2\xa7\xfc\x5c\xd6_\xb9\x0aC\x15<\xef\xee\xfc\xb8\
+\x82O\xae\xc2R\xd8N\x94\x9b\xc2x:\x92\x95}W\
+]\xcc\x9c@\xad\x90_\x1f^&;>\xdbG,\x9d\
+\xb2Nk\xa8<\xc0\xb3\x82\xa0\x1a\xfdjL\xab\x8b;\
+\xc6\xde.\xeb]U\x01\xd4\x1d\x87\x5c\xb3\xd44\xeeX\
+\x9dv]t\xf8c/W\xd4\x91\xc4\xec\xa3\x5c\xcb6\
+W\xd3\xd0\x9d\xb4o\xf7\xd3)\xd2\xdc\xe4\xd6\x84?\xc1\
+\xad\x0b\xa7}xd_\x00g\xe7\x1a\x00\x7f\xef\xe7\xb2\
+V\xa9\xec5Z\xb7*\xf9M>j\xf3\xdd\x09l\x97\
+\xd3\xd9\x5c\x98\xcd\x0a\xcc\x5c\x9d\xd8\x10m5&#E\
+;`\xdat\x9e6PU\xdb\xdd\xca\xba\x10\x7f\x1d\xff\
+gf\xbc\x96\xee\xe7\xe6\x84\xc9\x1a\xdc\xe1\xe7\xb2\xfe\x04\
+\x93\xa1j\x05\xcf{\xe8\xea\xe3\xa4\xe0C\xab\xa6c\x98\
+\xed\xae\xdf\xf8k\xe9\x8a\x12f\x0d\xd7\x991\x0f\xd6\xd4\
+'\xb9\x89\x1b\xd5Fk\x0dQ[W\x99\xae\x17\x80\x84\
+G Bw\xd7\x8f\xbaz\x9f\x12Q\x16\xb0+\x80\xdb\
+V\xcd\xa6m\x1e\xe3-uy\xbb\xba\xf1\xf6\xae3}\
+l\x19\xeeR\xd3\xc4\xb9i\xfd\x10\x0d\xd1ASV\xbb\
+k\xd5\x85\x14k_\xa6#E\xb7\x90(\x9b\x5cU\x8b\
+~\xd3\x95&\xe9L\x12\x0b\x8f\x0aH\x8f\x16\xc3m\xc4\
+9[\xed\xf9\xbee/\xe0|\x09\xb8\xc3\x17<\xbf\xd7\
+\xc9\x9b\x13\xf8\xc0\x08v\x0e\x8a5>^k\xb9D\x87\
+d\xdea\x99\xba\x22\x11\xaf\xc2\xb3\x16\x0b\xe5C\x98\xbd\
+\x01\xd1\xa36\xa7\xf3\x7f\xf2IIx\x94\x9fd\xe1\xf9\
+\x85!|bl\xf4\x1d\x8f\xf1\xef\x9b*\x06\xea\xc6]\
+\xc0';\xd5\xa2\xd3\xf0\x00\xe5\xeePm\xff$\x0d\xe5\
+\x00m@\xf2\x16\xc3\xfa\xbc\xd6\xd1p\xc1\xd7\xf2x\xe5\
+\xd0|\xdcoC\xd5\x01=A!D{\xa5@v\x1f\
+X\xbe\xf3.\xbf&\x93\xaa\xc9\x13\xb5\xb5\xf1\xb9\xb1\xeb\
+\xacq\x02o?\x03\xdb\x07L\x17`\xb7\xf0\x9bY\xc9\
+^\x97\x89n\xcb\x11\xc9\x96<\x93\xa8\x90e\xd1\x90\x14\
+\x955\xf9\xaf\xda\xd4\x87\x0f\x07\x12\xdd`\xectE\x1e\
+\xdc\xb2z\xbc\xd2fC\xda\xf7\xaf\xc0\x9d~\xb9\xac7\
+4e\x1e\xba\xcaW\x0e\x01;\xbb*\xa4~k7\x5c\
+\xaf\xe1A\x05Q5D\x16\x1d\x89J1=\xc1u\x09\
+\xd1\xea9\xba\x14\xdd\xa9M>\x9a\x1a%\xd4\x08k]\
+\xf5<\xd9\xbdv\xf7\xae\xc5\xd9\xc1\x8f\xf2VFY\xdf\
+\xc0\xeaq\xee&n\xd9\xebJO?\xae\xfbL\xdd9\
+T\xc3\xf3\xfc\xb1\xb58C\x01\xaf>\xe4E\x945\xa6\
+F,\xedky\x00\xfe\xc8\xe7\xf4\x7fr\x12\xc2\xc84\
+\x81\xea2\xb5\xadVI\xd4\x93\xed\xbe\x05\xed\xbd\x9a-\
+\x88\x062\xdc\xe1\xb6|v\xa9\xe9\x13E\xe1\xc1\x85j\
+]\xbfhw]\xee{\x09fc\x92?;\xe5\x1da\
+\xddJ\xcb\xb2\xf5.\xf0\xbc\x11\x8f5\xefw/\xc3_\
+\x8ea\xdf\xa0\xd8!\xb7\xab\x8dI\xaf\xb4FG\x88\xdf\
+\xa7KGS\xa3)\x9f\x04i\xe3\xeb\xa2\xfd\xf5.\xb0\
+4\x85\xdc\xa2\x85#\xb6\x09\xb0u\xefi`O`\x5c\
+\xd5\xbb\xce\xe0;\xfeE\xdb\x9b]\xe0\x19Y\x9f\xd7\xad\
+ \x1d\x87#\xd2\xec\x04\xa8\x1b.D\x97\x98\xd8\xa4M\
+@{\xc5bg\xf6\xd9W\x87\xa9\xa9\xf1\x11\xa2^A\
+\xf6R\x87\xf1Xe\x22\xba\xa3':\x9e\xb7\xbe'\x0a\
+\x92\xbc%\x80\xffp\xc2\xbb\xff\xce'\xad\xe5\x99\x19<\
+\x00\xbf\x09tR\xab\x95\x09\xfc\xfe)\xd85\x9c^\xd1\
+\xe8\xbb\x1e\xdc\xb7\x14\xc1\xd72U\xbb\xc7C\xb3\xb8'\
+\x1bJ*\xbc\xdd\x14\x0d\x9b\xa9\x09\xff\xccx-\x10<\
+~\x80]\xef\xc5\x1a\xae\x1c\xc0\xbbO\xc3mco\xab\
+\xf3c]\x07\xf8\x80'\x05~\xd0\xcbA\x9e\x80\x9b\xc7\
+pI\x98\xed\xe9Y?ixp\x02\xe8XP\xd8P\
+t/\x1b\x8e\x97\x0d\xf9\xae&\xee\xd3\xe4\xbed\x8b\xb8\
+\xe8\xc5cf\x8d\x1e\xdb~h5o\xbaE\xfa\xbbC\
+\xf8\xd2\x04\xfe\xe3Io\xe0\xbc\x0d[\xe4\xbeV\xf0\x00\
+\xfc9\xf0A\x9f\x03\xff\xd31X\x89`\x9b(:\x9c\
+w\x04k\xadrzg&\xbe\x92\xaa\xc0\xb7\x84\xa3#\
+d\xf6\x22\xcd\xc2o\x99u\xdd\x0f\x87\x86\x90\xbb+#\
+\xde\xb6T\xba\xce\xd2\x07\xc0\xae\x10\xde|\xdc\xbbu\xca\
+I\xe0\x87}\x0e\x94\xf8\x8f\x1f\xf29\xe8\xf8\x04\xdep\
+\x02\xf6\xccA\xa8\x9b;K\x80\x1f\x1f\xa2C$k\x15\
+\xcdZD8\x974\xcb6u\xba\x01 \xad{\xa5\x0a\
+\xff\x22\x7f\x9fR\x8a\xce\xbcU\xc3\xf5J4\x5c>0\
+\xd1U\x0fw\xf5\x1a\xdf\x03\x83\x1e\xe0Y\xb6i\xf9\x17\
+u\x1dx\xdf*\x0c\xe7\xe1\xc5\x038bW\x9a\xd6\xd5\
+\xe0\xb4\xea0\xa29K^;\xf1\x0dz\x92h\xd1\x8e\
+j\xa3+Q\xc3m\xec\x83\xc6u\xee\x0d\xdbF\xba\x1a\
+\x90\xdb(\xb2\xda\xab\xa7\xeeq\xd7\xfbm\xe7\xd1\x96\xe7\
+\xec\x8b\xe0+1\xbc\xfe\xa8\xf7\x1c\x7f\x04\xf8\x15\xdf\x83\
+g\xd9\x10\xf7\xcbt\xed\x0cha\xf9\x96\x0b\xe1\x9b\x14\
+|%\x81\xa1\xac_U j\x94\xd9)\xf1Pt\x0b\
+\x8bu\xa2b\xadP\x89_\x872\xf7\xe2LM\x8e\x9e\
+\xde\xd7SUEA\x8a\x0e_\xaa\xf2\xbc*\xe8u\x09\
+~\xaa\x22:\xaa\x8eccL\xb9\xcc@\xc0\xf7<\x0c\
+\x0f\xfbo*|\x01\xf0\x88\xef\xc1r\x06\xf0|\x87\xd7\
+Q)\xdcx\x18\x0e\x0f\xe0\xb2\xb0\xdcM\x5c\x88nW\
+\x84\x87+\xf2\x8d<\xfa4\xd9\xf4Z\x0c(\xfcv\x18\
+\xf4\xfd\x95v\xadX\xed\xb3\xb5A\xa2\xcdfk\xbbB\
+x\xdd\xd1^\xc0\xf9\xf1>\xc0\xe9\xeb\xb6\xb2q\xcc\xba\
+\xb0\x7f\xd4u\xe0$\x85\xbf\x9d\xc0\x0b7\xc0\x85\x98\xbe\
+/\xa1\xe8^\xb75Ed\xbb\xda\xaft\xb8\xac\xda\xca\
+\xbf\x86(lj\xe5\xa7\xa0v\xff\x8a\xae\x19\xd5u\xee\
+\xac\xd2\x0c\x93\xb5\xb8-1\xfd<\xb1Z\xce\xd6\x00n\
+|\x04n\x1dy\xcf\xe9\xbb\x80_\xea\x0b\x84\xb5\xec\xe3\
+~\x07\xf04\x9f\x03\xb7\xcd\xc3;w\xc3\xa6\x89\xe9\xb6\
+\x91\xb9\xb0Y\xdd\x92\xfb<\xe8\xca\x9f\x89\xe6Exm\
+y1W\x99\xcd\xd3\xcbz:\x87\xd5\x95Kj}\xbf\
+\xc5m\xa5-y\xae\xb4\xe6\xf8\x18\xd3|kO\x08?\
+}\x04\xfef\x85\xbeF\xa4w#x\xb9\x06\xf0\xbc\xd8\
+\xf7\xc0GG\xf0\xda#\xa0\x07\xb0[L\xd7\xff\xf8\xa2\
+\xba\xa9\x98\xbb+B\xeb\x5cv\xdb\x11\xba\xcb\x86\xf7|\
+\xd2\x02bF\xb7$<#\xae\xcc\xfa\xcc\x09\x93~\xb8\
+\xf1ho\xe0|73\xee \xb0\x16\xf0<\x0c|\xa7\
+\xef\xc1\x07\xcf\xc0\x8d'`\xe7\x02l\xd5\xc6\xc4\xfa\x9a\
+\xbe\xae\x8b\xd8g\xa35:\xd2!>\xb9-\x9f\xbf1\
+\xeb\xe8\xfb\xbfd]7\xae\x19\xc0[N\xc2\xcd\xcb\xbd\
+\xfe\xdc\x9b\xf1Y1\xb3\x8e\x9c\xc7\x1d_\xb1\xdf\xfd\xf9\
+>\x07\xdf?\x82;\x03x\xd5\x06\x08\x12S(\x1d\xb6\
+\xa8\xcdu\xfd\x9b\xbb\x8e\x15\xa2y}\xfb\x94$ \xfc\
+\xf6\xc8(\xfd\xcaE=W\xe9\x0a\x9d}Bl\x9f\xcf\
+\xb8\x8fSL\x09\xcc\xd3\x86\xf0\x87'\xe0w\x8e\xf7\x9a\
+\xbb\x8f\x00\xdf\xb7\x96\xc9\x0f\xd6\xe1\xc7\xf2\x11\xe0\xe9\xc0\
+\xd5>\x07\xdf\xbd\x02\xb7K\xf8\xae\x8dpAjZ\x98\
+I\xd9#3.\xfcJ\x1f\xba\xf4\xa3\xa6\xf5_S|\
+H\xacM\x9b\xe9\x0b\xb0.\x00e\xf7\x13m\xc2\xf1\xfd\
+\x03\xf8\xbd\xe3\xf0o\xfa\x01\xe7\x01\xe0\x1b\x99}\xc3\x9b\
+5\xbb-w\xdc\xd0\xc7\xfc}\xf4\x11\xf8\xde\xa3\xf0\xc5\
+\x10\x9e6\x07R5\xff\x17b\xbd}@\x0fW\xe9\xb3\
+\x88n]|U\xcf\x11k\x03\x1a!\xe0\x17\x8e\xc2\x9b\
+\xfa\x01\xe7\xab\xc0\xb3)\x98\xc3cjy\xb2q\x13p\
+\x1dp\xa5\xcf\xc1GV\xe1\xcfG\xb0c\x11\xbem\x0e\
+VbX\x15E\xf4T\xb7w\xfaZ-\x0f=\xac\x18\
+\xbe\xaa\xb0\xeeo=|\xddX\xf5\xb5,\xb2\xbaf\xce\
+\xac\xb5z\xeda\xf8\xd8\xa8\xd7\x1c=\x08\x1c\x00\x1e]\
+\x8f\x09\x0f\xd6\xf9Gq\x13\xf02<\xb6\xdb\xce\x84\xc4\
+[N\xc1\xb1y\xf8\xcey\x08c8e\xb7(l\xd4\
+\x81\x84_]\xafoS\xcd\x92\x86S\x01\x8foz`\
+\x16\xf7\xd3\xd7\x0df\xfc\xe6\xca\x01\xfc\xcf3\xa6\x8c\xf4\
+x?\xa7s\x0a\xb8\x06\x8f\xbdF\xce\xb5\xdbr\xc7K\
+\x80\x13\xdeGkx\xdbA\xf8\x993\xb0\xb8\x04W\x08\
+HU\xbd\xaf\x07\x8f>\xc7-d\xb6V\xc8\xab\xb1\x22\
+Su\xc5\x95\xd4\x04\x0d<\x86\x8e\xbf\xe7\xfb\xbd\xa7\xc4\
+V\xcbo\x0e\xd8\x88\xeag\x8fxmiT\x1d\xff\x18\
+S\x93\xce\xe3\x19<\x8f\x00\xd7\xf75\x8d\xef=\x04\xdf\
+~\x04\xfe\xdf\x1c<c\x1e\x96\x94\xbfS\xd6=\xdeo\
+#\xa1\xa5\x96\xffu\xc0i\xb1\x16M \xf2\xf9\xaeM\
+\x9f\xc9\x0c\xcb5Cs\xff\xa3\x87\xe17fs8\xaf\
+\x04\xfen\xbd':\xe0\xec\x8c\x13\xc0;\xed\x97\xde\xe4\
+\xfb\xa1c\xabp\xd32$\xf3\xf0\xdc%\xd8\xa7a9\
+\x81\xb1\xac\xb4\xb2k\xdb\xffBt\xac\xbelX3U\
+\xd5{j-\x99n_=\x81^\x9f\x90<\xb3*\xfb\
+\x22S\xc8\xf5\xdee\xf8\xe1\xc3\xf0\x89\xd5\x99\xe6\xe2e\
+xt}{<\x81'\xf3\xb1o\xc3\xa4\xb5\xae\xf5\xfe\
+T\x0a\xff\xf7$|0\x81\xd3!|\xe3\x06\xb801\
+\x0b\xf2\xf3\x82\xaf\x8eP\x1e:*\x14E\xf7r\xe7\xea\
+\xce\xc2\xd5\x89V\xd4,\xb7\xa9Z\xb4\xaa\x1b\xd4\xdd\x04\
+9\xd6\xb03\x84\x8b\x22\xb8\xf9\x0c\xfc\xe61\xf8\xb7\xc7\
+\xbdW;\xb8\xe3\xd3\xc0K\xe9\xa8C~\xbc\x82\x07\xcc\
+b\xb1,\x84\xff\x87\xbd|\xdf*|\xf4\x14\xfc\x8d\x86\
+\xab6\xc0\xb3\x07\x10\xc4\x06\x91U}\x06\xd1\xbd\xd8\xad\
+\x0a\x9e.\xe5Z7\xb8\xb2\xec\xbej\x85\xba@\xd1e\
+y\x12\x0d\x8b\x12\x0e\x0c\xe1pj2\xe2o<\x06w\
+\xc53]\xf7\xff\x85\xa9\xbb:t6'\xf7l\x83'\
+\x97v0K\x98\xbf\xbb\xef\x07\x8f\x8e\xe0\x9dg\xe0\x81\
+\x08.]\x84o\x08!J\xe0\xa4-Q\xac\xab\xdc\xeb\
+\x02S\x93\xb5i\xcazOM\xbc\xae\x01\x86\xee\x09\x22\
+]\x80fC\x00W\x0d\xcc\xb6T\xff\xf9$\xfc\xf8a\
+\xf8\xf4\xea\xcc\xd7\xfaM\xc0?=\x17\x93z\xae%\xae\
+W\x02\x7f13\xd2\x17\xe1\xb5[\xe0\xfb\x97\xe0\x9b\x81\
+\xf1\x08\xee\xb3;\x94\x85-\xabJk\xdb\xf0z\xecS\
+:\x05\xa0\xa6\xad\x1d\xa9)\x06\xabd\xd7\xab\x85a\xb1\
+2]\xb9\xf6\x84\xf0\xb5\xd8\x84\xdf\x7fx\xc2<^\xc3\
+\xf8\x97\xc0\xbf>W\x93\xf9\x18\xe8\xa3\x1c\x00\xfe\x0c\x93\
+\xd2\x98m,\xc0\x0d[\xe0\x87\x16\xe1%!\x88\x11<\
+\x98\xdane\xa2\xa1\x8e\xa7\xa3\xafs\xdbJ\x05:\x88\
+n\xb5B\xb0\x0e<Y\xf9DV\x90\xbeA\xc2\xed\x13\
+\xb8\xe94\xbc\xfd\xa4i\xa0\xbd\x86\xb1\x0a\xbc\x1a\xb3P\
+\x81'2x\xb2\xf1VL\xf5\xda\xecc\x0e^\xbe\x15\
+^\xbe\x00/\x8c`\xaf\x06\x99\xc2(6]\xa6c\xab\
+X7&Mi\xef\xf1\xe7\x05 =M\x9a3\xa0\xa4\
+\xf6\xefl\x91\xb0\xd9\xfe\xc1\xd3\x1a>\xb5\x0a\xef9\x03\
+o;\xe9\xbd%c\x17%x5p\xdf\xb9\x9e\xc0\xc7\
+\x12<XR\xf7\xcf\xad\x80\xb5&\xb5\xea\xa9\x1b\xe1\x99\
+!\xec\x1b\xc2\x0b\x96\xe09\x01l\xb0\x05\xbd'S8\
+\x83\xdd5F\x94\xbb\xc7W\x8b\xbf\xaa\x9d\xd1\xdd\xc7m\
+\xb5\xcc\x99\x85\x11\x1a\xe6\x85\xa9\xe8\x0b\x02\xb3~\xed\xb6\
+1\xdc\xbabR\x0a_\x98\xc0'F\xebr\xed\xee\x04\
+~\x0b\xf8\xd3\xc7j\xf2\x1ek\xf0d\xe3G\xf1i\xaa\
+\xe0;\x86\xf0\x8c%x\xde\x22<k\x00\xd7Fp\x89\
+\x80\xf9\xbcD\x0fV\x94Qn\xc7v\x87\x98l\xefT\
+\xd9Qt\xa5u\x01\xbc\x00\xd3qb\xc9M\xc5kx\
+85\x8b\xec>;\x86\x0f-\xc3-+\x86\xe3\xac\xe3\
+\xf8\x1d\xe0\x97\xd7 d?\xa1\xc0\x03&\xef\xf2\xbb\xc0\
+\x0b\xd7;\x9e\x5c\x9c\x87\xa7\x0f\xe1i\x91\xc9\x0d\x1d\x18\
+\xc0~\x09\x9bC\xd8\x96\x11\x11E\xf3F\x9e\x19r*\
+fiU\xc3#\x0a\xee\x9d\xc0\x97c\xd3D\xe0\x8bc\
+\xb8c\x02\xf7\x8f\xcf\xca5\xba\x07\xf89\xe0\xe6\xc7\xc3\
+\x84=\x9e\xc0\x93\x8d\x1f\xb0\x11\xc3\xbe\xb3)Pl\x88\
+`\xc7\x00.\x12\xb0y\x0e\xf6&\xb0i\x00\x8b\x91q\
+w\xf3\x0a\x22[*2\x96pF\x1a~rf\x15\x8e\
+\x02\x87R8\x12\x1b\xa2~tr\xd6m\xc0\x08\xf8m\
+\xeb\xa6\x12\xce\x8fN\xfd\xe9\x171\xbcW?\xc9o\xbf\
+\x0f\xec>\x0f\x89\xfec\x09\xf85\x8cR\xfdd\x03\xcd\
+[\x81K\xcfC`\xed\xe3)\x98\x96\x1f\xef{\x82\x03\
+\xe63\x98^\x90\xd7\x9f\x9f\xf2\xb3'2\xbe\x19S\x15\
+\xf7D\x00\xcc\x08x\x07=\x962\x9d\x1fk\x1f\x11\xa6\
+\xfa\xffC_\xa7\xa0\xf9\x1c\xf0\xf3\xc0\xae\xf3S\xf9\xd8\
+\x8e\xcb\x80\x9f\xc0\xd4\xad\x9c|\x1c\x03\xe6\xef\x81_\xc7\
+\xd4z\x7f\xdd\x0f\xf1\x04\x04\xd2f\xe0y\x98r\xd8\xe7\
+`rh\xc1c\xf4]\xee\xc2\xec\x22t\x0b\xf0\xb7<\
+\x06)\x84\xf3\xe0Y\xdb\xc8\x8a\xd1\x0eX ]\x0e\xec\
+\xa7\xd8S~\xbd\xc6\xbd\x16,_\xb0.\xe9\xf3\x98E\
+\x91O\xd8\xf1\xff\x07\x00\xef7\xf4\xa2\x11V\xce\xaf\x00\
 \x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x06\x94\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
-\x00\x00\x06[IDATx\x9c\xed\x9b}lS\xf5\
-\x1a\xc7?\xe7\xb4k\xc7\xba\xddm\xad\xb4e@\xd9\xda\
-\xc1\x90\xe1[p\xd3\x08^\x19F\xf4z}\xc3h\x22\
-\x09\x22&\x1aD\x93\x8b\xef\xd1\xa0\x04\x22J\xc4\x18\xf4\
-\x82Q\x11\xdf\xae\xca\xd5\x19Ep\x10I\x9cS\xe6\xe4\
-E\x14e\x14]\xb9l\xad\xe0\xca:6\xc11\xfa\xb2\
-\xf6\x9c\xfb\x87\xde\xc1\xb2\x9dv=\x9c\xde\xae\x83\xef_\
-\xcby\x9e\xe7\xf7{~\x9f\xec\xf7\x9c\xdf\xcb\xa9@\x02\
-577W\x8a\xa2\xf8\xbc,\xcb\x15\x801\x91\x7f*\
-\xe4\xf7\xfb\x09\x06\x83M\xa2(^XUU\x15\xd2\xb2\
-m1\x9e\xd1\xeb\xf5V\x01\x0d\xb2,O#M\x83\x07\
-\x88D\x22\x84B\xa1\xb2X,\xb6\xb7\xba\xbaz\x84\x96\
-m+\x02\x90eY\x00\xd6\x08\x82\xa0\xd7\xb2\xc3\xd3Q\
-8\x1cv\x99\xcd\xe6F-!(\x02\xf0z\xbd6Y\
-\x96K\xb5\xeaH+i\x0d!\xde\x14\xc8\xd6\xa2\x83T\
-\xe8O\x08n- \xc4\xad\x01CY\xe1p\xb8D\x0b\
-\x08\x19\x0b\x00\xb4\x81\x90\xd1\x00\xe0\xf4!d<\x008\
-=\x08\xc3\x02\x00\xa8\x870l\x00\x80:\x08\xc3\x0a\x00\
-$\x0f!#\x00\xe8t\xba\xa4\xfc\xc3\xe1p\x89\xc5b\
-\xd9[WW\x97p-\x93\x11\x00rrr\x92\x8e\x09\
-\x85BNI\x92\xdc\x89 d\x04\x80\xc2\xc2B\xb2\xb3\
-\x93_\x98\x86B!g,\x16s/Y\xb2Dq\x9c\
-\x82\x92\xa1\xa5\xa5\xa5\x18hI\xba\xd7\x14I\x96e\xda\
-\xdb\xdb9~\xfc8\x92$\x0d:N\xa7\xd3a\xb3\xd9\
-\xc6\x97\x97\x97\xffg \xfb\x90\xd9\xe9%\x92 \x08X\
-\xadV\xacV\xab\x9a\xf0\xa8\x92!#\xa6@*u\xc6\
-\x03Hj\x0aH\x92D \x10@\x96\xe5T\xe53(\
-\x99\xcdf\x8cFm\x0e\xa8\x92\x06\xd0\xdd\xdd\x9dv\x00\
-yyy\xe9\x01\xa0\xd7\xebq\xb9\x5c\x9at<Tt\
-\xc6\xd7\x80\xb3\x00\xd2\x9d@\xba\x95T\x0d\x88F\xa3\xf8\
-|\xbe\xb4\x17A\xbb\xddNnn\xae&m%\x05@\
-\x14EL&S\xda\x01deei\xd6V\xd2\x00\xec\
-v\xbbf\x9d\x0f\x05\x9d\xf15\xe0\x8c\x07\xa08\x056\
-\xd6/\x1fS\xb7k\xcd\xff3\x97\xa4$\x8azlf\
-\x17\x95\x93n\xe1\xaf\x17\xcdC\x14\xd5ml3\xf6?\
-@\x92\xa2\xf8\x8f4\xb1a\xeb\xd3\xd4|\xbdBu;\
-\x19\x0b\xe0T}\xb5\xfbM\x22=AU\xb1\xc3\x02\x80\
-$Ei\xeb\x1c\xf0\xc0'\xa1TM\x9c\x91\x85\x0eb\
-R\x94\xcec\xad\x83\xf2\xcf6\xe62\xc66\x11\xd3\x88\
-\x02Z\xdb\xf7\xd3\xde\xe9K\x1cc0Qd\x9d@N\
-v>\xbf\xfd\xee\xa7\xb5\xdd\x13w\xfd\x11\xee\xe9\x1et\
-\xfe\xa7J\x15\x80e\xff\xf8\x8a@\xa7\x97'WU\xc5\
-\xf5\xcb6\x98\x98s\xdd3\xcc\x9c:\x9f,\xfd\xc9\xed\
-\xeb/\xfe\xbd\xac\xfdx!\x8d\x9e/\xfa\xc5\x14\xfc\xc5\
-\xcem\xd7,az\xc5\xed\x18\x0d'O\x83\x0f\x1f9\
-\xc0\xbf7/f\xebw\xeb\xd4\xa4\xac\xa8\x94\x9d\x09\xea\
-u\x06\x16/\xf8\x0c\xd7\xd8)\xbd\x89wuw0\xae\
-\xe8<n\x99\xb9\x88\xa5\xf7~\xce[\x9f<\xc4\xc6/\
-W\xf6\xc6\x8c,t\xb0\xfc\xfe\x06t\xa2\x9e7?y\
-\x90\xdd?m\xe1hW\x1bcl\x13\x99s\xdd3<\
-0\xf7=t\xba,\xeav\xbe\xadY\x9e)\xab\x017\
-\xcdx\x98s\x9d\xd3x\xe1\x9d\xdbY_\xbb\x82\x8e\xa3\
-\x87\x88\xf4\x04\xd9\xef\xdb\xc9\xf2\xd7nd\xc7\x9e\xf5\xcc\
-\xbdq\x05\x0e{yo\xcc}\xb3\xd7b4\x98X\xb4\
-\xea\x0a\xb64\xbcJ\xa0\xd3K\xa4'H\xf3\xa1\xdd,\
-_{\x13\xbe\xd6Ff\xffm)\x82\xa0]\xda)\x03\
-p\xcd\xb4\x05x\xbc\xdb\xd9\xf6\xe3G\x03\xda\xdf\xda\xf0\
-0\xa2\xa0\xe3\xaa\xcb\xee\x06`\xb4m\x22\x17\x94]\xc5\
-\xa6\xad\xff\xa45\xe0\xe9\xe7\xdf\x13\x0d\xf3\xf2\x07\xf3y\
-\xb9\xfa\x1eD\x0d\x01\xa4d\x0a\xd8,%X\x0a\xc6\xd0\
-\xb0\xbbZ\xd1\xa7\xad\xa3\x85\x83\x87\xdd\x94\x97^\x01\xc0\
-$\xe74\x00v\xb9k\x14c\x9a\xbc\xdb\xb4M\x94\x14\
-\x01(\xc8\xfbc\xc3\xd4\xd6\x11\xff^\xe5\xc8o\x07)\
-u\x5c\x0c@~\xae\xb5\xf7\xd9\xa9\x9a\x5c:\x9d\x22\xeb\
-\x84>\xcfv\xb9k\x06\xfd\x06J\xa4\x94\x00\xe8\x89\x86\
-\x010d\xc5\xbf\xce2\x1ar\x08\x86\xbb\x00\x88D\xff\
-\xf8\xfe1\xdb\x98\x0b]m\xbd>U\x95w0\xe3\x92\
-y}\xe2\x9e\x5cU\xa5\x19\x80\x94\xd4\x00\x7f\xfb~b\
-\xb1\x1e\x1cE\xe7)w,\xeap\x8c\x9a\x8c\xaf\xb5\x11\
-\x80\x83~7\x00\xe3\xc7U\xf6\xf1[\xb5\xeeNf-\
-\x14\x98\xb5PH\xf8\xdaU\xa3\x94\x00\x08\x86\xbb\xf8\xd6\
-]\xc3\xd4\x0bo\xc5\x9c_4\xa0OE\xf9\xf5\xe4\x99\
-,\xbdub\x8f\xa7\x96\xb6\x8efn\x98\xfe\x00:\x95\
-\x1b\x1b5J\xd9[\xe0\xddO\x1f'&Eyb\xfe\
-&\xac\xe6\xe2>\xb6RG\x05w\xdf\xba\x1a\x8fw;\
-\xf5\xdf\xbf\x0f@L\x8a\xf2\xaf\x8d\x8f\xe1\x1a;\x85\x07\
-\xefXG\x9e\xc9\xd2'f\xd4\xc8\xf1\xcc\xba\xf2Q\x00\
-$9\xa6Y\x9e\xaaQ\x97\x8d\xbb\x94W\x16\x1f\xe8\xf7\
-\xfc\xed\x0d\x8f\xb2\xed\xc7\x8f\xf85\xd0\xc4\xb2W\xff\xce\
-#w~\xc8\xeaE?\xb3\xc7SK\xe7\xb1VF[\
-\xcb8\xd79\x95\xfd\xbe\x9d<\xbd\xe6zd\xf9\xe4M\
-\xef7?|\xc8K\xef\xe7q\xd7\xcd/\xf2\xfa\xd2C\
-x|;\xe8\x0e\x1e\xc5fq\xe2\x18UN\xd7\x89N\
-V\xbe3\x87}\x07\xea\xd5\xa6\xddO\xaa\x00lix\
-\x05\xd3\x88\xc2\x01m\x81No\xef\xdf\xfb\x0e\xd4s\xdf\
-\xb2\x09L\xaf\x98\xcb$\xd7\xe5X\xf2G\xf3\x8b\x7f/\
-\x9f~\xb9\x92\x1d\x8d\x1b\xfa\x0c\xfe\x7f\xaa\xdd\xfe\x06\xbb\
-\xdc5\xcc\xa8\x9c\x87k\xec\x14\x0cY#\xf0\xf8vP\
-\xbd\xe5)\xbe\xdb\xb7\x89p\xe4\x84\x9a\x94\x15\xa5\x0a\xc0\
-\xc7\x9f?;h\xdf\x13\xa1\xdf\xd9\x5c\xbf\x9a\xcd\xf5\xab\
-\x07\x1ds\xac+\xc0\xfa\xda\xe4\xf6\xf8jW\x87\xc3b\
-;\x0cpN\xbeCU\xdc\xb0\x00\xe0\xb0_@~\xae\
-\xba\xd3\xea\x8c\x07\x90\x9fkg\xf6\xcc\xe7T\xc7+\xd6\
-\x00[aY\xd7\x95\x15\xf7\xa8n8\xd5\xd2\xeb\x8c\x9c\
-S0\x8e\xf3K\xaf\xc6\x90\x95\xfcWd\xbd\xed(\x19\
-.\x99|\xf31\xd5\xadf\x902~\x0a\x9c\xae\xce\x02\
-Hw\x02\xe9\xd6Y\x00\xe9N \xdd:\x0b \xdd\x09\
-\xa4[\xf1\x00h\xfa\x1b\xddtJ\x96e\xc5\x8bCE\
-\x00%%%\x87\x81\xfe\xe7\xd3\x99\xa7&\xa7\xd3\xd9\xa6\
-d\x8c;\x05\x04AX\x00\x0c\xfe\xdb\xf4\xa1'I\x10\
-\x84{\xe39\xc4\x05P\x5c\x5c\xfc\x05p-\xf0-\x10\
-\xd10\xb1T+\x02\xec\x04\xae\xfds\x0c\x8a\xfa/z\
-q3\xb20\xf7\xe0(\x00\x00\x00\x00IEND\xae\
-B`\x82\
->>>>>>> eb94b4c7a8cb73d97e5730e6117a92f534196ecc
 \x00\x00o\xf0\
 \x89\
 PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
@@ -8779,85 +4018,18 @@ qt_resource_name = b"\
 \x0bcX\x07\
 \x00s\
 \x00t\x00o\x00p\x00.\x00p\x00n\x00g\
-<<<<<<< HEAD
-=======
-\x00\x12\
-\x0a\xeb\xb3'\
-\x00s\
-\x00e\x00r\x00v\x00e\x00r\x00_\x00s\x00e\x00t\x00t\x00i\x00n\x00g\x00.\x00p\x00n\
-\x00g\
-\x00#\
-\x01\xd5\xe6G\
-\x00f\
-\x00r\x00e\x00e\x00-\x00i\x00c\x00o\x00n\x00-\x00e\x00n\x00d\x00-\x005\x001\x002\
-\x009\x006\x007\x004\x00_\x00p\x00r\x00o\x00c\x00e\x00s\x00s\x00e\x00d\x00.\x00p\
-\x00n\x00g\
-\x00,\
-\x07\x19\xcf\xe7\
-\x00f\
-\x00r\x00e\x00e\x00-\x00i\x00c\x00o\x00n\x00-\x00l\x00o\x00c\x00a\x00t\x00i\x00o\
-\x00n\x00-\x00p\x00i\x00n\x00-\x008\x002\x005\x009\x004\x004\x008\x00_\x00p\x00r\
-\x00o\x00c\x00e\x00s\x00s\x00e\x00d\x00.\x00p\x00n\x00g\
-\x00\x12\
-\x0a]+\xa7\
-\x00l\
-\x00i\x00n\x00k\x00_\x00p\x00r\x00o\x00c\x00e\x00s\x00s\x00e\x00d\x00.\x00p\x00n\
-\x00g\
->>>>>>> eb94b4c7a8cb73d97e5730e6117a92f534196ecc
 \x00\x0c\
 \x0b\xdf!G\
 \x00s\
 \x00e\x00t\x00t\x00i\x00n\x00g\x00s\x00.\x00p\x00n\x00g\
-\x00$\
-\x001\x1bg\
-\x00f\
-\x00r\x00e\x00e\x00-\x00i\x00c\x00o\x00n\x00-\x00d\x00o\x00o\x00r\x00-\x009\x000\
-\x005\x000\x009\x009\x008\x00_\x00p\x00r\x00o\x00c\x00e\x00s\x00s\x00e\x00d\x00.\
-\x00p\x00n\x00g\
 \x00\x0f\
 \x0a\xe7\xb2\x87\
 \x00p\
 \x00l\x00a\x00y\x00-\x00b\x00u\x00t\x00t\x00o\x00n\x00.\x00p\x00n\x00g\
-<<<<<<< HEAD
-=======
-\x00\x0c\
-\x0c\x18/'\
-\x00G\
-\x00r\x00e\x00e\x00n\x00O\x00f\x00f\x00.\x00p\x00n\x00g\
-\x00,\
-\x00D\xc9\x87\
-\x00f\
-\x00r\x00e\x00e\x00-\x00i\x00c\x00o\x00n\x00-\x00r\x00i\x00g\x00h\x00t\x00-\x00a\
-\x00r\x00r\x00o\x00w\x00s\x00-\x006\x007\x007\x006\x000\x001\x001\x00_\x00p\x00r\
-\x00o\x00c\x00e\x00s\x00s\x00e\x00d\x00.\x00p\x00n\x00g\
->>>>>>> eb94b4c7a8cb73d97e5730e6117a92f534196ecc
-\x00\x09\
-\x04\xe4\xb1G\
-\x00l\
-\x00i\x00n\x00k\x001\x00.\x00p\x00n\x00g\
-\x00$\
-\x0d\xf3s\xc7\
-\x00f\
-\x00r\x00e\x00e\x00-\x00i\x00c\x00o\x00n\x00-\x00g\x00e\x00a\x00r\x00s\x00-\x004\
-\x001\x006\x001\x005\x003\x00_\x00p\x00r\x00o\x00c\x00e\x00s\x00s\x00e\x00d\x00.\
-\x00p\x00n\x00g\
 \x00\x09\
 \x09a\xe6'\
 \x00R\
 \x00e\x00d\x00O\x00n\x00.\x00p\x00n\x00g\
-<<<<<<< HEAD
-=======
-\x00\x0b\
-\x03\xfc@\xc7\
-\x00G\
-\x00r\x00e\x00e\x00n\x00O\x00n\x00.\x00p\x00n\x00g\
-\x00/\
-\x08\xdd\xf2\xe7\
-\x00f\
-\x00r\x00e\x00e\x00-\x00i\x00c\x00o\x00n\x00-\x00l\x00o\x00g\x00-\x00f\x00i\x00l\
-\x00e\x00-\x00f\x00o\x00r\x00m\x00a\x00t\x00-\x008\x007\x006\x000\x004\x007\x008\
-\x00_\x00p\x00r\x00o\x00c\x00e\x00s\x00s\x00e\x00d\x00.\x00p\x00n\x00g\
->>>>>>> eb94b4c7a8cb73d97e5730e6117a92f534196ecc
 \x00\x0a\
 \x05\xc2@g\
 \x00R\
@@ -8873,61 +4045,20 @@ qt_resource_struct = b"\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x08\x00\x00\x00\x03\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x06\x00\x00\x00\x03\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-<<<<<<< HEAD
-\x00\x00\x00\x80\x00\x00\x00\x00\x00\x01\x00\x00\x11H\
-\x00\x00\x01\x8f\xaa\xcc&\x1b\
-\x00\x00\x00h\x00\x00\x00\x00\x00\x01\x00\x00\x0e\xa3\
-\x00\x00\x01\x8f\xaa\xcc&\x1b\
-\x00\x00\x00\xae\x00\x00\x00\x00\x00\x01\x00\x00\x8c\xe2\
-\x00\x00\x01\x8f\xaa\xcc&\x1a\
-\x00\x00\x00\xc8\x00\x00\x00\x00\x00\x01\x00\x00\xfc\xd6\
-\x00\x00\x01\x8f\xaa\xcc&\x1b\
-\x00\x00\x00\x96\x00\x00\x00\x00\x00\x01\x00\x00\x17\xf2\
-\x00\x00\x01\x8f\xaa\xcc&\x1a\
-\x00\x00\x00D\x00\x00\x00\x00\x00\x01\x00\x00\x0a\x1f\
-\x00\x00\x01\x8f\xaa\xcc&\x1b\
+\x00\x00\x00\x80\x00\x00\x00\x00\x00\x01\x00\x00\x83+\
+\x00\x00\x01\xa1U\x11\x872\
+\x00\x00\x00\x9a\x00\x00\x00\x00\x00\x01\x00\x00\xf3\x1f\
+\x00\x00\x01\xa1U\x11\x874\
+\x00\x00\x00h\x00\x00\x00\x00\x00\x01\x00\x00\x0e;\
+\x00\x00\x01\xa1U\x11\x874\
+\x00\x00\x00D\x00\x00\x00\x00\x00\x01\x00\x00\x09\xe5\
+\x00\x00\x01\xa1U\x11\x874\
 \x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x8f\xaa\xcc&\x1b\
-\x00\x00\x00&\x00\x00\x00\x00\x00\x01\x00\x00\x06\x0e\
-\x00\x00\x01\x8f\xaa\xcc&\x1b\
-=======
-\x00\x00\x01B\x00\x00\x00\x00\x00\x01\x00\x005\x99\
-\x00\x00\x01\x8f\x9e\x02\xf1\xcd\
-\x00\x00\x01\xd2\x00\x00\x00\x00\x00\x01\x00\x00\xa9\xac\
-\x00\x00\x01\x8f\x9e\x03\x09L\
-\x00\x00\x00P\x00\x00\x00\x00\x00\x01\x00\x00\x19)\
-\x00\x00\x01\x8f\x9e\x02;\xb9\
-\x00\x00\x02\xae\x00\x00\x00\x00\x00\x01\x00\x01.\xe9\
-\x00\x00\x01d\xea\x1a\x00\x90\
-\x00\x00\x020\x00\x00\x00\x00\x00\x01\x00\x00\xb04\
-\x00\x00\x01\x8f\x7fk`h\
-\x00\x00\x03.\x00\x00\x00\x00\x00\x01\x00\x01\xa0\x01\
-\x00\x00\x01d\xea\x1bH\xb0\
-\x00\x00\x00\x9c\x00\x00\x00\x00\x00\x01\x00\x00 5\
-\x00\x00\x01\x8f\x9e\x02\xb6\xf5\
-\x00\x00\x03H\x00\x00\x00\x00\x00\x01\x00\x02\x0f\xf5\
-\x00\x00\x01\x8f\x81\x16\xbeL\
-\x00\x00\x02\xca\x00\x00\x00\x00\x00\x01\x00\x01\x99i\
-\x00\x00\x01\x8f\x9e\x02\xcd\xf8\
-\x00\x00\x02\x96\x00\x00\x00\x00\x00\x01\x00\x00\xb9\xf9\
-\x00\x00\x01d\xea\x19{\xc0\
-\x00\x00\x00\xfa\x00\x00\x00\x00\x00\x01\x00\x00+2\
-\x00\x00\x01\x8f\x9e\x03\x1a%\
-\x00\x00\x01\x90\x00\x00\x00\x00\x00\x01\x00\x00=\x16\
-\x00\x00\x01\x8f\x9d\xea{\x80\
+\x00\x00\x01\xa1U\x11\x874\
 \x00\x00\x00&\x00\x00\x00\x00\x00\x01\x00\x00\x05\xd4\
-\x00\x00\x01\x8f\x84\x1dr\xea\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x8f\x9d\xf6\xb5\x90\
-\x00\x00\x01$\x00\x00\x00\x00\x00\x01\x00\x001\x88\
-\x00\x00\x01\x8f\x7fm\xba}\
-\x00\x00\x01\xb4\x00\x00\x00\x00\x00\x01\x00\x00Al\
-\x00\x00\x01d\xea\x1b\xbd\xe0\
-\x00\x00\x02H\x00\x00\x00\x00\x00\x01\x00\x00\xb2\xd9\
-\x00\x00\x01\x8f\x9e\x02\x9d\x92\
->>>>>>> eb94b4c7a8cb73d97e5730e6117a92f534196ecc
+\x00\x00\x01\xa1U\x11\x874\
 "
 
 def qInitResources():
@@ -0,0 +1,523 @@
+"""Serial I/O and decoding in a separate process.
+
+Python runs one thread at a time, so the reader threads' decoding and the
+GUI's painting normally take turns in one interpreter.  With ``[io]
+process=true`` in emrdoor.ini (or ``EMRDOOR_IO_PROCESS=1``) the ports are
+opened, read, decoded and written by an ``IOProcess`` instead (a ``spawn``
+child: forking a process that runs Qt threads is not safe):
+
+* door frames (EVENT, STATUS, STATUS_BITS) are applied in the child to
+  the ``emrdoor_shared`` block, one seqlock batch per read: the child's
+  writer slot counter is odd while the batch is stored, and the GUI's
+  repaint timer pulls the changed doors without a lock, retrying while a
+  counter is odd or moves (``SharedDoorState``);
+* every read is reported to the GUI over a pipe as one binary ``BATCH``
+  message: byte / frame / error counts, decode time, the ACK and NAK
+  frames (for the command futures and latencies), board / command /
+  payload length of every frame and the changed doors with their new
+  flags (the last two for the journal);
+* commands go the other way as ``SEND`` messages to the port's
+  ``CommandWriter``, which runs in the child with the port's
+  ``PollScheduler`` and ``Pacer`` (their metrics stay in the child); the
+  GUI numbers the commands and the child its polls from one shared
+  ``SeqCounter`` per port.  ``BOARDS`` changes how many boards are polled.
+
+The child answers ``READY`` (the line report of each port) or ``FAILED``
+once its ports are open, ``LOST`` when a port's reader fails and
+``CLOSED`` when it has shut down.  ``IOProcess()`` blocks until ``READY``
+or raises ``OSError``.
+
+Shutdown: ``stop()`` sends ``STOP`` and returns at once.  The child stops
+its readers, joins them, stops and joins each port's writer, closes the
+ports, releases its view of the shared block, answers ``CLOSED`` and
+exits; ``join()`` waits for that.  The GUI removes the shared block last,
+after it has taken a private copy of the door state (``detach()``) and
+every writer has exited.
+
+One process reads every port on one core.  ``IOPool`` shards the ports
+over ``workers`` such processes (``[io] workers`` / ``EMRDOOR_IO_WORKERS``),
+each with its own writer slot in the shared block and its own pipe: the
+GUI's report thread waits on every pipe at once, so the batches of all
+workers arrive through one loop, and a command goes to the worker that
+owns its port.  Workers only help with a core each: ``python -m
+benchmarks.suite workers`` measures event throughput with 1, 2 and 4 of
+them.
+"""
+import json
+import multiprocessing
+import multiprocessing.connection
+import struct
+import threading
+import time
+from array import array
+from collections import Counter, deque, namedtuple
+from contextlib import contextmanager
+
+import serial
+
+from emrdoor_capture import REPLAY_PREFIX, CaptureWriter, CapturingSerial, open_replay
+from emrdoor_commands import CommandWriter, SeqCounter
+from emrdoor_log import get_logger, setup_logging
+from emrdoor_pacing import Pacer
+from emrdoor_polling import PollScheduler
+from emrdoor_ports import line_report, open_port
+from emrdoor_protocol import (CMD_ACK, CMD_EVENT, CMD_NAK, CMD_STATUS, CMD_STATUS_BITS, FrameDecoder,
+                              ack, nak)
+from emrdoor_shared import DoorWriter
+
+log = get_logger("ioproc")
+
+# settings: PortSettings (재생 파일은 None), capture: 캡처 파일 경로,
+# poll / pace: PollScheduler / Pacer 인자 (None = 폴링 / 속도 조절 안 함)
+PortSpec = namedtuple("PortSpec", "name settings capture poll pace", defaults=(None, None, None))
+# 한 번 읽은 것: 읽은 시각 (perf_counter_ns, 프로세스가 달라도 같은 시계), ACK/NAK 프레임 바이트,
+# 프레임마다 (보드, 명령, 페이로드 길이) 3바이트, 바뀐 도어 인덱스 (array "I")와 새 플래그 (bytes)
+Batch = namedtuple("Batch", "port read_ns bytes frames errors decode_ns answers headers changes values")
+Message = namedtuple("Message", "kind port body")
+
+# 자식 -> GUI: 종류, 포트 번호 + 종류별 내용 (READY: 포트별 line_report JSON, FAILED / LOST: 오류 문구)
+MESSAGE = struct.Struct("<BH")
+READY, FAILED, BATCH, LOST, CLOSED = range(5)
+# BATCH: 읽은 시각, 바이트, 프레임, 디코더 오류, 디코드 시간 (ns), ACK/NAK 바이트 수, 바뀐 도어 수
+BATCH_HEADER = struct.Struct("<qIIIIII")
+# GUI -> 자식: 종류, 포트 번호, 값 (SEND: seq, 뒤에 프레임 / BOARDS: 보드 수)
+REQUEST = struct.Struct("<BHI")
+SEND, BOARDS, STOP = range(3)
+
+START_TIMEOUT = 10.0    # 프로세스 시작 (numpy 등 import 포함) + 포트 열기
+JOIN_TIMEOUT = 2.0
+
+
+def _parse(data):
+    kind, port = MESSAGE.unpack_from(data)
+    body = memoryview(data)[MESSAGE.size:]
+    if kind != BATCH:
+        return Message(kind, port, bytes(body).decode())
+    read_ns, nbytes, frames, errors, decode_ns, answers, changed = BATCH_HEADER.unpack_from(body)
+    pos = BATCH_HEADER.size
+    headers = pos + answers
+    pos = headers + 3 * frames
+    changes = array("I")
+    changes.frombytes(body[pos:pos + 4 * changed])
+    values = bytes(body[pos + 4 * changed:])
+    return Message(kind, port, Batch(port, read_ns, nbytes, frames, errors, decode_ns,
+                                     bytes(body[BATCH_HEADER.size:headers]), bytes(body[headers:pos]),
+                                     changes, values))
+
+
+class IOProcess:
+    """The GUI side of one I/O process serving ``specs`` into ``state`` (a ``SharedDoorState``)."""
+
+    def __init__(self, specs, state, slot=0, timeout=START_TIMEOUT, wait=True):
+        self.specs = list(specs)
+        self.slot = slot
+        self.stopping = False
+        self.reports = None
+        self._send_lock = threading.Lock()
+        context = multiprocessing.get_context("spawn")
+        self._conn, child = context.Pipe()
+        self.seq_cells = [context.Value("B", 0) for _ in self.specs]   # 포트별 seq (GUI와 자식이 같이)
+        self.process = context.Process(target=_serve, args=(child, state.name, slot, self.specs,
+                                                            self.seq_cells),
+                                       name=f"EMRDoorIO-{slot}", daemon=True)
+        self.process.start()
+        child.close()
+        if wait:
+            self.wait_ready(timeout)
+
+    def wait_ready(self, timeout=START_TIMEOUT):
+        """Wait for ``READY`` (``wait=False``); ``OSError`` if the process failed to open its ports."""
+        try:
+            message = self.receive() if self._conn.poll(timeout) else None
+        except (EOFError, OSError):
+            message = None
+        if message is None or message.kind != READY:
+            self.stopping = True
+            self.join(JOIN_TIMEOUT)
+            raise OSError(message.body if message is not None and message.kind == FAILED
+                          else "I/O process did not start")
+        self.reports = json.loads(message.body)
+
+    @property
+    def port(self):
+        return ", ".join(spec.name for spec in self.specs)
+
+    @property
+    def is_open(self):
+        return not self.stopping and self.process.is_alive()
+
+    def fileno(self):
+        return self._conn.fileno()   # multiprocessing.connection.wait()
+
+    def _request(self, kind, port=0, value=0, data=b""):
+        with self._send_lock:
+            self._conn.send_bytes(REQUEST.pack(kind, port, value) + data)
+
+    def send(self, port, data, seq):
+        """Queue a command frame on port number ``port`` (raises ``OSError`` if the process is gone)."""
+        self._request(SEND, port, seq, data)
+
+    def seq_cell(self, port):
+        return self.seq_cells[port]
+
+    def set_boards(self, boards):
+        """Poll boards 1..``boards`` on every port."""
+        try:
+            self._request(BOARDS, value=boards)
+        except OSError:
+            pass    # 이미 끝났다: 읽기 쓰레드가 끊김을 알린다
+
+    def stop(self):
+        """Ask the process to close its ports and exit; returns at once."""
+        if self.stopping:
+            return
+        self.stopping = True
+        try:
+            self._request(STOP)
+        except OSError:
+            pass
+
+    def poll(self, timeout=0.0):
+        return self._conn.poll(timeout)
+
+    def receive(self):
+        """Next ``Message`` (blocks); ``EOFError`` once the process is gone."""
+        return _parse(self._conn.recv_bytes())
+
+    def join(self, timeout=None):
+        self.process.join(timeout)
+        if self.process.is_alive():
+            log.warning("I/O process did not exit", extra={"fields": {"port": self.port}})
+            self.process.terminate()
+            self.process.join()
+        self._conn.close()
+
+
+class IOPool:
+    """``specs`` sharded by port over ``workers`` ``IOProcess``es, each writing its own slot of ``state``.
+
+    Port ``n`` (in ``specs`` order) is port ``n // workers`` of worker
+    ``n % workers``: ``send()`` goes to the worker that owns the port and
+    ``receive()`` returns every worker's messages with ``specs`` port numbers.
+    """
+
+    def __init__(self, specs, state, workers=1, timeout=START_TIMEOUT):
+        self.specs = list(specs)
+        if not 1 <= workers <= state.slots:
+            raise ValueError(f"workers must be 1..{state.slots} (writer slots of the shared state)")
+        workers = max(1, min(workers, len(self.specs)))
+        self.stopping = False
+        self.workers = []
+        self._ready = deque()
+        self._closed = set()    # CLOSED를 보낸 worker의 슬롯
+        try:
+            # 다 띄운 다음에 기다린다: 프로세스 시작 (import)과 포트 열기가 겹치도록
+            for slot in range(workers):
+                self.workers.append(IOProcess(self.specs[slot::workers], state, slot, timeout, wait=False))
+            for io in self.workers:
+                io.wait_ready(timeout)
+        except BaseException:
+            self.stopping = True
+            for io in self.workers:
+                io.stop()
+            for io in self.workers:
+                io.join(JOIN_TIMEOUT)
+            raise
+        self.reports = [self.workers[n % workers].reports[n // workers] for n in range(len(self.specs))]
+
+    @property
+    def port(self):
+        return ", ".join(spec.name for spec in self.specs)
+
+    @property
+    def is_open(self):
+        return not self.stopping and all(io.is_open for io in self.workers)
+
+    def send(self, port, data, seq):
+        """Queue a command frame on port number ``port`` in the worker that owns it."""
+        workers = len(self.workers)
+        self.workers[port % workers].send(port // workers, data, seq)
+
+    def seq_cell(self, port):
+        workers = len(self.workers)
+        return self.workers[port % workers].seq_cell(port // workers)
+
+    def set_boards(self, boards):
+        for io in self.workers:
+            io.set_boards(boards)
+
+    def stop(self):
+        """Ask every worker to close its ports and exit; returns at once."""
+        if self.stopping:
+            return
+        self.stopping = True
+        for io in self.workers:
+            io.stop()
+
+    def _live(self):
+        return [io for io in self.workers if io.slot not in self._closed]
+
+    def poll(self, timeout=0.0):
+        if self._ready:
+            return True
+        live = self._live()
+        return bool(live) and bool(multiprocessing.connection.wait(live, timeout))
+
+    def receive(self):
+        """Next ``Message`` of any worker (blocks); ``EOFError`` once a worker is gone.
+
+        ``CLOSED`` comes once, after every worker has closed its ports.
+        """
+        while not self._ready:
+            live = self._live()
+            if not live:
+                raise EOFError
+            for io in multiprocessing.connection.wait(live):
+                self._take(io)
+        return self._ready.popleft()
+
+    def _take(self, io):
+        try:
+            kind, port, body = io.receive()
+        except EOFError:
+            if not io.stopping:
+                raise
+            kind, port, body = CLOSED, 0, ""    # 멈추라고 한 뒤에 CLOSED 없이 끝났다
+        if kind == CLOSED:
+            self._closed.add(io.slot)
+            if len(self._closed) == len(self.workers):
+                self._ready.append(Message(CLOSED, 0, body))
+            return
+        port = port * len(self.workers) + io.slot
+        if kind == BATCH:
+            body = body._replace(port=port)
+        self._ready.append(Message(kind, port, body))
+
+    def join(self, timeout=None):
+        """Wait for every worker; those still serving (another one exited on its own) are stopped first."""
+        for io in self._live():
+            io.stop()
+        for io in self.workers:
+            io.join(timeout)
+
+
+class RemoteWriter:
+    """Stands in for the ``CommandWriter`` of a port an ``IOProcess`` / ``IOPool`` serves (seq numbers, sends)."""
+
+    def __init__(self, io, port=0):
+        self.io = io
+        self.port = port
+        self.pacer = None       # 속도 조절과 재전송은 I/O 프로세스의 CommandWriter가
+        self.written_ns = {}    # 쓰기 시각은 I/O 프로세스에 있다 (추적의 bus 구간 없음)
+        self.seqs = SeqCounter(io.seq_cell(port))   # 자식의 POLL과 같은 번호 공간
+
+    def next_seq(self):
+        return self.seqs.next()
+
+    def send(self, data, seq, trace_id=0):
+        try:
+            self.io.send(self.port, data, seq)
+        except OSError as e:
+            log.warning("command not sent", extra={"fields": {"port": self.io.port, "seq": seq, "error": e}})
+
+
+# -- I/O process ------------------------------------------------------------
+
+def _open(spec):
+    if spec.name.startswith(REPLAY_PREFIX):
+        connection, report = open_replay(spec.name, timeout=1), {}
+    else:
+        connection = open_port(spec.name, spec.settings)
+        report = line_report(connection)
+    if spec.capture:
+        connection = CapturingSerial(connection, CaptureWriter(spec.capture))
+    return connection, report
+
+
+class _Port:
+    """One port in the I/O process: reader thread, decoder, command writer."""
+
+    def __init__(self, server, number, spec, connection, seq_cell):
+        self.server = server
+        self.number = number
+        self.connection = connection
+        self.decoder = FrameDecoder()
+        self.poller = PollScheduler(**spec.poll) if spec.poll is not None else None
+        pacer = Pacer(spec.name, **spec.pace) if spec.pace is not None else None
+        self.commands = CommandWriter(connection, self.poller, pacer, SeqCounter(seq_cell))
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name=f"IORead {spec.name}", daemon=True)
+
+    def _run(self):
+        try:
+            self._read()
+        except Exception as e:  # 디코드/적용 중의 버그도 조용히 죽지 않고 끊김으로 알린다 (GUI가 닫는다)
+            log.exception("I/O read loop failed", extra={"fields": {"port": getattr(self.connection, "port", "")}})
+            self._lost(f"{type(e).__name__}: {e}")
+
+    def _lost(self, error):
+        if self.running:
+            self.running = False
+            self.server.send(LOST, self.number, error.encode())
+
+    def _read(self):
+        connection, decoder = self.connection, self.decoder
+        while self.running:
+            try:
+                data = connection.read(max(1, connection.in_waiting))
+                if data and connection.in_waiting:
+                    data += connection.read(connection.in_waiting)
+            except (serial.SerialException, OSError) as e:
+                if self.running:
+                    log.warning("serial read failed", extra={"fields": {
+                        "port": getattr(connection, "port", ""), "error": e}})
+                    self._lost(str(e))
+                return
+            if not data:
+                continue
+            read_ns = time.perf_counter_ns()
+            errors = decoder.errors
+            frames = decoder.feed(data)
+            decode_ns = time.perf_counter_ns() - read_ns
+            answers, changes, values = self._apply(frames) if frames else (b"", [], b"")
+            headers = bytearray()
+            for frame in frames:
+                headers += bytes((frame.board, frame.cmd, len(frame.payload)))
+            self.server.send(BATCH, self.number, BATCH_HEADER.pack(
+                read_ns, len(data), len(frames), decoder.errors - errors, decode_ns, len(answers),
+                len(changes)) + answers + headers + array("I", changes).tobytes() + values)
+
+    def _apply(self, frames):
+        # GUI의 handle_frames와 같은 순서: 연속된 STATUS_BITS는 모아서 한 번에, 한 번 읽은 것이 한 묶음
+        now = time.monotonic()
+        answers, answered = bytearray(), []
+        changes, values = [], bytearray()
+        with self.server.writing() as state:
+            flags = state.flags
+            bitmaps = []
+            for frame in frames:
+                if frame.cmd == CMD_STATUS_BITS:
+                    bitmaps.append(frame)
+                    continue
+                if frame.cmd in (CMD_ACK, CMD_NAK):
+                    answered.append(frame)
+                    continue
+                if bitmaps:
+                    changed = self._apply_bitmaps(state, bitmaps, now)
+                    changes += changed
+                    values += bytes(flags[i] for i in changed)
+                    bitmaps = []
+                changed = state.apply(frame)
+                if self.poller is not None:
+                    if frame.cmd == CMD_STATUS:
+                        self.poller.status(frame.board, len(changed), now)
+                    elif frame.cmd == CMD_EVENT:
+                        self.poller.event(frame.board, now)
+                changes += changed
+                values += bytes(flags[i] for i in changed)
+            if bitmaps:
+                changed = self._apply_bitmaps(state, bitmaps, now)
+                changes += changed
+                values += bytes(flags[i] for i in changed)
+        for frame in answered:
+            # 다시 보낼 NAK busy는 GUI에 보내지 않는다: 다시 보낸 명령의 답이 future를 푼다
+            if not self.commands.answered(frame, now):
+                continue
+            if frame.cmd == CMD_ACK:
+                answers += ack(frame.board, frame.seq, frame.answers)
+            else:
+                answers += nak(frame.board, frame.seq, frame.answers, frame.reason)
+        return bytes(answers), changes, bytes(values)
+
+    def _apply_bitmaps(self, state, frames, now):
+        changed = state.set_bitmaps(frames)
+        if self.poller is not None:
+            per_board = Counter(i // state.doors_per_board + 1 for i in changed)
+            for frame in frames:
+                self.poller.status(frame.board, per_board[frame.board], now)
+        return changed
+
+    def stop(self):
+        self.running = False
+        cancel_read = getattr(self.connection, "cancel_read", None)
+        if cancel_read is not None:
+            try:
+                cancel_read()
+            except OSError:
+                pass
+
+    def close(self):
+        self.commands.stop()
+        if not self.commands.join(JOIN_TIMEOUT):
+            log.warning("command writer did not stop", extra={"fields": {
+                "port": getattr(self.connection, "port", "")}})
+        try:
+            self.connection.close()
+        except (serial.SerialException, OSError) as e:
+            log.warning("port close failed", extra={"fields": {"error": e}})
+
+
+class _Server:
+
+    def __init__(self, conn, writer):
+        self.conn = conn
+        self.writer = writer
+        self._send_lock = threading.Lock()
+        self._state_lock = threading.Lock()     # 한 슬롯의 seqlock에는 한 번에 한 쓰레드만
+
+    def send(self, kind, port, body=b""):
+        try:
+            with self._send_lock:
+                self.conn.send_bytes(MESSAGE.pack(kind, port) + body)
+        except OSError:
+            pass    # GUI가 없어졌다: 주 루프가 EOF를 보고 끝낸다
+
+    @contextmanager
+    def writing(self):
+        with self._state_lock, self.writer.writing() as state:
+            yield state
+
+
+def _serve(conn, name, slot, specs, seq_cells):
+    """I/O process main: open ``specs``, serve them until STOP (or the GUI is gone)."""
+    setup_logging(None)     # 로그 파일은 GUI 프로세스 것
+    writer = DoorWriter(name, slot)
+    server = _Server(conn, writer)
+    ports, reports = [], []
+    try:
+        for number, spec in enumerate(specs):
+            connection, report = _open(spec)
+            ports.append(_Port(server, number, spec, connection, seq_cells[number]))
+            reports.append(report)
+    except (serial.SerialException, OSError, ValueError) as e:
+        for port in ports:
+            port.close()
+        writer.close()
+        server.send(FAILED, len(ports), str(e).encode())
+        conn.close()
+        return
+    for port in ports:
+        port.thread.start()
+    server.send(READY, 0, json.dumps(reports).encode())
+    try:
+        while True:
+            request = conn.recv_bytes()
+            kind, number, value = REQUEST.unpack_from(request)
+            if kind == SEND:
+                ports[number].commands.send(request[REQUEST.size:], value)
+            elif kind == BOARDS:
+                for port in ports:
+                    if port.poller is not None:
+                        port.poller.set_boards(value)
+            elif kind == STOP:
+                break
+    except (EOFError, OSError):
+        pass    # GUI 프로세스가 끝났다
+    for port in ports:
+        port.stop()
+    for port in ports:
+        port.thread.join(JOIN_TIMEOUT)
+        port.close()
+    writer.close()
+    server.send(CLOSED, 0)
+    conn.close()
@@ -0,0 +1,269 @@
+"""Append-only binary journal of door events.
+
+Every event is a fixed-width record appended to numbered segment files in a
+journal directory.  ``JournalWriter.append`` only packs bytes into an
+in-memory batch; a background thread writes, flushes and fsyncs the batches,
+so a crash loses at most the batch that had not been flushed yet.  If a
+write fails (disk full, I/O error) the thread logs it and stops: ``flush()``
+raises ``OSError`` from then on and ``append()`` counts the records it drops.
+"""
+import os
+import struct
+import threading
+import time
+from collections import namedtuple
+
+from emrdoor_log import get_logger
+
+MAGIC = b"EMRJ"
+VERSION = 1
+
+# magic, version, record size, segment number
+HEADER = struct.Struct("<4sHHQ")
+# timestamp (ns since epoch), board, door, event, value, aux
+RECORD = struct.Struct("<QHHBBH")
+
+SEGMENT_SUFFIX = ".seg"
+
+# 이벤트 종류
+EV_FRAME = 1        # frame decoded, value = command, aux = length in bytes
+EV_DOOR_STATE = 2   # door status changed, value = status flags
+EV_COMMAND = 3      # command sent, value = command code
+EV_CONNECT = 4
+EV_DISCONNECT = 5
+
+ALL = 0xFFFF        # board/door wildcard (e.g. open-all command)
+
+log = get_logger("journal")
+
+Event = namedtuple("Event", "ts_ns board door event value aux")
+
+
+def segment_name(number):
+    return f"{number:012d}{SEGMENT_SUFFIX}"
+
+
+def list_segments(directory):
+    """Return ``(number, path)`` for every segment in ``directory``, oldest first."""
+    if not os.path.isdir(directory):
+        return []
+    segments = []
+    for name in os.listdir(directory):
+        stem, ext = os.path.splitext(name)
+        if ext == SEGMENT_SUFFIX and stem.isdigit():
+            segments.append((int(stem), os.path.join(directory, name)))
+    segments.sort()
+    return segments
+
+
+def segment_record_count(path):
+    """Number of complete records in a segment (a torn tail record is ignored)."""
+    size = os.path.getsize(path)
+    if size < HEADER.size:
+        return 0
+    return (size - HEADER.size) // RECORD.size
+
+
+def read_segment(path):
+    """Yield the events stored in one segment file."""
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+        if len(header) < HEADER.size:
+            return
+        magic, version, record_size, _ = HEADER.unpack(header)
+        if magic != MAGIC or record_size != RECORD.size:
+            raise ValueError(f"{path}: not a journal segment")
+        data = f.read()
+    usable = len(data) - len(data) % RECORD.size
+    for fields in RECORD.iter_unpack(memoryview(data)[:usable]):
+        yield Event(*fields)
+
+
+def read_journal(directory):
+    """Yield every event in the journal, oldest first."""
+    for _, path in list_segments(directory):
+        yield from read_segment(path)
+
+
+class JournalWriter:
+    """Batches events in memory and appends them to rotating segments from a
+    background thread."""
+
+    def __init__(self, directory, segment_records=1 << 20, batch_records=4096,
+                 flush_interval=0.2, fsync=True, on_seal=None):
+        self.directory = directory
+        self.segment_records = segment_records
+        self.batch_records = batch_records
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        # 세그먼트가 꽉 차서 닫힐 때 호출 (인덱스 생성 등), 인자는 세그먼트 경로.
+        # 쓰기 쓰레드가 아닌 별도 쓰레드에서: 느려도 append가 밀리지 않고, 실패해도 저널은 계속된다
+        self.on_seal = on_seal
+        self._sealing = []
+        self._seal_lock = threading.Lock()  # 훅은 한 번에 하나씩 (같은 세그먼트를 두 쓰레드가 만지지 않도록)
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._buf = bytearray()
+        self._pending = 0
+        self._closing = False
+        self._flush_waiters = []
+        self.records_written = 0
+        self.records_dropped = 0    # 쓰기가 실패한 뒤로, 또는 닫은 뒤에 버린 레코드
+        self.error = None           # 쓰기 쓰레드를 멈춘 예외
+
+        os.makedirs(directory, exist_ok=True)
+        self._open_last_segment()
+
+        self._thread = threading.Thread(target=self._run, name="JournalWriter", daemon=True)
+        self._thread.start()
+
+    def append(self, board, door, event, value=0, aux=0, ts_ns=None):
+        if ts_ns is None:
+            ts_ns = time.time_ns()
+        record = RECORD.pack(ts_ns, board, door, event, value, aux)
+        with self._lock:
+            if self._closing or self.error is not None:
+                # 닫은 뒤: 종료 때 멈추지 않은 읽기 쓰레드가 아직 쓸 수 있다
+                self.records_dropped += 1
+                return
+            self._buf += record
+            self._pending += 1
+            if self._pending >= self.batch_records:
+                self._wake.set()
+
+    def flush(self):
+        """Write out everything appended so far and wait until it is on disk."""
+        done = threading.Event()
+        with self._lock:
+            if self._closing:
+                return
+            self._check()
+            self._flush_waiters.append(done)
+        self._wake.set()
+        done.wait()
+        with self._lock:
+            self._check()
+
+    def _check(self):
+        if self.error is not None:
+            raise OSError(f"journal writer failed: {self.error}") from self.error
+
+    def close(self):
+        with self._lock:
+            if self._closing:
+                return
+            self._closing = True
+        self._wake.set()
+        self._thread.join()
+        for thread in self._sealing:
+            thread.join()
+
+    # -- background thread -------------------------------------------------
+
+    def _open_last_segment(self):
+        segments = list_segments(self.directory)
+        if segments:
+            number, path = segments[-1]
+            count = segment_record_count(path)
+            if count < self.segment_records and os.path.getsize(path) >= HEADER.size:
+                # 크래시로 잘린 마지막 레코드는 버리고 이어서 쓴다
+                self._path = path
+                self._file = open(path, "r+b")
+                self._file.truncate(HEADER.size + count * RECORD.size)
+                self._file.seek(0, os.SEEK_END)
+                self._segment = number
+                self._segment_count = count
+                return
+            self._new_segment(number + 1)
+        else:
+            self._new_segment(0)
+
+    def _new_segment(self, number):
+        path = os.path.join(self.directory, segment_name(number))
+        self._path = path
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, RECORD.size, number))
+        self._segment = number
+        self._segment_count = 0
+
+    def _sync(self):
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def _rotate(self):
+        self._sync()
+        self._file.close()
+        sealed = self._path
+        self._new_segment(self._segment + 1)
+        if self.on_seal is not None:
+            self.in_background(self.on_seal, sealed)
+
+    def in_background(self, fn, path):
+        """Run ``fn(path)`` on a seal thread (one hook at a time, joined by ``close()``)."""
+        thread = threading.Thread(target=self._seal, args=(fn, path), name="JournalSeal", daemon=True)
+        with self._lock:    # GUI 쓰레드와 쓰기 쓰레드 (_rotate) 둘 다 부른다
+            self._sealing = [t for t in self._sealing if t.is_alive()]
+            self._sealing.append(thread)
+        thread.start()
+
+    def _seal(self, fn, path):
+        try:
+            with self._seal_lock:
+                fn(path)
+        except Exception as e:
+            log.error("journal seal hook failed", extra={"fields": {"path": path, "error": e}})
+
+    def _write(self, buf):
+        view = memoryview(buf)
+        while view:
+            room = self.segment_records - self._segment_count
+            if room == 0:
+                self._rotate()
+                continue
+            chunk = view[:room * RECORD.size]
+            self._file.write(chunk)
+            n = len(chunk) // RECORD.size
+            self._segment_count += n
+            self.records_written += n
+            view = view[len(chunk):]
+        self._sync()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            with self._lock:
+                buf, self._buf = self._buf, bytearray()
+                self._pending = 0
+                waiters, self._flush_waiters = self._flush_waiters, []
+                closing = self._closing
+            if buf:
+                written = self.records_written
+                try:
+                    self._write(buf)
+                except Exception as e:
+                    self._fail(e, len(buf) // RECORD.size - (self.records_written - written), waiters)
+                    return
+            for waiter in waiters:
+                waiter.set()
+            if closing:
+                self._file.close()
+                return
+
+    def _fail(self, error, lost, waiters):
+        log.error("journal write failed", extra={"fields": {"path": self._path, "error": error}})
+        with self._lock:
+            self.error = error
+            self.records_dropped += lost + self._pending
+            self._buf = bytearray()
+            self._pending = 0
+            waiters += self._flush_waiters
+            self._flush_waiters = []
+        for waiter in waiters:
+            waiter.set()    # flush()는 기다리지 않고 error를 본다
+        try:
+            self._file.close()
+        except OSError:
+            pass
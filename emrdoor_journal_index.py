@@ -0,0 +1,183 @@
+"""Sparse time index and per-door posting lists for journal segments.
+
+Each sealed segment gets an ``.idx`` sidecar holding, per block of ``stride``
+records, a running max/min of the timestamps (so a time range maps to a
+record range with two binary searches) and, per door, the sorted list of
+record numbers.  A query then touches only the postings and records it
+returns.  The segment still being written has no index and is scanned.
+"""
+import mmap
+import os
+import struct
+import numpy as np
+
+from emrdoor_journal import HEADER, Event, list_segments, segment_record_count
+from emrdoor_journal_mmap import RECORD_DTYPE, SegmentView
+
+INDEX_MAGIC = b"EMRX"
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".idx"
+# magic, version, stride, records, blocks, doors
+INDEX_HEADER = struct.Struct("<4sHHQII")
+
+
+def door_key(board, door):
+    return (board << 16) | door
+
+
+def index_path(segment_path):
+    return os.path.splitext(segment_path)[0] + INDEX_SUFFIX
+
+
+def build_index(segment_path, stride=256):
+    """Write the ``.idx`` sidecar for a sealed segment."""
+    n = segment_record_count(segment_path)
+    records = np.fromfile(segment_path, dtype=RECORD_DTYPE, count=n, offset=HEADER.size)
+    ts = records["ts_ns"]
+
+    if n:
+        starts = np.arange(0, n, stride)
+        # 블록별 최대값의 누적 최대 / 최소값의 뒤에서부터 누적 최소 -> 둘 다 정렬됨
+        hwm = np.maximum.accumulate(np.maximum.reduceat(ts, starts))
+        lwm = np.minimum.accumulate(np.minimum.reduceat(ts, starts)[::-1])[::-1]
+    else:
+        hwm = lwm = np.empty(0, dtype="<u8")
+
+    keys = (records["board"].astype("<u4") << 16) | records["door"]
+    postings = np.argsort(keys, kind="stable").astype("<u4")
+    doors, first, counts = np.unique(keys[postings], return_index=True, return_counts=True)
+
+    path = index_path(segment_path)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, stride, n, len(hwm), len(doors)))
+        for array, dtype in ((hwm, "<u8"), (lwm, "<u8"), (doors, "<u4"),
+                             (first, "<u4"), (counts, "<u4"), (postings, "<u4")):
+            f.write(np.ascontiguousarray(array, dtype=dtype).tobytes())
+    os.replace(tmp, path)
+    return path
+
+
+def index_journal(directory, stride=256):
+    """Build missing indexes for every sealed segment (all but the newest)."""
+    built = []
+    for _, path in list_segments(directory)[:-1]:
+        if not os.path.exists(index_path(path)):
+            built.append(build_index(path, stride))
+    return built
+
+
+class SegmentIndex:
+    """Read-only view of one ``.idx`` file."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.stride, self.records, blocks, doors = \
+            INDEX_HEADER.unpack_from(self._mm)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            raise ValueError(f"{path}: not a journal index")
+        offset = INDEX_HEADER.size
+
+        def take(dtype, count):
+            nonlocal offset
+            array = np.frombuffer(self._mm, dtype=dtype, count=count, offset=offset)
+            offset += array.nbytes
+            return array
+
+        self.hwm = take("<u8", blocks)
+        self.lwm = take("<u8", blocks)
+        self.doors = take("<u4", doors)
+        self.first = take("<u4", doors)
+        self.counts = take("<u4", doors)
+        self.postings = take("<u4", self.records)
+
+    @property
+    def min_ts(self):
+        return int(self.lwm[0]) if len(self.lwm) else None
+
+    @property
+    def max_ts(self):
+        return int(self.hwm[-1]) if len(self.hwm) else None
+
+    def lookup(self, keys, start_ns, end_ns):
+        """Record numbers for ``keys`` that may fall in ``[start_ns, end_ns)``."""
+        lo = int(np.searchsorted(self.hwm, start_ns, "left")) * self.stride
+        hi = min(self.records, int(np.searchsorted(self.lwm, end_ns, "left")) * self.stride)
+        if lo >= hi:
+            return np.empty(0, dtype="<u4")
+        found = []
+        for key in keys:
+            pos = int(np.searchsorted(self.doors, key))
+            if pos == len(self.doors) or self.doors[pos] != key:
+                continue
+            first = int(self.first[pos])
+            plist = self.postings[first:first + int(self.counts[pos])]
+            a, b = np.searchsorted(plist, (lo, hi))
+            found.append(plist[a:b])
+        if not found:
+            return np.empty(0, dtype="<u4")
+        if len(found) == 1:
+            return found[0]
+        return np.sort(np.concatenate(found))
+
+    def close(self):
+        # numpy 뷰가 살아 있으면 mmap을 닫을 수 없으므로 먼저 놓는다
+        self.hwm = self.lwm = self.doors = self.first = self.counts = self.postings = None
+        self._mm.close()
+
+
+class JournalIndex:
+    """Door/time-range queries over a journal directory."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._indexes = {}
+
+    def _index(self, path):
+        ipath = index_path(path)
+        mtime = os.path.getmtime(ipath) if os.path.exists(ipath) else None
+        cached = self._indexes.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        if cached is not None:
+            cached[1].close()
+        index = SegmentIndex(ipath) if mtime is not None else None
+        self._indexes[path] = (mtime, index)
+        return index
+
+    def query(self, doors, start_ns, end_ns):
+        """Return every event for ``doors`` (``(board, door)`` pairs) with
+        ``start_ns <= ts_ns < end_ns``, in journal order."""
+        keys = sorted({door_key(board, door) for board, door in doors})
+        events = []
+        for _, path in list_segments(self.directory):
+            index = self._index(path)
+            if index is not None:
+                if index.records == 0 or index.max_ts < start_ns or index.min_ts >= end_ns:
+                    continue
+                rows = index.lookup(keys, start_ns, end_ns)
+                if not len(rows):
+                    continue
+            with SegmentView(path) as view:
+                records = view.records
+                if not len(records):
+                    continue
+                if index is None:
+                    # 아직 쓰는 중인 세그먼트: 전체 스캔
+                    door_keys = (records["board"].astype("<u4") << 16) | records["door"]
+                    mask = np.isin(door_keys, keys)
+                    hits = records[mask]
+                else:
+                    hits = records[rows]
+                del records
+            ts = hits["ts_ns"]
+            hits = hits[(ts >= start_ns) & (ts < end_ns)]
+            events.extend(Event(*row) for row in hits.tolist())
+        return events
+
+    def close(self):
+        for _, index in self._indexes.values():
+            if index is not None:
+                index.close()
+        self._indexes.clear()
@@ -0,0 +1,161 @@
+"""Zero-copy, memory-mapped access to journal segments.
+
+Segments are mapped read-only and exposed as NumPy structured arrays laid
+directly over the file bytes, so filters and aggregations run vectorized
+without creating a Python object per record.  Only the matching rows are
+ever copied out.
+"""
+import mmap
+import os
+
+import numpy as np
+
+from emrdoor_journal import HEADER, MAGIC, RECORD, Event, list_segments
+
+RECORD_DTYPE = np.dtype([
+    ("ts_ns", "<u8"),
+    ("board", "<u2"),
+    ("door", "<u2"),
+    ("event", "u1"),
+    ("value", "u1"),
+    ("aux", "<u2"),
+])
+assert RECORD_DTYPE.itemsize == RECORD.size
+
+_EMPTY = np.empty(0, dtype=RECORD_DTYPE)
+
+
+def record_mask(records, board=None, door=None, event=None, start_ns=None, end_ns=None):
+    """Boolean mask of ``records`` matching every given filter (``None`` = any)."""
+    mask = np.ones(len(records), dtype=bool)
+    if board is not None:
+        mask &= records["board"] == board
+    if door is not None:
+        mask &= records["door"] == door
+    if event is not None:
+        mask &= records["event"] == event
+    if start_ns is not None:
+        mask &= records["ts_ns"] >= start_ns
+    if end_ns is not None:
+        mask &= records["ts_ns"] < end_ns
+    return mask
+
+
+class SegmentView:
+    """Read-only mapping of one segment; ``records`` is a view, not a copy."""
+
+    def __init__(self, path):
+        self.path = path
+        self._mm = None
+        self.records = _EMPTY
+        self.refresh()
+
+    def refresh(self):
+        """Remap if the segment grew since the last call; returns the new length."""
+        size = os.path.getsize(self.path)
+        count = (size - HEADER.size) // RECORD.size if size >= HEADER.size else 0
+        if count == len(self.records):
+            return count
+        with open(self.path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, _, record_size, _ = HEADER.unpack_from(mm)
+        if magic != MAGIC or record_size != RECORD.size:
+            mm.close()
+            raise ValueError(f"{self.path}: not a journal segment")
+        # 예전 mmap은 바깥에서 잡고 있는 배열이 없어지면 GC가 닫는다
+        self._mm = mm
+        self.records = np.frombuffer(mm, dtype=RECORD_DTYPE, count=count, offset=HEADER.size)
+        return count
+
+    def __len__(self):
+        return len(self.records)
+
+    def close(self):
+        self.records = _EMPTY
+        if self._mm is not None:
+            try:
+                self._mm.close()
+            except BufferError:
+                pass  # 호출자가 아직 뷰를 들고 있음
+            self._mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class JournalView:
+    """All segments of a journal addressed as one sequence of records."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.segments = []
+        self._starts = np.zeros(1, dtype=np.int64)
+        self.refresh()
+
+    def refresh(self):
+        """Pick up new segments and records; returns the total record count."""
+        known = {view.path for view in self.segments}
+        if self.segments:
+            self.segments[-1].refresh()
+        for _, path in list_segments(self.directory):
+            if path not in known:
+                if self.segments:
+                    self.segments[-1].refresh()  # 이전 세그먼트의 마지막 배치
+                self.segments.append(SegmentView(path))
+        self._starts = np.concatenate(([0], np.cumsum([len(v) for v in self.segments])))
+        return len(self)
+
+    def __len__(self):
+        return int(self._starts[-1])
+
+    def locate(self, row):
+        """Map a global row number to ``(segment view, local row)``."""
+        seg = int(np.searchsorted(self._starts, row, "right")) - 1
+        return self.segments[seg], row - int(self._starts[seg])
+
+    def record(self, row):
+        view, local = self.locate(row)
+        return Event(*view.records[local].tolist())
+
+    def rows(self, start, stop):
+        """Records ``start:stop``; a view when they lie in one segment, else a copy."""
+        parts = []
+        while start < stop:
+            view, local = self.locate(start)
+            take = min(stop - start, len(view) - local)
+            parts.append(view.records[local:local + take])
+            start += take
+        if len(parts) == 1:
+            return parts[0]
+        return np.concatenate(parts) if parts else _EMPTY
+
+    def select(self, **filters):
+        """Copy out the records matching ``filters`` (see ``record_mask``)."""
+        parts = [v.records[record_mask(v.records, **filters)] for v in self.segments]
+        return np.concatenate(parts) if parts else _EMPTY
+
+    def count(self, **filters):
+        return sum(int(np.count_nonzero(record_mask(v.records, **filters)))
+                   for v in self.segments)
+
+    def count_by(self, field, **filters):
+        """``{value: count}`` of a small integer field (board, door, event, value)."""
+        if RECORD_DTYPE[field].itemsize > 2:
+            raise ValueError(f"cannot count by {field}")
+        totals = np.zeros(1 << (8 * RECORD_DTYPE[field].itemsize), dtype=np.int64)
+        for v in self.segments:
+            column = v.records[field]
+            if filters:
+                column = column[record_mask(v.records, **filters)]
+            totals += np.bincount(column, minlength=len(totals))
+        nonzero = np.flatnonzero(totals)
+        return dict(zip(nonzero.tolist(), totals[nonzero].tolist()))
+
+    def close(self):
+        for view in self.segments:
+            view.close()
+        self.segments = []
+        self._starts = np.zeros(1, dtype=np.int64)
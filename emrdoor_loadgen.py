@@ -0,0 +1,343 @@
+"""Synthetic multi-port load generator (POSIX only).
+
+Drives ``ports`` pseudo-terminals in parallel, each carrying ``boards``
+controllers, into a ``MainWindow`` through the app's own receive path
+(``SerialReadThread`` -> ``handle_serial_data`` / ``handle_frames`` ->
+``repaint_doors``, or with ``process=True`` ``workers`` I/O processes
+writing the shared door state) and measures how long every door change
+takes from the moment its frame is written to the port until its grid row
+is updated.
+
+Event profiles (``rate`` is door events per second per board):
+
+  steady   constant rate
+  bursty   the same average rate, delivered in bursts of ``on`` seconds
+           every ``period`` seconds
+  herd     steady background; at ``at`` seconds every board resends the
+           status of all its doors at once (site-wide power restore)
+
+    python -m emrdoor_loadgen --ports 8 --boards 25 --profile herd --duration 5
+"""
+import argparse
+import fcntl
+import json
+import os
+import random
+import select
+import sys
+import tempfile
+import threading
+import time
+import tty
+from collections import namedtuple
+
+from emrdoor_ioproc import PortSpec
+from emrdoor_ports import DEFAULT_SETTINGS
+from emrdoor_protocol import FLAG_OPEN, FLAG_POWER_FAIL, door_event, status
+from emrdoor_shared import SharedDoorState
+
+TICK = 0.005
+LOAD_SETTINGS = DEFAULT_SETTINGS._replace(baudrate=115200, timeout=0.05)   # I/O 프로세스가 여는 pty
+
+# rate(t): 보드당 초당 이벤트 수, resync_at: 전체 상태 재전송 시각 (None = 없음)
+Profile = namedtuple("Profile", "name rate resync_at")
+
+
+def steady(rate):
+    return Profile("steady", lambda t: rate, None)
+
+
+def bursty(rate, on=0.2, period=1.0):
+    peak = rate * period / on
+    return Profile("bursty", lambda t: peak if t % period < on else 0.0, None)
+
+
+def herd(rate, at=1.0):
+    return Profile("herd", lambda t: rate, at)
+
+
+PROFILES = {"steady": steady, "bursty": bursty, "herd": herd}
+
+
+def percentiles(samples, scale=1e3, unit="ms"):
+    if not samples:
+        return {}
+    samples = sorted(samples)
+    pick = lambda q: samples[min(len(samples) - 1, int(q * len(samples)))] * scale  # noqa: E731
+    return {f"p50_{unit}": pick(0.50), f"p90_{unit}": pick(0.90), f"p99_{unit}": pick(0.99),
+            f"p999_{unit}": pick(0.999), f"max_{unit}": samples[-1] * scale}
+
+
+class LatencyTracker:
+    """Send time of the oldest unpainted change per door index.
+
+    Generator threads call ``sent()``; the GUI thread calls ``painted()``
+    after ``repaint_doors``.  A door that changes again before it is painted
+    keeps its first timestamp, which is the delay an operator would see.
+    """
+
+    def __init__(self):
+        self.pending = {}
+        self.samples = []
+        self.frames = 0
+
+    def sent(self, indices, t):
+        setdefault = self.pending.setdefault
+        for i in indices:
+            setdefault(i, t)
+
+    def painted(self, indices, t):
+        pop = self.pending.pop
+        for i in indices:
+            sent = pop(i, None)
+            if sent is not None:
+                self.samples.append(t - sent)
+
+    def settled(self, shown, loads, t):
+        """Pending doors already showing the flags their port sent last.
+
+        The shared-memory state (``process=True``) repaints only doors that
+        differ from the last frame, so a door that changed and changed back
+        in between is up to date without ever being dirty.
+        """
+        per_port = len(loads[0].flags)
+        self.painted([i for i in list(self.pending)
+                      if shown[i] == loads[i // per_port].flags[i % per_port]], t)
+
+    def received(self, frames):
+        self.frames += len(frames)
+
+
+class LoadPort:
+    """One pty carrying boards ``first_board`` .. ``first_board + boards - 1``."""
+
+    def __init__(self, first_board, boards, doors, profile, tracker, baudrate=None, seed=None):
+        self.first_board = first_board
+        self.boards = boards
+        self.doors = doors
+        self.profile = profile
+        self.tracker = tracker
+        self.baudrate = baudrate
+        self.rng = random.Random(seed)
+        self.flags = bytearray(boards * doors)
+        self.port = None
+        self.bytes_sent = 0
+        self.events_sent = 0
+
+        self._base = (first_board - 1) * doors   # DoorState 인덱스 시작
+        self._master = self._slave = None
+        self._thread = None
+        self._running = False
+        self._seq = 0
+
+    def start(self):
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._slave)
+        tty.setraw(self._master)
+        fl = fcntl.fcntl(self._master, fcntl.F_GETFL)
+        fcntl.fcntl(self._master, fcntl.F_SETFL, fl | os.O_NONBLOCK)
+        self.port = os.ttyname(self._slave)
+        return self.port
+
+    def run(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=f"LoadPort-{self.first_board}",
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def close(self):
+        self.stop()
+        for fd in (self._master, self._slave):
+            if fd is not None:
+                os.close(fd)
+        self._master = self._slave = None
+
+    def _next_seq(self):
+        self._seq = (self._seq + 1) & 0xFF
+        return self._seq
+
+    def _write(self, data):
+        view = memoryview(data)
+        while view:
+            try:
+                n = os.write(self._master, view)
+            except BlockingIOError:
+                # 읽는 쪽이 밀렸다: 버리지 않고 기다린다 (지연에 그대로 반영)
+                _, writable, _ = select.select([], [self._master], [], 1.0)
+                if not writable and not self._running:
+                    return
+                continue
+            self.bytes_sent += n
+            view = view[n:]
+
+    def _run(self):
+        doors = self.doors
+        started = last = bus_free = time.monotonic()
+        carry = 0.0
+        resync_at = self.profile.resync_at
+        while self._running:
+            time.sleep(max(TICK, bus_free - time.monotonic()))
+            now = time.monotonic()
+            carry += self.profile.rate(now - started) * self.boards * (now - last)
+            last = now
+            count = int(carry)
+            carry -= count
+
+            out = bytearray()
+            changed = []
+            for _ in range(count):
+                k = self.rng.randrange(self.boards * doors)
+                self.flags[k] ^= FLAG_OPEN
+                board, door = divmod(k, doors)
+                out += door_event(self.first_board + board, self._next_seq(), door + 1, self.flags[k])
+                changed.append(self._base + k)
+            if resync_at is not None and now - started >= resync_at:
+                resync_at = None
+                for board in range(self.boards):
+                    start = board * doors
+                    for k in range(start, start + doors):
+                        self.flags[k] ^= FLAG_POWER_FAIL
+                    out += status(self.first_board + board, self._next_seq(), 1,
+                                  self.flags[start:start + doors])
+                    changed.extend(range(self._base + start, self._base + start + doors))
+            if not out:
+                continue
+            self.tracker.sent(changed, time.perf_counter())
+            self.events_sent += len(changed)
+            self._write(out)
+            if self.baudrate:
+                # 8N1: 바이트당 10비트, 다음 쓰기는 선로가 빈 다음에
+                bus_free = max(now, bus_free) + len(out) * 10 / self.baudrate
+
+
+def run_load(app, window, ports=8, boards=25, profile="steady", rate=1.0, duration=5.0,
+             baudrate=None, seed=1, drain=5.0, process=False, workers=1, **options):
+    """Drive ``window`` with ``ports`` x ``boards`` boards; returns a result dict."""
+    import serial
+
+    doors = window.door_state.doors_per_board
+    profile = PROFILES[profile](rate, **options)
+    tracker = LatencyTracker()
+    window.build_door_rows(ports * boards * doors)
+    app.processEvents()
+
+    painting = []
+
+    def traced_take_dirty():
+        dirty = take_dirty()
+        painting.extend(dirty)
+        return dirty
+
+    def traced_repaint():
+        window.repaint_doors()
+        t = time.perf_counter()
+        tracker.painted(painting, t)
+        painting.clear()
+        if process:
+            tracker.settled(window.door_state.flags, loads, t)
+
+    loads = [LoadPort(p * boards + 1, boards, doors, profile, tracker, baudrate,
+                      None if seed is None else seed + p) for p in range(ports)]
+    readers = []
+    state = take_dirty = None
+    try:
+        names = [load.start() for load in loads]
+        if process:
+            # 포트를 workers개의 I/O 프로세스에 나눠서 (window.door_state가 공유 메모리로 바뀐다)
+            readers.append(window.start_io_process([PortSpec(name, LOAD_SETTINGS) for name in names], workers))
+        else:
+            for name in names:
+                reader = window.start_reader(serial.Serial(name, 115200, timeout=0.05))
+                reader.frames_received.connect(tracker.received)
+                readers.append(reader)
+
+        # repaint_doors가 그린 인덱스를 가로챈다
+        state = window.door_state
+        take_dirty = state.take_dirty
+        state.take_dirty = traced_take_dirty
+        window.repaint_timer.timeout.disconnect()
+        window.repaint_timer.timeout.connect(traced_repaint)
+
+        t0 = time.perf_counter()
+        for load in loads:
+            load.run()
+        while time.perf_counter() - t0 < duration:
+            app.processEvents()
+        for load in loads:
+            load.stop()
+        sent_s = time.perf_counter() - t0
+        end = time.perf_counter() + drain
+        while tracker.pending and time.perf_counter() < end:
+            app.processEvents()
+    finally:
+        if take_dirty is not None:
+            state.take_dirty = take_dirty
+            window.repaint_timer.timeout.disconnect()
+            window.repaint_timer.timeout.connect(window.repaint_doors)
+        if isinstance(window.door_state, SharedDoorState):
+            window.door_state = window.door_state.detach()  # 공유 블록은 I/O 프로세스가 끝나면 지운다
+        for reader in readers:
+            reader.data_received.disconnect()  # 닫을 때 "Disconnected" 대화상자 방지
+            reader.stop()  # read 취소, 포트는 읽기 쓰레드가 닫는다
+        for reader in readers:
+            reader.wait()
+            if process:
+                reader.state.close()
+        for load in loads:
+            load.close()
+    if process:
+        tracker.frames = sum(reader.frames for reader in readers)
+
+    events = sum(load.events_sent for load in loads)
+    result = {
+        "profile": profile.name, "ports": ports, "boards": ports * boards, "doors": ports * boards * doors,
+        "events": events, "frames": tracker.frames, "painted": len(tracker.samples),
+        "unpainted": len(tracker.pending), "events_per_s": events / sent_s,
+        "mbytes_per_s": sum(load.bytes_sent for load in loads) / sent_s / 1e6,
+    }
+    result.update(percentiles(tracker.samples))
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Multi-port synthetic load through the console")
+    parser.add_argument("--ports", type=int, default=8)
+    parser.add_argument("--boards", type=int, default=25, help="boards per port")
+    parser.add_argument("--profile", choices=PROFILES, default="steady")
+    parser.add_argument("--rate", type=float, default=1.0, help="door events per second per board")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds of load")
+    parser.add_argument("--baud", type=int, default=0, help="pace each port at this baud rate (0 = unpaced)")
+    parser.add_argument("--at", type=float, default=1.0, help="herd: resync time in seconds")
+    parser.add_argument("--on", type=float, default=0.2, help="bursty: burst length in seconds")
+    parser.add_argument("--period", type=float, default=1.0, help="bursty: burst period in seconds")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--process", action="store_true", help="read the ports in a separate I/O process")
+    parser.add_argument("--workers", type=int, default=1, help="with --process: I/O processes to shard the ports over")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    import EMRDoor_App
+
+    options = {"herd": {"at": args.at}, "bursty": {"on": args.on, "period": args.period}}
+    app = QApplication.instance() or QApplication(sys.argv)
+    EMRDoor_App.JOURNAL_DIR = tempfile.mkdtemp(prefix="emrdoor-load-")
+    window = EMRDoor_App.MainWindow()
+    window.show()
+    try:
+        result = run_load(app, window, args.ports, args.boards, args.profile, args.rate,
+                          args.duration, args.baud or None, args.seed, process=args.process,
+                          workers=args.workers, **options.get(args.profile, {}))
+    finally:
+        window.close()
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
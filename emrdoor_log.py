@@ -0,0 +1,118 @@
+"""Non-blocking structured logging.
+
+Log calls on the GUI/reader threads only put the ``LogRecord`` on a queue;
+a ``QueueListener`` thread formats it and writes the file/console output.
+Structured fields are passed with ``extra={"fields": {...}}`` and rendered
+as ``key=value`` pairs.  High-frequency call sites (one per serial frame)
+should go through a ``Sampler`` so that, when enabled, only one record in
+``every`` is emitted, and when disabled the cost is a single attribute
+check.
+"""
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+
+LOGGER_NAME = "emrdoor"
+# processName: I/O 프로세스 (EMRDoorIO-N)의 레코드를 GUI 프로세스 (MainProcess) 것과 구별한다
+LOG_FORMAT = "%(asctime)s %(levelname)-5s %(name)s %(processName)s/%(threadName)s: %(message)s%(fields_text)s"
+
+_listener = None
+
+
+def get_logger(name=None):
+    return logging.getLogger(f"{LOGGER_NAME}.{name}" if name else LOGGER_NAME)
+
+
+class StructuredFormatter(logging.Formatter):
+    """Appends ``extra={"fields": {...}}`` to the message as ``key=value``."""
+
+    def format(self, record):
+        fields = getattr(record, "fields", None)
+        record.fields_text = "".join(f" {k}={v}" for k, v in fields.items()) if fields else ""
+        return super().format(record)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    # 기본 QueueHandler.prepare()는 호출한 쓰레드에서 메시지를 포맷한다.
+    # 포맷은 listener 쓰레드에서 하도록 레코드를 그대로 넘긴다.
+    def prepare(self, record):
+        return record
+
+
+class Sampler:
+    """Gate for per-frame log calls: ``if sampler(): log.debug(...)``.
+
+    Returns ``True`` for one call in ``every`` while the logger is enabled
+    for ``level``; ``suppressed`` is the number of calls skipped since the
+    last ``True`` so it can be logged alongside the sample.
+    """
+
+    def __init__(self, logger, level=logging.DEBUG, every=100):
+        self.logger = logger
+        self.level = level
+        self.every = every
+        self.suppressed = 0
+        self._countdown = 0
+
+    def __call__(self):
+        if not self.logger.isEnabledFor(self.level):
+            return False
+        if self._countdown:
+            self._countdown -= 1
+            self.suppressed += 1
+            return False
+        self._countdown = self.every - 1
+        return True
+
+    def take_suppressed(self):
+        n, self.suppressed = self.suppressed, 0
+        return n
+
+
+def setup_logging(path=None, level=logging.INFO, console=True,
+                  max_bytes=10 * 1024 * 1024, backups=5):
+    """Route the ``emrdoor`` logger through a queue to a background writer."""
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    formatter = StructuredFormatter(LOG_FORMAT)
+    handlers = []
+    if path:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8")
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+    if console:
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        handlers.append(stream_handler)
+
+    log_queue = queue.SimpleQueue()
+    logger = get_logger()
+    logger.setLevel(level)
+    logger.propagate = False
+    logger.addHandler(_DeferredQueueHandler(log_queue))
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+    return _listener
+
+
+def shutdown_logging():
+    """Flush queued records and stop the writer thread."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    logger = get_logger()
+    for handler in list(logger.handlers):
+        if isinstance(handler, _DeferredQueueHandler):
+            logger.removeHandler(handler)
+    _listener = None
@@ -0,0 +1,208 @@
+"""In-process metrics: counters, gauges and log-linear (HDR-style) histograms.
+
+Recording is plain attribute and list arithmetic (no locks), a few hundred
+nanoseconds per call, so the receive path can be instrumented per chunk
+and per frame batch.  The price is that every metric must have a single
+writer thread; metrics updated from ``SerialReadThread`` therefore carry a
+``port`` label, one instance per reader.
+
+    from emrdoor_metrics import REGISTRY
+    rx = REGISTRY.counter("serial_read_bytes_total", "bytes read", port="COM3")
+    rx.inc(len(data))
+    REGISTRY.snapshot()
+
+``EMRDOOR_METRICS=0`` hands out no-op metrics instead.
+"""
+import os
+import threading
+
+# 히스토그램 버킷: 2의 거듭제곱 구간마다 16칸 (상대 오차 약 6%), 0 ~ 2**64
+SUB_BITS = 5
+SHIFT = SUB_BITS - 1
+BUCKETS = ((64 - SUB_BITS) << SHIFT) + (1 << SUB_BITS)
+
+
+def bucket_index(value):
+    e = value.bit_length() - SUB_BITS
+    return value if e <= 0 else (e << SHIFT) + (value >> e)
+
+
+def bucket_bounds(index):
+    """``(lowest, highest)`` value that falls into bucket ``index``."""
+    if index < 1 << SUB_BITS:
+        return index, index
+    e = (index >> SHIFT) - 1
+    m = index - (e << SHIFT)
+    return m << e, ((m + 1) << e) - 1
+
+
+def _key(name, labels):
+    return name, tuple(sorted(labels.items()))
+
+
+def format_name(name, labels):
+    if not labels:
+        return name
+    return name + "{" + ",".join(f"{k}={v}" for k, v in labels) + "}"
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help="", labels=()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.value = 0
+
+    def inc(self, n=1):
+        self.value += n
+
+    def snapshot(self):
+        return self.value
+
+
+class Gauge:
+    """Set from the owning thread, or computed on read when ``fn`` is given."""
+    kind = "gauge"
+
+    def __init__(self, name, help="", labels=(), fn=None):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.fn = fn
+        self._value = 0
+
+    @property
+    def value(self):
+        return self.fn() if self.fn is not None else self._value
+
+    def set(self, value):
+        self._value = value
+
+    def inc(self, n=1):
+        self._value += n
+
+    def dec(self, n=1):
+        self._value -= n
+
+    def snapshot(self):
+        return self.value
+
+
+class Histogram:
+    """Integer samples (normally nanoseconds) in log-linear buckets."""
+    kind = "histogram"
+
+    def __init__(self, name, help="", labels=()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.counts = [0] * BUCKETS
+        self.count = 0
+        self.sum = 0
+        self.max = 0
+
+    def record(self, value):
+        e = value.bit_length() - SUB_BITS
+        self.counts[value if e <= 0 else (e << SHIFT) + (value >> e)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q, base=None):
+        """Upper bound of the bucket holding quantile ``q``.
+
+        ``base`` is an earlier copy of ``counts``; the percentile is then
+        taken over the samples recorded since that copy.
+        """
+        counts = self.counts if base is None else [a - b for a, b in zip(self.counts, base)]
+        total = sum(counts)
+        if not total:
+            return 0
+        rank = max(1, round(q * total))
+        seen = 0
+        for i, n in enumerate(counts):
+            seen += n
+            if seen >= rank:
+                return min(bucket_bounds(i)[1], self.max)
+        return self.max
+
+    def snapshot(self):
+        return {"count": self.count, "sum": self.sum, "max": self.max,
+                "p50": self.percentile(0.50), "p90": self.percentile(0.90),
+                "p99": self.percentile(0.99), "p999": self.percentile(0.999)}
+
+
+class _Null:
+    """Stand-in handed out by a disabled registry."""
+    kind = "null"
+    value = count = sum = max = 0
+    counts = ()
+
+    def inc(self, n=1):
+        pass
+
+    def dec(self, n=1):
+        pass
+
+    def set(self, value):
+        pass
+
+    def record(self, value):
+        pass
+
+    def percentile(self, q, base=None):
+        return 0
+
+
+NULL = _Null()
+
+
+class Registry:
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name, help, labels, **kwargs):
+        if not self.enabled:
+            return NULL
+        key = _key(name, labels)
+        with self._lock:
+            metric = self._metrics.get(key)
+            if metric is None:
+                metric = self._metrics[key] = cls(name, help, key[1], **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"metric {name!r} is already a {metric.kind}")
+        return metric
+
+    def counter(self, name, help="", **labels):
+        return self._get(Counter, name, help, labels)
+
+    def gauge(self, name, help="", fn=None, **labels):
+        return self._get(Gauge, name, help, labels, fn=fn)
+
+    def histogram(self, name, help="", **labels):
+        return self._get(Histogram, name, help, labels)
+
+    def metrics(self, name=None):
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return [m for m in metrics if name is None or m.name == name]
+
+    def total(self, name):
+        """Sum of a counter or gauge over all its label sets."""
+        return sum(m.value for m in self.metrics(name))
+
+    def snapshot(self):
+        return {format_name(m.name, m.labels): m.snapshot() for m in self.metrics()}
+
+    def clear(self):
+        with self._lock:
+            self._metrics.clear()
+
+
+REGISTRY = Registry(enabled=os.environ.get("EMRDOOR_METRICS", "1") != "0")
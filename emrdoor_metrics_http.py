@@ -0,0 +1,139 @@
+"""Prometheus text exposition of the metrics registry over local HTTP.
+
+    EMRDOOR_METRICS_PORT=9464 python EMRDoor_App.py
+    curl http://127.0.0.1:9464/metrics
+
+Histograms recorded in nanoseconds (``*_ns``) are exported in seconds
+(``*_seconds``) with power-of-two ``le`` boundaries from 1 µs to ~69 s.
+``Exposition`` keeps the rendered text of every metric and only
+re-renders the ones whose value or sample count changed since the last
+scrape; an unchanged registry is served from one cached byte string.
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import accumulate
+
+from emrdoor_metrics import bucket_index
+
+PREFIX = "emrdoor_"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_PORT = 9464
+
+# le 경계: 2**10 ns (~1µs) ~ 2**36 ns (~69s); 경계 값은 버킷 시작과 정확히 맞는다
+LE_NS = [1 << k for k in range(10, 37)]
+LE_INDEX = [bucket_index(ns) for ns in LE_NS]
+LE_TEXT = [f'le="{ns / 1e9!r}"' for ns in LE_NS]
+LE_INF = 'le="+Inf"'
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(labels, extra=None):
+    items = [f'{k}="{_escape(v)}"' for k, v in labels]
+    if extra:
+        items.append(extra)
+    return "{" + ",".join(items) + "}" if items else ""
+
+
+def export_name(metric):
+    name = metric.name
+    if metric.kind == "histogram" and name.endswith("_ns"):
+        name = name[:-3] + "_seconds"
+    return PREFIX + name
+
+
+def _render_metric(name, metric):
+    if metric.kind != "histogram":
+        return f"{name}{_labels(metric.labels)} {metric.value}\n"
+    labels = _labels(metric.labels)
+    lines = []
+    scale = 1
+    if name.endswith("_seconds"):
+        scale = 1e-9
+        cumulative = list(accumulate(metric.counts))
+        for le, i in zip(LE_TEXT, LE_INDEX):
+            lines.append(f"{name}_bucket{_labels(metric.labels, le)} {cumulative[i - 1]}\n")
+    lines.append(f"{name}_bucket{_labels(metric.labels, LE_INF)} {metric.count}\n")
+    lines.append(f"{name}_sum{labels} {metric.sum * scale!r}\n")
+    lines.append(f"{name}_count{labels} {metric.count}\n")
+    return "".join(lines)
+
+
+class Exposition:
+    """Cached text exposition of a registry (thread safe)."""
+
+    def __init__(self, registry):
+        self.registry = registry
+        self._lock = threading.Lock()
+        self._cache = {}        # metric id -> (version, text)
+        self._versions = None
+        self._body = b""
+        self.renders = 0        # 실제로 다시 만든 메트릭 수 (벤치마크용)
+
+    def render(self):
+        with self._lock:
+            metrics = sorted(self.registry.metrics(), key=lambda m: (m.name, m.labels))
+            versions = [(id(m), m.count if m.kind == "histogram" else m.value) for m in metrics]
+            if versions == self._versions:
+                return self._body
+            cache = {}
+            parts = []
+            last = None
+            for metric, (key, version) in zip(metrics, versions):
+                name = export_name(metric)
+                if metric.name != last:
+                    last = metric.name
+                    if metric.help:
+                        parts.append(f"# HELP {name} {metric.help}\n")
+                    parts.append(f"# TYPE {name} {metric.kind}\n")
+                cached = self._cache.get(key)
+                if cached is None or cached[0] != version:
+                    cached = (version, _render_metric(name, metric))
+                    self.renders += 1
+                cache[key] = cached
+                parts.append(cached[1])
+            self._cache = cache
+            self._versions = versions
+            self._body = "".join(parts).encode()
+            return self._body
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = self.server.exposition.render()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # 스크레이프마다 stderr에 찍지 않는다
+
+
+class MetricsServer:
+    """``/metrics`` on ``host:port`` served from a daemon thread."""
+
+    def __init__(self, registry, port=DEFAULT_PORT, host="127.0.0.1"):
+        self.exposition = Exposition(registry)
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.exposition = self.exposition
+        self.address = self._server.server_address
+        self._thread = threading.Thread(target=self._server.serve_forever, name="MetricsServer",
+                                        daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread.is_alive():
+            self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,121 @@
+"""Per-board transmit pacing: AIMD token buckets.
+
+A small controller buffers a few frames and silently drops the rest when
+commands arrive faster than it executes them; the host only notices a
+missing ACK, retries, and the retries make the overrun worse.  ``Pacer``
+gives every board a token bucket (``burst`` frames deep) and adapts its
+rate from what the board answers:
+
+* every timely ACK adds ``increase / rate`` frames/s, so the rate climbs by
+  about ``increase`` frames/s per second of clean traffic;
+* a NAK busy, a missing ACK (timeout) or an ACK slower than
+  ``latency_limit`` times the board's best round trip and more than
+  ``latency_slack`` over it (its buffer is filling up; the slack keeps a
+  few ms of shared-bus queueing from counting) multiplies the rate by
+  ``decrease``.  Signals about frames
+  sent before the last cut are ignored, so one burst of losses (which
+  comes back as a string of timeouts) cuts the rate once.
+
+The rate of every board is exported as ``board_send_rate{port,board}``.
+``CommandWriter`` holds back a command until its board has a token and
+retries it when the ACK does not come; broadcasts are not paced.
+"""
+import threading
+
+from emrdoor_metrics import REGISTRY
+
+
+class TokenBucket:
+
+    def __init__(self, rate, burst, now):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = now
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, now):
+        """Take a token: 0 if there was one, else seconds until there is (nothing taken)."""
+        self._refill(now)
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+
+class _Board:
+
+    def __init__(self, bucket, gauge):
+        self.bucket = bucket
+        self.gauge = gauge
+        self.best_rtt = None
+        self.cut_at = 0.0   # 마지막으로 줄인 시각; 그 전에 보낸 프레임의 신호는 이미 반영됨
+
+
+class Pacer:
+
+    def __init__(self, port="", initial=50.0, minimum=5.0, maximum=2000.0, burst=4, increase=500.0,
+                 decrease=0.5, latency_limit=4.0, latency_slack=0.02, timeout=0.5):
+        self.port = port
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_limit = latency_limit
+        self.latency_slack = latency_slack
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._boards = {}
+
+    def _board(self, board, now):
+        state = self._boards.get(board)
+        if state is None:
+            gauge = REGISTRY.gauge("board_send_rate", "paced command rate (frames/s)",
+                                   port=self.port, board=str(board))
+            state = self._boards[board] = _Board(TokenBucket(self.initial, self.burst, now), gauge)
+            gauge.set(self.initial)
+        return state
+
+    def rate(self, board):
+        with self._lock:
+            state = self._boards.get(board)
+            return state.bucket.rate if state is not None else self.initial
+
+    def take(self, board, now):
+        """0 if a frame for ``board`` may go now (a token is used), else seconds to wait."""
+        with self._lock:
+            return self._board(board, now).bucket.take(now)
+
+    def ack(self, board, sent, now):
+        """``board`` answered the frame written at ``sent``."""
+        rtt = now - sent
+        with self._lock:
+            state = self._board(board, now)
+            if state.best_rtt is None or rtt < state.best_rtt:
+                state.best_rtt = rtt
+            if rtt > max(state.best_rtt * self.latency_limit, state.best_rtt + self.latency_slack):
+                self._decrease(state, sent, now)
+            else:
+                bucket = state.bucket
+                self._set(state, bucket.rate + self.increase / bucket.rate)
+
+    def backoff(self, board, sent, now):
+        """NAK busy or no answer for the frame written to ``board`` at ``sent``."""
+        with self._lock:
+            self._decrease(self._board(board, now), sent, now)
+
+    def _decrease(self, state, sent, now):
+        if sent <= state.cut_at:
+            return
+        state.cut_at = now
+        self._set(state, state.bucket.rate * self.decrease)
+
+    def _set(self, state, rate):
+        rate = min(self.maximum, max(self.minimum, rate))
+        state.bucket.rate = rate
+        state.gauge.set(rate)
@@ -0,0 +1,190 @@
+"""Adaptive status polling of the controller boards.
+
+A POLL asks one board for the STATUS of all of its doors, so boards are
+the unit of scheduling.  Every board has its own poll interval: a board
+whose STATUS showed a change, or that sent an unsolicited EVENT, is hot
+and drops to ``min_interval``; every poll that finds nothing new backs its
+interval off by ``backoff`` up to ``max_interval``.  By default that is one
+round-robin sweep of every board at the ceiling, so an idle board is seen
+about as often as plain round-robin polling would see it (a longer
+``max_interval`` gives the hot boards more of the bus at the cost of the
+idle ones).
+
+A board that never answers backs off the same way (the interval grows at
+every poll, a changed STATUS resets it).
+
+Polls are paced by bus time: a poll (request + STATUS reply + controller
+turnaround) is sent whenever polls plus the other measured traffic
+(events, operator commands) stay under ``ceiling`` of the line's capacity,
+and it goes to the board with the earliest deadline, due or not.  The
+intervals therefore decide the order, not whether the bus sits idle: hot
+boards come round every ``min_interval``, idle boards share what is left
+round-robin, and when the bus cannot keep up with every interval the most
+overdue board always goes next, so the shortfall is spread evenly instead
+of starving the idle boards.
+
+What the hot boards get comes out of the idle boards' sweep, so it is
+capped: a board not polled for ``age_limit`` round-robin sweeps (every
+board once at the current budget) goes next, whatever the deadlines say.
+The default of one sweep means no board is ever seen later than plain
+round-robin would see it; on a bus the polls fill, that is round-robin.
+``python -m benchmarks.suite polling`` compares the change -> STATUS
+delay at several ``age_limit`` values with plain round-robin.
+
+``CommandWriter`` asks ``due()`` for a poll only when it has no operator
+command queued, and a queued command wakes it immediately, so a command
+waits for at most the poll already on the wire.
+"""
+import heapq
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+from emrdoor_metrics import REGISTRY
+from emrdoor_protocol import OVERHEAD
+
+_schedulers = weakref.WeakSet()
+m_polls = REGISTRY.counter("polls_sent_total", "status polls written")
+m_staleness_ns = REGISTRY.histogram("poll_staleness_ns", "age of a board's status when it was refreshed")
+REGISTRY.gauge("poll_staleness_max_s", "age of the oldest board status",
+               fn=lambda: max((s.staleness(time.monotonic()) for s in list(_schedulers)), default=0.0))
+
+BITS_PER_BYTE = 10      # 8N1
+WINDOW = 1.0            # 그 밖의 트래픽 사용률을 재는 구간 (초)
+
+
+class PollScheduler:
+
+    def __init__(self, boards, doors_per_board=8, baudrate=9600, ceiling=0.5, min_interval=0.25,
+                 max_interval=None, backoff=1.5, turnaround=0.003, age_limit=1.0):
+        self.doors_per_board = doors_per_board
+        self.baudrate = baudrate
+        self.ceiling = ceiling
+        self.min_interval = min_interval
+        self._max_interval = max_interval
+        self.backoff = backoff
+        self.turnaround = turnaround
+        self.age_limit = age_limit  # 어느 보드든 라운드 로빈 이만큼 바퀴 안에는 다시 본다
+        # POLL 요청 + STATUS 응답 (첫 도어 1바이트 + 도어당 1바이트) + 컨트롤러 응답 지연
+        self.poll_cost = ((OVERHEAD + OVERHEAD + 1 + doors_per_board) * BITS_PER_BYTE / baudrate
+                          + turnaround)
+
+        self._lock = threading.Lock()
+        self._next_poll = 0.0       # 예산상 다음 POLL을 보낼 수 있는 시각
+        self._window_start = time.monotonic()
+        self._window_used = 0.0     # 이번 구간의 POLL 외 버스 시간
+        self.other_utilization = 0.0
+        self.polls = 0
+        self.boards = 0
+        self.interval = [0.0]
+        self.refreshed = [0.0]      # 보드별 마지막 STATUS 시각 (monotonic)
+        self._version = [0]
+        self._heap = []             # (due, board, version)
+        self._polled = OrderedDict()    # board -> 마지막 POLL 시각, 오래된 것부터
+        self.set_boards(boards)
+        _schedulers.add(self)
+
+    def set_boards(self, boards):
+        """Grow or shrink the polled boards (1..``boards``); new boards are due now."""
+        now = time.monotonic()
+        with self._lock:
+            for board in range(self.boards + 1, boards + 1):
+                self.interval.append(self.min_interval)
+                self.refreshed.append(now)
+                self._version.append(0)
+                heapq.heappush(self._heap, (now, board, 0))
+                self._polled[board] = now
+            del self.interval[boards + 1:], self.refreshed[boards + 1:], self._version[boards + 1:]
+            self._heap = [e for e in self._heap if e[1] <= boards]
+            for board in range(boards + 1, self.boards + 1):
+                del self._polled[board]
+            heapq.heapify(self._heap)
+            self.boards = boards
+
+    @property
+    def max_interval(self):
+        """Longest poll interval (s): the configured one, or one sweep of every board."""
+        if self._max_interval is not None:
+            return self._max_interval
+        return max(self.min_interval, self.boards * self.poll_cost / self.ceiling)
+
+    @property
+    def budget(self):
+        """Fraction of the line left for polls."""
+        # 다른 트래픽이 천장을 다 써도 최소한은 폴링한다 (완전히 멈추면 상태를 영영 모른다)
+        return max(self.ceiling - self.other_utilization, self.ceiling * 0.1)
+
+    def due(self, now):
+        """``(board, 0)`` if a board is to be polled now, else ``(None, seconds to wait)``."""
+        with self._lock:
+            self._roll_window(now)
+            while self._heap and self._heap[0][2] != self._version[self._heap[0][1]]:
+                heapq.heappop(self._heap)   # 다시 잡힌 일정의 옛 항목
+            if not self._heap:
+                return None, WINDOW
+            if self._next_poll > now:
+                return None, self._next_poll - now
+            slot = self.poll_cost / self.budget
+            oldest, polled = next(iter(self._polled.items()))
+            if now + slot - polled >= self.boards * slot * self.age_limit:
+                # 한 바퀴 돌 시간이 지나도록 안 본 보드가 먼저다: 아무 보드도 라운드 로빈보다 늦게 보지 않는다
+                board, deadline = oldest, now
+                self._version[board] += 1
+            else:
+                # 예산이 남으면 기한 전이라도 가장 먼저 기한이 오는 보드를 당겨서 폴링한다
+                deadline, board, _ = heapq.heappop(self._heap)
+            # 당겨 쓴 폴링은 원래 기한부터 다음 간격을 센다: 여유 예산도 간격에 반비례해 나뉜다
+            heapq.heappush(self._heap, (max(deadline, now) + self.interval[board], board, self._version[board]))
+            self._polled.move_to_end(board)
+            self._polled[board] = now
+            # 바뀐 게 보이면 status()가 다시 min_interval로 당긴다
+            self.interval[board] = min(self.interval[board] * self.backoff, self.max_interval)
+            self._next_poll = max(now, self._next_poll) + self.poll_cost / self.budget
+            self.polls += 1
+        m_polls.inc()
+        return board, 0.0
+
+    def status(self, board, changed, now):
+        """A STATUS from ``board`` arrived; ``changed`` doors differed from what we had."""
+        with self._lock:
+            if not 1 <= board <= self.boards:
+                return
+            m_staleness_ns.record(int((now - self.refreshed[board]) * 1e9))
+            self.refreshed[board] = now
+            if changed:
+                self._heat(board, now)
+
+    def event(self, board, now, nbytes=OVERHEAD + 2):
+        """An unsolicited EVENT from ``board``: it is active, look at the rest of it soon."""
+        with self._lock:
+            self._window_used += nbytes * BITS_PER_BYTE / self.baudrate
+            if 1 <= board <= self.boards:
+                self._heat(board, now)
+
+    def _heat(self, board, now):
+        if self.interval[board] == self.min_interval:
+            return
+        # 긴 간격으로 잡혀 있던 일정을 당긴다
+        self.interval[board] = self.min_interval
+        self._version[board] += 1
+        heapq.heappush(self._heap, (now + self.min_interval, board, self._version[board]))
+
+    def traffic(self, nbytes):
+        """Other bus traffic (operator commands and their replies)."""
+        with self._lock:
+            self._window_used += nbytes * BITS_PER_BYTE / self.baudrate
+
+    def _roll_window(self, now):
+        elapsed = now - self._window_start
+        if elapsed >= WINDOW:
+            used = self._window_used / elapsed
+            self.other_utilization += 0.5 * (used - self.other_utilization)
+            self._window_start = now
+            self._window_used = 0.0
+
+    def staleness(self, now):
+        """Age of the oldest board status (s)."""
+        with self._lock:
+            return max((now - t for t in self.refreshed[1:]), default=0.0)
+
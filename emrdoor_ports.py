@@ -0,0 +1,243 @@
+"""Per-port serial line settings and baud-rate autodetection.
+
+Every port remembers its own speed, framing, parity and timeouts in an
+ini file next to the app (``QSettings``, one group per port)::
+
+    [ports]
+    COM3\\baudrate=115200
+    COM3\\parity=N
+    COM3\\write_timeout=1.0
+
+``autodetect()`` finds the speed of an unknown controller: it polls a
+board at every common rate, fastest first, and keeps the first rate where
+every poll gets its STATUS reply back without a single framing error.  A
+rate that only works some of the time is not "stable" and is skipped.
+
+Low-latency mode (Linux, ``low_latency=true`` per port or
+``EMRDOOR_LOW_LATENCY=1``) is for USB-serial adapters, which hold received
+bytes in the adapter for up to 16 ms (FTDI ``latency_timer``) before
+handing them to the host; at 115200 that dwarfs the wire time of an ACK.
+It takes an exclusive lock on the port (``flock`` + ``TIOCEXCL``), sets
+``ASYNC_LOW_LATENCY`` with ``TIOCSSERIAL`` (ftdi_sio then drops
+``latency_timer`` to 1 ms) and VMIN=1/VTIME=0 so a read returns on the
+first byte.  ``line_report()`` reads back what actually took effect; each
+step is best effort and drivers that do not implement it (ptys, cdc_acm,
+Windows) report ``low_latency: None``.
+
+``python -m benchmarks.suite lowlat`` compares the POLL round trip in both
+modes; set ``EMRDOOR_BENCH_PORT`` to a real adapter, a pty ignores the ioctl.
+"""
+import array
+import os
+import sys
+import time
+from collections import namedtuple
+
+try:
+    import fcntl
+    import termios
+except ImportError:     # Windows: 저지연 모드 없음
+    fcntl = termios = None
+
+import serial
+
+from emrdoor_log import get_logger
+from emrdoor_protocol import FrameDecoder, poll
+
+log = get_logger("ports")
+
+PortSettings = namedtuple("PortSettings",
+                          "baudrate bytesize parity stopbits timeout write_timeout low_latency")
+
+# 기존 고정값 (9600 8N1, 읽기 1초, 쓰기 무제한)
+DEFAULT_SETTINGS = PortSettings(9600, serial.EIGHTBITS, serial.PARITY_NONE, serial.STOPBITS_ONE, 1.0, None,
+                                False)
+BAUDRATES = (921600, 460800, 230400, 115200, 57600, 38400, 19200, 9600)
+PROBE_READ = 0.02   # 탐색 중 read 한 번의 최대 대기
+
+# linux/serial.h: serial_struct.flags (int 배열로 읽었을 때 인덱스 4)
+ASYNC_LOW_LATENCY = 0x2000
+_SERIAL_FLAGS = 4
+
+
+def _flag(value):
+    return str(value).lower() in ("1", "true", "yes", "on")
+
+
+_TYPES = {"baudrate": int, "bytesize": int, "parity": str, "stopbits": float,
+          "timeout": float, "write_timeout": float, "low_latency": _flag}
+
+
+def _group(port):
+    # QSettings는 "/"를 그룹 구분자로 쓴다 (/dev/ttyUSB0)
+    return "ports/" + port.strip("/").replace("/", "_")
+
+
+def load_settings(settings, port, default=DEFAULT_SETTINGS):
+    """Saved line settings of ``port`` (``settings`` is a ``QSettings``)."""
+    values = {}
+    for field, kind in _TYPES.items():
+        value = settings.value(f"{_group(port)}/{field}")
+        if value is None or value == "":
+            values[field] = getattr(default, field)
+        elif str(value).lower() == "none":
+            values[field] = None
+        else:
+            try:
+                values[field] = kind(value)
+            except ValueError:
+                log.warning("bad port setting", extra={"fields": {"port": port, field: value}})
+                values[field] = getattr(default, field)
+    if values["stopbits"] is not None and values["stopbits"] == int(values["stopbits"]):
+        values["stopbits"] = int(values["stopbits"])
+    return PortSettings(**values)
+
+
+def save_settings(settings, port, port_settings):
+    for field, value in port_settings._asdict().items():
+        settings.setValue(f"{_group(port)}/{field}", "none" if value is None else value)
+    settings.sync()
+
+
+def open_port(port, port_settings=DEFAULT_SETTINGS):
+    fields = port_settings._asdict()
+    low_latency = fields.pop("low_latency")
+    if not low_latency:
+        return serial.Serial(port, **fields)
+    connection = LowLatencySerial(port, exclusive=True, **fields)
+    tune_low_latency(connection)
+    return connection
+
+
+class LowLatencySerial(serial.Serial):
+    """Gives ``TIOCEXCL`` back on close; the last close would, but a pty stays open on the other side."""
+
+    def close(self):
+        if self.is_open and termios is not None and hasattr(termios, "TIOCNXCL"):
+            try:
+                fcntl.ioctl(self.fd, termios.TIOCNXCL)
+            except OSError:
+                pass
+        super().close()
+
+
+def tune_low_latency(connection):
+    """Exclusive access, ``ASYNC_LOW_LATENCY`` and VMIN=1/VTIME=0 (Linux, best effort).
+
+    pyserial rewrites termios on every reconfigure (baud rate, timeout), so
+    call this again after changing the port.
+    """
+    if termios is None or not sys.platform.startswith("linux"):
+        log.warning("low latency mode needs Linux", extra={"fields": {"port": connection.port}})
+        return
+    fd = connection.fileno()
+    for step, apply in (("exclusive", lambda: fcntl.ioctl(fd, termios.TIOCEXCL)),
+                        ("async_low_latency", lambda: connection.set_low_latency_mode(True)),
+                        ("vmin_vtime", lambda: _set_vmin_vtime(fd, 1, 0))):
+        try:
+            apply()
+        except (OSError, ValueError, termios.error) as e:
+            log.warning("low latency step not supported", extra={"fields": {
+                "port": connection.port, "step": step, "error": e}})
+
+
+def _set_vmin_vtime(fd, vmin, vtime):
+    attrs = termios.tcgetattr(fd)
+    attrs[6][termios.VMIN] = vmin
+    attrs[6][termios.VTIME] = vtime
+    termios.tcsetattr(fd, termios.TCSANOW, attrs)
+
+
+def _latency_timer(port):
+    # FTDI 등 usb-serial: 어댑터가 바이트를 모아 두는 시간 (ms)
+    path = f"/sys/class/tty/{os.path.basename(os.path.realpath(port))}/device/latency_timer"
+    try:
+        with open(path) as f:
+            return int(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def line_report(connection):
+    """Effective line settings read back from the open port."""
+    report = {"port": connection.port, "baudrate": connection.baudrate,
+              "framing": f"{connection.bytesize}{connection.parity}{connection.stopbits:g}",
+              "timeout": connection.timeout, "write_timeout": connection.write_timeout,
+              "exclusive": bool(getattr(connection, "exclusive", False)),
+              "low_latency": None, "vmin": None, "vtime": None, "latency_timer_ms": None}
+    if termios is None or not hasattr(connection, "fileno"):
+        return report
+    fd = connection.fileno()
+    try:
+        cc = termios.tcgetattr(fd)[6]
+        report["vmin"], report["vtime"] = _cc(cc[termios.VMIN]), _cc(cc[termios.VTIME])
+    except termios.error:
+        pass
+    if sys.platform.startswith("linux"):
+        buf = array.array("i", [0] * 32)
+        try:
+            fcntl.ioctl(fd, termios.TIOCGSERIAL, buf)
+            report["low_latency"] = bool(buf[_SERIAL_FLAGS] & ASYNC_LOW_LATENCY)
+        except OSError:
+            pass
+        report["latency_timer_ms"] = _latency_timer(connection.port)
+    return report
+
+
+def _cc(value):
+    # 원시 모드에서는 VMIN/VTIME 자리가 int, 아니면 1바이트 bytes
+    return value if isinstance(value, int) else ord(value)
+
+
+def handshake(connection, board=1, attempts=3, timeout=0.3, seq=0x80):
+    """Poll ``board`` ``attempts`` times; round trips in seconds, ``None`` if the line is not clean.
+
+    Any reply from ``board`` with our sequence number counts (STATUS, or a
+    NAK from a controller that does not know POLL).  A missing reply or a
+    decoder resync after the first reply fails the whole handshake; junk
+    before it is what was already on the wire when the port was clocked.
+    Reads block for at most ``connection.timeout``, keep it short.
+    """
+    decoder = FrameDecoder()
+    connection.reset_input_buffer()
+    rtts = []
+    for i in range(attempts):
+        s = (seq + i) & 0xFF
+        t0 = time.perf_counter()
+        connection.write(poll(board, s))
+        answered = False
+        while not answered and time.perf_counter() - t0 < timeout:
+            data = connection.read(max(1, connection.in_waiting))
+            answered = any(f.board == board and f.seq == s for f in decoder.feed(data))
+        if not answered or (i and decoder.errors):
+            return None
+        rtts.append(time.perf_counter() - t0)
+        decoder.errors = 0
+    return rtts
+
+
+def autodetect(port, base=DEFAULT_SETTINGS, rates=BAUDRATES, board=1, attempts=3, timeout=0.3):
+    """Fastest stable rate: ``(PortSettings or None, {rate: median round trip s or None})``.
+
+    The port is reopened for every rate (some drivers refuse to re-clock an
+    open port); framing, parity and timeouts come from ``base``.  A rate the
+    driver refuses (or that fails mid-handshake) counts as not answering.
+    """
+    results = {}
+    for rate in sorted(rates, reverse=True):
+        try:
+            connection = open_port(port, base._replace(baudrate=rate, timeout=PROBE_READ))
+            try:
+                rtts = handshake(connection, board, attempts, timeout)
+            finally:
+                connection.close()
+        except (serial.SerialException, OSError) as e:   # 지원하지 않는 속도: 다음 속도로
+            log.warning("baud rate probe failed", extra={"fields": {"port": port, "baudrate": rate, "error": e}})
+            rtts = None
+        results[rate] = sorted(rtts)[len(rtts) // 2] if rtts else None
+        if rtts:
+            log.info("baud rate detected", extra={"fields": {
+                "port": port, "baudrate": rate, "rtt_ms": round(results[rate] * 1e3, 2)}})
+            return base._replace(baudrate=rate), results
+    log.warning("no baud rate answered", extra={"fields": {"port": port, "rates": list(results)}})
+    return None, results
@@ -0,0 +1,258 @@
+"""On-demand profiling of the running console.
+
+``SamplingProfiler`` samples the Python stacks of every thread from a
+helper thread (``sys._current_frames()``) for a fixed time and writes
+them as folded stacks (``profile-*.folded``, loadable in speedscope or
+flamegraph.pl) plus a text summary of the hottest functions per thread.
+``MemoryTracker`` turns ``tracemalloc`` on at the first snapshot and writes
+every snapshot (``memory-*.snapshot``) with a summary and the diff against
+the previous one.  Nothing runs and nothing is traced until an operator
+asks for it from ``ProfilerPanel`` in the settings dock.
+"""
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QHBoxLayout, QLabel, QPushButton, QSpinBox, QVBoxLayout, QWidget
+
+from emrdoor_log import get_logger
+
+log = get_logger("profiling")
+
+TOP = 25
+
+
+def _stamp():
+    now = time.time()
+    return time.strftime("%Y%m%d-%H%M%S", time.localtime(now)) + f"-{int(now * 1000) % 1000:03d}"
+
+
+class SamplingProfiler:
+
+    def __init__(self, directory, interval=0.005):
+        self.directory = directory
+        self.interval = interval
+        self.status = ""
+        self._stop = threading.Event()
+        self._thread = None
+        self._labels = {}   # code -> "함수 (파일:줄)"
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, seconds):
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(seconds,), name="SamplingProfiler",
+                                        daemon=True)
+        self._thread.start()
+        self.status = f"프로파일링 {seconds}초"
+
+    def stop(self):
+        self._stop.set()
+
+    def _label(self, code):
+        label = self._labels.get(code)
+        if label is None:
+            label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            self._labels[code] = label
+        return label
+
+    def _run(self, seconds):
+        me = threading.get_ident()
+        stacks = Counter()
+        samples = 0
+        end = time.monotonic() + seconds
+        while not self._stop.wait(self.interval) and time.monotonic() < end:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(self._label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(names.get(ident, str(ident)))
+                stacks[";".join(reversed(stack))] += 1
+            samples += 1
+        try:
+            self.status = self._write(stacks, samples)
+        except OSError as e:
+            log.error("profile write failed", extra={"fields": {"directory": self.directory, "error": e}})
+            self.status = f"프로파일 저장 실패: {e}"
+
+    def _write(self, stacks, samples):
+        os.makedirs(self.directory, exist_ok=True)
+        base = os.path.join(self.directory, f"profile-{_stamp()}")
+        with open(base + ".folded", "w") as f:
+            for stack, count in stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        per_thread = {}
+        for stack, count in stacks.items():
+            thread, *frames = stack.split(";")
+            own = per_thread.setdefault(thread, Counter())
+            own[frames[-1] if frames else "?"] += count
+        with open(base + ".txt", "w") as f:
+            f.write(f"{samples} samples every {self.interval * 1e3:g} ms\n")
+            for thread, own in sorted(per_thread.items()):
+                total = sum(own.values())
+                f.write(f"\n[{thread}] {total} samples\n")
+                for label, count in own.most_common(TOP):
+                    f.write(f"{count / total * 100:6.1f}%  {label}\n")
+        log.info("profile written", extra={"fields": {"path": base + ".folded", "samples": samples}})
+        return f"저장: {os.path.basename(base)}.folded"
+
+
+class MemoryTracker:
+
+    def __init__(self, directory, frames=10):
+        self.directory = directory
+        self.frames = frames
+        self.status = ""
+        self._previous = None
+        self._lock = threading.Lock()
+        self._saving = False
+        self._stop_after = False    # 저장 중에 중지를 눌렀다: 저장이 끝나면 멈춘다
+
+    @property
+    def busy(self):
+        return self._saving
+
+    @property
+    def tracing(self):
+        return tracemalloc.is_tracing() and not self._stop_after
+
+    def snapshot(self):
+        """First call starts tracing; later calls save a snapshot and a diff (in the background)."""
+        with self._lock:
+            if self._saving:
+                return
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self.frames)
+                self._previous = tracemalloc.take_snapshot()
+                self.status = "메모리 추적 시작"
+                return
+            self._saving = True
+        threading.Thread(target=self._take, name="MemorySnapshot", daemon=True).start()
+        self.status = "스냅샷 저장 중"
+
+    def stop(self):
+        """Stop tracing; a snapshot being saved is finished first."""
+        with self._lock:
+            if self._saving:
+                self._stop_after = True
+                self.status = "스냅샷 저장 후 추적 중지"
+                return
+            self._stop()
+
+    def _stop(self):
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._previous = None
+        self._stop_after = False
+        self.status = "메모리 추적 중지"
+
+    def _take(self):
+        try:
+            self._save()
+        except (OSError, RuntimeError) as e:
+            log.error("memory snapshot failed", extra={"fields": {"error": e}})
+            self.status = f"스냅샷 실패: {e}"
+        finally:
+            with self._lock:
+                self._saving = False
+                if self._stop_after:
+                    self._stop()
+
+    def _save(self):
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>")))
+        current, peak = tracemalloc.get_traced_memory()
+        os.makedirs(self.directory, exist_ok=True)
+        base = os.path.join(self.directory, f"memory-{_stamp()}")
+        snapshot.dump(base + ".snapshot")
+        with open(base + ".txt", "w") as f:
+            f.write(f"traced {current / 1e6:.1f} MB, peak {peak / 1e6:.1f} MB\n\n[top {TOP} by line]\n")
+            for stat in snapshot.statistics("lineno")[:TOP]:
+                f.write(f"{stat}\n")
+            if self._previous is not None:
+                f.write(f"\n[top {TOP} growth since previous snapshot]\n")
+                for stat in snapshot.compare_to(self._previous, "lineno")[:TOP]:
+                    f.write(f"{stat}\n")
+        self._previous = snapshot
+        log.info("memory snapshot written", extra={"fields": {"path": base + ".snapshot", "traced": current}})
+        self.status = f"저장: {os.path.basename(base)}.snapshot"
+
+
+class ProfilerPanel(QWidget):
+    """Profiler / memory controls for the settings dock."""
+
+    def __init__(self, directory, parent=None):
+        super().__init__(parent)
+        self.profiler = SamplingProfiler(directory)
+        self.memory = MemoryTracker(directory)
+
+        self.seconds = QSpinBox()
+        self.seconds.setRange(1, 600)
+        self.seconds.setValue(10)
+        self.seconds.setSuffix(" 초")
+        self.profileBt = QPushButton("프로파일")
+        self.profileBt.clicked.connect(self.toggle_profile)
+        self.snapshotBt = QPushButton("메모리 스냅샷")
+        self.snapshotBt.clicked.connect(self.take_snapshot)
+        self.memoryStopBt = QPushButton("추적 중지")
+        self.memoryStopBt.clicked.connect(self.stop_memory)
+        self.memoryStopBt.setEnabled(False)
+        self.status = QLabel()
+        self.status.setWordWrap(True)
+
+        row = QHBoxLayout()
+        row.addWidget(self.seconds)
+        row.addWidget(self.profileBt)
+        row2 = QHBoxLayout()
+        row2.addWidget(self.snapshotBt)
+        row2.addWidget(self.memoryStopBt)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(row)
+        layout.addLayout(row2)
+        layout.addWidget(self.status)
+
+        # 작업 중일 때만 상태를 갱신한다
+        self.timer = QTimer(self)
+        self.timer.setInterval(250)
+        self.timer.timeout.connect(self.refresh)
+
+    def toggle_profile(self):
+        if self.profiler.running:
+            self.profiler.stop()
+        else:
+            self.profiler.start(self.seconds.value())
+        self.refresh()
+        self.timer.start()
+
+    def take_snapshot(self):
+        self.memory.snapshot()
+        self.refresh()
+        self.timer.start()
+
+    def stop_memory(self):
+        self.memory.stop()
+        self.refresh()
+
+    def refresh(self):
+        running = self.profiler.running
+        self.profileBt.setText("중지" if running else "프로파일")
+        self.seconds.setEnabled(not running)
+        self.snapshotBt.setEnabled(not self.memory.busy)
+        self.memoryStopBt.setEnabled(self.memory.tracing)
+        self.status.setText("\n".join(filter(None, (self.profiler.status, self.memory.status))))
+        if not running and not self.memory.busy:
+            self.timer.stop()
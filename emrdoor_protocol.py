@@ -0,0 +1,272 @@
+"""Door controller serial protocol.
+
+Frame layout (all fields one byte)::
+
+    STX | board | cmd | seq | len | payload[len] | lrc | ETX
+
+``lrc`` is the XOR of board..payload.  Boards answer every command frame
+with ``ACK``/``NAK`` carrying the same ``seq``; ``EVENT`` frames are sent
+unsolicited when a door changes.
+
+When a read brings at least ``BULK_CHECK`` bytes, ``FrameDecoder`` checks
+every LRC in it against one running XOR of the buffer (``xor_prefix``):
+board..lrc XOR to zero exactly when the running XOR is the same at the
+frame's STX and at its lrc byte.
+
+Large boards report status as ``STATUS_BITS``: one bit per door (open or
+not), least significant bit of the first byte is ``first_door``, up to
+2032 doors per frame.  The other flags only travel in ``EVENT``/``STATUS``.
+"""
+import struct
+from collections import namedtuple
+
+from emrdoor_checksum import LRC, xor_prefix
+
+STX = 0x02
+ETX = 0x03
+HEADER_LEN = 5          # STX, board, cmd, seq, len
+OVERHEAD = HEADER_LEN + 2
+MAX_PAYLOAD = 255
+BULK_CHECK = 64         # 버퍼가 이 바이트 수 이상이면 LRC를 누적 XOR로 한 번에 검사
+
+BROADCAST = 0xFF        # board address: every board
+ALL_DOORS = 0xFF        # door number: every door on the board
+
+# 명령 코드
+CMD_ACK = 0x06
+CMD_NAK = 0x15
+CMD_EVENT = 0x10        # controller -> host: door, flags
+CMD_STATUS = 0x11       # controller -> host: first door, flags per door
+CMD_STATUS_BITS = 0x12  # controller -> host: first door, FLAG_OPEN bitmap (LSB first)
+CMD_OPEN = 0x20         # host -> controller: door (ALL_DOORS = all)
+CMD_CLOSE = 0x21        # host -> controller: door (ALL_DOORS = all), relock before open_time
+CMD_DOORS = 0x22        # host -> controller: (door, action) pairs, all or nothing
+CMD_POLL = 0x30         # host -> controller: request STATUS
+
+# CMD_DOORS 동작
+ACTION_CLOSE = 0
+ACTION_OPEN = 1
+MAX_DOOR_ACTIONS = MAX_PAYLOAD // 2
+
+# NAK 사유
+NAK_BAD_DOOR = 1
+NAK_BUSY = 2
+NAK_UNKNOWN = 3
+
+# 도어 상태 비트 (테이블 1~7열: 도어, 단선, 정전, 방전, 커버, 화재, 비상)
+FLAG_OPEN = 0x01
+FLAG_LINE_CUT = 0x02
+FLAG_POWER_FAIL = 0x04
+FLAG_DISCHARGE = 0x08
+FLAG_COVER = 0x10
+FLAG_FIRE = 0x20
+FLAG_EMERGENCY = 0x40
+FLAG_COLUMNS = (FLAG_OPEN, FLAG_LINE_CUT, FLAG_POWER_FAIL, FLAG_DISCHARGE,
+                FLAG_COVER, FLAG_FIRE, FLAG_EMERGENCY)
+
+Frame = namedtuple("Frame", "board cmd seq payload")
+
+# 메시지 종류: 클래스 이름, 명령, 인코더 이름, 고정 필드 ((이름, struct 형식[, 기본값]), ...)와
+# 꼬리 (None, (이름, "s") = 나머지 바이트 그대로, (이름, 형식) = 그 형식의 반복).
+# 기본값이 있는 필드는 맨 뒤에, 꼬리가 없는 메시지에만 둔다 (인코더의 기본 인자가 된다).
+MessageType = namedtuple("MessageType", "name cmd encoder fields tail")
+
+SCHEMA = (
+    MessageType("Ack", CMD_ACK, "ack", (("answers", "B"),), None),
+    MessageType("Nak", CMD_NAK, "nak", (("answers", "B"), ("reason", "B")), None),
+    MessageType("Event", CMD_EVENT, "door_event", (("door", "B"), ("flags", "B")), None),
+    MessageType("Status", CMD_STATUS, "status", (("first_door", "B"),), ("flags", "s")),
+    MessageType("StatusBits", CMD_STATUS_BITS, "status_bitmap", (("first_door", "B"),), ("bits", "s")),
+    MessageType("Open", CMD_OPEN, "open_door", (("door", "B", ALL_DOORS),), None),
+    MessageType("Close", CMD_CLOSE, "close_door", (("door", "B", ALL_DOORS),), None),
+    MessageType("Doors", CMD_DOORS, "door_actions", (), ("actions", "BB")),
+    MessageType("Poll", CMD_POLL, "poll", (), None),
+)
+
+
+lrc = LRC.compute
+
+
+def encode_frame(board, cmd, seq, payload=b""):
+    if len(payload) > MAX_PAYLOAD:
+        raise ValueError("payload too long")
+    body = bytes((board, cmd, seq & 0xFF, len(payload))) + bytes(payload)
+    return bytes((STX,)) + body + bytes((lrc(body), ETX))
+
+
+def encode(frame):
+    return encode_frame(frame.board, frame.cmd, frame.seq, frame.payload)
+
+
+def _compile_encoder(kind):
+    # namedtuple처럼 소스를 만들어 exec한다: 진짜 시그니처(기본값 포함)에 필드 루프 없는 본문
+    names = [f[0] for f in kind.fields]
+    params = ["board", "seq"] + [f"{f[0]}={f[2]!r}" if len(f) > 2 else f[0] for f in kind.fields]
+    fields = "".join(f[1] for f in kind.fields)
+    size = struct.calcsize("<" + fields)
+    args = "".join(f", {n}" for n in names)
+    env = {"_lrc": lrc, "_STX": bytes((STX,))}
+    if kind.tail is None and set(fields) <= {"B"}:
+        # 1바이트 필드뿐: 프레임 전체를 pack 한 번에, lrc는 값들의 XOR (범위는 pack이 검사)
+        env["_pack"] = struct.Struct(f"<5B{fields}2B").pack
+        check = " ^ ".join(["board", "seq", str(kind.cmd ^ size)] + names)
+        lines = ["seq &= 0xFF",
+                 f"return _pack({STX}, board, {kind.cmd}, seq, {size}{args}, {check}, {ETX})"]
+    else:
+        env["_pack"] = struct.Struct(f"<4B{fields}").pack
+        if kind.tail is None:
+            lines = [f"body = _pack(board, {kind.cmd}, seq & 0xFF, {size}{args})"]
+        else:
+            name, form = kind.tail
+            params.append(name)
+            if form == "s":
+                lines = [f"tail = bytes({name})"]
+            else:
+                env["_item"] = struct.Struct("<" + form).pack
+                lines = [f"tail = b''.join([_item(*item) for item in {name}])"]
+            lines += [f"if len(tail) > {MAX_PAYLOAD - size}:",
+                      "    raise ValueError('payload too long')",
+                      f"body = _pack(board, {kind.cmd}, seq & 0xFF, {size} + len(tail){args}) + tail"]
+        lines.append(f"return _STX + body + bytes((_lrc(body), {ETX}))")
+    source = f"def {kind.encoder}({', '.join(params)}):\n" + "".join(f"    {line}\n" for line in lines)
+    exec(source, env)
+    return env[kind.encoder]
+
+
+def _compile_decoder(kind, cls):
+    fixed = struct.Struct("<" + "".join(f[1] for f in kind.fields))
+    new = tuple.__new__
+    if kind.tail is None:
+        unpack = fixed.unpack
+
+        def decode(board, cmd, seq, payload):
+            return new(cls, (board, cmd, seq, payload) + unpack(payload))
+        return decode
+    unpack, size = fixed.unpack_from, fixed.size
+    if kind.tail[1] == "s":
+        def decode(board, cmd, seq, payload):
+            return new(cls, (board, cmd, seq, payload) + unpack(payload) + (payload[size:],))
+        return decode
+    items = struct.Struct("<" + kind.tail[1]).iter_unpack
+
+    def decode(board, cmd, seq, payload):
+        return new(cls, (board, cmd, seq, payload) + unpack(payload) + (list(items(payload[size:])),))
+    return decode
+
+
+def compile_schema(schema):
+    """``(messages, decoders, encoders)`` for ``schema``.
+
+    ``messages[cmd]`` is a namedtuple class whose first fields are those of
+    ``Frame``; ``decoders[cmd](board, cmd, seq, payload)`` returns one (and
+    raises ``struct.error`` if the payload does not fit); ``encoders[name]``
+    builds the frame bytes from ``board, seq`` and the fields.
+    """
+    messages, decoders, encoders = {}, {}, {}
+    for kind in schema:
+        fields = tuple(f[0] for f in kind.fields) + ((kind.tail[0],) if kind.tail else ())
+        cls = messages[kind.cmd] = namedtuple(kind.name, Frame._fields + fields)
+        decoders[kind.cmd] = _compile_decoder(kind, cls)
+        encoders[kind.encoder] = _compile_encoder(kind)
+    return messages, decoders, encoders
+
+
+MESSAGES, DECODERS, ENCODERS = compile_schema(SCHEMA)
+
+
+def decode(frame):
+    """The schema message for a ``Frame`` (the frame itself if its command is not in the schema)."""
+    decoder = DECODERS.get(frame.cmd)
+    return frame if decoder is None else decoder(*frame[:4])
+
+
+class FrameDecoder:
+    """Incremental decoder: ``feed()`` raw bytes, get complete frames back.
+
+    Frames come back as schema messages (``MESSAGES``), or as ``Frame`` for a
+    command the schema does not know.  Garbage and corrupted frames are
+    skipped by resynchronising on the next ``STX``; ``errors`` counts how many
+    times that happened, and frames whose payload does not fit the schema
+    of their command (dropped too).  A garbage run counts once however the
+    reads split it.
+    """
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._resync = False    # 버린 바이트 뒤에서 다음 STX를 찾는 중 (이미 센 쓰레기)
+        self.errors = 0
+
+    def feed(self, data):
+        buf = self._buf
+        buf += data
+        frames = []
+        pos = 0
+        end = len(buf)
+        resync = self._resync
+        decoders = DECODERS
+        # 많이 읽혔으면 누적 XOR을 한 번 만들어 두고 프레임마다 두 바이트만 비교한다
+        prefix = xor_prefix(buf) if end >= BULK_CHECK else None
+        while True:
+            start = buf.find(STX, pos)
+            if start < 0:
+                if end > pos:
+                    if not resync:
+                        self.errors += 1
+                    resync = True   # 다음 읽기에서 이어지는 쓰레기는 다시 세지 않는다
+                pos = end
+                break
+            if start > pos and not resync:
+                self.errors += 1  # 프레임 사이의 쓰레기 바이트
+            resync = False
+            if end - start < HEADER_LEN:
+                pos = start
+                break
+            size = OVERHEAD + buf[start + 4]
+            if end - start < size:
+                pos = start
+                break
+            if buf[start + size - 1] != ETX or (
+                    prefix[start] != prefix[start + size - 2] if prefix is not None
+                    else buf[start + size - 2] != lrc(buf[start + 1:start + size - 2])):
+                self.errors += 1
+                pos = start + 1
+                resync = True
+                continue
+            pos = start + size
+            cmd = buf[start + 2]
+            payload = bytes(buf[start + HEADER_LEN:pos - 2])
+            decoder = decoders.get(cmd)
+            if decoder is None:
+                frames.append(Frame(buf[start + 1], cmd, buf[start + 3], payload))
+                continue
+            try:
+                frames.append(decoder(buf[start + 1], cmd, buf[start + 3], payload))
+            except struct.error:
+                self.errors += 1    # 명령에 맞지 않는 길이
+        del buf[:pos]
+        self._resync = resync
+        return frames
+
+    def reset(self):
+        self._buf.clear()
+        self._resync = False
+
+
+door_event = ENCODERS["door_event"]
+status = ENCODERS["status"]
+status_bitmap = ENCODERS["status_bitmap"]
+open_door = ENCODERS["open_door"]
+close_door = ENCODERS["close_door"]
+door_actions = ENCODERS["door_actions"]
+poll = ENCODERS["poll"]
+ack = ENCODERS["ack"]
+nak = ENCODERS["nak"]
+
+
+def status_bits(board, seq, first_door, flags):
+    """STATUS_BITS frame with the ``FLAG_OPEN`` bit of every door in ``flags``."""
+    bits = bytearray((len(flags) + 7) // 8)
+    for k, f in enumerate(flags):
+        if f & FLAG_OPEN:
+            bits[k >> 3] |= 1 << (k & 7)
+    return status_bitmap(board, seq, first_door, bits)
@@ -0,0 +1,143 @@
+"""Door state in shared memory: I/O processes write, the GUI reads.
+
+One ``multiprocessing.shared_memory`` block holds a generation counter per
+writer slot and the flags of every door, indexed like ``DoorState`` and
+sized for every board address.  Each writer (one I/O process) owns a slot
+and brackets every batch of updates with ``DoorWriter.writing()``: the
+counter is odd while the batch is being stored and even again after it (a
+seqlock).  The reader never takes a lock: ``SharedDoorState.pull()``
+compares the shared flags in place with its own copy, copies only the
+doors that differ and tries again if any counter was odd or moved in the
+meantime, so it never sees half a batch (e.g. half of a STATUS frame).
+A door that changed and changed back between two pulls looks the same on
+screen, so it is not repainted: in an event storm the GUI paints what
+differs from the last frame, not every change.
+
+``SharedDoorState`` is a ``DoorState`` to the GUI: ``flags`` is the copy
+made by the last pull and ``take_dirty()`` pulls first, so the repaint
+timer is what reads the shared block.  Every writer touches only the
+doors of the boards on its own ports.
+
+The counters are plain aligned 8-byte stores with no fences: the stores
+of a batch become visible in order on x86 (TSO), which is what the
+seqlock needs.  Other architectures (ARM, POWER) may reorder them, so
+``SharedDoorState`` refuses to start anywhere but x86 (``X86``) and the
+app keeps its reader threads there.
+"""
+import platform
+import struct
+import time
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from emrdoor_state import DoorState
+
+# slots, doors_per_board, capacity
+HEADER = struct.Struct("<III")
+ALIGN = 64
+MAX_BOARDS = 255
+SPARE = 512         # 보드 255의 STATUS가 도어 수보다 길어도 블록 안에 들어가도록
+# 펜스 없는 seqlock은 저장 순서가 지켜지는 x86에서만 맞다
+X86 = platform.machine().lower() in ("x86_64", "amd64", "i386", "i486", "i586", "i686", "x86")
+
+
+def capacity(doors_per_board):
+    return MAX_BOARDS * doors_per_board + SPARE
+
+
+def _layout(slots):
+    counters = ALIGN
+    flags = counters + -(-slots * 8 // ALIGN) * ALIGN
+    return counters, flags
+
+
+class SharedDoorState(DoorState):
+    """The GUI side: creates the block and reads it."""
+
+    def __init__(self, doors_per_board=8, slots=1, initial=b""):
+        if not X86:
+            raise RuntimeError(f"shared door state needs an x86 host (seqlock without fences), "
+                               f"not {platform.machine()}")
+        size = capacity(doors_per_board)
+        counters, flags = _layout(slots)
+        self.shm = shared_memory.SharedMemory(create=True, size=flags + size)
+        HEADER.pack_into(self.shm.buf, 0, slots, doors_per_board, size)
+        super().__init__(doors_per_board, size)
+        self.slots = slots
+        initial = bytes(initial[:size])
+        self.flags[:len(initial)] = initial
+        self.shm.buf[flags:flags + len(initial)] = initial
+        self._generations = np.ndarray(slots, np.uint64, self.shm.buf, counters)
+        self._shared = np.ndarray(size, np.uint8, self.shm.buf, flags)
+        self._local = np.frombuffer(self.flags, np.uint8)  # flags는 더 늘지 않는다
+        self.retries = 0
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def pull(self):
+        """Copy the doors the writers changed; returns their indices."""
+        while True:
+            before = self._generations.copy()
+            if not (before & 1).any():
+                changed = np.flatnonzero(self._shared != self._local)
+                values = self._shared[changed]
+                if np.array_equal(self._generations, before):
+                    break
+            self.retries += 1
+            time.sleep(0)   # 쓰는 중: 그 프로세스에 양보하고 다시
+        self._local[changed] = values
+        changed = changed.tolist()
+        self._dirty.update(changed)
+        return changed
+
+    def take_dirty(self):
+        self.pull()
+        return super().take_dirty()
+
+    def detach(self):
+        """A plain ``DoorState`` with the latest flags (and what is still dirty)."""
+        self.pull()
+        state = DoorState(self.doors_per_board, len(self.flags))
+        state.flags[:] = self.flags
+        state.mark_dirty(self._dirty)
+        return state
+
+    def close(self):
+        """Release and remove the block (after every writer has exited and the reader has detached)."""
+        if self._shared is None:
+            return
+        self._generations = self._shared = self._local = None
+        self.shm.close()
+        self.shm.unlink()
+
+
+class DoorWriter:
+    """An I/O process's side: a ``DoorState`` over the block and its slot."""
+
+    def __init__(self, name, slot):
+        # multiprocessing으로 띄운 프로세스는 GUI와 resource tracker를 같이 쓴다: 지우는 건 만든 쪽
+        self.shm = shared_memory.SharedMemory(name=name)
+        slots, doors_per_board, size = HEADER.unpack_from(self.shm.buf, 0)
+        counters, flags = _layout(slots)
+        self._generation = np.ndarray(1, np.uint64, self.shm.buf, counters + 8 * slot)
+        self.state = DoorState(doors_per_board, buffer=self.shm.buf[flags:flags + size])
+
+    @contextmanager
+    def writing(self):
+        """Store a batch: the slot's counter is odd until it is done."""
+        self._generation[0] += 1
+        try:
+            yield self.state
+        finally:
+            self.state.take_dirty()     # 변경 추적은 GUI 쪽 (pull)에서
+            self._generation[0] += 1
+
+    def close(self):
+        self._generation = None
+        self.state.flags.release()
+        self.state = None
+        self.shm.close()
@@ -0,0 +1,146 @@
+"""Current status flags of every door, with change tracking for the grid."""
+import numpy as np
+
+from emrdoor_metrics import REGISTRY
+from emrdoor_protocol import CMD_EVENT, CMD_STATUS, CMD_STATUS_BITS, FLAG_OPEN
+
+m_rejected = REGISTRY.counter("door_frames_rejected_total", "door frames for board 0 or an out-of-range door")
+
+
+class DoorState:
+    """Flags per door, indexed ``(board - 1) * doors_per_board + (door - 1)``.
+
+    Updates record which indices changed; the GUI drains them with
+    ``take_dirty()`` on its repaint timer so it only touches changed cells.
+    A frame for board 0, door 0 or a door past ``doors_per_board`` (a
+    corrupt frame) is dropped and counted in ``rejected`` (and the
+    ``door_frames_rejected_total`` metric): its index would be negative or
+    another board's door.
+    """
+
+    def __init__(self, doors_per_board=8, doors=0, buffer=None):
+        self.doors_per_board = doors_per_board
+        # buffer: 크기가 정해진 외부 버퍼 (공유 메모리), 늘어나지 않는다
+        self.flags = bytearray(doors) if buffer is None else buffer
+        self._dirty = set()
+        self.rejected = 0
+
+    def valid(self, board, door):
+        return board >= 1 and 1 <= door <= self.doors_per_board
+
+    def index(self, board, door):
+        if not self.valid(board, door):
+            raise ValueError(f"no door {door} on board {board}")
+        return (board - 1) * self.doors_per_board + (door - 1)
+
+    def location(self, index):
+        board, door = divmod(index, self.doors_per_board)
+        return board + 1, door + 1
+
+    def __len__(self):
+        return len(self.flags)
+
+    def _grow(self, size):
+        if size > len(self.flags):
+            if not isinstance(self.flags, bytearray):
+                raise IndexError("door index beyond the state buffer")
+            self.flags.extend(bytes(size - len(self.flags)))
+
+    def set(self, board, door, flags):
+        """Store ``flags`` for one door; returns ``True`` if it changed."""
+        if not self.valid(board, door):
+            self._reject()
+            return False
+        i = self.index(board, door)
+        self._grow(i + 1)
+        if self.flags[i] == flags:
+            return False
+        self.flags[i] = flags
+        self._dirty.add(i)
+        return True
+
+    def set_range(self, board, first_door, flags):
+        """Store consecutive doors from a STATUS frame; returns changed indices.
+
+        Doors past ``doors_per_board`` are dropped, as in ``set_bitmaps``.
+        """
+        if not self.valid(board, first_door):
+            self._reject()
+            return []
+        flags = flags[:self.doors_per_board - first_door + 1]
+        start = self.index(board, first_door)
+        self._grow(start + len(flags))
+        changed = [start + k for k, f in enumerate(flags) if self.flags[start + k] != f]
+        for i in changed:
+            self.flags[i] = flags[i - start]
+        self._dirty.update(changed)
+        return changed
+
+    def set_bitmaps(self, frames):
+        """Apply many STATUS_BITS frames at once; returns the changed indices (sorted).
+
+        All bitmaps are unpacked in one ``np.unpackbits`` call and compared
+        with the current flags in one vector op; only ``FLAG_OPEN`` changes,
+        the other flags of a door are kept.  If a door is reported twice the
+        last frame wins.
+        """
+        if not frames:
+            return []
+        n = len(frames)
+        boards = np.fromiter((f.board for f in frames), np.int64, n)
+        first = np.fromiter((f.first_door for f in frames), np.int64, n)
+        widths = np.fromiter((len(f.bits) for f in frames), np.int64, n) * 8  # 실은 비트
+        starts = (boards - 1) * self.doors_per_board + (first - 1)
+        counts = np.clip(self.doors_per_board - first + 1, 0, widths)   # 채움 비트 제외
+        invalid = (boards < 1) | (first < 1) | (first > self.doors_per_board)
+        if invalid.any():
+            self._reject(int(np.count_nonzero(invalid)))
+            counts[invalid] = 0
+        bits = np.unpackbits(np.frombuffer(b"".join([f.bits for f in frames]), np.uint8),
+                             bitorder="little")
+        # 비트 위치 -> 도어 인덱스: 프레임 k의 비트는 starts[k]부터
+        offsets = np.cumsum(widths) - widths
+        position = np.arange(len(bits))
+        index = position + np.repeat(starts - offsets, widths)
+        if np.any(counts != widths):
+            valid = position < np.repeat(offsets + counts, widths)    # 채움 비트, 범위 밖 도어
+            index, bits = index[valid], bits[valid]
+        if len(index) == 0:
+            return []
+        order = np.argsort(starts, kind="stable")
+        if np.any((starts[order] + counts[order])[:-1] > starts[order][1:]):
+            # 같은 도어가 두 번: 마지막 것만 남긴다
+            _, last = np.unique(index[::-1], return_index=True)
+            keep = np.sort(len(index) - 1 - last)
+            index, bits = index[keep], bits[keep]
+        self._grow(int(index.max()) + 1)
+        flags = np.frombuffer(self.flags, np.uint8)
+        # 열림 비트만 비교해서 다른 도어만 뒤집는다 (나머지 플래그는 그대로)
+        changed = index[(flags[index] & FLAG_OPEN) != bits * FLAG_OPEN]
+        flags[changed] ^= FLAG_OPEN
+        del flags   # bytearray를 다시 늘릴 수 있게 뷰를 놓는다
+        changed = np.sort(changed).tolist()
+        self._dirty.update(changed)
+        return changed
+
+    def apply(self, frame):
+        """Apply an EVENT/STATUS/STATUS_BITS frame; returns the changed door indices."""
+        if frame.cmd == CMD_EVENT:
+            return [self.index(frame.board, frame.door)] if self.set(frame.board, frame.door, frame.flags) else []
+        if frame.cmd == CMD_STATUS:
+            return self.set_range(frame.board, frame.first_door, frame.flags)
+        if frame.cmd == CMD_STATUS_BITS:
+            return self.set_bitmaps([frame])
+        return []
+
+    def _reject(self, frames=1):
+        self.rejected += frames
+        m_rejected.inc(frames)
+
+    def mark_dirty(self, indices):
+        """Force ``indices`` to be repainted (e.g. after the grid was rebuilt)."""
+        self._dirty.update(indices)
+
+    def take_dirty(self):
+        dirty, self._dirty = self._dirty, set()
+        return sorted(dirty)
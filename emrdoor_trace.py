@@ -0,0 +1,91 @@
+"""Command latency tracing into a ring buffer, exported as Chrome trace JSON.
+
+A trace follows one command through its phases, each recorded as a span::
+
+    gui       click handler until the command is queued
+    queue     waiting in the command queue
+    write     serial write
+    bus       write done -> ACK bytes read (wire + controller)
+    dispatch  ACK read -> handled on the GUI thread
+    repaint   ACK handled -> grid repainted
+    command   the whole thing, click -> repaint
+
+Call sites test ``TRACER.enabled`` before doing any work, so a disabled
+tracer costs one attribute check.  Open the export in chrome://tracing or
+https://ui.perfetto.dev; every command gets its own async track.
+
+    EMRDOOR_TRACE=trace.json python EMRDoor_App.py    # written on exit
+"""
+import json
+import os
+import threading
+import time
+
+PHASES = ("gui", "queue", "write", "bus", "dispatch", "repaint", "command")
+
+
+class Tracer:
+
+    def __init__(self, capacity=1 << 16):
+        self.enabled = False
+        self.capacity = capacity
+        self._ring = [None] * capacity
+        self._next = 0
+        self._ids = 0
+        self._lock = threading.Lock()
+
+    def start(self):
+        self.enabled = True
+
+    def stop(self):
+        self.enabled = False
+
+    def clear(self):
+        with self._lock:
+            self._ring = [None] * self.capacity
+            self._next = 0
+
+    def new_trace(self):
+        with self._lock:
+            self._ids += 1
+            return self._ids
+
+    def span(self, trace_id, name, start_ns, end_ns, **args):
+        thread = threading.current_thread().name
+        with self._lock:
+            self._ring[self._next % self.capacity] = (trace_id, name, start_ns, end_ns, thread, args)
+            self._next += 1
+
+    def spans(self):
+        """Recorded spans, oldest first (at most ``capacity``)."""
+        with self._lock:
+            n = self._next
+            if n <= self.capacity:
+                return self._ring[:n]
+            i = n % self.capacity
+            return self._ring[i:] + self._ring[:i]
+
+    def durations(self):
+        """``{phase: [seconds, ...]}`` over the buffered spans."""
+        result = {}
+        for _, name, start_ns, end_ns, _, _ in self.spans():
+            result.setdefault(name, []).append((end_ns - start_ns) / 1e9)
+        return result
+
+    def chrome_trace(self):
+        pid = os.getpid()
+        events = []
+        for trace_id, name, start_ns, end_ns, thread, args in self.spans():
+            common = {"name": name, "cat": "command", "id": trace_id, "pid": pid, "tid": 0}
+            events.append(dict(common, ph="b", ts=start_ns / 1e3, args=dict(args, thread=thread)))
+            events.append(dict(common, ph="e", ts=end_ns / 1e3))
+        return {"traceEvents": events, "displayTimeUnit": "ms",
+                "otherData": {"clock": "perf_counter_ns", "exported": time.strftime("%Y-%m-%dT%H:%M:%S")}}
+
+    def export(self, path):
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+        return path
+
+
+TRACER = Tracer()
@@ -0,0 +1,178 @@
+"""GUI event-loop lag monitor and stall detector.
+
+A precise ``QTimer`` heartbeat on the GUI thread measures how late every
+tick fires (``event_loop_lag_ns``).  A helper thread watches the heartbeat;
+when it is more than ``threshold`` late it samples the GUI thread's Python
+stack with ``sys._current_frames()`` until the loop comes back, and the
+stall is recorded with those samples.
+
+Modal dialogs (``QMessageBox``, ``SubDialog.exec()``) do not stop the
+heartbeat because they run a nested event loop, but they do block the slot
+that opened them.  The heartbeat notices it is running deeper than the
+normal loop and records those as ``modal`` stalls for the blocked slot.
+
+``report()`` groups stalls by where they happened, worst total time first.
+"""
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, namedtuple
+
+from PySide6.QtCore import QObject, Qt, QTimer
+
+from emrdoor_log import get_logger
+from emrdoor_metrics import REGISTRY
+
+log = get_logger("watchdog")
+
+# kind: blocked (이벤트 루프가 멈춤) / modal (중첩 루프 안에서 슬롯이 막혀 있음)
+Stall = namedtuple("Stall", "kind start duration where stack")
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+MAX_SAMPLES = 50        # 멈춤 하나당 스택 샘플 수 상한
+MAX_STALLS = 1000
+
+m_lag_ns = REGISTRY.histogram("event_loop_lag_ns", "GUI heartbeat lateness")
+m_stalls = REGISTRY.counter("gui_stalls_total", "GUI stalls over the threshold")
+m_stall_ns = REGISTRY.histogram("gui_stall_ns", "GUI stall duration")
+
+
+def _is_app_frame(summary):
+    return summary.filename.startswith(APP_DIR) and os.sep + "benchmarks" + os.sep not in summary.filename
+
+
+def _where(stacks):
+    """Innermost app frame of the most common stack sample."""
+    innermost = Counter()
+    for stack in stacks:
+        app_frames = [f for f in stack if _is_app_frame(f)] or stack
+        if app_frames:
+            f = app_frames[-1]
+            innermost[f"{os.path.basename(f.filename)}:{f.lineno} {f.name}"] += 1
+    return innermost.most_common(1)[0][0] if innermost else "?"
+
+
+class EventLoopMonitor(QObject):
+
+    def __init__(self, parent=None, interval_ms=50, threshold_ms=200):
+        super().__init__(parent)
+        self.interval = interval_ms / 1e3
+        self.threshold = threshold_ms / 1e3
+        self.stalls = []
+
+        self._lock = threading.Lock()
+        self._gui_ident = threading.get_ident()
+        self._expected = None       # 다음 하트비트 예정 시각 (monotonic)
+        self._samples = []          # 진행 중인 멈춤의 스택 샘플 (헬퍼 쓰레드가 채움)
+        self._base_depth = None     # 평소 이벤트 루프에서의 스택 깊이
+        self._modal = None          # (슬롯 frame, 시작 시각, 스택)
+        self._stop = threading.Event()
+        self._thread = None
+
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self._beat)
+
+    def start(self):
+        self._expected = time.monotonic() + self.interval
+        self._stop.clear()
+        self.timer.start()
+        self._thread = threading.Thread(target=self._watch, name="EventLoopWatchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()    # sleep 중인 헬퍼 쓰레드도 바로 깨운다 (앱 종료 지연 방지)
+        self.timer.stop()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    # -- GUI thread ----------------------------------------------------------
+
+    def _beat(self):
+        now = time.monotonic()
+        lag = max(0.0, now - self._expected)
+        m_lag_ns.record(int(lag * 1e9))
+        with self._lock:
+            samples, self._samples = self._samples, []
+        if samples or lag >= self.threshold:
+            self._record("blocked", self._expected, lag, samples)
+        self._expected = now + self.interval
+        self._check_nested(now)
+
+    def _check_nested(self, now):
+        frames = []
+        frame = sys._getframe(2)    # _check_nested, _beat 위: 이벤트 루프를 돌리는 쪽
+        while frame is not None:
+            frames.append(frame)
+            frame = frame.f_back
+        frames.reverse()
+        depth = len(frames)
+        if self._base_depth is None or depth < self._base_depth:
+            self._base_depth = depth
+        if depth > self._base_depth:
+            slot = frames[self._base_depth]
+            if self._modal is None or self._modal[0] is not slot:
+                self._end_modal(now)
+                self._modal = (slot, now, traceback.extract_stack(frames[depth - 1]))
+        else:
+            self._end_modal(now)
+
+    def _end_modal(self, now):
+        if self._modal is None:
+            return
+        slot, start, stack = self._modal
+        self._modal = None
+        if now - start >= self.threshold:
+            self._record("modal", start, now - start, [stack[:self._base_depth + 1]])
+
+    def _record(self, kind, start, duration, stacks):
+        stall = Stall(kind, start, duration, _where(stacks), stacks[len(stacks) // 2] if stacks else [])
+        m_stalls.inc()
+        m_stall_ns.record(int(duration * 1e9))
+        if len(self.stalls) < MAX_STALLS:
+            self.stalls.append(stall)
+        log.warning("gui stall", extra={"fields": {
+            "kind": kind, "ms": round(duration * 1e3, 1), "where": stall.where}})
+
+    # -- helper thread ---------------------------------------------------------
+
+    def _watch(self):
+        check = min(self.threshold / 4, self.interval)
+        while not self._stop.wait(check):
+            if time.monotonic() - self._expected < self.threshold:
+                continue
+            frame = sys._current_frames().get(self._gui_ident)
+            if frame is None:
+                continue
+            stack = traceback.extract_stack(frame)
+            with self._lock:
+                if len(self._samples) < MAX_SAMPLES:
+                    self._samples.append(stack)
+
+    # -- report ----------------------------------------------------------------
+
+    def report(self, top=10):
+        """Worst offenders: ``[{kind, where, count, total_ms, max_ms, stack}]``."""
+        groups = {}
+        for stall in self.stalls:
+            g = groups.setdefault((stall.kind, stall.where), {
+                "kind": stall.kind, "where": stall.where, "count": 0, "total_ms": 0.0,
+                "max_ms": 0.0, "stack": stall.stack})
+            g["count"] += 1
+            g["total_ms"] += stall.duration * 1e3
+            if stall.duration * 1e3 > g["max_ms"]:
+                g["max_ms"] = stall.duration * 1e3
+                g["stack"] = stall.stack
+        return sorted(groups.values(), key=lambda g: g["total_ms"], reverse=True)[:top]
+
+    def format_report(self, top=10):
+        lines = []
+        for g in self.report(top):
+            lines.append(f"{g['total_ms']:9.1f} ms  {g['count']:4d}x  max {g['max_ms']:7.1f} ms  "
+                         f"{g['kind']:7s} {g['where']}")
+            lines.extend("      " + line.rstrip() for line in traceback.format_list(g["stack"][-6:]))
+        return "\n".join(lines)